@@ -6,15 +6,73 @@ Interface yang user-friendly untuk generate dan check password strength
 import streamlit as st
 import sys
 import os
+import sqlite3
+from concurrent.futures import TimeoutError as FutureTimeout, wait as wait_futures
+from datetime import datetime, time as day_time, timedelta
 
 # Add src folder ke path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from password_generator import generate_password, get_rules_summary
-from strength_checker import check_password_strength, get_strength_emoji
-from file_export import export_to_file, list_exports, read_export_file
+from password_generator import (generate_password, get_rules_summary, get_policy,
+                                MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH)
+from mask_generator import compile_mask, MASK_HELP
+from pronounceable_generator import (generate_pronounceable, get_pronounceable_entropy,
+                                    MIN_PRONOUNCEABLE_LENGTH, MAX_PRONOUNCEABLE_LENGTH,
+                                    MAX_DIGITS)
+from strength_checker import get_strength_emoji, STRENGTH_LEVELS
+from strength_cache import get_default_cache
+from incremental_checker import IncrementalChecker
+from crack_estimator import ATTACK_MODELS, format_duration
+from breach_checker import get_default_breach_db
+from pattern_analyzer import get_analyzer
+from file_export import (list_exports, query_exports, read_export_file, get_text_reader,
+                         iter_export_chunks, EXPORT_FORMATS)
+from export_manifest import SORT_ORDERS
+from export_writer import get_default_writer
 
 
+# Mode generator di sidebar
+MODE_RANDOM = "Acak"
+MODE_MASK = "Mask"
+MODE_PRONOUNCEABLE = "Mudah Diucapkan"
+
+# Lama maksimal klik export menunggu path file dari writer background
+EXPORT_WAIT_SECONDS = 0.5
+
+# Lama tab History menunggu export session ini yang masih antre: singkat di
+# setiap rerun (semua tab dijalankan tiap interaksi), lebih lama saat Refresh
+HISTORY_WAIT_SECONDS = 0.1
+HISTORY_REFRESH_SECONDS = 2.0
+
+# Jumlah file per halaman di tab History Export
+HISTORY_PAGE_SIZE = 25
+
+# Jumlah baris isi file yang ditampilkan per halaman preview
+PREVIEW_PAGE_LINES = 200
+
+# File export sampai ukuran ini langsung disiapkan untuk download; yang
+# lebih besar baru dibaca setelah diminta
+DOWNLOAD_INLINE_LIMIT = 8 << 20
+
+
+def export_in_background(pwd, result, rules_summary):
+    """
+    Antrekan export ke writer background lalu tampilkan hasilnya.
+    
+    Klik hanya menunggu sebentar supaya path bisa ditampilkan; jika writer
+    sedang sibuk, export tetap diselesaikan di background.
+    """
+    future = get_default_writer().submit(pwd, result, rules_summary)
+    st.session_state.pending_exports = st.session_state.get('pending_exports', []) + [future]
+    try:
+        filepath = future.result(timeout=EXPORT_WAIT_SECONDS)
+    except FutureTimeout:
+        st.success("✅ Export diantre, file disimpan di background!")
+        st.info("📁 File akan muncul di tab History Export")
+        return future
+    st.success(f"✅ File berhasil disimpan!\n\n📁 Path: `{filepath}`")
+    return future
+
 # Konfigurasi Streamlit
 st.set_page_config(
     page_title="Password Generator & Strength Checker",
@@ -60,28 +118,100 @@ st.markdown("---")
 with st.sidebar:
     st.header("⚙️ Pengaturan")
     
-    # Password Length
-    st.subheader("Panjang Password")
-    password_length = st.slider(
-        "Pilih panjang password (karakter)",
-        min_value=4,
-        max_value=128,
-        value=12,
-        step=1,
-        help="Minimum 4 karakter untuk security basic, recommended 12+ untuk security tinggi"
+    # Generator Mode
+    st.subheader("Mode Generator")
+    generator_mode = st.radio(
+        "Pilih mode generator",
+        options=[MODE_RANDOM, MODE_MASK, MODE_PRONOUNCEABLE],
+        horizontal=True,
+        help="Mask: format per posisi, misal ?u?l?l?d?d?s. "
+             "Mudah Diucapkan: password yang bisa dibacakan (misal untuk help desk)"
     )
     
-    # Rules Selection
-    st.subheader("Aturan Password")
-    use_uppercase = st.checkbox("📌 Huruf Besar (A-Z)", value=True)
-    use_lowercase = st.checkbox("📌 Huruf Kecil (a-z)", value=True)
-    use_numbers = st.checkbox("📌 Angka (0-9)", value=True)
-    use_symbols = st.checkbox("📌 Simbol (!@#$%^&*)", value=True)
-    
-    # Validate minimal 1 rule
-    if not any([use_uppercase, use_lowercase, use_numbers, use_symbols]):
-        st.error("❌ Minimal pilih 1 aturan!")
-        st.stop()
+    policy = None
+    mask_plan = None
+    pronounceable = None
+    
+    if generator_mode == MODE_RANDOM:
+        # Password Length
+        st.subheader("Panjang Password")
+        password_length = st.slider(
+            "Pilih panjang password (karakter)",
+            min_value=MIN_PASSWORD_LENGTH,
+            max_value=MAX_PASSWORD_LENGTH,
+            value=12,
+            step=1,
+            help="Minimum 4 karakter untuk security basic, recommended 12+ untuk security tinggi"
+        )
+        
+        # Rules Selection
+        st.subheader("Aturan Password")
+        use_uppercase = st.checkbox("📌 Huruf Besar (A-Z)", value=True)
+        use_lowercase = st.checkbox("📌 Huruf Kecil (a-z)", value=True)
+        use_numbers = st.checkbox("📌 Angka (0-9)", value=True)
+        use_symbols = st.checkbox("📌 Simbol (!@#$%^&*)", value=True)
+        
+        # Validate minimal 1 rule
+        if not any([use_uppercase, use_lowercase, use_numbers, use_symbols]):
+            st.error("❌ Minimal pilih 1 aturan!")
+            st.stop()
+        
+        # Advanced Options
+        st.subheader("Opsi Lanjutan")
+        min_per_class = st.number_input(
+            "Minimal karakter per tipe",
+            min_value=0,
+            max_value=8,
+            value=1,
+            help="Setiap tipe karakter yang dipilih dijamin muncul minimal sebanyak ini"
+        )
+        exclude_ambiguous = st.checkbox("🚫 Hindari karakter ambigu (Il1|O0o)", value=False)
+        exclude_chars = st.text_input("Karakter yang dikecualikan", value="")
+        
+        # Compile policy sekali, dipakai generator dan rules summary
+        try:
+            policy = get_policy(use_uppercase, use_lowercase, use_numbers, use_symbols,
+                                min_per_class=int(min_per_class),
+                                exclude_chars=exclude_chars,
+                                exclude_ambiguous=exclude_ambiguous)
+            policy.validate_length(password_length)
+        except ValueError as e:
+            st.error(f"❌ {str(e)}")
+            st.stop()
+    elif generator_mode == MODE_PRONOUNCEABLE:
+        # Pronounceable (model Markov)
+        st.subheader("Password Mudah Diucapkan")
+        pronounce_length = st.slider(
+            "Jumlah huruf",
+            min_value=MIN_PRONOUNCEABLE_LENGTH,
+            max_value=MAX_PRONOUNCEABLE_LENGTH,
+            value=12,
+            step=1
+        )
+        pronounce_digits = st.number_input("Jumlah angka di akhir", min_value=0,
+                                           max_value=MAX_DIGITS, value=2)
+        
+        try:
+            pronounceable = {"length": pronounce_length, "digits": int(pronounce_digits)}
+            pronounce_entropy = get_pronounceable_entropy(**pronounceable)
+        except (ValueError, FileNotFoundError) as e:
+            st.error(f"❌ {str(e)}")
+            st.stop()
+        
+        st.caption(f"Entropy model: {pronounce_entropy:.1f} bit")
+    else:
+        # Mask / Template
+        st.subheader("Mask Password")
+        mask_input = st.text_input("Mask", value="?u?l?l?l?d?d?s", help=MASK_HELP)
+        custom_charset = st.text_input("Charset custom ?1 (opsional)", value="")
+        
+        try:
+            mask_plan = compile_mask(mask_input, {"1": custom_charset} if custom_charset else None)
+        except ValueError as e:
+            st.error(f"❌ {str(e)}")
+            st.stop()
+        
+        st.caption(f"Keyspace: {mask_plan.keyspace:,} kombinasi ({mask_plan.entropy_bits:.1f} bit)")
 
 # Main Content - Tabs
 tab1, tab2, tab3, tab4 = st.tabs([
@@ -101,18 +231,21 @@ with tab1:
         if st.button("🎲 Generate Password", use_container_width=True, type="primary"):
             try:
                 # Generate password
-                generated_pwd = generate_password(
-                    length=password_length,
-                    use_uppercase=use_uppercase,
-                    use_lowercase=use_lowercase,
-                    use_numbers=use_numbers,
-                    use_symbols=use_symbols
-                )
+                if mask_plan is not None:
+                    generated_pwd = mask_plan.generate(1)[0]
+                    generated_entropy = mask_plan.entropy_bits
+                elif pronounceable is not None:
+                    generated_pwd = generate_pronounceable(**pronounceable)
+                    generated_entropy = pronounce_entropy
+                else:
+                    generated_pwd = generate_password(length=password_length, policy=policy)
+                    generated_entropy = policy.entropy_bits(password_length)
                 
                 # Store in session state
                 st.session_state.generated_password = generated_pwd
+                st.session_state.generated_entropy = generated_entropy
                 st.session_state.show_result = True
-                
+            
             except ValueError as e:
                 st.error(f"❌ Error: {str(e)}")
     
@@ -121,7 +254,13 @@ with tab1:
         st.markdown("---")
         
         pwd = st.session_state.generated_password
-        rules_summary = get_rules_summary(use_uppercase, use_lowercase, use_numbers, use_symbols)
+        if mask_plan is not None:
+            rules_summary = f"Mask {mask_plan.mask} ({mask_plan.keyspace:,} kombinasi)"
+        elif pronounceable is not None:
+            rules_summary = (f"Mudah diucapkan: {pronounceable['length']} huruf + "
+                             f"{pronounceable['digits']} angka ({pronounce_entropy:.1f} bit)")
+        else:
+            rules_summary = get_rules_summary(policy=policy)
         
         # Display password
         st.markdown("#### 🔑 Password yang Dihasilkan:")
@@ -138,7 +277,9 @@ with tab1:
         # Strength analysis
         st.markdown("---")
         st.markdown("#### 📊 Analisis Kekuatan:")
-        result = check_password_strength(pwd)
+        result = get_default_cache().check(pwd, entropy_bits=st.session_state.get('generated_entropy'),
+                                           breach_db=get_default_breach_db(),
+                                           pattern_analyzer=get_analyzer())
         
         strength = result['strength']
         score = result['score']
@@ -152,6 +293,15 @@ with tab1:
         
         st.progress(score / 100, text=f"{score}% Kuat")
         
+        if result.get('breached'):
+            st.error("⚠️ Password ini ditemukan di data kebocoran! Jangan dipakai.")
+        
+        # Entropy & perkiraan waktu crack
+        st.markdown("#### ⏱️ Perkiraan Waktu Crack:")
+        st.caption(f"Entropy generator: {result['entropy_bits']:.1f} bit")
+        for key, label, _ in ATTACK_MODELS:
+            st.write(f"• {label}: **{format_duration(result['crack_times'][key])}**")
+        
         # Generate more options
         st.markdown("---")
         st.markdown("#### 🔄 Opsi Lainnya:")
@@ -165,9 +315,7 @@ with tab1:
         with col2:
             if st.button("💾 Simpan ke File", use_container_width=True, type="primary"):
                 try:
-                    filepath = export_to_file(pwd, result, rules_summary)
-                    st.success(f"✅ File berhasil disimpan!")
-                    st.info(f"📁 {filepath}")
+                    export_in_background(pwd, result, rules_summary)
                 except IOError as e:
                     st.error(f"❌ Gagal menyimpan: {str(e)}")
         
@@ -202,14 +350,32 @@ with tab2:
                 st.session_state.password_to_check = password_input
                 st.session_state.show_analysis = True
     
+    # Live meter: checker incremental per session, hanya karakter yang berubah
+    # sejak rerun sebelumnya yang diproses
+    live_checker = st.session_state.get('live_checker')
+    if live_checker is None:
+        live_checker = IncrementalChecker(get_analyzer(), get_default_breach_db())
+        st.session_state.live_checker = live_checker
+    
+    if password_input:
+        live_checker.set_text(password_input)
+        live = live_checker.result()
+        st.progress(live['score'] / 100,
+                    text=f"{get_strength_emoji(live['strength'])} {live['strength'].value} "
+                         f"({live['score']}/100)")
+    
     # Display analysis
     if st.session_state.get('show_analysis', False) and st.session_state.get('password_to_check'):
         pwd = st.session_state.password_to_check
-        result = check_password_strength(pwd)
+        live_checker.set_text(pwd)
+        result = live_checker.result()
         
         st.markdown("---")
         st.markdown("#### 📊 Hasil Analisis:")
         
+        if result.get('breached'):
+            st.error("⚠️ Password ini ditemukan di data kebocoran! Jangan dipakai.")
+        
         # Strength gauge
         strength = result['strength']
         score = result['score']
@@ -242,7 +408,7 @@ with tab2:
             st.metric("Panjang", f"{len(pwd)} karakter")
         
         with col4:
-            st.metric("Tipe Karakter", "")
+            st.metric("Entropy", f"{result['entropy_bits']:.1f} bit")
         
         # Progress bar
         st.markdown("##### 📈 Progress:")
@@ -275,6 +441,19 @@ with tab2:
             status_sym = "✅" if details['simbol'] else "❌"
             st.write(f"{status_sym} Simbol (!@#$%)")
         
+        # Perkiraan waktu crack per model penyerang
+        st.markdown("##### ⏱️ Perkiraan Waktu Crack:")
+        st.caption("Entropy dihitung dari jenis karakter yang dipakai")
+        for key, label, _ in ATTACK_MODELS:
+            st.write(f"• {label}: **{format_duration(result['crack_times'][key])}**")
+        
+        # Pola yang mudah ditebak
+        if 'guesses_log10' in result:
+            st.markdown("##### 🔍 Pola Terdeteksi:")
+            st.write(f"Perkiraan tebakan: **~10^{result['guesses_log10']:.1f}**")
+            for match in result['patterns']:
+                st.write(f"• {match.pattern}: `{match.token}` (~10^{match.guesses_log10:.1f})")
+        
         # Recommendations
         if result['feedback']:
             st.markdown("##### 💡 Saran Perbaikan:")
@@ -288,9 +467,7 @@ with tab2:
         if st.button("💾 Export Hasil ke File", use_container_width=True):
             try:
                 rules_summary = "Password dari Strength Checker"
-                filepath = export_to_file(pwd, result, rules_summary)
-                st.success(f"✅ File berhasil disimpan!\n\n📁 Path: `{filepath}`")
-                st.session_state.last_export = filepath
+                st.session_state.last_export = export_in_background(pwd, result, rules_summary)
             except IOError as e:
                 st.error(f"❌ Gagal menyimpan file: {str(e)}")
 
@@ -301,39 +478,99 @@ with tab3:
     
     output_dir = os.path.join(os.path.dirname(__file__), "output")
     
-    # List all exports
-    exports = list_exports(output_dir)
+    # Hanya export dari session ini yang ditunggu (sebentar) supaya langsung
+    # muncul di daftar; gagal/tidaknya juga dihitung per session, bukan
+    # counter writer untuk seluruh proses
+    refresh = st.button("🔄 Refresh")
+    pending = st.session_state.get('pending_exports', [])
+    if pending:
+        wait_futures(pending, timeout=HISTORY_REFRESH_SECONDS if refresh else HISTORY_WAIT_SECONDS)
+        done = [future for future in pending if future.done()]
+        st.session_state.export_failures = st.session_state.get('export_failures', 0) + sum(
+            1 for future in done if future.exception() is not None)
+        st.session_state.pending_exports = [future for future in pending if not future.done()]
+    if st.session_state.get('pending_exports'):
+        st.info(f"⏳ {len(st.session_state.pending_exports)} export masih ditulis di background")
+    if st.session_state.get('export_failures'):
+        st.warning(f"⚠️ {st.session_state.export_failures} export gagal ditulis")
+    
+    # Filter & urutan dijalankan di manifest sqlite, jadi hanya satu
+    # halaman yang diambil walaupun folder berisi ribuan file
+    col1, col2 = st.columns(2)
+    with col1:
+        sort = st.selectbox("Urutkan:", options=list(SORT_ORDERS),
+                            format_func=lambda x: x.replace("_", " ").capitalize())
+        strengths = st.multiselect("Kekuatan:", options=STRENGTH_LEVELS,
+                                   format_func=lambda x: x.value)
+    with col2:
+        score_range = st.slider("Skor (terendah di file):", 0, 100, (0, 100))
+        days = st.date_input("Tanggal export:", value=())
+    
+    filters = {"sort": sort, "strengths": strengths or None}
+    if score_range != (0, 100):
+        filters["min_score"], filters["max_score"] = score_range
+    if len(days) == 2:
+        filters["since"] = datetime.combine(days[0], day_time.min)
+        filters["until"] = datetime.combine(days[1], day_time.min) + timedelta(days=1)
+    
+    try:
+        _, total = query_exports(output_dir, per_page=1, **filters)
+        pages = max(1, -(-total // HISTORY_PAGE_SIZE))
+        page = st.number_input(f"Halaman (dari {pages}):", min_value=1, max_value=pages, value=1)
+        exports, _ = query_exports(output_dir, page=page, per_page=HISTORY_PAGE_SIZE, **filters)
+    except sqlite3.Error:
+        # Manifest tidak bisa dibuka (misal folder read-only): daftar
+        # biasa tanpa filter
+        exports = [{"name": name, "score": None} for name in list_exports(output_dir)]
+        total = len(exports)
     
     if exports:
-        st.info(f"📊 Total file yang di-export: **{len(exports)}**")
+        st.info(f"📊 Total file yang cocok: **{total}**")
         
+        labels = {item["name"]: f"📄 {item['name']}" + (
+            f" (skor {item['score']})" if item["score"] is not None else "") for item in exports}
         selected_file = st.selectbox(
             "Pilih file untuk dibaca:",
-            options=exports,
-            format_func=lambda x: f"📄 {x}"
+            options=list(labels),
+            format_func=labels.get
         )
         
         if selected_file:
             filepath = os.path.join(output_dir, selected_file)
             
-            # Read file
+            # Read file: .pwx ditampilkan ringkasannya, export teks hanya
+            # satu halaman baris (file di-mmap, bukan dibaca utuh)
             try:
-                content = read_export_file(filepath)
-                
-                # Display content
                 st.markdown("##### 📄 Isi File:")
-                st.text(content)
-                
-                # Download button
-                st.download_button(
-                    label="⬇️ Download File",
-                    data=content,
-                    file_name=selected_file,
-                    mime="text/plain"
-                )
+                if selected_file.endswith(EXPORT_FORMATS["pwx"]):
+                    st.text(read_export_file(filepath))
+                    mime = "application/octet-stream"
+                else:
+                    reader = get_text_reader(filepath)
+                    pages = reader.pages(PREVIEW_PAGE_LINES)
+                    preview_page = st.number_input(
+                        f"Halaman isi (dari {pages}, {len(reader):,} baris):",
+                        min_value=1, max_value=pages, value=1, key=f"preview_{selected_file}")
+                    st.text(reader.page(preview_page, PREVIEW_PAGE_LINES))
+                    mime = "text/plain"
                 
+                # Download button: download_button Streamlit 1.28 butuh
+                # seluruh isi sebagai bytes, jadi file besar baru dibaca
+                # (per potongan) setelah diminta, tidak di setiap rerun
+                size = os.path.getsize(filepath)
+                if size <= DOWNLOAD_INLINE_LIMIT or st.checkbox(
+                        f"Siapkan download ({size / (1 << 20):,.1f} MB)", key=f"download_{selected_file}"):
+                    st.download_button(
+                        label="⬇️ Download File",
+                        data=b"".join(iter_export_chunks(filepath)),
+                        file_name=selected_file,
+                        mime=mime
+                    )
+            
             except FileNotFoundError as e:
                 st.error(f"❌ File tidak ditemukan: {str(e)}")
+    elif strengths or len(filters) > 2:
+        st.info("🔍 Tidak ada file export yang cocok dengan filter")
     else:
         st.info("📭 Belum ada file export. Generate password terlebih dahulu dan export hasilnya!")
 
@@ -408,11 +645,32 @@ with tab4:
     
     st.markdown("---")
     st.info("💡 **Tips**: Password yang kuat adalah kombinasi dari panjang (12+ karakter) + keragaman karakter (huruf + angka + simbol)")
+    
+    # Statistik cache hasil strength check (shared untuk semua session)
+    with st.expander("⚡ Statistik Cache Strength Check"):
+        cache_stats = get_default_cache().stats()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Entry", f"{cache_stats['entries']}/{cache_stats['max_entries']}")
+        col2.metric("Hit Rate", f"{cache_stats['hit_rate']:.0%}")
+        col3.metric("Hit / Miss", f"{cache_stats['hits']} / {cache_stats['misses']}")
+        col4.metric("Eviction", cache_stats['evictions'] + cache_stats['expirations'])
+        st.caption("Key cache berupa hash BLAKE2b ber-salt, password tidak disimpan sebagai plaintext")
+    
+    # Statistik writer export background
+    with st.expander("💾 Statistik Export Background"):
+        writer_stats = get_default_writer().stats()
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Antrean", f"{writer_stats['queued']} (maks {writer_stats['max_queued']})")
+        col2.metric("Tersimpan / Gagal", f"{writer_stats['written']} / {writer_stats['failed']}")
+        col3.metric("Rata-rata Batch", f"{writer_stats['mean_batch']:.1f}")
+        col4.metric("Latency p99", f"{writer_stats['latency']['p99_ms']:.1f} ms")
 
 
 # Initialize session state
 if 'generated_password' not in st.session_state:
     st.session_state.generated_password = None
+if 'generated_entropy' not in st.session_state:
+    st.session_state.generated_entropy = None
 if 'show_result' not in st.session_state:
     st.session_state.show_result = False
 if 'check_strength' not in st.session_state:
@@ -423,3 +681,7 @@ if 'show_analysis' not in st.session_state:
     st.session_state.show_analysis = False
 if 'last_export' not in st.session_state:
     st.session_state.last_export = None
+if 'pending_exports' not in st.session_state:
+    st.session_state.pending_exports = []
+if 'export_failures' not in st.session_state:
+    st.session_state.export_failures = 0
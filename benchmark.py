@@ -0,0 +1,702 @@
+#!/usr/bin/env python
+"""
+Benchmark script untuk fitur bulk / performa
+"""
+
+import sys
+import os
+import time
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+
+def timed(func, *args, **kwargs):
+    """Jalankan func dan kembalikan (hasil, durasi detik)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+print("=" * 60)
+print("BENCHMARK PASSWORD TOOLS")
+print("=" * 60)
+
+# Bench 1: Bulk Generation
+print("\n[BENCH 1] Bulk Generation vs Loop generate_password")
+print("-" * 60)
+
+from password_generator import generate_password, generate_passwords
+
+COUNT = 50_000
+LENGTH = 16
+
+_, loop_time = timed(lambda: [generate_password(LENGTH) for _ in range(COUNT)])
+print(f"Loop generate_password : {loop_time:.3f}s ({COUNT / loop_time:,.0f} pwd/s)")
+
+_, bulk_time = timed(generate_passwords, COUNT, LENGTH)
+print(f"generate_passwords     : {bulk_time:.3f}s ({COUNT / bulk_time:,.0f} pwd/s)")
+print(f"Speedup                : {loop_time / bulk_time:.1f}x")
+
+# Bench 2: Streaming Memory
+print("\n[BENCH 2] Streaming iter_passwords - Peak Memory")
+print("-" * 60)
+
+import tracemalloc
+from password_generator import write_passwords
+
+with open(os.devnull, "w") as devnull:
+    for total in (1_000, 100_000, 1_000_000):
+        tracemalloc.start()
+        _, elapsed = timed(write_passwords, devnull, LENGTH, total)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{total:>10,} password: {elapsed:.3f}s, peak memory {peak / 1024:,.0f} KiB")
+
+# Bench 3: Parallel Scaling
+print("\n[BENCH 3] Parallel Generation - Scaling Curve")
+print("-" * 60)
+
+from parallel_generator import write_passwords_parallel
+
+PARALLEL_COUNT = 2_000_000
+cores = os.cpu_count() or 1
+print(f"CPU core terdeteksi: {cores}")
+
+baseline = None
+with open(os.devnull, "w") as devnull:
+    worker_counts = sorted({1, 2, 4, cores})
+    for workers in worker_counts:
+        _, elapsed = timed(write_passwords_parallel, devnull, PARALLEL_COUNT, LENGTH,
+                           workers=workers)
+        baseline = baseline or elapsed
+        print(f"workers={workers:<3} {elapsed:.3f}s "
+              f"({PARALLEL_COUNT / elapsed:,.0f} pwd/s, scaling {baseline / elapsed:.2f}x)")
+
+# Bench 4: Mask Generation
+print("\n[BENCH 4] Mask Plan vs Post-Filter Random Output")
+print("-" * 60)
+
+from mask_generator import compile_mask
+
+MASK = "?u?l?l?l?d?d?s"
+plan = compile_mask(MASK)
+_, mask_time = timed(plan.generate, COUNT)
+print(f"MaskPlan.generate      : {mask_time:.3f}s ({COUNT / mask_time:,.0f} pwd/s)")
+
+
+def post_filter(count):
+    """Cara lama: generate acak lalu buang yang tidak sesuai format"""
+    found = []
+    while len(found) < count:
+        for p in generate_passwords(10_000, 7):
+            if (p[0].isupper() and p[1:4].islower() and p[4:6].isdigit()
+                    and not p[6].isalnum()):
+                found.append(p)
+    return found[:count]
+
+
+_, filter_time = timed(post_filter, 1_000)
+print(f"Post-filter (1k saja)  : {filter_time:.3f}s ({1_000 / filter_time:,.0f} pwd/s)")
+
+# Bench 5: Uniqueness Guard
+print("\n[BENCH 5] Uniqueness Guard - Bulk Insert & Test")
+print("-" * 60)
+
+import tempfile
+from uniqueness_guard import UniquenessGuard
+
+BLOOM_COUNT = 200_000
+sample = generate_passwords(BLOOM_COUNT, LENGTH)
+with tempfile.TemporaryDirectory() as tmp:
+    with UniquenessGuard(os.path.join(tmp, "bench.bloom"), capacity=100_000_000) as guard:
+        print(f"Ukuran filter (100M kapasitas, fp 1e-6): {guard.bits / 8 / 2**20:,.0f} MiB, "
+              f"{guard.hashes} hash")
+        _, insert_time = timed(guard.add_many, sample)
+        print(f"add_many      : {BLOOM_COUNT / insert_time:,.0f} pwd/s")
+        _, test_time = timed(guard.contains_many, sample)
+        print(f"contains_many : {BLOOM_COUNT / test_time:,.0f} pwd/s")
+
+# Bench 6: Entropy Pool
+print("\n[BENCH 6] Entropy Pool vs secrets per Draw")
+print("-" * 60)
+
+import secrets
+from entropy_pool import EntropyPool
+
+DRAWS = 200_000
+pool = EntropyPool()
+_, secrets_time = timed(lambda: [secrets.randbelow(94) for _ in range(DRAWS)])
+print(f"secrets.randbelow      : {DRAWS / secrets_time:,.0f} draw/s")
+_, pool_time = timed(lambda: [pool.randbelow(94) for _ in range(DRAWS)])
+print(f"EntropyPool.randbelow  : {DRAWS / pool_time:,.0f} draw/s")
+_, bulk_time = timed(pool.randbelow_bytes, 94, DRAWS)
+print(f"EntropyPool bulk       : {DRAWS / bulk_time:,.0f} draw/s")
+print(f"Pool stats             : {pool.stats()}")
+
+# Bench 7: Pronounceable Generator
+print("\n[BENCH 7] Pronounceable Generator - Biaya per Karakter")
+print("-" * 60)
+
+from pronounceable_generator import get_model
+
+PRON_COUNT = 20_000
+model = get_model()
+for letters in (8, 16, 32):
+    _, pron_time = timed(lambda: [model.sample(letters) for _ in range(PRON_COUNT)])
+    print(f"{letters:>2} huruf: {PRON_COUNT / pron_time:,.0f} pwd/s, "
+          f"{pron_time / (PRON_COUNT * letters) * 1e9:,.0f} ns/karakter, "
+          f"entropy {model.entropy_bits(letters):.1f} bit")
+
+# Bench 8: Batch Strength Check
+print("\n[BENCH 8] Strength Check - Loop vs Batch Kolumnar")
+print("-" * 60)
+
+from strength_checker import check_password_strength, check_password_strength_many
+
+CHECK_COUNT = 200_000
+sample = generate_passwords(CHECK_COUNT, 12)
+_, loop_time = timed(lambda: [check_password_strength(p) for p in sample])
+print(f"Loop check_password_strength : {CHECK_COUNT / loop_time:,.0f} pwd/s")
+batch, batch_time = timed(check_password_strength_many, sample)
+print(f"check_password_strength_many : {CHECK_COUNT / batch_time:,.0f} pwd/s "
+      f"({loop_time / batch_time:.1f}x)")
+column_bytes = sum(col.itemsize * len(col) for col in
+                   (batch.scores, batch.codes, batch.masks, batch.lengths))
+print(f"Ukuran kolom hasil           : {column_bytes / CHECK_COUNT:.0f} byte/pwd")
+
+# Bench 9: Footprint StrengthResult
+print("\n[BENCH 9] Footprint Hasil Strength Check (tracemalloc)")
+print("-" * 60)
+
+FOOTPRINT_COUNT = 100_000
+sample = generate_passwords(FOOTPRINT_COUNT, 10)
+
+
+def held_bytes(build):
+    """Memory yang masih dipegang oleh hasil build() (byte per item)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / FOOTPRINT_COUNT
+
+
+# Bentuk lama: dict baru + details dict + list feedback per hasil
+legacy = held_bytes(lambda: [dict(check_password_strength(p)) for p in sample])
+compact = held_bytes(lambda: [check_password_strength(p) for p in sample])
+columnar = held_bytes(lambda: check_password_strength_many(sample))
+print(f"dict per hasil (format lama) : {legacy:,.0f} byte/hasil")
+print(f"StrengthResult (__slots__)   : {compact:,.0f} byte/hasil")
+print(f"StrengthBatch (kolumnar)     : {columnar:,.1f} byte/hasil")
+
+# Bench 10: Breach Checker
+print("\n[BENCH 10] Breach Checker - Build Streaming & Latency Lookup")
+print("-" * 60)
+
+import statistics
+from breach_checker import BreachDatabase, build_breach_db
+
+BREACH_COUNT = 1_000_000
+hashes = sorted(os.urandom(20) for _ in range(BREACH_COUNT))
+with tempfile.TemporaryDirectory() as tmp:
+    dump_path = os.path.join(tmp, "dump.txt")
+    db_path = os.path.join(tmp, "breached.sha1db")
+    with open(dump_path, "w") as f:
+        f.writelines(f"{h.hex().upper()}:1\n" for h in hashes)
+    
+    with open(dump_path, "rb") as f:
+        _, build_time = timed(build_breach_db, f, db_path)
+    print(f"Build : {BREACH_COUNT / build_time:,.0f} baris/s "
+          f"({os.path.getsize(db_path) / 2**20:,.1f} MiB)")
+    
+    with BreachDatabase(db_path) as db:
+        for label, probes in (("hit ", hashes[::100]),
+                              ("miss", [os.urandom(20) for _ in range(10_000)])):
+            latencies = []
+            for digest in probes:
+                start = time.perf_counter()
+                db.contains_digest(digest)
+                latencies.append(time.perf_counter() - start)
+            latencies.sort()
+            print(f"Lookup {label}: p50 {statistics.median(latencies) * 1e6:.1f}µs, "
+                  f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.1f}µs")
+
+# Bench 11: Pattern Analyzer
+print("\n[BENCH 11] Pattern Analyzer - Scan Aho-Corasick vs Ukuran Kamus")
+print("-" * 60)
+
+import random
+import string
+from pattern_analyzer import DictionaryAutomaton, get_analyzer
+
+SCAN_COUNT = 20_000
+sample = generate_passwords(SCAN_COUNT, LENGTH)
+with tempfile.TemporaryDirectory() as tmp:
+    rng = random.Random(1)
+    with open(os.path.join(tmp, "besar.txt"), "w") as f:
+        for _ in range(20_000):
+            f.write("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10))) + "\n")
+    big, build_time = timed(DictionaryAutomaton, tmp)
+    print(f"Build kamus 20k kata : {build_time:.2f}s ({big.node_count:,} node)")
+    _, load_time = timed(DictionaryAutomaton, tmp)
+    print(f"Load dari disk (mmap): {load_time * 1e3:.2f}ms")
+    
+    for label, automaton in (("kamus bawaan", get_analyzer().automaton), ("kamus 20k", big)):
+        _, scan_time = timed(lambda: [list(automaton.scan(p)) for p in sample])
+        print(f"Scan {label:<12}: {scan_time / (SCAN_COUNT * LENGTH) * 1e9:,.0f} ns/karakter")
+
+analyzer = get_analyzer()
+_, analyze_time = timed(lambda: [analyzer.analyze(p) for p in sample[:2_000]])
+print(f"analyze() lengkap    : {2_000 / analyze_time:,.0f} pwd/s")
+
+print("\n[BENCH 12] Crack Time - Tanpa Memo vs Memoized per (Charset, Panjang)")
+print("-" * 60)
+
+from crack_estimator import charset_entropy, crack_seconds, entropy_to_guesses_log10
+from strength_checker import check_password_strength_many, _CHARSET_BY_MASK
+
+AUDIT_COUNT = 200_000
+audit = check_password_strength_many(generate_passwords(AUDIT_COUNT, LENGTH))
+rows = list(zip(audit.masks, audit.lengths))
+
+def crack_uncached():
+    return [crack_seconds.__wrapped__(entropy_to_guesses_log10(
+                charset_entropy.__wrapped__(_CHARSET_BY_MASK[m], n))) for m, n in rows]
+
+def crack_memoized():
+    return [crack_seconds(entropy_to_guesses_log10(
+                charset_entropy(_CHARSET_BY_MASK[m], n))) for m, n in rows]
+
+_, uncached_time = timed(crack_uncached)
+_, memo_time = timed(crack_memoized)
+_, min_time = timed(audit.min_crack_seconds, "offline_fast")
+print(f"Tanpa memo          : {AUDIT_COUNT / uncached_time:,.0f} pwd/s")
+print(f"Memoized            : {AUDIT_COUNT / memo_time:,.0f} pwd/s "
+      f"({uncached_time / memo_time:.1f}x, {crack_seconds.cache_info().currsize} entry cache)")
+print(f"min_crack_seconds() : {AUDIT_COUNT / min_time:,.0f} pwd/s")
+
+print("\n[BENCH 13] Strength Cache - Audit dengan Password Berulang")
+print("-" * 60)
+
+import random
+from strength_cache import StrengthCache
+from strength_checker import check_password_strength
+
+analyzer = get_analyzer()
+rng = random.Random(7)
+unique = generate_passwords(2_000, LENGTH)
+repeated = [rng.choice(unique) for _ in range(20_000)]
+
+_, direct_time = timed(lambda: [check_password_strength(p, pattern_analyzer=analyzer)
+                                for p in repeated])
+cache = StrengthCache(max_entries=len(unique))
+_, cached_time = timed(lambda: [cache.check(p, pattern_analyzer=analyzer) for p in repeated])
+stats = cache.stats()
+print(f"Tanpa cache : {len(repeated) / direct_time:,.0f} pwd/s")
+print(f"Dengan cache: {len(repeated) / cached_time:,.0f} pwd/s "
+      f"({direct_time / cached_time:.1f}x, hit rate {stats['hit_rate']:.0%})")
+
+print("\n[BENCH 14] Live Meter - Check Penuh vs Incremental per Ketikan")
+print("-" * 60)
+
+from incremental_checker import IncrementalChecker
+
+typed = generate_passwords(500, LENGTH)
+keystrokes = len(typed) * LENGTH
+
+def full_per_keystroke():
+    for password in typed:
+        for k in range(1, len(password) + 1):
+            check_password_strength(password[:k], pattern_analyzer=analyzer)
+
+def incremental_per_keystroke(with_result=True):
+    checker = IncrementalChecker(analyzer)
+    for password in typed:
+        checker.clear()
+        for char in password:
+            checker.append(char)
+            if with_result:
+                checker.result()
+
+_, full_time = timed(full_per_keystroke)
+_, live_time = timed(incremental_per_keystroke)
+_, update_time = timed(incremental_per_keystroke, False)
+print(f"Check penuh         : {full_time / keystrokes * 1e6:,.1f} µs/ketikan")
+print(f"Incremental + hasil : {live_time / keystrokes * 1e6:,.1f} µs/ketikan "
+      f"({full_time / live_time:.1f}x)")
+print(f"Update state saja   : {update_time / keystrokes * 1e6:,.1f} µs/ketikan")
+
+print("\n[BENCH 15] Dump Auditor - Throughput & Memory vs Ukuran Dump")
+print("-" * 60)
+
+from dump_auditor import audit_dump
+from password_generator import iter_password_blocks
+
+AUDIT_LINES = 500_000
+with tempfile.TemporaryDirectory() as tmp:
+    dump_path = os.path.join(tmp, "dump.txt")
+    with open(dump_path, "w") as f:
+        for block in iter_password_blocks(12, AUDIT_LINES):
+            f.write("\n".join(f"user{i}@contoh.id:{p}" for i, p in enumerate(block)) + "\n")
+    
+    for workers in sorted({1, os.cpu_count() or 1}):
+        report, _ = timed(audit_dump, dump_path, workers=workers, separator=":")
+        print(f"{workers} worker  : {report.lines_per_second:,.0f} baris/detik")
+    
+    # Memory parent tetap konstan walaupun dump 4x lebih besar
+    for multiplier in (1, 4):
+        if multiplier > 1:
+            with open(dump_path, "rb") as src:
+                data = src.read()
+            with open(dump_path, "ab") as dst:
+                for _ in range(multiplier - 1):
+                    dst.write(data)
+        tracemalloc.start()
+        audit_dump(dump_path, workers=1, separator=":")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Peak memory {multiplier}x ({AUDIT_LINES * multiplier:,} baris): {peak / 1e6:,.1f} MB")
+
+print("\n[BENCH 16] Strength Service - Micro-batching vs Request Tunggal")
+print("-" * 60)
+
+import asyncio
+import json
+import subprocess
+from strength_service import StrengthService, DEFAULT_MAX_BATCH
+
+SERVICE_CLIENTS = 64
+SERVICE_REQUESTS = 20
+
+async def service_client(port, client_id):
+    """Satu client keep-alive yang mengirim SERVICE_REQUESTS request /check berurutan"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for i in range(SERVICE_REQUESTS):
+        body = json.dumps({"password": f"Client{client_id}-Pass{i}!"}).encode()
+        writer.write(b"POST /check HTTP/1.1\r\nContent-Length: %d\r\n\r\n" % len(body) + body)
+        await writer.drain()
+        length = 0
+        while (line := await reader.readline()) != b"\r\n":
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        await reader.readexactly(length)
+    writer.close()
+
+async def service_load(max_batch):
+    service = StrengthService(max_batch=max_batch)
+    server = await service.start("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        start = time.perf_counter()
+        await asyncio.gather(*(service_client(port, c) for c in range(SERVICE_CLIENTS)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await service.close()
+    return service.stats()["endpoints"]["/check"], elapsed
+
+cli_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+_, spawn_time = timed(lambda: [subprocess.run([sys.executable, cli_path, "check", "Rahasia123!"],
+                                              capture_output=True) for _ in range(5)])
+print(f"Spawn cli.py per request : {spawn_time / 5 * 1000:,.1f} ms/request")
+
+total_requests = SERVICE_CLIENTS * SERVICE_REQUESTS
+for max_batch in (1, DEFAULT_MAX_BATCH):
+    endpoint, elapsed = asyncio.run(service_load(max_batch))
+    latency, batching = endpoint["latency"], endpoint["batching"]
+    print(f"Service max_batch={max_batch:<3}: {total_requests / elapsed:,.0f} request/detik, "
+          f"p50 {latency['p50_ms']:.1f} ms, p99 {latency['p99_ms']:.1f} ms, "
+          f"rata-rata batch {batching['mean_batch']:.1f}")
+
+print("\n[BENCH 17] Policy Engine - Fused Checker vs Regex per Rule")
+print("-" * 60)
+
+import random
+import re
+from policy_engine import PolicySet, compile_policy
+from password_generator import generate_passwords
+
+POLICY_COUNT = 20
+POLICY_PASSWORDS = 20_000
+bench_random = random.Random(42)
+banned_pool = [f"kata{i}" for i in range(500)] + ["password", "admin", "qwerty", "rahasia"]
+policy_specs = [{"name": f"tenant{i}", "min_length": bench_random.choice((8, 10, 12)),
+                 "required": bench_random.sample(["uppercase", "lowercase", "numbers", "symbols"], 2),
+                 "max_repeat": bench_random.choice((2, 3)),
+                 "banned_substrings": bench_random.sample(banned_pool, 50)}
+                for i in range(POLICY_COUNT)]
+policy_passwords = generate_passwords(POLICY_PASSWORDS // 2, 12) + \
+    [bench_random.choice(banned_pool) + str(i) for i in range(POLICY_PASSWORDS // 2)]
+class_patterns = {"uppercase": re.compile(r"[A-Z]"), "lowercase": re.compile(r"[a-z]"),
+                  "numbers": re.compile(r"[0-9]"), "symbols": re.compile(r"[^A-Za-z0-9]")}
+
+def naive_check(spec, password):
+    """Evaluasi per rule: satu scan (regex / substring) per rule, semua rule dicek"""
+    lower = password.lower()
+    rules = (len(password) >= spec["min_length"],
+             all([class_patterns[name].search(password) for name in spec["required"]]),
+             not re.search(r"(.)\1{%d}" % spec["max_repeat"], password),
+             not any([word in lower for word in spec["banned_substrings"]]))
+    return all(rules)
+
+_, compile_time = timed(lambda: [compile_policy(spec) for spec in policy_specs])
+_, cached_time = timed(lambda: [compile_policy(spec) for spec in policy_specs])
+print(f"Compile {POLICY_COUNT} policy: {compile_time * 1000:,.1f} ms "
+      f"(dari cache: {cached_time * 1000:,.2f} ms)")
+
+sample = policy_passwords[:2000]
+naive_results, naive_time = timed(lambda: [[naive_check(spec, p) for spec in policy_specs]
+                                           for p in sample])
+policy_set = PolicySet(policy_specs)
+fused_results, fused_time = timed(lambda: [[not r.violations for r in policy_set.evaluate(p)]
+                                           for p in sample])
+assert naive_results == fused_results
+print(f"{len(sample):,} password x {POLICY_COUNT} policy: regex per rule {naive_time:.3f}s, "
+      f"PolicySet {fused_time:.3f}s ({naive_time / fused_time:.1f}x)")
+
+single = compile_policy(policy_specs[0])
+_, naive_batch_time = timed(lambda: [naive_check(policy_specs[0], p) for p in policy_passwords])
+batch, batch_time = timed(single.evaluate_many, policy_passwords)
+print(f"Batch {POLICY_PASSWORDS:,} password x 1 policy: regex per rule "
+      f"{POLICY_PASSWORDS / naive_batch_time:,.0f}/s, evaluate_many "
+      f"{POLICY_PASSWORDS / batch_time:,.0f}/s ({naive_batch_time / batch_time:.1f}x)")
+
+print("\n[BENCH 18] Corpus Analyzer - MinHash/LSH vs Perbandingan Berpasangan")
+print("-" * 60)
+
+from corpus_analyzer import CorpusAnalyzer
+
+CORPUS_SIZE = 100_000
+corpus_random = random.Random(7)
+corpus_bases = ["summer", "kucing", "rahasia", "jakarta", "garuda", "merdeka", "sayang", "bandung"]
+corpus = generate_passwords(CORPUS_SIZE // 2, 12) + \
+    [corpus_random.choice(corpus_bases).capitalize() + str(corpus_random.randint(1990, 2030))
+     + corpus_random.choice(("", "!", "#", "123")) for _ in range(CORPUS_SIZE // 2)]
+corpus_random.shuffle(corpus)
+
+def ngrams(password, n=3):
+    text = password.lower()
+    return {text[i:i + n] for i in range(max(len(text) - n + 1, 1))}
+
+def pairwise_pairs(passwords, threshold):
+    """Jaccard n-gram eksak untuk semua pasangan (kuadratik)"""
+    grams = [ngrams(p) for p in passwords]
+    return {(a, b) for a in range(len(grams)) for b in range(a + 1, len(grams))
+            if len(grams[a] & grams[b]) / len(grams[a] | grams[b]) >= threshold}
+
+analyzer = CorpusAnalyzer()
+_, add_time = timed(analyzer.add_many, corpus)
+clusters, cluster_time = timed(analyzer.clusters)
+print(f"Index {CORPUS_SIZE:,} password: {CORPUS_SIZE / add_time:,.0f}/s, "
+      f"{analyzer.memory_bytes / len(analyzer):.0f} byte/password "
+      f"(10 juta ~ {analyzer.memory_bytes / len(analyzer) * 1e7 / 2 ** 20:,.0f} MB)")
+print(f"Clustering LSH: {cluster_time:.2f}s, {len(clusters):,} cluster "
+      f"(terbesar {len(clusters[0]):,} password)")
+
+sample = corpus[:1500]
+exact, pairwise_time = timed(pairwise_pairs, sample, 0.6)
+sample_analyzer = CorpusAnalyzer()
+sample_analyzer.add_many(sample)
+groups = {i: n for n, cluster in enumerate(sample_analyzer.clusters()) for i in cluster}
+recall = sum(groups.get(a, -1) == groups.get(b, -2) for a, b in exact) / (len(exact) or 1)
+pairs_total = CORPUS_SIZE * (CORPUS_SIZE - 1) / 2
+estimate = pairwise_time * pairs_total / (len(sample) * (len(sample) - 1) / 2)
+print(f"Berpasangan {len(sample):,} password: {pairwise_time:.2f}s "
+      f"(perkiraan {CORPUS_SIZE:,}: {estimate / 60:,.0f} menit, {estimate / (add_time + cluster_time):,.0f}x LSH)")
+print(f"Recall LSH terhadap pasangan Jaccard >= 0.6: {recall:.1%} ({len(exact):,} pasangan)")
+
+print("\n[BENCH 19] Export - Satu File per Password vs Bulk Streaming")
+print("-" * 60)
+
+import tempfile
+from file_export import export_to_file, export_many
+from strength_checker import check_password_strength_many
+
+PER_FILE_COUNT = 2_000
+BULK_COUNT = 100_000
+export_passwords = generate_passwords(BULK_COUNT, 16)
+export_batch = check_password_strength_many(export_passwords)
+export_records = [(p, export_batch[i], "Huruf Besar, Huruf Kecil, Angka, Simbol")
+                  for i, p in enumerate(export_passwords)]
+
+def per_file_export(records):
+    paths = [export_to_file(password, info, rules) for password, info, rules in records]
+    for path in paths:
+        os.remove(path)
+
+_, per_file_time = timed(per_file_export, export_records[:PER_FILE_COUNT])
+per_file_rate = PER_FILE_COUNT / per_file_time
+print(f"export_to_file, {PER_FILE_COUNT:,} file: {per_file_rate:,.0f} password/s")
+
+with tempfile.TemporaryDirectory() as export_dir:
+    for fmt in ("txt", "csv", "jsonl"):
+        (path, _), bulk_time = timed(export_many, export_records, fmt, output_dir=export_dir)
+        print(f"export_many {fmt:<5}, {BULK_COUNT:,} record: {BULK_COUNT / bulk_time:,.0f} password/s "
+              f"({BULK_COUNT / bulk_time / per_file_rate:.1f}x), {os.path.getsize(path) / 2 ** 20:,.1f} MB")
+    (_, _), fsync_time = timed(export_many, export_records, "csv", output_dir=export_dir,
+                               flush_every=10_000, fsync=True)
+    print(f"export_many csv + fsync per 10.000: {BULK_COUNT / fsync_time:,.0f} password/s")
+
+print("\n[BENCH 20] Export Binary .pwx vs CSV - Akses Baris & Filter")
+print("-" * 60)
+
+import csv
+import itertools
+from file_export import PwxReader
+
+PWX_COUNT = 500_000
+pwx_passwords = generate_passwords(PWX_COUNT // 2, 16) + generate_passwords(PWX_COUNT // 2, 6)
+pwx_batch = check_password_strength_many(pwx_passwords)
+pwx_records = [(p, pwx_batch[i], "rules") for i, p in enumerate(pwx_passwords)]
+
+with tempfile.TemporaryDirectory() as pwx_dir:
+    (csv_path, _), csv_write = timed(export_many, pwx_records, "csv", output_dir=pwx_dir)
+    (pwx_path, _), pwx_write = timed(export_many, pwx_records, "pwx", output_dir=pwx_dir)
+    print(f"Tulis {PWX_COUNT:,} baris: CSV {csv_write:.2f}s ({os.path.getsize(csv_path) / 2 ** 20:.1f} MB), "
+          f".pwx {pwx_write:.2f}s ({os.path.getsize(pwx_path) / 2 ** 20:.1f} MB)")
+    
+    target = PWX_COUNT - 10
+    def csv_row(n):
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            return next(itertools.islice(csv.reader(f), n + 1, None))
+    def pwx_row(n):
+        with PwxReader(pwx_path) as reader:
+            return reader[n][0]
+    csv_value, csv_row_time = timed(csv_row, target)
+    pwx_value, pwx_row_time = timed(pwx_row, target)
+    assert csv_value[0] == pwx_value
+    print(f"Buka + baris ke-{target:,}: CSV {csv_row_time * 1000:,.1f} ms, "
+          f".pwx {pwx_row_time * 1000:,.3f} ms ({csv_row_time / pwx_row_time:,.0f}x)")
+    
+    def csv_filter():
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            rows = csv.reader(f)
+            next(rows)
+            return [i for i, row in enumerate(rows) if int(row[2]) < 90]
+    def pwx_filter():
+        with PwxReader(pwx_path) as reader:
+            return list(reader.scan(max_score=89))
+    csv_hits, csv_filter_time = timed(csv_filter)
+    pwx_hits, pwx_filter_time = timed(pwx_filter)
+    assert csv_hits == pwx_hits
+    print(f"Filter skor < 90 ({len(pwx_hits):,} baris): CSV {csv_filter_time:.3f}s, "
+          f".pwx {pwx_filter_time:.3f}s ({csv_filter_time / pwx_filter_time:,.0f}x)")
+
+print("\n[BENCH 21] Export Writer Background vs Export Sinkron")
+print("-" * 60)
+
+from datetime import datetime
+from file_export import AtomicExportFile, _format_text_report
+from export_writer import ExportWriter
+
+WRITER_COUNT = 1_000
+writer_result = check_password_strength("Rahasia2024!")
+
+def sync_export(directory, fsync):
+    """Export sinkron di thread caller: tulis, (fsync per file), rename"""
+    for _ in range(WRITER_COUNT):
+        atomic = AtomicExportFile(directory, encoding="utf-8")
+        atomic.file.write(_format_text_report("Rahasia2024!", writer_result, "rules",
+                                              datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        if fsync:
+            atomic.fsync()
+        atomic.commit()
+
+for fsync in (False, True):
+    with tempfile.TemporaryDirectory() as writer_dir:
+        _, sync_time = timed(sync_export, writer_dir, fsync)
+    with tempfile.TemporaryDirectory() as writer_dir:
+        writer = ExportWriter(writer_dir, fsync=fsync)
+        _, submit_time = timed(lambda: [writer.submit("Rahasia2024!", writer_result, "rules")
+                                        for _ in range(WRITER_COUNT)])
+        _, drain_time = timed(writer.flush)
+        writer.close()
+        stats = writer.stats()
+    label = "fsync" if fsync else "tanpa fsync"
+    print(f"{WRITER_COUNT:,} export ({label}): sinkron {sync_time * 1e6 / WRITER_COUNT:,.0f} us/export "
+          f"di thread caller; writer {submit_time * 1e6 / WRITER_COUNT:,.1f} us/submit, "
+          f"selesai {WRITER_COUNT / (submit_time + drain_time):,.0f} export/s "
+          f"(batch rata-rata {stats['mean_batch']:.1f}, p99 {stats['latency']['p99_ms']:.1f} ms)")
+
+print("\n[BENCH 22] Manifest Export vs Scan Folder")
+print("-" * 60)
+
+from file_export import get_export_manifest, query_exports
+from strength_checker import PasswordStrength
+
+MANIFEST_FILES = 10_000
+MANIFEST_REPEAT = 20
+
+def scan_newest(directory):
+    """Cara lama + urut terbaru: listdir, filter ekstensi, stat tiap file"""
+    names = [name for name in os.listdir(directory) if name.endswith((".txt", ".csv", ".jsonl", ".pwx"))]
+    return sorted(names, key=lambda name: os.stat(os.path.join(directory, name)).st_mtime_ns,
+                  reverse=True)[:50]
+
+with tempfile.TemporaryDirectory() as manifest_dir:
+    for i in range(MANIFEST_FILES):
+        with open(os.path.join(manifest_dir, f"password_{i:06d}.txt"), "w", encoding="utf-8") as f:
+            f.write(f"Password: x\nScore: {i % 101}/100\n")
+    
+    _, listdir_time = timed(lambda: [os.listdir(manifest_dir) for _ in range(MANIFEST_REPEAT)])
+    _, scan_time = timed(lambda: [scan_newest(manifest_dir) for _ in range(MANIFEST_REPEAT)])
+    _, build_time = timed(lambda: get_export_manifest(manifest_dir).refresh())
+    _, page_time = timed(lambda: [query_exports(manifest_dir) for _ in range(MANIFEST_REPEAT)])
+    _, filter_time = timed(lambda: [query_exports(manifest_dir, sort="skor_terendah",
+                                                  strengths=[PasswordStrength.WEAK])
+                                    for _ in range(MANIFEST_REPEAT)])
+    with open(os.path.join(manifest_dir, "password_new.txt"), "w", encoding="utf-8") as f:
+        f.write("Password: x\nScore: 50/100\n")
+    _, update_time = timed(lambda: query_exports(manifest_dir))
+    get_export_manifest(manifest_dir).close()
+
+print(f"{MANIFEST_FILES:,} file: listdir saja {listdir_time * 1e3 / MANIFEST_REPEAT:.1f} ms, "
+      f"listdir + urut terbaru {scan_time * 1e3 / MANIFEST_REPEAT:.1f} ms per halaman")
+print(f"Manifest: bangun pertama {build_time * 1e3:,.0f} ms, halaman terbaru "
+      f"{page_time * 1e3 / MANIFEST_REPEAT:.2f} ms, filter kekuatan + urut skor "
+      f"{filter_time * 1e3 / MANIFEST_REPEAT:.2f} ms, setelah 1 file baru {update_time * 1e3:.1f} ms")
+
+print("\n[BENCH 23] Reader Halaman (mmap + index baris) vs read_export_file")
+print("-" * 60)
+
+import tracemalloc
+from file_export import TextExportReader, iter_export_chunks, read_export_file
+
+PAGER_LINES = 2_000_000
+pager_row = "Rahasia2024!xyz,Sangat Kuat,100,True,True,True,True,True,True,,Panjang: 16\n"
+
+def peak_memory(func):
+    """(hasil, waktu, peak alokasi Python dalam MB)"""
+    tracemalloc.start()
+    result, elapsed = timed(func)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+with tempfile.TemporaryDirectory() as pager_dir:
+    pager_path = os.path.join(pager_dir, "pager.csv")
+    with open(pager_path, "w", encoding="utf-8") as f:
+        for _ in range(PAGER_LINES // 10_000):
+            f.write(pager_row * 10_000)
+    size_mb = os.path.getsize(pager_path) / 2 ** 20
+    
+    _, full_time, full_peak = peak_memory(lambda: read_export_file(pager_path))
+    _, build_time = timed(lambda: TextExportReader(pager_path).close())
+    reader, open_time = timed(TextExportReader, pager_path)
+    page, page_time, page_peak = peak_memory(lambda: reader.lines(PAGER_LINES - 200, 200))
+    assert len(page) == 200 and len(reader) == PAGER_LINES
+    reader.close()
+    _, chunk_time, chunk_peak = peak_memory(lambda: sum(map(len, iter_export_chunks(pager_path))))
+    index_kb = os.path.getsize(os.path.join(pager_dir, ".pager.csv.idx")) / 1024
+
+print(f"File {PAGER_LINES:,} baris ({size_mb:,.0f} MB): read_export_file {full_time * 1000:,.0f} ms, "
+      f"peak {full_peak:,.0f} MB")
+print(f"Reader: bangun index {build_time * 1000:,.0f} ms ({index_kb:,.0f} KB), buka lagi "
+      f"{open_time * 1000:.2f} ms, 200 baris terakhir {page_time * 1000:.2f} ms (peak {page_peak:.2f} MB)")
+print(f"Download per potongan: {chunk_time * 1000:,.0f} ms, peak {chunk_peak:.1f} MB")
+
+print("\n" + "=" * 60)
+print("BENCHMARK COMPLETE")
+print("=" * 60)
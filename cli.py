@@ -3,16 +3,44 @@ CLI Version - Password Generator & Strength Checker
 Versi command line untuk testing tanpa Streamlit
 """
 
+import argparse
+import asyncio
 import sys
 import os
+from array import array
+from concurrent.futures import TimeoutError as FutureTimeout
 
 # Add src folder ke path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from password_generator import generate_password, get_rules_summary
-from strength_checker import check_password_strength, get_strength_emoji, get_strength_color
+from password_generator import (generate_password, get_rules_summary, get_policy,
+                                get_policy_entropy, write_passwords, iter_passwords,
+                                DEFAULT_BLOCK_SIZE,
+                                MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH)
+from parallel_generator import write_passwords_parallel
+from mask_generator import compile_mask, MASK_HELP
+from passphrase_generator import (generate_passphrase, get_passphrase_entropy,
+                                  get_wordlist, CAPITALIZE_MODES, FALLBACK_WORDLIST_PATH)
+from pronounceable_generator import (generate_pronounceable, get_pronounceable_entropy,
+                                    get_model)
+from breach_checker import build_breach_db, get_breach_db, get_default_breach_db
+from pattern_analyzer import get_analyzer, DEFAULT_DICTIONARY_DIR
+from uniqueness_guard import UniquenessGuard, unique_blocks
+from entropy_pool import get_default_pool
+from strength_checker import (check_password_strength, get_strength_emoji, get_strength_color,
+                              CRITERIA, STRENGTH_LEVELS)
+from strength_cache import StrengthCache, DEFAULT_MAX_ENTRIES
+from incremental_checker import IncrementalChecker
+from dump_auditor import audit_dump, DEFAULT_CHUNK_BYTES, DEFAULT_TOP
+from strength_service import (StrengthService, DEFAULT_HOST, DEFAULT_PORT,
+                              DEFAULT_MAX_BATCH, DEFAULT_MAX_WAIT, DEFAULT_MAX_PENDING)
+from policy_engine import PolicySet, load_policy
+from corpus_analyzer import CorpusAnalyzer, iter_corpus, DEFAULT_THRESHOLD
+from crack_estimator import ATTACK_MODELS, format_duration
 from input_validator import validate_password_length, get_user_input_with_retry, validate_yes_no
-from file_export import export_to_file, list_exports, read_export_file
+from file_export import (export_many, list_exports, read_export_file, get_text_reader,
+                         PwxReader, EXPORT_FORMATS)
+from export_writer import get_default_writer
 
 # ANSI Colors
 RESET = "\033[0m"
@@ -23,6 +51,9 @@ RED = "\033[91m"
 BLUE = "\033[94m"
 CYAN = "\033[96m"
 
+# Lama maksimal menu export menunggu path file dari writer background
+EXPORT_WAIT_SECONDS = 0.5
+
 
 def print_header(text):
     """Print header dengan styling"""
@@ -60,10 +91,11 @@ def menu_generate_password():
     print_section("1. Tentukan Panjang Password")
     
     def validator(input_str):
-        return validate_password_length(input_str, min_length=4, max_length=128)
+        return validate_password_length(input_str, min_length=MIN_PASSWORD_LENGTH,
+                                        max_length=MAX_PASSWORD_LENGTH)
     
     length_str = get_user_input_with_retry(
-        f"{CYAN}Masukkan panjang password (4-128): {RESET}",
+        f"{CYAN}Masukkan panjang password ({MIN_PASSWORD_LENGTH}-{MAX_PASSWORD_LENGTH}): {RESET}",
         validator_func=validator,
         max_retries=3
     )
@@ -101,19 +133,23 @@ def menu_generate_password():
     )
     use_symbols = use_symbols == "True"
     
+    exclude_ambiguous = get_user_input_with_retry(
+        f"{CYAN}Hindari karakter ambigu (Il1|O0o)? [y/n]: {RESET}",
+        validator_func=lambda x: validate_yes_no(x),
+        max_retries=2
+    )
+    exclude_ambiguous = exclude_ambiguous == "True"
+    
     # Generate password
     print_section("3. Generate Password")
     
     try:
-        password = generate_password(
-            length=length,
-            use_uppercase=use_uppercase,
-            use_lowercase=use_lowercase,
-            use_numbers=use_numbers,
-            use_symbols=use_symbols
-        )
+        policy = get_policy(use_uppercase, use_lowercase, use_numbers, use_symbols,
+                            exclude_ambiguous=exclude_ambiguous)
         
-        rules = get_rules_summary(use_uppercase, use_lowercase, use_numbers, use_symbols)
+        password = generate_password(length=length, policy=policy)
+        
+        rules = get_rules_summary(policy=policy)
         
         # Display result
         print_section("4. Hasil")
@@ -130,7 +166,8 @@ def menu_generate_password():
         
         # Check strength
         print_section("5. Analisis Kekuatan")
-        strength_result = check_password_strength(password)
+        strength_result = check_password_strength(
+            password, entropy_bits=get_policy_entropy(len(password), policy=policy))
         display_strength(password, strength_result)
         
         # Export option
@@ -142,11 +179,7 @@ def menu_generate_password():
         )
         
         if export_choice == "True":
-            try:
-                filepath = export_to_file(password, strength_result, rules)
-                print_success(f"File berhasil disimpan: {filepath}\n")
-            except IOError as e:
-                print_error(f"Gagal menyimpan file: {str(e)}\n")
+            export_in_background(password, strength_result, rules)
         
         # Retry option
         retry = get_user_input_with_retry(
@@ -166,14 +199,16 @@ def menu_check_strength():
     """Menu untuk check password strength"""
     print_header("📊 PASSWORD STRENGTH CHECKER")
     
-    password = input(f"{CYAN}Masukkan password untuk dicek: {RESET}").strip()
+    checker = IncrementalChecker(get_analyzer(), get_default_breach_db())
+    password = read_password_live(checker, f"{CYAN}Masukkan password untuk dicek: {RESET}").strip()
     
     if not password:
         print_error("Password tidak boleh kosong!")
         return
     
     print_section("Analisis Kekuatan")
-    result = check_password_strength(password)
+    checker.set_text(password)
+    result = checker.result()
     display_strength(password, result)
     
     # Export option
@@ -185,17 +220,30 @@ def menu_check_strength():
     )
     
     if export_choice == "True":
-        try:
-            filepath = export_to_file(password, result, "Password dari Strength Checker")
-            print_success(f"File berhasil disimpan: {filepath}\n")
-        except IOError as e:
-            print_error(f"Gagal menyimpan file: {str(e)}\n")
+        export_in_background(password, result, "Password dari Strength Checker")
+
+
+def export_in_background(password, result, rules):
+    """
+    Antrekan export ke writer background; path ditampilkan jika selesai
+    dalam EXPORT_WAIT_SECONDS, selain itu export lanjut di background
+    (export yang masih antre tetap ditulis sebelum program keluar)
+    """
+    future = get_default_writer().submit(password, result, rules)
+    try:
+        print_success(f"File berhasil disimpan: {future.result(timeout=EXPORT_WAIT_SECONDS)}\n")
+    except FutureTimeout:
+        print_info("Export diantre, file disimpan di background\n")
+    except IOError as e:
+        print_error(f"Gagal menyimpan file: {str(e)}\n")
 
 
 def menu_view_exports():
     """Menu untuk lihat file exports"""
     print_header("📁 HISTORY EXPORTS")
     
+    # Export yang masih antre ditunggu sebentar supaya ikut terdaftar
+    get_default_writer().flush(timeout=2.0)
     output_dir = os.path.join(os.path.dirname(__file__), "output")
     exports = list_exports(output_dir)
     
@@ -216,10 +264,20 @@ def menu_view_exports():
         if choice.isdigit() and 1 <= int(choice) <= len(exports):
             selected = exports[int(choice) - 1]
             filepath = os.path.join(output_dir, selected)
-            content = read_export_file(filepath)
             
             print_section("Isi File")
-            print(content)
+            if selected.endswith(EXPORT_FORMATS["pwx"]):
+                print(read_export_file(filepath))
+            else:
+                # Export teks ditampilkan per halaman (file di-mmap, bukan dibaca utuh)
+                reader = get_text_reader(filepath)
+                pages = reader.pages()
+                for page in range(1, pages + 1):
+                    print(reader.page(page))
+                    if page < pages and input(
+                            f"{CYAN}-- halaman {page}/{pages}, Enter untuk lanjut, q untuk berhenti --{RESET}"
+                            ).strip().lower() == "q":
+                        break
         else:
             print_error("Pilihan tidak valid!")
     
@@ -227,6 +285,54 @@ def menu_view_exports():
         print_error(f"Error: {str(e)}")
 
 
+def read_password_live(checker, prompt):
+    """
+    Baca password per ketikan sambil menampilkan live strength meter.
+    
+    Setiap ketikan hanya memperbarui state IncrementalChecker (append atau
+    backspace). Jika terminal tidak mendukung mode per karakter (Windows
+    atau stdin bukan TTY), fallback ke input() biasa.
+    """
+    try:
+        import termios
+    except ImportError:
+        termios = None
+    
+    if termios is None or not sys.stdin.isatty():
+        password = input(prompt)
+        checker.set_text(password)
+        return password
+    
+    fd = sys.stdin.fileno()
+    original = termios.tcgetattr(fd)
+    raw = termios.tcgetattr(fd)
+    raw[3] &= ~(termios.ECHO | termios.ICANON)
+    checker.clear()
+    
+    try:
+        termios.tcsetattr(fd, termios.TCSADRAIN, raw)
+        while True:
+            result = checker.result()
+            strength = result['strength']
+            meter = (f"{get_strength_color(strength)}{get_strength_emoji(strength)} "
+                     f"{strength.value} ({result['score']}/100){RESET}") if len(checker) else ""
+            sys.stdout.write(f"\r\033[K{prompt}{'*' * len(checker)}  {meter}")
+            sys.stdout.flush()
+            
+            char = sys.stdin.read(1)
+            if char in ("", "\n", "\r", "\x04"):
+                break
+            if char in ("\x7f", "\x08"):
+                checker.backspace()
+            elif char.isprintable():
+                checker.append(char)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, original)
+        print()
+    
+    return checker.text
+
+
 def display_strength(password, result):
     """Display strength analysis"""
     strength = result['strength']
@@ -236,7 +342,9 @@ def display_strength(password, result):
     
     print(f"\n{color}{BOLD}Level Kekuatan: {emoji} {strength.value}{RESET}")
     print(f"{color}Skor: {score}/100{RESET}")
-    print(f"{CYAN}Panjang: {len(password)} karakter{RESET}\n")
+    print(f"{CYAN}Panjang: {len(password)} karakter{RESET}")
+    source = "policy generator" if result['entropy_source'] == "generator" else "jenis karakter"
+    print(f"{CYAN}Entropy: {result['entropy_bits']:.1f} bit (dari {source}){RESET}\n")
     
     # Progress bar
     progress = int((score / 100) * 30)
@@ -260,6 +368,19 @@ def display_strength(password, result):
         symbol = f"{GREEN}✓{RESET}" if status else f"{RED}✗{RESET}"
         print(f"  {symbol} {criterion}")
     
+    print(f"\n{BOLD}Perkiraan Waktu Crack:{RESET}")
+    crack_times = result['crack_times']
+    for key, label, _ in ATTACK_MODELS:
+        print(f"  {label}: {format_duration(crack_times[key])}")
+    
+    if result.get('breached'):
+        print(f"\n{RED}{BOLD}⚠ Password ditemukan di data kebocoran!{RESET}")
+    
+    if 'guesses_log10' in result:
+        print(f"\n{BOLD}Perkiraan Tebakan:{RESET} ~10^{result['guesses_log10']:.1f}")
+        for match in result['patterns']:
+            print(f"  {YELLOW}•{RESET} {match.pattern}: '{match.token}' (~10^{match.guesses_log10:.1f})")
+    
     # Recommendations
     print()
     if result['feedback']:
@@ -337,12 +458,560 @@ def show_info():
   • File I/O
 
 """
-    
+
     print(info_text)
     input(f"{CYAN}Tekan Enter untuk kembali...{RESET}")
 
 
+def add_rule_arguments(parser):
+    """Tambahkan flag rules karakter ke parser subcommand"""
+    parser.add_argument("--no-uppercase", action="store_true", help="Tanpa huruf besar (A-Z)")
+    parser.add_argument("--no-lowercase", action="store_true", help="Tanpa huruf kecil (a-z)")
+    parser.add_argument("--no-numbers", action="store_true", help="Tanpa angka (0-9)")
+    parser.add_argument("--no-symbols", action="store_true", help="Tanpa simbol (!@#$%%^&*)")
+    parser.add_argument("--min-per-class", type=int, default=1,
+                        help="Jumlah minimal karakter untuk tiap kelas aktif")
+    parser.add_argument("--exclude", default="", help="Karakter yang tidak boleh dipakai")
+    parser.add_argument("--exclude-ambiguous", action="store_true",
+                        help="Hindari karakter ambigu (Il1|O0o)")
+
+
+def build_policy(args):
+    """Bangun GenerationPolicy dari flag rules subcommand"""
+    return get_policy(
+        use_uppercase=not args.no_uppercase,
+        use_lowercase=not args.no_lowercase,
+        use_numbers=not args.no_numbers,
+        use_symbols=not args.no_symbols,
+        min_per_class=args.min_per_class,
+        exclude_chars=args.exclude,
+        exclude_ambiguous=args.exclude_ambiguous,
+    )
+
+
+def command_generate(args):
+    """Subcommand generate: stream password ke stdout atau file"""
+    policy = build_policy(args)
+    count = args.count if args.count > 0 else None
+    
+    if args.workers is not None and count is None:
+        raise ValueError("Mode paralel (--workers) membutuhkan --count > 0")
+    if args.workers is not None and args.unique:
+        raise ValueError("--unique belum bisa digabung dengan --workers")
+    if args.export and (count is None or args.workers is not None):
+        raise ValueError("--export membutuhkan --count > 0 dan tidak bisa digabung dengan --workers")
+    
+    guard = UniquenessGuard(args.unique) if args.unique else None
+    
+    if args.export:
+        try:
+            return export_generated(args, policy, count, guard)
+        finally:
+            if guard is not None:
+                guard.close()
+    
+    def write(stream):
+        if args.workers is not None:
+            return write_passwords_parallel(stream, count, args.length,
+                                            workers=args.workers, policy=policy)
+        return write_passwords(stream, args.length, count,
+                               block_size=args.block_size, policy=policy, guard=guard)
+    
+    try:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", buffering=1 << 20) as f:
+                written = write(f)
+            print_success(f"{written} password ditulis ke {args.output}")
+        else:
+            write(sys.stdout)
+            sys.stdout.flush()
+    finally:
+        if guard is not None:
+            guard.close()
+    
+    if args.stats:
+        print_pool_stats()
+    return 0
+
+
+def export_generated(args, policy, count, guard):
+    """Generate password beserta hasil strength check ke satu file CSV/JSONL/teks"""
+    entropy = policy.entropy_bits(args.length)
+    rules = policy.summary()
+    passwords = iter_passwords(args.length, count, block_size=args.block_size,
+                               policy=policy, guard=guard)
+    records = ((password, check_password_strength(password, entropy_bits=entropy), rules)
+               for password in passwords)
+    
+    output_dir = filename = None
+    if args.output:
+        output_dir, filename = os.path.split(os.path.abspath(args.output))
+    filepath, written = export_many(records, args.export, filename, output_dir,
+                                    flush_every=args.flush_every, fsync=args.fsync)
+    print_success(f"{written} password ditulis ke {filepath}")
+    
+    if args.stats:
+        print_pool_stats()
+    return 0
+
+
+def command_query(args):
+    """Subcommand query: baca baris atau filter file export binary .pwx"""
+    levels = {level.value.lower(): level for level in STRENGTH_LEVELS}
+    bits = {key: bit for key, bit, _, _ in CRITERIA}
+    strengths = None
+    if args.strength:
+        unknown = [name for name in args.strength if name.lower() not in levels]
+        if unknown:
+            raise ValueError(f"Strength tidak dikenal: {', '.join(unknown)} "
+                             f"(pilihan: {', '.join(level.value for level in STRENGTH_LEVELS)})")
+        strengths = [levels[name.lower()] for name in args.strength]
+    required = args.require or []
+    for key in required:
+        if key not in bits:
+            raise ValueError(f"Kriteria tidak dikenal: {key} (pilihan: {', '.join(bits)})")
+    
+    with PwxReader(args.input) as reader:
+        if args.row is not None:
+            if not 0 <= args.row < len(reader):
+                raise ValueError(f"Baris {args.row} di luar jangkauan (0-{len(reader) - 1})")
+            rows = [args.row]
+        else:
+            rows = reader.scan(args.min_score, args.max_score, strengths,
+                               sum(bits[key] for key in required), args.pattern)
+        
+        if args.count:
+            print(sum(1 for _ in rows))
+            return 0
+        
+        shown = 0
+        for i in rows:
+            if args.limit and shown >= args.limit:
+                break
+            password, result, rules = reader[i]
+            print(f"{i}\t{result.score}\t{result.strength.value}\t{password}")
+            shown += 1
+    return 0
+
+
+def print_pool_stats():
+    """Tampilkan counter EntropyPool ke stderr (stdout tetap bersih untuk pipe)"""
+    stats = get_default_pool().stats()
+    print(f"Entropy pool: {stats['refills']} refill, {stats['bytes_served']:,} byte, "
+          f"rejection rate {stats['rejection_rate']:.2%}", file=sys.stderr)
+
+
+def command_passphrase(args):
+    """Subcommand passphrase: generate passphrase Diceware dari wordlist"""
+    wordlist = get_wordlist(args.wordlist)
+    if wordlist.path == os.path.abspath(FALLBACK_WORDLIST_PATH):
+        print(f"Wordlist data/wordlist.txt tidak ada, memakai kamus bawaan ({len(wordlist):,} kata)",
+              file=sys.stderr)
+    options = {
+        "word_count": args.words,
+        "capitalize": args.capitalize,
+        "inject_digit": args.digit,
+        "wordlist": wordlist,
+    }
+    entropy = get_passphrase_entropy(**options)
+    
+    for _ in range(args.count):
+        passphrase = generate_passphrase(separator=args.separator, **options)
+        print(passphrase)
+        if args.check:
+            display_strength(passphrase, check_password_strength(passphrase, entropy_bits=entropy))
+    
+    if args.check:
+        print_info(f"Wordlist: {len(wordlist):,} kata, entropy: {entropy:.1f} bit")
+    return 0
+
+
+def command_pronounce(args):
+    """Subcommand pronounce: generate password yang mudah diucapkan"""
+    model = get_model(args.corpus)
+    options = {"length": args.length, "digits": args.digits, "model": model}
+    entropy = get_pronounceable_entropy(**options)
+    
+    for _ in range(args.count):
+        password = generate_pronounceable(capitalize=not args.lowercase, **options)
+        print(password)
+        if args.check:
+            display_strength(password, check_password_strength(password, entropy_bits=entropy))
+    
+    if args.check:
+        print_info(f"Entropy model: {entropy:.1f} bit")
+    return 0
+
+
+def command_mask(args):
+    """Subcommand mask: generate password dari template posisi"""
+    custom = {key: value for key, value in
+              (("1", args.charset1), ("2", args.charset2),
+               ("3", args.charset3), ("4", args.charset4)) if value}
+    plan = compile_mask(args.mask, custom)
+    
+    if args.keyspace:
+        print(f"Keyspace: {plan.keyspace:,} ({plan.entropy_bits:.1f} bit)")
+        return 0
+    
+    guard = UniquenessGuard(args.unique) if args.unique else None
+    blocks = plan.iter_blocks(args.count)
+    if guard is not None:
+        blocks = unique_blocks(blocks, guard, plan.generate)
+    
+    try:
+        for block in blocks:
+            sys.stdout.write("\n".join(block))
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+    finally:
+        if guard is not None:
+            guard.close()
+    return 0
+
+
+def command_check(args):
+    """Subcommand check: analisis kekuatan password dari argumen atau stdin"""
+    breach_db = get_breach_db(args.breach_db) if args.breach_db else get_default_breach_db()
+    analyzer = get_analyzer(args.dictionaries)
+    passwords = args.passwords or (line.rstrip("\r\n") for line in sys.stdin)
+    # Dump kredensial sering berisi password yang sama berulang kali
+    cache = StrengthCache(max_entries=args.cache_size, ttl=None)
+    
+    for password in passwords:
+        if not password:
+            continue
+        display_strength(password, cache.check(password, breach_db=breach_db,
+                                               pattern_analyzer=analyzer))
+    return 0
+
+
+def command_live(args):
+    """Subcommand live: strength meter as-you-type, Enter untuk analisis lengkap"""
+    breach_db = get_breach_db(args.breach_db) if args.breach_db else get_default_breach_db()
+    checker = IncrementalChecker(get_analyzer(args.dictionaries), breach_db)
+    
+    while True:
+        password = read_password_live(checker, f"{CYAN}Password (Enter kosong = selesai): {RESET}")
+        if not password:
+            return 0
+        display_strength(password, checker.result())
+
+
+def command_audit(args):
+    """Subcommand audit: audit kekuatan semua password di file dump kredensial"""
+    breach_db = args.breach_db
+    if breach_db is None and get_default_breach_db() is not None:
+        breach_db = get_default_breach_db().path
+    
+    def progress(report):
+        sys.stderr.write(f"\r\033[K{report.lines:,} baris ({report.lines_per_second:,.0f} baris/detik)")
+        sys.stderr.flush()
+    
+    report = audit_dump(args.input, workers=args.workers,
+                        chunk_bytes=args.chunk_size * 1024 * 1024,
+                        separator=args.separator, breach_db_path=breach_db,
+                        dictionaries=args.dictionaries, top=args.top,
+                        progress=progress if not args.quiet else None)
+    if not args.quiet:
+        sys.stderr.write("\n")
+    print(report.format())
+    return 0
+
+
+def command_policy(args):
+    """Subcommand policy: cek password terhadap satu atau beberapa policy JSON/TOML"""
+    policies = PolicySet(load_policy(path) for path in args.policy)
+    passwords = args.passwords or (line.rstrip("\r\n") for line in sys.stdin)
+    
+    if args.summary:
+        # Mode batch: hanya jumlah per policy, password tidak ditampilkan
+        passwords = [password for password in passwords if password]
+        for policy in policies.policies:
+            batch = policy.evaluate_many(passwords)
+            print_info(f"{policy.name}: {batch.passed_count:,}/{len(batch):,} lolos")
+            for rule, count in batch.rule_counts().items():
+                if count:
+                    print(f"    {rule:<18}: {count:,}")
+        return 0
+    
+    failed = 0
+    for password in passwords:
+        if not password:
+            continue
+        print(f"\n{BOLD}{password}{RESET}")
+        for result in policies.evaluate(password):
+            if result.passed:
+                print_success(f"{result.policy.name}: lolos")
+                continue
+            failed += 1
+            print_error(f"{result.policy.name}: tidak lolos")
+            for message in result.messages:
+                print(f"    • {message}")
+            if "banned_substrings" in result.failed_rules:
+                print(f"      ({', '.join(result.policy.find_banned(password))})")
+    # Exit code 1 jika ada yang tidak lolos, supaya bisa dipakai di script
+    return 1 if failed else 0
+
+
+def command_similar(args):
+    """Subcommand similar: cari cluster password mirip dan password dipakai ulang"""
+    analyzer = CorpusAnalyzer(threshold=args.threshold)
+    line_numbers = array("I")
+    for line_no, _, password in iter_corpus(args.input, args.separator):
+        analyzer.add(password)
+        line_numbers.append(line_no)
+    
+    clusters = analyzer.clusters()
+    reused = analyzer.reuse_groups()
+    print_info(f"{len(analyzer):,} password, {len(clusters):,} cluster mirip, "
+               f"{len(reused):,} password dipakai ulang")
+    
+    shown = clusters[:args.top]
+    # Akun/password dibaca ulang dari file hanya untuk cluster yang ditampilkan
+    wanted = {line_numbers[i] for cluster in shown for i in cluster}
+    rows = {line_no: (account, password)
+            for line_no, account, password in iter_corpus(args.input, args.separator)
+            if line_no in wanted}
+    
+    for number, cluster in enumerate(shown, 1):
+        print(f"\n{BOLD}Cluster {number}{RESET} ({len(cluster)} password)")
+        for i in cluster:
+            account, password = rows[line_numbers[i]]
+            label = f"baris {line_numbers[i]:,}" + (f" ({account})" if account else "")
+            print(f"    {label}" + (f": {password}" if args.show_passwords else ""))
+    return 0
+
+
+def command_serve(args):
+    """Subcommand serve: service HTTP JSON lokal untuk generate dan strength check"""
+    breach_db = args.breach_db
+    if breach_db is None and get_default_breach_db() is not None:
+        breach_db = get_default_breach_db().path
+    dictionaries = None if args.no_patterns else (args.dictionaries or DEFAULT_DICTIONARY_DIR)
+    service = StrengthService(workers=args.workers, max_batch=args.max_batch,
+                              max_wait=args.max_wait / 1000, max_pending=args.max_pending,
+                              breach_db_path=breach_db, dictionaries=dictionaries)
+    
+    async def run():
+        server = await service.start(args.host, args.port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print_success(f"Service berjalan di http://{host}:{port} ({service.workers} worker)")
+        print_info("Endpoint: POST /check, POST /generate, GET /stats, GET /health "
+                   "(Ctrl+C untuk berhenti)")
+        try:
+            await server.serve_forever()
+        finally:
+            await service.close()
+    
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    
+    print()
+    for path, endpoint in service.stats()["endpoints"].items():
+        latency, batching = endpoint["latency"], endpoint["batching"] or {}
+        print_info(f"{path}: {latency['count']:,} request, p50 {latency['p50_ms']:.1f} ms, "
+                   f"p99 {latency['p99_ms']:.1f} ms, rata-rata batch "
+                   f"{batching.get('mean_batch', 0):.1f}, ditolak {batching.get('rejected', 0):,}")
+    return 0
+
+
+def command_build_breach_db(args):
+    """Subcommand build-breach-db: konversi dump hash SHA-1 terurut ke database biner"""
+    with open(args.input, "rb", buffering=1 << 20) as f:
+        count = build_breach_db(f, args.output)
+    print_success(f"{count:,} hash ditulis ke {args.output}")
+    return 0
+
+
+def build_parser():
+    """Bangun argument parser untuk mode non-interaktif"""
+    parser = argparse.ArgumentParser(
+        description="Password Generator & Strength Checker "
+                    "(tanpa argumen = menu interaktif)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    gen = subparsers.add_parser("generate", help="Generate password (streaming, satu per baris)")
+    gen.add_argument("-n", "--count", type=int, default=1,
+                     help="Jumlah password (0 atau kurang = tanpa batas)")
+    gen.add_argument("-l", "--length", type=int, default=16, help="Panjang password")
+    gen.add_argument("-o", "--output", help="File tujuan (default: stdout)")
+    gen.add_argument("--block-size", type=int, default=DEFAULT_BLOCK_SIZE,
+                     help="Jumlah password per blok streaming")
+    gen.add_argument("-w", "--workers", type=int,
+                     help="Generate paralel dengan N worker process")
+    gen.add_argument("--unique", metavar="BLOOM_FILE",
+                     help="Jangan pernah issue password yang sama (Bloom filter persisten)")
+    gen.add_argument("--stats", action="store_true",
+                     help="Tampilkan statistik entropy pool ke stderr")
+    gen.add_argument("--export", choices=EXPORT_FORMATS,
+                     help="Tulis password beserta hasil strength check ke satu file "
+                          "(default folder output/, atau -o)")
+    gen.add_argument("--flush-every", type=int,
+                     help="Mode --export: flush ke disk setiap N password")
+    gen.add_argument("--fsync", action="store_true",
+                     help="Mode --export: fsync setiap flush dan di akhir")
+    add_rule_arguments(gen)
+    gen.set_defaults(func=command_generate)
+    
+    query = subparsers.add_parser("query", help="Baca baris / filter file export binary .pwx")
+    query.add_argument("input", help="File .pwx (generate --export pwx)")
+    query.add_argument("--row", type=int, help="Ambil satu baris (indeks mulai 0)")
+    query.add_argument("--min-score", type=int, help="Skor minimal")
+    query.add_argument("--max-score", type=int, help="Skor maksimal")
+    query.add_argument("--strength", action="append",
+                       help="Level strength, misal 'Lemah' (bisa diulang)")
+    query.add_argument("--require", action="append",
+                       help="Kriteria yang harus terpenuhi, misal 'simbol' (bisa diulang)")
+    query.add_argument("--pattern", help="Regex yang dicari di password")
+    query.add_argument("--limit", type=int, default=20, help="Jumlah baris maksimal (0 = semua)")
+    query.add_argument("--count", action="store_true", help="Hanya tampilkan jumlah baris yang cocok")
+    query.set_defaults(func=command_query)
+    
+    phrase = subparsers.add_parser("passphrase", help="Generate passphrase dari wordlist (Diceware)")
+    phrase.add_argument("-n", "--count", type=int, default=1, help="Jumlah passphrase")
+    phrase.add_argument("-w", "--words", type=int, default=6, help="Jumlah kata")
+    phrase.add_argument("-s", "--separator", default="-", help="Pemisah antar kata")
+    phrase.add_argument("--capitalize", choices=CAPITALIZE_MODES, default="none",
+                        help="Mode huruf kapital")
+    phrase.add_argument("--digit", action="store_true", help="Sisipkan satu angka acak")
+    phrase.add_argument("--wordlist", help="Path wordlist (default: data/wordlist.txt)")
+    phrase.add_argument("--check", action="store_true",
+                        help="Tampilkan analisis kekuatan dan entropy")
+    phrase.set_defaults(func=command_passphrase)
+    
+    pron = subparsers.add_parser("pronounce", help="Generate password yang mudah diucapkan")
+    pron.add_argument("-n", "--count", type=int, default=1, help="Jumlah password")
+    pron.add_argument("-l", "--length", type=int, default=12, help="Jumlah huruf")
+    pron.add_argument("-d", "--digits", type=int, default=2, help="Jumlah angka di akhir")
+    pron.add_argument("--lowercase", action="store_true", help="Tanpa huruf kapital di awal")
+    pron.add_argument("--corpus", help="Path corpus kata (default: data/pronounceable_corpus.txt)")
+    pron.add_argument("--check", action="store_true",
+                      help="Tampilkan analisis kekuatan dan entropy")
+    pron.set_defaults(func=command_pronounce)
+    
+    mask = subparsers.add_parser("mask", help="Generate password dari mask (contoh: ?u?l?l?d?d?s)",
+                                 description=f"Placeholder: {MASK_HELP}")
+    mask.add_argument("mask", help="Template mask")
+    mask.add_argument("-n", "--count", type=int, default=1, help="Jumlah password")
+    for i in range(1, 5):
+        mask.add_argument(f"-{i}", f"--charset{i}", help=f"Charset custom untuk ?{i}")
+    mask.add_argument("--keyspace", action="store_true",
+                      help="Tampilkan jumlah kombinasi saja")
+    mask.add_argument("--unique", metavar="BLOOM_FILE",
+                      help="Jangan pernah issue password yang sama (Bloom filter persisten)")
+    mask.set_defaults(func=command_mask)
+    
+    check = subparsers.add_parser("check", help="Analisis kekuatan password (argumen atau stdin)")
+    check.add_argument("passwords", nargs="*",
+                       help="Password yang dicek (kosong = baca per baris dari stdin)")
+    check.add_argument("--breach-db",
+                       help="Database kebocoran (default: data/breached.sha1db jika ada)")
+    check.add_argument("--dictionaries",
+                       help="Folder kamus untuk deteksi pola (default: data/dictionaries)")
+    check.add_argument("--cache-size", type=int, default=DEFAULT_MAX_ENTRIES,
+                       help="Jumlah maksimal hasil di cache (password berulang tidak dicek ulang)")
+    check.set_defaults(func=command_check)
+    
+    live = subparsers.add_parser("live", help="Live strength meter saat mengetik password")
+    live.add_argument("--breach-db",
+                      help="Database kebocoran (default: data/breached.sha1db jika ada)")
+    live.add_argument("--dictionaries",
+                      help="Folder kamus untuk deteksi pola (default: data/dictionaries)")
+    live.set_defaults(func=command_live)
+    
+    audit = subparsers.add_parser("audit", help="Audit kekuatan password di dump kredensial besar")
+    audit.add_argument("input", help="File dump, satu password (atau akun:password) per baris")
+    audit.add_argument("-w", "--workers", type=int,
+                       help="Jumlah worker process (default: jumlah core)")
+    audit.add_argument("-s", "--separator",
+                       help="Pemisah akun dan password, misal ':' (default: password saja)")
+    audit.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_BYTES // (1024 * 1024),
+                       help="Ukuran chunk per task dalam MB")
+    audit.add_argument("--top", type=int, default=DEFAULT_TOP,
+                       help="Jumlah password terlemah di laporan")
+    audit.add_argument("--breach-db",
+                       help="Database kebocoran (default: data/breached.sha1db jika ada)")
+    audit.add_argument("--dictionaries",
+                       help="Folder kamus untuk deteksi pola (opsional, jauh lebih lambat)")
+    audit.add_argument("-q", "--quiet", action="store_true", help="Tanpa progress di stderr")
+    audit.set_defaults(func=command_audit)
+    
+    policy = subparsers.add_parser("policy", help="Cek password terhadap policy JSON/TOML")
+    policy.add_argument("passwords", nargs="*",
+                        help="Password yang dicek (kosong = baca per baris dari stdin)")
+    policy.add_argument("-p", "--policy", action="append", required=True,
+                        help="File policy .json/.toml (bisa diulang untuk beberapa policy)")
+    policy.add_argument("--summary", action="store_true",
+                        help="Tampilkan jumlah lolos/pelanggaran per policy saja")
+    policy.set_defaults(func=command_policy)
+    
+    similar = subparsers.add_parser("similar",
+                                    help="Cari password yang mirip/dipakai ulang di corpus (MinHash/LSH)")
+    similar.add_argument("input", help="File corpus, satu password (atau akun:password) per baris")
+    similar.add_argument("-s", "--separator",
+                         help="Pemisah akun dan password, misal ':' (default: password saja)")
+    similar.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="Perkiraan kemiripan (Jaccard n-gram) minimal, 0-1")
+    similar.add_argument("--top", type=int, default=20, help="Jumlah cluster yang ditampilkan")
+    similar.add_argument("--show-passwords", action="store_true",
+                         help="Tampilkan password (default: hanya nomor baris dan akun)")
+    similar.set_defaults(func=command_similar)
+    
+    serve = subparsers.add_parser("serve", help="Jalankan service HTTP JSON (generate & check)")
+    serve.add_argument("--host", default=DEFAULT_HOST, help="Alamat bind")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port (0 = acak)")
+    serve.add_argument("-w", "--workers", type=int,
+                       help="Jumlah worker process (default: jumlah core)")
+    serve.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH,
+                       help="Jumlah maksimal password per batch")
+    serve.add_argument("--max-wait", type=float, default=DEFAULT_MAX_WAIT * 1000,
+                       help="Lama maksimal menunggu batch terisi (milidetik)")
+    serve.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING,
+                       help="Jumlah maksimal password antre per endpoint (di atasnya 503)")
+    serve.add_argument("--breach-db",
+                       help="Database kebocoran (default: data/breached.sha1db jika ada)")
+    serve.add_argument("--dictionaries",
+                       help="Folder kamus untuk deteksi pola (default: data/dictionaries)")
+    serve.add_argument("--no-patterns", action="store_true",
+                       help="Tanpa deteksi pola (lebih cepat)")
+    serve.set_defaults(func=command_serve)
+    
+    breach = subparsers.add_parser("build-breach-db",
+                                   help="Bangun database kebocoran dari dump SHA-1 terurut (HIBP)")
+    breach.add_argument("input", help="Dump teks, satu HASH atau HASH:COUNT per baris")
+    breach.add_argument("output", help="File database tujuan")
+    breach.set_defaults(func=command_build_breach_db)
+    
+    return parser
+
+
+def run_command(argv):
+    """Jalankan subcommand non-interaktif dan kembalikan exit code"""
+    args = build_parser().parse_args(argv)
+    
+    if args.command is None:
+        main_menu()
+        return 0
+    
+    try:
+        return args.func(args)
+    except (ValueError, FileNotFoundError) as e:
+        print_error(str(e))
+        return 2
+    except BrokenPipeError:
+        # Pipe ditutup oleh proses tujuan (misal `| head`), bukan error
+        sys.stderr.close()
+        return 0
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_command(sys.argv[1:]))
+    
     try:
         main_menu()
     except KeyboardInterrupt:
@@ -0,0 +1,239 @@
+"""
+Breach Checker Module
+Cek password terhadap database hash SHA-1 dari data kebocoran (offline, mmap)
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+
+# Lokasi default database (hasil build_breach_db, tidak ikut di repo)
+DEFAULT_BREACH_DB_PATH = os.environ.get(
+    "PASSWORD_BREACH_DB",
+    os.path.join(os.path.dirname(__file__), "..", "data", "breached.sha1db")
+)
+
+# Header: magic, versi, ukuran record, jumlah hash (di-pad ke 32 byte)
+DB_MAGIC = b"PWBRCH01"
+DB_HEADER = struct.Struct("<8sIIQ8x")
+FORMAT_VERSION = 1
+
+RECORD_SIZE = 20  # digest SHA-1
+
+# Fan-out per 2 byte pertama hash: FANOUT[p] = jumlah hash dengan prefix < p
+PREFIX_BYTES = 2
+FANOUT_ENTRIES = (1 << (8 * PREFIX_BYTES)) + 1
+FANOUT_FORMAT = "Q"
+FANOUT_SIZE = FANOUT_ENTRIES * 8
+RECORDS_OFFSET = DB_HEADER.size + FANOUT_SIZE
+
+HASH_HEX_LENGTH = 2 * RECORD_SIZE
+
+# Cache BreachDatabase per path
+_DB_CACHE = {}
+
+
+def password_digest(password: str) -> bytes:
+    """
+    Digest SHA-1 password (UTF-8), format yang sama dengan dump HIBP.
+    
+    Byte non-UTF-8 dari dump yang di-decode dengan surrogateescape
+    dikembalikan ke byte aslinya.
+    """
+    return hashlib.sha1(password.encode("utf-8", "surrogateescape")).digest()
+
+
+class BreachDatabase:
+    """
+    Database hash SHA-1 terurut yang di-memory-map.
+    
+    Layout file: header, tabel fan-out 65537 entry (uint64) lalu record
+    20 byte terurut. Fan-out mempersempit pencarian ke satu bucket prefix
+    2 byte, lalu binary search di dalam bucket, sehingga satu lookup hanya
+    menyentuh beberapa page walaupun file berukuran beberapa GB.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path file database
+        
+        Raises:
+            FileNotFoundError: Jika database tidak ditemukan
+            ValueError: Jika file bukan database yang valid
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Database kebocoran tidak ditemukan: {path}")
+        
+        self.path = path
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size < RECORDS_OFFSET:
+                raise ValueError(f"Bukan database kebocoran yang valid: {path}")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, version, record_size, count = DB_HEADER.unpack_from(self._map)
+        if magic != DB_MAGIC or version != FORMAT_VERSION or record_size != RECORD_SIZE:
+            self.close()
+            raise ValueError(f"Bukan database kebocoran yang valid: {path}")
+        if len(self._map) < RECORDS_OFFSET + count * RECORD_SIZE:
+            self.close()
+            raise ValueError(f"Database kebocoran terpotong: {path}")
+        
+        self.count = count
+        self.mtime_ns = stat.st_mtime_ns
+        # Zero-copy: view langsung ke page mmap fan-out
+        self._fanout = memoryview(self._map)[DB_HEADER.size:RECORDS_OFFSET].cast(FANOUT_FORMAT)
+        
+        # Akses acak: jangan biarkan OS read-ahead seluruh file
+        if hasattr(mmap, "MADV_RANDOM"):
+            self._map.madvise(mmap.MADV_RANDOM)
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __contains__(self, password: str) -> bool:
+        return self.contains_digest(password_digest(password))
+    
+    def contains_digest(self, digest: bytes) -> bool:
+        """Cek apakah digest SHA-1 (20 byte) ada di database"""
+        prefix = int.from_bytes(digest[:PREFIX_BYTES], "big")
+        lo = self._fanout[prefix]
+        hi = self._fanout[prefix + 1]
+        data = self._map
+        
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = RECORDS_OFFSET + mid * RECORD_SIZE
+            record = data[offset:offset + RECORD_SIZE]
+            if record < digest:
+                lo = mid + 1
+            elif record > digest:
+                hi = mid
+            else:
+                return True
+        return False
+    
+    def contains_many(self, passwords) -> list:
+        """Cek banyak password sekaligus, kembalikan list bool"""
+        return [self.contains_digest(password_digest(p)) for p in passwords]
+    
+    def close(self):
+        """Tutup mmap"""
+        if getattr(self, "_map", None) is None:
+            return
+        if getattr(self, "_fanout", None) is not None:
+            self._fanout.release()
+            self._fanout = None
+        self._map.close()
+        self._map = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def build_breach_db(lines, path: str) -> int:
+    """
+    Bangun database dari dump teks dalam satu pass streaming.
+    
+    Format baris: `HASH` atau `HASH:COUNT` (40 hex SHA-1, format dump HIBP
+    "ordered by hash"). Input harus sudah terurut berdasarkan hash; hash
+    duplikat dilewati. Memory tetap konstan berapa pun ukuran dump.
+    
+    Args:
+        lines: Iterable baris (str atau bytes), misal file yang dibuka
+        path: Path file database tujuan
+    
+    Returns:
+        Jumlah hash yang ditulis
+    
+    Raises:
+        ValueError: Jika ada baris yang tidak valid atau input tidak terurut
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    
+    fanout = [0] * FANOUT_ENTRIES
+    count = 0
+    previous = b""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as f:
+            # Tempat header & fan-out, diisi setelah semua record ditulis
+            f.write(bytes(RECORDS_OFFSET))
+            
+            for line_no, line in enumerate(lines, 1):
+                if isinstance(line, bytes):
+                    line = line.decode("ascii", "replace")
+                line = line.strip()
+                if not line:
+                    continue
+                
+                hex_hash = line.split(":", 1)[0]
+                if len(hex_hash) != HASH_HEX_LENGTH:
+                    raise ValueError(f"Baris {line_no}: bukan hash SHA-1 (40 hex)")
+                try:
+                    digest = bytes.fromhex(hex_hash)
+                except ValueError:
+                    raise ValueError(f"Baris {line_no}: bukan hash SHA-1 (40 hex)") from None
+                
+                if digest <= previous:
+                    if digest == previous:
+                        continue
+                    raise ValueError(f"Baris {line_no}: dump harus terurut berdasarkan hash")
+                
+                f.write(digest)
+                fanout[int.from_bytes(digest[:PREFIX_BYTES], "big") + 1] += 1
+                previous = digest
+                count += 1
+            
+            # Ubah jumlah per prefix menjadi offset kumulatif
+            for i in range(1, FANOUT_ENTRIES):
+                fanout[i] += fanout[i - 1]
+            
+            f.seek(0)
+            f.write(DB_HEADER.pack(DB_MAGIC, FORMAT_VERSION, RECORD_SIZE, count))
+            f.write(struct.pack(f"<{FANOUT_ENTRIES}{FANOUT_FORMAT}", *fanout))
+        
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    return count
+
+
+def get_breach_db(path: str = None) -> BreachDatabase:
+    """
+    Dapatkan BreachDatabase (di-cache per path)
+    
+    Args:
+        path: Path database (default: DEFAULT_BREACH_DB_PATH)
+    
+    Returns:
+        BreachDatabase yang siap dipakai
+    """
+    path = os.path.abspath(path or DEFAULT_BREACH_DB_PATH)
+    db = _DB_CACHE.get(path)
+    if db is None:
+        db = BreachDatabase(path)
+        _DB_CACHE[path] = db
+    return db
+
+
+def get_default_breach_db():
+    """
+    BreachDatabase default jika file-nya sudah dibangun, selain itu None.
+    
+    Dipakai oleh UI supaya cek kebocoran otomatis aktif begitu database
+    tersedia, tanpa membuat aplikasi gagal jika belum ada.
+    """
+    if not os.path.exists(DEFAULT_BREACH_DB_PATH):
+        return None
+    return get_breach_db()
@@ -0,0 +1,369 @@
+"""
+Corpus Analyzer Module
+Deteksi password yang mirip (variasi kecil) dan dipakai ulang di satu corpus
+dengan MinHash + locality-sensitive hashing
+"""
+
+import hashlib
+import os
+from array import array
+from operator import eq
+
+# Panjang n-gram karakter (password di-lowercase sebelum dipotong)
+DEFAULT_NGRAM = 3
+
+# LSH: signature = bands x rows nilai MinHash. Dua password menjadi kandidat
+# jika semua nilai di salah satu band sama; peluangnya naik tajam di sekitar
+# Jaccard (1 / bands) ** (1 / rows) ~ 0.46 untuk default ini
+DEFAULT_BANDS = 10
+DEFAULT_ROWS = 3
+
+# Kandidat dianggap mirip jika perkiraan Jaccard (nilai signature yang sama)
+# minimal sebesar ini
+DEFAULT_THRESHOLD = 0.5
+
+# Bucket LSH sampai ukuran ini dibandingkan semua pasangannya; bucket yang
+# lebih besar (misal n-gram populer seperti "123") diurutkan berdasarkan
+# signature dan tiap anggota hanya dibandingkan dengan tetangga terdekatnya
+MAX_PAIRWISE_BUCKET = 32
+NEIGHBOR_WINDOW = 8
+
+# Nilai MinHash 15 bit, disimpan per lane 16 bit (bit tertinggi tiap lane
+# dipakai sebagai guard saat menghitung minimum, lihat
+# CorpusAnalyzer._signature)
+LANE_BYTES = 2
+VALUE_BITS = 15
+
+# Jumlah n-gram maksimal di tabel hash sebelum tabel dikosongkan
+MAX_GRAMS = 1_000_000
+
+# Entry bucket LSH (key band + indeks) dikemas dalam 64 bit dan dibagi ke
+# 2^PARTITION_BITS array menurut bit teratasnya; hanya satu partisi yang
+# diurutkan (sebagai list) dalam satu waktu
+PARTITION_BITS = 8
+
+# Pengali hashing multiplikatif (64 bit, ganjil) untuk memadatkan key band
+# yang tidak muat; key yang bertabrakan hanya menambah kandidat, yang tetap
+# diverifikasi dengan similarity
+_KEY_MULTIPLIER = 0x9E3779B97F4A7C15
+
+SALT_SIZE = 16
+
+
+def _lane_masks(lanes: int) -> tuple:
+    """(mask nilai, mask guard) untuk integer berisi `lanes` lane 16 bit"""
+    values = guards = 0
+    for lane in range(lanes):
+        values |= ((1 << VALUE_BITS) - 1) << (8 * LANE_BYTES * lane)
+        guards |= 1 << (8 * LANE_BYTES * lane + VALUE_BITS)
+    return values, guards
+
+
+class _GramTable(dict):
+    """
+    n-gram -> semua nilai hash MinHash-nya, dikemas dalam satu integer
+    (satu lane 16 bit per fungsi hash, dihitung sekali per n-gram)
+    """
+    
+    def __init__(self, hashes: int):
+        super().__init__()
+        self.digest_size = hashes * LANE_BYTES
+        self.value_mask, _ = _lane_masks(hashes)
+    
+    def __missing__(self, gram: str) -> int:
+        if len(self) >= MAX_GRAMS:
+            self.clear()
+        digest = hashlib.blake2b(gram.encode("utf-8", "surrogatepass"),
+                                 digest_size=self.digest_size).digest()
+        value = int.from_bytes(digest, "little") & self.value_mask
+        self[gram] = value
+        return value
+
+
+class _DisjointSet:
+    """Union-find di atas array (compact untuk jutaan entry)"""
+    
+    def __init__(self, size: int):
+        self.parent = array("I", range(size))
+        self.size = array("I", [1]) * size
+    
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    def union(self, a: int, b: int):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+
+class CorpusAnalyzer:
+    """
+    Index MinHash untuk mencari cluster password yang mirip.
+    
+    Setiap password hanya disimpan sebagai signature MinHash (bands x rows
+    nilai 15 bit, masing-masing 2 byte) dan fingerprint 64 bit ber-salt untuk deteksi password
+    identik, di array flat tanpa object per entry (default 68 byte per
+    password, 10 juta password ~ 680 MB). Plaintext tidak disimpan; hasil
+    berupa indeks sesuai urutan add().
+    
+    clusters() membandingkan hanya kandidat dari bucket LSH, jadi waktunya
+    mendekati linear terhadap jumlah password, bukan kuadratik.
+    """
+    
+    def __init__(self, ngram: int = DEFAULT_NGRAM, bands: int = DEFAULT_BANDS,
+                 rows: int = DEFAULT_ROWS, threshold: float = DEFAULT_THRESHOLD):
+        """
+        Args:
+            ngram: Panjang n-gram karakter
+            bands: Jumlah band LSH
+            rows: Jumlah nilai MinHash per band
+            threshold: Perkiraan Jaccard minimal agar dua password dianggap mirip
+        
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if ngram < 1:
+            raise ValueError("Panjang n-gram minimal 1")
+        if bands < 1 or rows < 1:
+            raise ValueError("Jumlah band dan row minimal 1")
+        if not 0 < threshold <= 1:
+            raise ValueError("Threshold harus di antara 0 dan 1")
+        
+        self.ngram = ngram
+        self.bands = bands
+        self.rows = rows
+        self.threshold = threshold
+        self.hashes = bands * rows
+        self._guards = _lane_masks(self.hashes)[1]
+        self.signatures = array("H")
+        self.fingerprints = array("Q")
+        self._grams = _GramTable(self.hashes)
+        self._salt = os.urandom(SALT_SIZE)
+    
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Ukuran array signature dan fingerprint (tanpa tabel n-gram)"""
+        return (len(self.signatures) * self.signatures.itemsize
+                + len(self.fingerprints) * self.fingerprints.itemsize)
+    
+    def _signature(self, password: str) -> bytes:
+        """
+        Signature MinHash: minimum per fungsi hash atas semua n-gram password.
+        
+        Minimum dihitung untuk semua lane sekaligus (SWAR): (a | guard) - b
+        menyisakan bit guard di lane yang a >= b, lalu guard itu diubah jadi
+        mask lane untuk memilih b. Tidak ada lane yang meminjam dari lane
+        sebelahnya karena nilai hanya 15 bit.
+        """
+        text = password.lower()
+        n = self.ngram
+        grams = self._grams
+        guards = self._guards
+        if len(text) <= n:
+            return grams[text].to_bytes(self.hashes * LANE_BYTES, "little")
+        
+        current = grams[text[:n]]
+        for i in range(1, len(text) - n + 1):
+            other = grams[text[i:i + n]]
+            ge = ((current | guards) - other) & guards
+            current ^= (current ^ other) & (ge - (ge >> VALUE_BITS))
+        return current.to_bytes(self.hashes * LANE_BYTES, "little")
+    
+    def add(self, password: str) -> int:
+        """
+        Tambahkan satu password ke index
+        
+        Returns:
+            Indeks password (urutan penambahan, mulai 0)
+        
+        Raises:
+            ValueError: Jika password kosong
+        """
+        if not password:
+            raise ValueError("Password kosong tidak bisa dianalisis")
+        self.signatures.frombytes(self._signature(password))
+        digest = hashlib.blake2b(password.encode("utf-8", "surrogatepass"),
+                                 key=self._salt, digest_size=8).digest()
+        self.fingerprints.append(int.from_bytes(digest, "little"))
+        return len(self.fingerprints) - 1
+    
+    def add_many(self, passwords) -> int:
+        """
+        Tambahkan banyak password (password kosong dilewati)
+        
+        Returns:
+            Jumlah password yang ditambahkan
+        """
+        before = len(self)
+        for password in passwords:
+            if password:
+                self.add(password)
+        return len(self) - before
+    
+    def _slice(self, i: int):
+        k = self.hashes
+        return self.signatures[i * k:(i + 1) * k]
+    
+    def similarity(self, i: int, j: int) -> float:
+        """Perkiraan Jaccard n-gram password ke-i dan ke-j (0-1)"""
+        return sum(map(eq, self._slice(i), self._slice(j))) / self.hashes
+    
+    def _band_buckets(self, band: int):
+        """
+        Yield list indeks yang nilai MinHash-nya sama di satu band.
+        
+        Key band dan indeks digabung menjadi satu entry 64 bit di array('Q')
+        (8 byte per password, bukan object int per password). Entry dibagi
+        ke partisi menurut bit teratas key, jadi key yang sama selalu ada
+        di partisi yang sama dan tiap partisi bisa diurutkan sendiri-sendiri.
+        Key yang lebih lebar dari sisa bit di-hash; tabrakan hanya menambah
+        kandidat.
+        """
+        count = len(self)
+        shift = max(count.bit_length(), 1)
+        index_mask = (1 << shift) - 1
+        key_bits = 64 - shift
+        exact = self.rows * VALUE_BITS <= key_bits
+        if exact:
+            key_bits = self.rows * VALUE_BITS
+        hash_shift = 64 - key_bits
+        partition_shift = max(key_bits + shift - PARTITION_BITS, 0)
+        start = band * self.rows
+        columns = [self.signatures[start + r::self.hashes] for r in range(self.rows)]
+        
+        partitions = [array("Q") for _ in range(1 << min(PARTITION_BITS, key_bits + shift))]
+        for i, values in enumerate(zip(*columns)):
+            key = 0
+            for value in values:
+                key = (key << VALUE_BITS) | value
+            if not exact:
+                key = ((key * _KEY_MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> hash_shift
+            entry = (key << shift) | i
+            partitions[entry >> partition_shift].append(entry)
+        
+        for p in range(len(partitions)):
+            entries = sorted(partitions[p])
+            partitions[p] = None
+            run = []
+            current = None
+            for entry in entries:
+                key = entry >> shift
+                if key != current:
+                    if len(run) > 1:
+                        yield run
+                    run = []
+                    current = key
+                run.append(entry & index_mask)
+            if len(run) > 1:
+                yield run
+    
+    def _candidate_pairs(self, members: list):
+        """Pasangan yang dibandingkan dalam satu bucket"""
+        if len(members) <= MAX_PAIRWISE_BUCKET:
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    yield members[a], members[b]
+            return
+        members = sorted(members, key=lambda i: self._slice(i).tobytes())
+        for a in range(len(members)):
+            for b in range(a + 1, min(a + 1 + NEIGHBOR_WINDOW, len(members))):
+                yield members[a], members[b]
+    
+    def clusters(self, min_size: int = 2) -> list:
+        """
+        Cluster password yang mirip (termasuk yang identik)
+        
+        Args:
+            min_size: Ukuran cluster minimal yang dilaporkan
+        
+        Returns:
+            List cluster (list indeks terurut), dari yang terbesar
+        """
+        sets = _DisjointSet(len(self))
+        threshold = self.threshold * self.hashes
+        k = self.hashes
+        signatures = self.signatures
+        
+        for band in range(self.bands):
+            for members in self._band_buckets(band):
+                for a, b in self._candidate_pairs(members):
+                    if sets.find(a) == sets.find(b):
+                        continue
+                    matches = sum(map(eq, signatures[a * k:(a + 1) * k],
+                                      signatures[b * k:(b + 1) * k]))
+                    if matches >= threshold:
+                        sets.union(a, b)
+        
+        groups = {}
+        for i in range(len(self)):
+            root = sets.find(i)
+            if sets.size[root] >= min_size:
+                groups.setdefault(root, []).append(i)
+        return sorted(groups.values(), key=lambda group: (-len(group), group[0]))
+    
+    def reuse_groups(self, min_size: int = 2) -> list:
+        """
+        Kelompok password yang identik (dari fingerprint)
+        
+        Returns:
+            List kelompok (list indeks terurut), dari yang terbesar
+        """
+        shift = max(len(self).bit_length(), 1)
+        index_mask = (1 << shift) - 1
+        entries = sorted((fingerprint << shift) | i for i, fingerprint in enumerate(self.fingerprints))
+        
+        groups = []
+        group = []
+        current = None
+        for entry in entries:
+            fingerprint = entry >> shift
+            if fingerprint != current:
+                if len(group) >= min_size:
+                    groups.append(group)
+                group = []
+                current = fingerprint
+            group.append(entry & index_mask)
+        if len(group) >= min_size:
+            groups.append(group)
+        return sorted(groups, key=lambda group: (-len(group), group[0]))
+
+
+def iter_corpus(path: str, separator: str = None):
+    """
+    Yield (nomor baris, akun, password) dari file corpus, dibaca streaming
+    
+    Args:
+        path: File satu password (atau akun:password) per baris
+        separator: Pemisah akun dan password (default: password saja)
+    
+    Raises:
+        FileNotFoundError: Jika file tidak ditemukan
+        ValueError: Jika separator kosong
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File corpus tidak ditemukan: {path}")
+    if separator == "":
+        raise ValueError("Separator tidak boleh kosong")
+    
+    with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+        for line_no, row in enumerate(f, 1):
+            row = row.rstrip("\r\n")
+            if separator is None:
+                account, password = "", row
+            else:
+                account, found, password = row.partition(separator)
+                if not found:
+                    continue
+            if password:
+                yield line_no, account, password
@@ -0,0 +1,275 @@
+"""
+Dump Auditor Module
+Audit kekuatan password dari dump kredensial besar (mmap + process pool)
+"""
+
+import heapq
+import mmap
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from breach_checker import get_breach_db
+from pattern_analyzer import get_analyzer
+from strength_cache import StrengthCache
+from strength_checker import (CRITERIA, STRENGTH_LEVELS, _strength_code,
+                              check_password_strength_many)
+
+# Ukuran satu chunk (byte) yang dikerjakan satu worker per task; batas
+# atas memory per worker karena chunk di-decode sekaligus
+DEFAULT_CHUNK_BYTES = 2 * 1024 * 1024
+
+# Jumlah password terlemah yang dicatat di laporan
+DEFAULT_TOP = 10
+
+# Cache hasil per worker untuk mode breach/pola (dump sering berisi password berulang)
+WORKER_CACHE_ENTRIES = 65_536
+
+_WORKER_CACHE = None
+
+
+class AuditReport:
+    """
+    Agregat hasil audit yang di-merge per chunk secara streaming.
+    
+    Semua field berukuran tetap (histogram skor, jumlah per mask kriteria,
+    N password terlemah), jadi memory tidak bertambah berapa pun jumlah
+    baris dump.
+    """
+    
+    def __init__(self, top: int = DEFAULT_TOP):
+        self.top = top
+        self.lines = 0
+        self.audited = 0
+        self.breached = 0
+        self.score_counts = [0] * 101
+        self.mask_counts = [0] * 64
+        # (skor, nomor baris, akun, mask), terurut dari yang terlemah
+        self.worst = []
+        self.bytes = 0
+        self.elapsed = 0.0
+    
+    def merge(self, partial: dict, line_offset: int):
+        """Gabungkan hasil satu chunk; nomor baris lokal digeser `line_offset`"""
+        self.lines += partial["lines"]
+        self.audited += partial["audited"]
+        self.breached += partial["breached"]
+        self.bytes += partial["bytes"]
+        for score, count in partial["scores"].items():
+            self.score_counts[score] += count
+        for mask, count in partial["masks"].items():
+            self.mask_counts[mask] += count
+        
+        worst = [(score, line_no + line_offset, account, mask)
+                 for score, line_no, account, mask in partial["worst"]]
+        self.worst = heapq.nsmallest(self.top, self.worst + worst)
+    
+    @property
+    def skipped(self) -> int:
+        """Baris kosong atau tanpa separator"""
+        return self.lines - self.audited
+    
+    @property
+    def lines_per_second(self) -> float:
+        return self.lines / self.elapsed if self.elapsed else 0.0
+    
+    def level_counts(self) -> dict:
+        """Jumlah password per kategori strength"""
+        counts = dict.fromkeys(STRENGTH_LEVELS, 0)
+        for score, count in enumerate(self.score_counts):
+            if count:
+                counts[STRENGTH_LEVELS[_strength_code(score)]] += count
+        return counts
+    
+    def criteria_failures(self) -> dict:
+        """Jumlah password yang tidak memenuhi tiap kriteria (key sesuai CRITERIA)"""
+        return {key: sum(count for mask, count in enumerate(self.mask_counts)
+                         if not mask & bit)
+                for key, bit, _, _ in CRITERIA}
+    
+    def format(self) -> str:
+        """Laporan audit dalam bentuk teks"""
+        audited = self.audited or 1
+        lines = [
+            f"Baris            : {self.lines:,} ({self.skipped:,} dilewati)",
+            f"Password diaudit : {self.audited:,}",
+            f"Throughput       : {self.lines_per_second:,.0f} baris/detik "
+            f"({self.bytes / (self.elapsed or 1) / 1e6:,.1f} MB/detik)",
+            "",
+            "Distribusi kekuatan:",
+        ]
+        for level, count in self.level_counts().items():
+            lines.append(f"  {level.value:<12}: {count:>12,} ({count / audited:6.1%})")
+        
+        lines += ["", "Distribusi skor:"]
+        for start in range(0, 101, 10):
+            end = min(start + 9, 100)
+            count = sum(self.score_counts[start:end + 1])
+            label = f"{start}-{end}" if end != start else str(start)
+            lines.append(f"  {label:<7}: {count:>12,} ({count / audited:6.1%})")
+        
+        lines += ["", "Kriteria tidak terpenuhi:"]
+        for key, count in self.criteria_failures().items():
+            lines.append(f"  {key:<14}: {count:>12,} ({count / audited:6.1%})")
+        if self.breached:
+            lines.append(f"  {'bocor':<14}: {self.breached:>12,} ({self.breached / audited:6.1%})")
+        
+        if self.worst:
+            lines += ["", f"{len(self.worst)} password terlemah:"]
+            for score, line_no, account, mask in self.worst:
+                failed = ", ".join(key for key, bit, _, _ in CRITERIA if not mask & bit)
+                label = f"baris {line_no:,}" + (f" ({account})" if account else "")
+                lines.append(f"  {label}: skor {score}" + (f" - gagal: {failed}" if failed else ""))
+        return "\n".join(lines)
+
+
+def _chunk_bounds(path: str, chunk_bytes: int):
+    """Yield (start, end) chunk file yang selalu berakhir tepat setelah newline"""
+    size = os.path.getsize(path)
+    if size == 0:
+        return
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            end = mm.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if end == -1 else end + 1
+            yield start, end
+            start = end
+
+
+def _worker_cache() -> StrengthCache:
+    """StrengthCache per worker process"""
+    global _WORKER_CACHE
+    if _WORKER_CACHE is None:
+        _WORKER_CACHE = StrengthCache(max_entries=WORKER_CACHE_ENTRIES, ttl=None)
+    return _WORKER_CACHE
+
+
+def _audit_chunk(task: tuple) -> dict:
+    """Worker: audit satu chunk dan kembalikan agregat parsialnya"""
+    path, start, end, separator, breach_db_path, dictionaries, top = task
+    
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8", "surrogateescape")
+    rows = text.split("\n")
+    if text.endswith("\n"):
+        rows.pop()
+    
+    line_numbers = []
+    accounts = []
+    passwords = []
+    for line_no, row in enumerate(rows, 1):
+        row = row.rstrip("\r")
+        if separator is None:
+            account, password = "", row
+        else:
+            account, found, password = row.partition(separator)
+            if not found:
+                continue
+        if password:
+            line_numbers.append(line_no)
+            accounts.append(account)
+            passwords.append(password)
+    
+    breached = 0
+    if breach_db_path is None and dictionaries is None:
+        batch = check_password_strength_many(passwords)
+        scores, masks = batch.scores, batch.masks
+    else:
+        breach_db = get_breach_db(breach_db_path) if breach_db_path else None
+        analyzer = get_analyzer(dictionaries) if dictionaries else None
+        cache = _worker_cache()
+        scores, masks = [], []
+        for password in passwords:
+            result = cache.check(password, breach_db=breach_db, pattern_analyzer=analyzer)
+            scores.append(result.score)
+            masks.append(result.mask)
+            breached += bool(result.breached)
+    
+    worst = heapq.nsmallest(top, range(len(scores)), key=lambda i: (scores[i], i))
+    return {
+        "lines": len(rows),
+        "audited": len(passwords),
+        "breached": breached,
+        "bytes": end - start,
+        "scores": Counter(scores),
+        "masks": Counter(masks),
+        "worst": [(scores[i], line_numbers[i], accounts[i], masks[i]) for i in worst],
+    }
+
+
+def audit_dump(path: str, workers: int = None, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+               separator: str = None, breach_db_path: str = None,
+               dictionaries: str = None, top: int = DEFAULT_TOP,
+               progress=None) -> AuditReport:
+    """
+    Audit kekuatan semua password di file dump.
+    
+    File di-memory-map lalu dibagi menjadi chunk yang selalu berakhir di
+    batas baris. Tiap chunk diaudit oleh worker process, dan hasil
+    parsialnya langsung digabung ke AuditReport sesuai urutan chunk
+    (maksimal 2 task per worker yang tertunda), jadi memory tetap konstan.
+    
+    Args:
+        path: Path file dump (satu password atau kredensial per baris)
+        workers: Jumlah worker process (default: jumlah core; 1 = tanpa pool)
+        chunk_bytes: Ukuran chunk dalam byte
+        separator: Pemisah akun dan password, misal ":" untuk `email:password`
+            (default: satu password per baris)
+        breach_db_path: Database kebocoran (opsional)
+        dictionaries: Folder kamus untuk deteksi pola (opsional, jauh lebih lambat)
+        top: Jumlah password terlemah yang dicatat
+        progress: Callback(report) setiap chunk selesai (opsional)
+    
+    Returns:
+        AuditReport
+    
+    Raises:
+        FileNotFoundError: Jika file dump tidak ditemukan
+        ValueError: Jika parameter tidak valid
+    """
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"File dump tidak ditemukan: {path}")
+    if chunk_bytes < 1:
+        raise ValueError("Ukuran chunk minimal 1 byte")
+    if workers is not None and workers < 1:
+        raise ValueError("Jumlah worker minimal 1")
+    if top < 0:
+        raise ValueError("Jumlah password terlemah tidak boleh negatif")
+    if separator == "":
+        raise ValueError("Separator tidak boleh kosong")
+    
+    # Validasi di parent supaya error tidak muncul dari dalam worker
+    if breach_db_path:
+        get_breach_db(breach_db_path)
+    if dictionaries:
+        get_analyzer(dictionaries)
+    
+    report = AuditReport(top)
+    started = time.perf_counter()
+    tasks = ((path, start, end, separator, breach_db_path, dictionaries, top)
+             for start, end in _chunk_bounds(path, chunk_bytes))
+    
+    def merge(partial):
+        report.merge(partial, report.lines)
+        report.elapsed = time.perf_counter() - started
+        if progress is not None:
+            progress(report)
+    
+    if workers == 1:
+        for task in tasks:
+            merge(_audit_chunk(task))
+        return report
+    
+    max_pending = (workers or os.cpu_count() or 1) * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for task in tasks:
+            pending.append(pool.submit(_audit_chunk, task))
+            if len(pending) >= max_pending:
+                # Merge sesuai urutan chunk supaya nomor baris benar
+                merge(pending.popleft().result())
+        while pending:
+            merge(pending.popleft().result())
+    return report
@@ -0,0 +1,248 @@
+"""
+Entropy Pool Module
+Buffer byte acak kriptografis (os.urandom) untuk draw berkecepatan tinggi
+"""
+
+import os
+import threading
+from functools import lru_cache
+
+# Ukuran blok refill dari OS
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+# Request yang lebih besar dari ini langsung dibaca dari OS per chunk
+MAX_DIRECT_READ = 1 << 20
+
+
+@lru_cache(maxsize=512)
+def _byte_tables(n: int) -> tuple:
+    """
+    Precompute tabel translate untuk mengambil angka acak 0..n-1 (n <= 256).
+    
+    Returns:
+        Tuple (translate_table, reject_bytes, limit). Byte >= limit dibuang
+        (rejection sampling), byte < limit dipetakan ke b % n.
+    """
+    limit = 256 - (256 % n)
+    table = bytes(b % n for b in range(256))
+    reject = bytes(range(limit, 256))
+    return table, reject, limit
+
+
+@lru_cache(maxsize=64)
+def _alphabet_table(alphabet: str) -> bytes:
+    """Tabel translate indeks -> karakter alphabet (ASCII)"""
+    return alphabet.encode("ascii").ljust(256, b"\0")
+
+
+class EntropyPool:
+    """
+    Pool byte acak thread-safe yang di-refill dari os.urandom per blok besar.
+    
+    Byte diberikan sebagai slice memoryview dari buffer (tanpa copy). Buffer
+    lama tidak pernah ditimpa, refill selalu membuat object bytes baru,
+    sehingga slice yang sudah diberikan tetap valid. Setelah fork, process
+    anak otomatis membuang buffer warisan parent supaya tidak ada byte acak
+    yang terpakai dua kali.
+    """
+    
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE):
+        """
+        Args:
+            block_size: Jumlah byte per refill dari OS
+        """
+        if block_size < 1:
+            raise ValueError("Ukuran blok minimal 1 byte")
+        
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._buffer = b""
+        self._pos = 0
+        self._pid = os.getpid()
+        
+        # Counter
+        self.refills = 0
+        self.bytes_served = 0
+        self.draws = 0
+        self.rejected = 0
+    
+    def reset(self):
+        """Buang sisa buffer; draw berikutnya akan refill dari OS"""
+        with self._lock:
+            self._discard()
+    
+    def _discard(self):
+        """Kosongkan buffer. Harus dipanggil di dalam lock."""
+        self._pid = os.getpid()
+        self._buffer = b""
+        self._pos = 0
+    
+    def _reserve(self, n: int) -> tuple:
+        """Ambil n byte: kembalikan (buffer, offset). Harus dipanggil di dalam lock."""
+        if self._pid != os.getpid():
+            # Process anak hasil fork: buang buffer warisan parent
+            self._discard()
+        
+        self.bytes_served += n
+        
+        if n > self.block_size:
+            self.refills += 1
+            return os.urandom(n), 0
+        
+        if self._pos + n > len(self._buffer):
+            self._buffer = os.urandom(self.block_size)
+            self._pos = 0
+            self.refills += 1
+        
+        start = self._pos
+        self._pos += n
+        return self._buffer, start
+    
+    def _count(self, draws: int, rejected: int):
+        """Update counter rejection sampling secara thread-safe"""
+        with self._lock:
+            self.draws += draws
+            self.rejected += rejected
+    
+    def take(self, n: int) -> memoryview:
+        """
+        Ambil n byte acak sebagai memoryview (zero-copy).
+        
+        Returns:
+            memoryview read-only sepanjang n byte
+        """
+        with self._lock:
+            buffer, start = self._reserve(n)
+        return memoryview(buffer)[start:start + n]
+    
+    def take_bytes(self, n: int) -> bytes:
+        """Ambil n byte acak sebagai bytes (untuk operasi seperti translate)"""
+        with self._lock:
+            buffer, start = self._reserve(n)
+        if start == 0 and len(buffer) == n:
+            return buffer
+        return buffer[start:start + n]
+    
+    def randbelow(self, n: int) -> int:
+        """
+        Satu angka acak uniform 0..n-1 (tanpa bias, rejection sampling).
+        
+        Raises:
+            ValueError: Jika n < 1
+        """
+        if n < 1:
+            raise ValueError("Batas atas harus minimal 1")
+        if n == 1:
+            return 0
+        
+        bits = (n - 1).bit_length()
+        nbytes = (bits + 7) // 8
+        mask = (1 << bits) - 1
+        # Satu lock untuk seluruh draw; angka tunggal jalur paling sering dipakai
+        with self._lock:
+            draws = 0
+            while True:
+                buffer, start = self._reserve(nbytes)
+                value = int.from_bytes(buffer[start:start + nbytes], "little") & mask
+                draws += 1
+                if value < n:
+                    break
+            self.draws += draws
+            self.rejected += draws - 1
+        return value
+    
+    def randbelow_each(self, bounds) -> list:
+        """
+        Satu angka acak uniform 0..n-1 untuk setiap n di `bounds` (n <= 256).
+        
+        Semua byte diambil dengan satu take, jadi jauh lebih murah daripada
+        memanggil randbelow() berkali-kali untuk draw kecil.
+        """
+        results = []
+        draws = 0
+        raw = b""
+        pos = 0
+        for n in bounds:
+            if not 1 <= n <= 256:
+                raise ValueError("Batas atas harus di antara 1 dan 256")
+            limit = 256 - (256 % n)
+            while True:
+                if pos >= len(raw):
+                    raw = self.take_bytes(len(bounds) + 8)
+                    pos = 0
+                b = raw[pos]
+                pos += 1
+                draws += 1
+                if b < limit:
+                    results.append(b % n)
+                    break
+        self._count(draws, draws - len(results))
+        return results
+    
+    def randbelow_bytes(self, n: int, count: int) -> bytes:
+        """
+        `count` angka acak uniform 0..n-1 (n <= 256) sebagai bytes.
+        
+        Mapping dan rejection dilakukan sekaligus oleh bytes.translate,
+        jadi tidak ada loop Python per angka.
+        """
+        if not 1 <= n <= 256:
+            raise ValueError("Batas atas harus di antara 1 dan 256")
+        
+        table, reject, limit = _byte_tables(n)
+        parts = []
+        remaining = count
+        
+        while remaining > 0:
+            # Ambil sedikit lebih banyak untuk menutup byte yang ditolak
+            request = min(remaining * 256 // limit + 64, MAX_DIRECT_READ)
+            raw = self.take_bytes(request)
+            accepted = raw.translate(table, reject)
+            self._count(len(raw), len(raw) - len(accepted))
+            chunk = accepted[:remaining]
+            parts.append(chunk)
+            remaining -= len(chunk)
+        
+        return b"".join(parts)
+    
+    def random_chars(self, alphabet: str, count: int) -> str:
+        """`count` karakter acak uniform dari alphabet ASCII (maksimal 256 karakter)"""
+        indices = self.randbelow_bytes(len(alphabet), count)
+        return indices.translate(_alphabet_table(alphabet)).decode("ascii")
+    
+    def choices(self, population, count: int) -> list:
+        """`count` elemen acak uniform dari sequence apa saja (maksimal 256 elemen)"""
+        return [population[i] for i in self.randbelow_bytes(len(population), count)]
+    
+    def choice(self, population):
+        """Satu elemen acak uniform dari sequence"""
+        return population[self.randbelow(len(population))]
+    
+    @property
+    def rejection_rate(self) -> float:
+        """Rasio kandidat yang ditolak oleh rejection sampling"""
+        return self.rejected / self.draws if self.draws else 0.0
+    
+    def stats(self) -> dict:
+        """
+        Statistik pool
+        
+        Returns:
+            Dictionary berisi refills, bytes_served, draws, rejected, rejection_rate
+        """
+        return {
+            "refills": self.refills,
+            "bytes_served": self.bytes_served,
+            "draws": self.draws,
+            "rejected": self.rejected,
+            "rejection_rate": self.rejection_rate,
+        }
+
+
+# Pool default yang dipakai bersama oleh semua generator
+_default_pool = EntropyPool()
+
+
+def get_default_pool() -> EntropyPool:
+    """Dapatkan EntropyPool default (shared per process)"""
+    return _default_pool
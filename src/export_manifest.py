@@ -0,0 +1,267 @@
+"""
+Export Manifest Module
+Index persisten (sqlite3, mode WAL) untuk file export di folder output
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+from strength_checker import STRENGTH_LEVELS, _strength_code
+
+# Nama file database di dalam folder export (diawali "." supaya tidak
+# terdaftar sebagai export)
+MANIFEST_FILENAME = ".manifest.sqlite3"
+
+DEFAULT_PAGE_SIZE = 50
+
+# Urutan yang didukung query(): nama -> klausa ORDER BY
+SORT_ORDERS = {
+    "terbaru": "created DESC, name DESC",
+    "terlama": "created ASC, name ASC",
+    "skor_terendah": "score IS NULL, score ASC, created DESC",
+    "skor_tertinggi": "score IS NULL, score DESC, created DESC",
+    "nama": "name ASC",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER
+);
+CREATE TABLE IF NOT EXISTS exports (
+    name TEXT PRIMARY KEY,
+    format TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    rows INTEGER,
+    score INTEGER,
+    strength INTEGER
+);
+CREATE INDEX IF NOT EXISTS exports_created ON exports (created);
+CREATE INDEX IF NOT EXISTS exports_score ON exports (score, created);
+CREATE INDEX IF NOT EXISTS exports_strength ON exports (strength, created);
+"""
+
+_MANIFEST_CACHE = {}
+_MANIFEST_CACHE_LOCK = threading.Lock()
+
+
+class ExportManifest:
+    """
+    Manifest file export: nama, format, waktu, ukuran, jumlah password dan
+    skor (terendah untuk export bulk) per file.
+    
+    Export yang ditulis lewat file_export langsung dicatat dengan record().
+    refresh() menyamakan manifest dengan isi folder secara incremental:
+    jika mtime folder sama dengan saat refresh terakhir tidak ada yang
+    dibaca sama sekali; jika berubah, hanya stat per file yang dibandingkan
+    dan hanya file baru/berubah yang dibuka untuk diambil skornya.
+    """
+    
+    def __init__(self, directory: str, extensions: dict, inspect=None):
+        """
+        Args:
+            directory: Folder export
+            extensions: Ekstensi -> nama format file yang dicatat
+            inspect: Fungsi (path, format) -> (jumlah password, skor terendah)
+                untuk file yang belum tercatat (opsional)
+        
+        Raises:
+            sqlite3.Error: Jika database tidak bisa dibuat/dibuka
+        """
+        self.directory = directory
+        self.extensions = extensions
+        self.inspect = inspect
+        self.path = os.path.join(directory, MANIFEST_FILENAME)
+        
+        # Satu koneksi dipakai bersama thread writer export dan session
+        # Streamlit, jadi semua akses lewat lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def _format_of(self, name: str):
+        if name.startswith("."):
+            return None
+        return self.extensions.get(os.path.splitext(name)[1])
+    
+    def record(self, path: str, rows: int = None, score: int = None):
+        """
+        Catat (atau perbarui) satu file export yang baru ditulis
+        
+        Args:
+            path: Path file export di folder manifest
+            rows: Jumlah password di file
+            score: Skor password (terendah untuk export bulk)
+        """
+        name = os.path.basename(path)
+        fmt = self._format_of(name)
+        if fmt is None:
+            return
+        stat = os.stat(path)
+        with self._lock:
+            self._upsert(name, fmt, stat, rows, score)
+    
+    def _upsert(self, name: str, fmt: str, stat, rows: int, score: int):
+        strength = _strength_code(score) if score is not None else None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO exports "
+            "(name, format, mtime_ns, size, created, rows, score, strength) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (name, fmt, stat.st_mtime_ns, stat.st_size, stat.st_mtime, rows, score, strength))
+    
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Samakan manifest dengan isi folder
+        
+        Args:
+            force: Scan folder walaupun mtime-nya tidak berubah
+        
+        Returns:
+            True jika folder di-scan
+        """
+        if not os.path.isdir(self.directory):
+            return False
+        with self._lock:
+            # mtime diambil sebelum scan: perubahan selama scan memicu
+            # scan berikutnya
+            mtime = os.stat(self.directory).st_mtime_ns
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'mtime_ns'").fetchone()
+            if not force and row is not None and row[0] == mtime:
+                return False
+            
+            known = {name: (mtime_ns, size) for name, mtime_ns, size in
+                     self._conn.execute("SELECT name, mtime_ns, size FROM exports")}
+            changed = []
+            seen = set()
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    fmt = self._format_of(entry.name)
+                    if fmt is None or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    seen.add(entry.name)
+                    if known.get(entry.name) != (stat.st_mtime_ns, stat.st_size):
+                        changed.append((entry.name, fmt, stat))
+            
+            self._conn.execute("BEGIN")
+            try:
+                for name, fmt, stat in changed:
+                    rows = score = None
+                    if self.inspect is not None:
+                        rows, score = self.inspect(os.path.join(self.directory, name), fmt)
+                    self._upsert(name, fmt, stat, rows, score)
+                self._conn.executemany("DELETE FROM exports WHERE name = ?",
+                                       [(name,) for name in known.keys() - seen])
+                self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('mtime_ns', ?)",
+                                   (mtime,))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return True
+    
+    def query(self, page: int = 1, per_page: int = DEFAULT_PAGE_SIZE, sort: str = "terbaru",
+              min_score: int = None, max_score: int = None, strengths=None,
+              since: datetime = None, until: datetime = None, formats=None) -> tuple:
+        """
+        Daftar export dengan filter, urutan dan halaman (refresh otomatis)
+        
+        Args:
+            page: Nomor halaman (mulai 1)
+            per_page: Jumlah export per halaman
+            sort: Salah satu key SORT_ORDERS
+            min_score: Skor minimal (opsional)
+            max_score: Skor maksimal (opsional)
+            strengths: Iterable PasswordStrength (opsional)
+            since: Hanya export sejak waktu ini (opsional)
+            until: Hanya export sebelum waktu ini (opsional)
+            formats: Iterable nama format, misal ["txt", "pwx"] (opsional)
+        
+        Returns:
+            Tuple (list dictionary export, jumlah total yang cocok)
+        
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if page < 1 or per_page < 1:
+            raise ValueError("Halaman dan jumlah per halaman minimal 1")
+        if sort not in SORT_ORDERS:
+            raise ValueError(f"Urutan tidak dikenal: {sort} (pilihan: {', '.join(SORT_ORDERS)})")
+        
+        conditions = []
+        params = []
+        if min_score is not None:
+            conditions.append("score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            conditions.append("score <= ?")
+            params.append(max_score)
+        if strengths is not None:
+            codes = [STRENGTH_LEVELS.index(level) for level in strengths]
+            conditions.append(f"strength IN ({', '.join('?' * len(codes))})")
+            params += codes
+        if since is not None:
+            conditions.append("created >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            conditions.append("created < ?")
+            params.append(until.timestamp())
+        if formats is not None:
+            formats = list(formats)
+            conditions.append(f"format IN ({', '.join('?' * len(formats))})")
+            params += formats
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        
+        self.refresh()
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM exports {where}", params).fetchone()[0]
+            rows = self._conn.execute(
+                f"SELECT name, format, created, size, rows, score, strength FROM exports {where} "
+                f"ORDER BY {SORT_ORDERS[sort]} LIMIT ? OFFSET ?",
+                params + [per_page, (page - 1) * per_page]).fetchall()
+        
+        return [{
+            "name": name,
+            "format": fmt,
+            "created": datetime.fromtimestamp(created),
+            "size": size,
+            "rows": count,
+            "score": score,
+            "strength": STRENGTH_LEVELS[strength] if strength is not None else None,
+        } for name, fmt, created, size, count, score, strength in rows], total
+    
+    def names(self) -> list:
+        """Nama semua export, terbaru lebih dulu (refresh otomatis)"""
+        self.refresh()
+        with self._lock:
+            return [name for name, in self._conn.execute(
+                f"SELECT name FROM exports ORDER BY {SORT_ORDERS['terbaru']}")]
+
+
+def get_manifest(directory: str, extensions: dict, inspect=None) -> ExportManifest:
+    """
+    ExportManifest untuk satu folder (dibuka sekali per proses)
+    
+    Raises:
+        sqlite3.Error: Jika database tidak bisa dibuat/dibuka
+    """
+    directory = os.path.abspath(directory)
+    manifest = _MANIFEST_CACHE.get(directory)
+    if manifest is None:
+        with _MANIFEST_CACHE_LOCK:
+            manifest = _MANIFEST_CACHE.get(directory)
+            if manifest is None:
+                os.makedirs(directory, exist_ok=True)
+                manifest = ExportManifest(directory, extensions, inspect)
+                _MANIFEST_CACHE[directory] = manifest
+    return manifest
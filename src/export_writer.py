@@ -0,0 +1,353 @@
+"""
+Export Writer Module
+Export di background thread: antrean terbatas, batch, rename atomik dan fsync per batch
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+
+from file_export import (AtomicExportFile, EXPORT_FORMATS, _default_output_dir,
+                         _format_text_report, check_export_format, fsync_directory,
+                         open_export_file, record_export, write_export)
+from latency_tracker import LatencyTracker
+
+# Jumlah maksimal export yang antre sebelum backpressure berlaku
+DEFAULT_QUEUE_SIZE = 1024
+
+# Jumlah maksimal export yang ditulis (dan di-fsync) dalam satu batch
+DEFAULT_MAX_BATCH = 64
+
+# Perilaku saat antrean penuh: "block" (submit menunggu) atau "drop"
+# (export dibuang, submit mengembalikan None dan counter dropped naik)
+BACKPRESSURE_MODES = ("block", "drop")
+
+_STOP = object()
+
+_DEFAULT_WRITER = None
+_DEFAULT_WRITER_LOCK = threading.Lock()
+
+
+class _ExportJob:
+    """Satu export di antrean: laporan satu password atau export bulk"""
+    
+    __slots__ = ("fmt", "payload", "filename", "generated_at", "future", "submitted_at")
+    
+    def __init__(self, fmt: str, payload: tuple, filename: str):
+        self.fmt = fmt
+        self.payload = payload
+        self.filename = filename
+        self.generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.future = Future()
+        self.submitted_at = time.perf_counter()
+
+
+class ExportWriter:
+    """
+    Writer export di thread terpisah supaya caller (klik Streamlit, menu
+    CLI) tidak menunggu disk.
+    
+    submit() memasukkan export ke antrean terbatas dan langsung
+    mengembalikan Future. Thread writer mengambil semua export yang antre
+    (maksimal max_batch) sekaligus: semua ditulis ke file sementara dan
+    di-fsync, lalu di-rename atomik ke nama final dan folder di-fsync
+    sekali untuk satu batch. File yang terlihat dengan nama export selalu
+    utuh.
+    """
+    
+    def __init__(self, output_dir: str = None, queue_size: int = DEFAULT_QUEUE_SIZE,
+                 max_batch: int = DEFAULT_MAX_BATCH, backpressure: str = "block",
+                 fsync: bool = True):
+        """
+        Args:
+            output_dir: Folder tujuan (default: output/)
+            queue_size: Jumlah maksimal export yang antre
+            max_batch: Jumlah maksimal export per batch
+            backpressure: "block" atau "drop" saat antrean penuh
+            fsync: fsync tiap file sebelum rename dan folder sekali per batch
+        
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if queue_size < 1:
+            raise ValueError("Ukuran antrean minimal 1")
+        if max_batch < 1:
+            raise ValueError("Ukuran batch minimal 1")
+        if backpressure not in BACKPRESSURE_MODES:
+            raise ValueError(f"Mode backpressure tidak dikenal: {backpressure} "
+                             f"(pilihan: {', '.join(BACKPRESSURE_MODES)})")
+        
+        self.output_dir = output_dir or _default_output_dir()
+        self.max_batch = max_batch
+        self.backpressure = backpressure
+        self.fsync = fsync
+        self._queue = queue.Queue(queue_size)
+        
+        # Counter dibaca thread lain lewat stats(), diubah di bawah lock
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._closed = False
+        # submit() yang sudah lolos cek _closed tetapi belum selesai put
+        self._putting = 0
+        self.submitted = 0
+        self.completed = 0
+        self.written = 0
+        self.failed = 0
+        self.dropped = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.max_queued = 0
+        self.latency = LatencyTracker()
+        
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="export-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, password: str, strength_info, rules_summary: str,
+               filename: str = None) -> Future:
+        """
+        Antrekan export satu password (format sama dengan export_to_file)
+        
+        Returns:
+            Future berisi path file, atau None jika dibuang (mode "drop")
+        
+        Raises:
+            RuntimeError: Jika writer sudah ditutup
+        """
+        return self._submit(_ExportJob(None, (password, strength_info, rules_summary), filename))
+    
+    def submit_many(self, records, fmt: str = "csv", filename: str = None) -> Future:
+        """
+        Antrekan export bulk (lihat export_many); records dibaca di thread
+        writer, jadi jangan diubah setelah submit
+        
+        Returns:
+            Future berisi (path file, jumlah record), atau None jika dibuang
+        
+        Raises:
+            ValueError: Jika format tidak dikenal
+            RuntimeError: Jika writer sudah ditutup
+        """
+        check_export_format(fmt)
+        return self._submit(_ExportJob(fmt, (records,), filename))
+    
+    def _submit(self, job: _ExportJob) -> Future:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ExportWriter sudah ditutup")
+            self.submitted += 1
+            self._putting += 1
+        try:
+            if self.backpressure == "block":
+                self._queue.put(job)
+            else:
+                self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                self.completed += 1
+                self._done.notify_all()
+            return None
+        finally:
+            with self._lock:
+                self._putting -= 1
+        
+        depth = self._queue.qsize()
+        with self._lock:
+            self.max_queued = max(self.max_queued, depth)
+        return job.future
+    
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Tunggu sampai semua export yang sudah di-submit selesai ditulis
+        
+        Returns:
+            False jika timeout habis lebih dulu
+        """
+        with self._lock:
+            target = self.submitted
+            return self._done.wait_for(lambda: self.completed >= target, timeout)
+    
+    def close(self, timeout: float = None) -> bool:
+        """
+        Tolak submit baru, tulis semua yang masih antre lalu hentikan thread
+        
+        Returns:
+            False jika thread belum selesai saat timeout habis
+        """
+        with self._lock:
+            first = not self._closed
+            self._closed = True
+        if first:
+            # Di luar lock: put bisa menunggu antrean, dan thread writer
+            # butuh lock untuk menyelesaikan export
+            self._queue.put(_STOP)
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _run(self):
+        """Loop thread writer: ambil semua yang antre sebagai satu batch"""
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                self._drain()
+                return
+            batch = [job]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is _STOP:
+                    stop = True
+                    break
+                batch.append(job)
+            self._write_batch(batch)
+            if stop:
+                self._drain()
+                return
+    
+    def _drain(self):
+        """
+        Tulis export yang masuk bersamaan dengan close(): tunggu sampai
+        tidak ada submit() yang masih di tengah put (tidak ada submit baru
+        setelah _closed)
+        """
+        while True:
+            batch = []
+            while len(batch) < self.max_batch:
+                try:
+                    job = self._queue.get(timeout=0.01)
+                except queue.Empty:
+                    break
+                if job is not _STOP:
+                    batch.append(job)
+            if batch:
+                self._write_batch(batch)
+                continue
+            with self._lock:
+                if not self._putting and self._queue.empty():
+                    return
+    
+    def _write_batch(self, batch: list):
+        """Tulis ke file sementara, fsync, lalu rename semua export di batch dan fsync folder sekali"""
+        prepared = []
+        for job in batch:
+            atomic = None
+            try:
+                if job.fmt is None:
+                    atomic = AtomicExportFile(self.output_dir, encoding="utf-8")
+                    atomic.file.write(_format_text_report(*job.payload, job.generated_at))
+                    atomic.file.flush()
+                    summary = (1, job.payload[1]['score'])
+                else:
+                    atomic = open_export_file(self.output_dir, job.fmt)
+                    summary = write_export(atomic.file, job.payload[0], job.fmt, self.output_dir)
+                prepared.append((job, atomic, summary))
+            except Exception as e:
+                if atomic is not None:
+                    atomic.discard()
+                self._finish(job, error=e)
+        
+        if self.fsync:
+            prepared = self._sync(prepared)
+        
+        committed = []
+        for job, atomic, (count, lowest) in prepared:
+            try:
+                if job.fmt is None:
+                    path = atomic.commit(job.filename, "password", ".txt")
+                    committed.append((job, path))
+                else:
+                    path = atomic.commit(job.filename, "passwords", EXPORT_FORMATS[job.fmt])
+                    committed.append((job, (path, count)))
+                record_export(path, count, lowest)
+            except Exception as e:
+                atomic.discard()
+                self._finish(job, error=e)
+        
+        if self.fsync and committed:
+            fsync_directory(self.output_dir)
+        for job, result in committed:
+            self._finish(job, result=result)
+        
+        with self._lock:
+            self.batches += 1
+            self.largest_batch = max(self.largest_batch, len(batch))
+    
+    def _sync(self, prepared: list) -> list:
+        """
+        fsync tiap file sementara di batch sebelum rename (bukan os.sync(),
+        yang ikut menunggu I/O semua filesystem dan tidak melaporkan error).
+        Export yang gagal di-fsync dibuang dan Future-nya gagal.
+        
+        Returns:
+            Export yang berhasil di-fsync
+        """
+        synced = []
+        for job, atomic, summary in prepared:
+            try:
+                atomic.fsync()
+            except OSError as e:
+                atomic.discard()
+                self._finish(job, error=e)
+                continue
+            synced.append((job, atomic, summary))
+        return synced
+    
+    def _finish(self, job: _ExportJob, result=None, error: Exception = None):
+        """Selesaikan Future satu export dan perbarui counter"""
+        with self._lock:
+            self.completed += 1
+            if error is None:
+                self.written += 1
+                self.latency.record(time.perf_counter() - job.submitted_at)
+            else:
+                self.failed += 1
+            self._done.notify_all()
+        if error is None:
+            job.future.set_result(result)
+        else:
+            job.future.set_exception(IOError(f"Gagal menulis file: {str(error)}"))
+    
+    def stats(self) -> dict:
+        """Kedalaman antrean, counter export dan batch, serta latency submit-sampai-tersimpan"""
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "max_queued": self.max_queued,
+                "submitted": self.submitted,
+                "written": self.written,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "batches": self.batches,
+                "mean_batch": (self.written + self.failed) / self.batches if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+                "latency": self.latency.stats(),
+            }
+
+
+def get_default_writer() -> ExportWriter:
+    """
+    ExportWriter shared untuk seluruh proses ke folder output/ (dibuat saat
+    pertama dipakai, ditutup otomatis saat proses selesai supaya export
+    yang masih antre tetap tertulis)
+    """
+    global _DEFAULT_WRITER
+    if _DEFAULT_WRITER is None:
+        with _DEFAULT_WRITER_LOCK:
+            if _DEFAULT_WRITER is None:
+                _DEFAULT_WRITER = ExportWriter()
+                atexit.register(_DEFAULT_WRITER.close)
+    return _DEFAULT_WRITER
@@ -1,11 +1,225 @@
 """
 File Export Module
-Untuk export hasil password dan informasi ke file .txt
+Untuk export hasil password dan informasi ke file .txt, atau banyak
+password sekaligus ke satu file CSV/JSONL/teks/binary kolumnar (.pwx)
 """
 
+import csv
+import json
+import mmap
 import os
+import re
+import shutil
+import sqlite3
+import struct
+import tempfile
+import threading
+from array import array
+from collections import OrderedDict
 from datetime import datetime
 
+from export_manifest import get_manifest
+from strength_checker import CRITERIA, STRENGTH_LEVELS, StrengthResult
+
+# Format export bulk beserta ekstensi filenya
+EXPORT_FORMATS = {"csv": ".csv", "jsonl": ".jsonl", "txt": ".txt", "pwx": ".pwx"}
+
+# Buffer write export bulk: ribuan record per syscall write
+DEFAULT_EXPORT_BUFFER = 1 << 20
+
+# Kolom CSV export bulk (kriteria sesuai urutan CRITERIA)
+CSV_COLUMNS = (("password", "strength", "score") + tuple(key for key, _, _, _ in CRITERIA)
+               + ("feedback", "rules"))
+
+# Nilai kolom kriteria per mask untuk StrengthResult (tanpa dict details per record)
+_DETAILS_BY_MASK = tuple(tuple(bool(mask & bit) for _, bit, _, _ in CRITERIA)
+                         for mask in range(64))
+
+# Format .pwx: header (magic, versi, flag, jumlah baris) lalu tabel section
+# (offset, panjang byte). Setiap section dimulai di offset kelipatan 8
+PWX_MAGIC = b"PWX1"
+PWX_VERSION = 1
+_PWX_HEADER = struct.Struct("<4sHHQ")
+_PWX_SECTION = struct.Struct("<QQ")
+
+# Section .pwx dan typecode array-nya (None = blob byte)
+PWX_SECTIONS = (
+    ("scores", "B"),
+    ("codes", "B"),
+    ("masks", "B"),
+    ("password_offsets", "Q"),
+    ("passwords", None),
+    ("rule_ids", "I"),
+    ("rule_offsets", "Q"),
+    ("rules", None),
+)
+
+# Kolom tetap ditulis ke file sementara per sekian baris (memory konstan)
+PWX_CHUNK_ROWS = 65_536
+
+# Jumlah baris yang dipindai sekaligus oleh PwxReader.scan()
+PWX_SCAN_ROWS = 1 << 20
+
+# Jumlah baris .pwx yang ditampilkan read_export_file()
+PWX_PREVIEW_ROWS = 100
+
+# Index baris export teks: offset awal tiap LINE_INDEX_STRIDE baris. Header:
+# magic, ukuran & mtime file sumber, jumlah baris, stride (di-pad ke 40 byte
+# supaya array offset setelahnya ter-align)
+LINE_INDEX_MAGIC = b"PWLIDX01"
+LINE_INDEX_HEADER = struct.Struct("<8sQQQI4x")
+LINE_INDEX_STRIDE = 256
+
+# File lebih kecil dari ini di-index di memori saja (tanpa file .idx)
+LINE_INDEX_MIN_SIZE = 1 << 20
+
+# Satu match = LINE_INDEX_STRIDE baris lengkap
+_LINE_BLOCK = re.compile(rb"(?:[^\n]*\n){%d}" % LINE_INDEX_STRIDE)
+
+# Jumlah baris per halaman TextExportReader.page()
+DEFAULT_PAGE_LINES = 200
+
+# Jumlah TextExportReader yang tetap terbuka di get_text_reader()
+TEXT_READER_CACHE_SIZE = 16
+_TEXT_READER_CACHE = OrderedDict()
+_TEXT_READER_LOCK = threading.Lock()
+
+REPORT_LINE = "═══════════════════════════════════════════════════════════"
+SECTION_LINE = "────────────────────────────────────────────────────────────"
+
+
+def _default_output_dir() -> str:
+    return os.path.join(os.path.dirname(__file__), "..", "output")
+
+
+class AtomicExportFile:
+    """
+    File export yang ditulis ke file sementara di folder tujuan lalu
+    di-rename ke nama final, jadi file setengah jadi (misal proses mati
+    saat menulis) tidak pernah terlihat dengan nama export.
+    
+    File sementara diawali "." dan berakhiran ".tmp", tidak ikut di
+    list_exports().
+    """
+    
+    def __init__(self, output_dir: str, binary: bool = False, **kwargs):
+        fd, self.temp_path = tempfile.mkstemp(dir=output_dir, prefix=".export_", suffix=".tmp")
+        self.output_dir = output_dir
+        self.file = os.fdopen(fd, "wb" if binary else "w", **kwargs)
+    
+    def fsync(self):
+        """Flush dan fsync isi file sementara"""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+    
+    def commit(self, filename: str = None, prefix: str = "password", extension: str = ".txt") -> str:
+        """
+        Tutup file lalu rename ke nama final.
+        
+        Nama yang diberikan ditimpa secara atomik (os.replace). Tanpa
+        filename, nama `prefix_timestamp` (sampai mikrodetik) dibuat lewat
+        hard link yang gagal jika nama sudah ada, jadi dua export di detik
+        yang sama tidak saling menimpa; jika bentrok ditambah nomor urut.
+        
+        Returns:
+            Path final
+        """
+        self.file.close()
+        if filename is not None:
+            filepath = os.path.join(self.output_dir, filename)
+            os.replace(self.temp_path, filepath)
+            return filepath
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        suffix = 0
+        while True:
+            name = f"{prefix}_{timestamp}{f'_{suffix}' if suffix else ''}{extension}"
+            filepath = os.path.join(self.output_dir, name)
+            try:
+                os.link(self.temp_path, filepath)
+            except FileExistsError:
+                suffix += 1
+                continue
+            except (AttributeError, NotImplementedError, PermissionError):
+                # Filesystem tanpa hard link: cek lalu rename
+                if os.path.exists(filepath):
+                    suffix += 1
+                    continue
+                os.replace(self.temp_path, filepath)
+                return filepath
+            os.remove(self.temp_path)
+            return filepath
+    
+    def discard(self):
+        """Tutup dan hapus file sementara (setelah error)"""
+        self.file.close()
+        if os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+
+def fsync_directory(path: str):
+    """fsync folder supaya rename di dalamnya aman (diabaikan jika OS tidak mendukung)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _format_text_report(password: str, strength_info, rules_summary: str,
+                        generated_at: str) -> str:
+    """Laporan teks satu password (format file export .txt)"""
+    details = strength_info['details']
+    
+    def met(key):
+        return 'YA' if details[key] else 'TIDAK'
+    
+    parts = [
+        REPORT_LINE,
+        "               PASSWORD GENERATOR RESULT",
+        REPORT_LINE,
+        "",
+        f"Generated At: {generated_at}",
+        "",
+        "PASSWORD",
+        SECTION_LINE,
+        password,
+        "",
+        "RULES USED",
+        SECTION_LINE,
+        rules_summary,
+        "",
+        "STRENGTH ANALYSIS",
+        SECTION_LINE,
+        f"Level: {strength_info['strength'].value}",
+        f"Score: {strength_info['score']}/100",
+        "",
+        "Criteria Met:",
+        f"  ✓ Panjang Password (8+ karakter): {met('panjang')}",
+        f"  ✓ Panjang Extra (12+ karakter):   {met('panjang_extra')}",
+        f"  ✓ Huruf Besar (A-Z):              {met('huruf_besar')}",
+        f"  ✓ Huruf Kecil (a-z):              {met('huruf_kecil')}",
+        f"  ✓ Angka (0-9):                    {met('angka')}",
+        f"  ✓ Simbol (!@#$%^&*):              {met('simbol')}",
+        "",
+        "Recommendations:",
+        SECTION_LINE,
+    ]
+    
+    feedback = strength_info['feedback']
+    if feedback:
+        parts += [f"{i}. {rec}" for i, rec in enumerate(feedback, 1)]
+    else:
+        parts.append("Tidak ada rekomendasi. Password sudah sangat kuat!")
+    
+    parts += ["", REPORT_LINE, ""]
+    return "\n".join(parts)
+
 
 def export_to_file(password: str, strength_info: dict, rules_summary: str, 
                    filename: str = None) -> str:
@@ -26,99 +240,777 @@ def export_to_file(password: str, strength_info: dict, rules_summary: str,
     """
     
     # Tentukan directory output
-    output_dir = os.path.join(os.path.dirname(__file__), "..", "output")
+    output_dir = _default_output_dir()
     
     # Create directory jika belum ada
     os.makedirs(output_dir, exist_ok=True)
     
-    # Generate filename jika tidak diberikan
-    if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"password_{timestamp}.txt"
+    content = _format_text_report(password, strength_info, rules_summary,
+                                  datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    
+    # Write to file (atomik: file sementara lalu rename)
+    atomic = None
+    try:
+        atomic = AtomicExportFile(output_dir, encoding='utf-8')
+        atomic.file.write(content)
+        filepath = atomic.commit(filename, "password", ".txt")
+        record_export(filepath, 1, strength_info['score'])
+        return filepath
+    except IOError as e:
+        if atomic is not None:
+            atomic.discard()
+        raise IOError(f"Gagal menulis file: {str(e)}")
+
+
+def _record_fields(strength_info) -> tuple:
+    """(strength, skor, tuple kriteria, feedback) dari StrengthResult atau dict"""
+    if isinstance(strength_info, StrengthResult):
+        return (strength_info.strength.value, strength_info.score,
+                _DETAILS_BY_MASK[strength_info.mask], strength_info.feedback)
+    details = strength_info['details']
+    return (strength_info['strength'].value, strength_info['score'],
+            tuple(bool(details[key]) for key, _, _, _ in CRITERIA), strength_info['feedback'])
+
+
+def export_many(records, fmt: str = "csv", filename: str = None, output_dir: str = None,
+                buffer_size: int = DEFAULT_EXPORT_BUFFER, flush_every: int = None,
+                fsync: bool = False) -> tuple:
+    """
+    Export banyak password ke satu file CSV, JSONL, teks, atau binary
+    kolumnar .pwx (dibaca lagi dengan PwxReader).
+    
+    Record ditulis streaming lewat buffer besar (satu syscall write per
+    `buffer_size` byte, bukan satu file per password), jadi memory tetap
+    konstan berapa pun jumlah record. File ditulis ke file sementara dan
+    baru di-rename ke nama final setelah selesai.
+    
+    Args:
+        records: Iterable (password, hasil strength checker, ringkasan rules)
+        fmt: "csv", "jsonl", "txt" (format laporan export_to_file), atau "pwx"
+        filename: Nama file (opsional, auto-generate jika tidak diberikan)
+        output_dir: Folder tujuan (default: output/)
+        buffer_size: Ukuran buffer write dalam byte
+        flush_every: Flush ke OS setiap N record (opsional)
+        fsync: fsync setiap flush dan di akhir, supaya data aman jika mesin mati
+    
+    Returns:
+        Tuple (path file, jumlah record)
+    
+    Raises:
+        ValueError: Jika format atau parameter tidak valid
+        IOError: Jika ada masalah saat menulis file
+    """
+    check_export_format(fmt)
+    if buffer_size < 1:
+        raise ValueError("Ukuran buffer minimal 1 byte")
+    if flush_every is not None and flush_every < 1:
+        raise ValueError("flush_every minimal 1 record")
     
-    # Full path
-    filepath = os.path.join(output_dir, filename)
+    if output_dir is None:
+        output_dir = _default_output_dir()
+    os.makedirs(output_dir, exist_ok=True)
     
-    # Prepare content
-    content = f"""═══════════════════════════════════════════════════════════
-               PASSWORD GENERATOR RESULT
-═══════════════════════════════════════════════════════════
+    atomic = None
+    try:
+        atomic = open_export_file(output_dir, fmt, buffer_size)
+        count, lowest = write_export(atomic.file, records, fmt, output_dir, flush_every, fsync)
+        if fsync:
+            atomic.fsync()
+        filepath = atomic.commit(filename, "passwords", EXPORT_FORMATS[fmt])
+        if fsync:
+            fsync_directory(output_dir)
+        record_export(filepath, count, lowest)
+        return filepath, count
+    except BaseException as e:
+        # File sementara dihapus apa pun error-nya (termasuk dari records)
+        if atomic is not None:
+            atomic.discard()
+        if isinstance(e, IOError):
+            raise IOError(f"Gagal menulis file: {str(e)}")
+        raise
 
-Generated At: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
-PASSWORD
-────────────────────────────────────────────────────────────
-{password}
+def check_export_format(fmt: str):
+    """
+    Raises:
+        ValueError: Jika format export tidak dikenal
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Format export tidak dikenal: {fmt} "
+                         f"(pilihan: {', '.join(EXPORT_FORMATS)})")
 
-RULES USED
-────────────────────────────────────────────────────────────
-{rules_summary}
 
-STRENGTH ANALYSIS
-────────────────────────────────────────────────────────────
-Level: {strength_info['strength'].value}
-Score: {strength_info['score']}/100
+def open_export_file(output_dir: str, fmt: str,
+                     buffer_size: int = DEFAULT_EXPORT_BUFFER) -> AtomicExportFile:
+    """AtomicExportFile dengan mode (teks/binary) dan buffer sesuai format"""
+    if fmt == "pwx":
+        return AtomicExportFile(output_dir, binary=True, buffering=buffer_size)
+    return AtomicExportFile(output_dir, encoding="utf-8", buffering=buffer_size, newline="")
 
-Criteria Met:
-  ✓ Panjang Password (8+ karakter): {'YA' if strength_info['details']['panjang'] else 'TIDAK'}
-  ✓ Panjang Extra (12+ karakter):   {'YA' if strength_info['details']['panjang_extra'] else 'TIDAK'}
-  ✓ Huruf Besar (A-Z):              {'YA' if strength_info['details']['huruf_besar'] else 'TIDAK'}
-  ✓ Huruf Kecil (a-z):              {'YA' if strength_info['details']['huruf_kecil'] else 'TIDAK'}
-  ✓ Angka (0-9):                    {'YA' if strength_info['details']['angka'] else 'TIDAK'}
-  ✓ Simbol (!@#$%^&*):              {'YA' if strength_info['details']['simbol'] else 'TIDAK'}
 
-Recommendations:
-────────────────────────────────────────────────────────────
-"""
+def write_export(f, records, fmt: str, spill_dir: str, flush_every: int = None,
+                 fsync: bool = False) -> tuple:
+    """
+    Tulis record ke file export yang sudah dibuka (lihat export_many)
     
-    if strength_info['feedback']:
-        for i, rec in enumerate(strength_info['feedback'], 1):
-            content += f"{i}. {rec}\n"
+    Returns:
+        Tuple (jumlah record, skor terendah atau None jika kosong)
+    """
+    if fmt == "pwx":
+        count, lowest = _write_pwx(f, records, spill_dir, flush_every, fsync)
+    else:
+        count, lowest = _write_records(f, records, fmt, flush_every, fsync)
+    f.flush()
+    return count, (lowest if count else None)
+
+
+def _write_records(f, records, fmt: str, flush_every: int, fsync: bool) -> tuple:
+    """Tulis semua record ke file yang sudah dibuka; kembalikan (jumlah, skor terendah)"""
+    generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if fmt == "csv":
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        write = writer.writerow
     else:
-        content += "Tidak ada rekomendasi. Password sudah sangat kuat!\n"
+        write = f.write
     
-    content += "\n═══════════════════════════════════════════════════════════\n"
+    count = 0
+    lowest = 101
+    for password, strength_info, rules_summary in records:
+        if fmt == "txt":
+            write(_format_text_report(password, strength_info, rules_summary, generated_at))
+            score = strength_info['score']
+        else:
+            strength, score, details, feedback = _record_fields(strength_info)
+            if fmt == "csv":
+                write((password, strength, score) + tuple(map(int, details))
+                      + ("; ".join(feedback), rules_summary))
+            else:
+                record = {"password": password, "strength": strength, "score": score}
+                record.update(zip(CSV_COLUMNS[3:-2], details))
+                record["feedback"] = feedback
+                record["rules"] = rules_summary
+                write(json.dumps(record, ensure_ascii=False))
+                write("\n")
+        
+        if score < lowest:
+            lowest = score
+        count += 1
+        if flush_every is not None and count % flush_every == 0:
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+    return count, lowest
+
+
+def _record_columns(strength_info) -> tuple:
+    """(skor, kode strength, mask kriteria) dari StrengthResult atau dict"""
+    if isinstance(strength_info, StrengthResult):
+        return strength_info.score, strength_info.code, strength_info.mask
+    details = strength_info['details']
+    mask = sum(bit for key, bit, _, _ in CRITERIA if details[key])
+    return (strength_info['score'], STRENGTH_LEVELS.index(strength_info['strength']), mask)
+
+
+def _pad_to_8(f):
+    f.write(bytes(-f.tell() % 8))
+
+
+def _write_pwx(f, records, spill_dir: str, flush_every: int, fsync: bool) -> tuple:
+    """
+    Tulis record ke file .pwx yang sudah dibuka (mode binary).
+    
+    Blob password langsung di-stream ke file setelah header; kolom tetap
+    dikumpulkan per PWX_CHUNK_ROWS baris lalu di-spill ke file sementara
+    dan disalin ke belakang blob di akhir. Rules biasanya sama untuk satu
+    export, jadi disimpan sekali per nilai unik (rule_ids menunjuk ke
+    tabel rules).
+    """
+    header_size = _PWX_HEADER.size + _PWX_SECTION.size * len(PWX_SECTIONS)
+    f.write(bytes(header_size))
+    
+    fixed = ("scores", "codes", "masks", "password_offsets", "rule_ids")
+    columns = {name: array(typecode) for name, typecode in PWX_SECTIONS if name in fixed}
+    spills = {name: tempfile.TemporaryFile(dir=spill_dir) for name in fixed}
+    scores, codes, masks = columns["scores"], columns["codes"], columns["masks"]
+    password_offsets, rule_ids = columns["password_offsets"], columns["rule_ids"]
     
-    # Write to file
+    def spill():
+        for name, column in columns.items():
+            column.tofile(spills[name])
+            del column[:]
+    
+    rule_table = {}
+    sections = {}
+    blob_start = f.tell()
+    offset = 0
+    count = 0
+    lowest = 101
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return filepath
-    except IOError as e:
-        raise IOError(f"Gagal menulis file: {str(e)}")
+        password_offsets.append(0)
+        for password, strength_info, rules_summary in records:
+            data = password.encode("utf-8", "surrogateescape")
+            f.write(data)
+            offset += len(data)
+            password_offsets.append(offset)
+            
+            score, code, mask = _record_columns(strength_info)
+            if score < lowest:
+                lowest = score
+            scores.append(score)
+            codes.append(code)
+            masks.append(mask)
+            rule_ids.append(rule_table.setdefault(rules_summary or "", len(rule_table)))
+            
+            count += 1
+            if count % PWX_CHUNK_ROWS == 0:
+                spill()
+            if flush_every is not None and count % flush_every == 0:
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+        spill()
+        sections["passwords"] = (blob_start, offset)
+        
+        for name in fixed:
+            _pad_to_8(f)
+            start = f.tell()
+            spills[name].seek(0)
+            shutil.copyfileobj(spills[name], f, DEFAULT_EXPORT_BUFFER)
+            sections[name] = (start, f.tell() - start)
+    finally:
+        for spill_file in spills.values():
+            spill_file.close()
+    
+    rule_blobs = [rules.encode("utf-8", "surrogateescape") for rules in rule_table]
+    rule_offsets = array("Q", [0])
+    for data in rule_blobs:
+        rule_offsets.append(rule_offsets[-1] + len(data))
+    for name, data in (("rule_offsets", rule_offsets.tobytes()), ("rules", b"".join(rule_blobs))):
+        _pad_to_8(f)
+        sections[name] = (f.tell(), len(data))
+        f.write(data)
+    
+    f.seek(0)
+    f.write(_PWX_HEADER.pack(PWX_MAGIC, PWX_VERSION, 0, count))
+    for name, _ in PWX_SECTIONS:
+        f.write(_PWX_SECTION.pack(*sections[name]))
+    f.seek(0, os.SEEK_END)
+    return count, lowest
+
+
+class PwxReader:
+    """
+    Reader file export .pwx lewat memory map.
+    
+    Kolom `scores`, `codes`, `masks`, `password_offsets` dan `rule_ids`
+    adalah memoryview langsung ke file (zero-copy), jadi membuka export
+    50 juta baris hanya membaca header. reader[i] O(1): dua offset lalu
+    decode satu password. Semua view tidak valid lagi setelah close().
+    """
+    
+    def __init__(self, filepath: str):
+        """
+        Args:
+            filepath: Path file .pwx
+        
+        Raises:
+            FileNotFoundError: Jika file tidak ditemukan
+            ValueError: Jika file bukan .pwx yang valid
+        """
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"File tidak ditemukan: {filepath}")
+        self.path = filepath
+        self._file = open(filepath, "rb")
+        self._views = []
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._open()
+        except ValueError as e:
+            self.close()
+            raise ValueError(f"Bukan file export .pwx yang valid: {filepath} ({e})")
+    
+    def _open(self):
+        view = self._view(memoryview(self._mmap))
+        if len(view) < _PWX_HEADER.size + _PWX_SECTION.size * len(PWX_SECTIONS):
+            raise ValueError("header tidak lengkap")
+        magic, version, _, rows = _PWX_HEADER.unpack_from(view)
+        if magic != PWX_MAGIC:
+            raise ValueError("magic tidak cocok")
+        if version != PWX_VERSION:
+            raise ValueError(f"versi {version} tidak didukung")
+        
+        self.rows = rows
+        for i, (name, typecode) in enumerate(PWX_SECTIONS):
+            start, length = _PWX_SECTION.unpack_from(view, _PWX_HEADER.size + i * _PWX_SECTION.size)
+            if start + length > len(view):
+                raise ValueError(f"section {name} melewati akhir file")
+            section = self._view(view[start:start + length])
+            if typecode not in (None, "B"):
+                section = self._view(section.cast(typecode))
+            setattr(self, name, section)
+        
+        if (len(self.scores) != rows or len(self.codes) != rows or len(self.masks) != rows
+                or len(self.password_offsets) != rows + 1 or len(self.rule_ids) != rows):
+            raise ValueError("panjang kolom tidak sesuai jumlah baris")
+        rule_offsets = self.rule_offsets
+        self.rule_table = [str(self.rules[rule_offsets[i]:rule_offsets[i + 1]],
+                               "utf-8", "surrogateescape")
+                           for i in range(len(rule_offsets) - 1)]
+    
+    def _view(self, view: memoryview) -> memoryview:
+        self._views.append(view)
+        return view
+    
+    def close(self):
+        """Lepas semua view lalu tutup memory map dan file"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __len__(self) -> int:
+        return self.rows
+    
+    def _index(self, i: int) -> int:
+        if i < 0:
+            i += self.rows
+        if not 0 <= i < self.rows:
+            raise IndexError("Indeks baris di luar jangkauan")
+        return i
+    
+    def password(self, i: int) -> str:
+        """Password baris ke-i"""
+        i = self._index(i)
+        offsets = self.password_offsets
+        return str(self.passwords[offsets[i]:offsets[i + 1]], "utf-8", "surrogateescape")
+    
+    def __getitem__(self, i: int) -> tuple:
+        """
+        Baris ke-i sebagai (password, StrengthResult, rules), format yang
+        sama dengan record export_many
+        """
+        i = self._index(i)
+        password = self.password(i)
+        result = StrengthResult(self.masks[i], len(password), self.scores[i])
+        return password, result, self.rule_table[self.rule_ids[i]]
+    
+    def __iter__(self):
+        for i in range(self.rows):
+            yield self[i]
+    
+    def scan(self, min_score: int = None, max_score: int = None, strengths=None,
+             required_mask: int = 0, pattern: str = None):
+        """
+        Yield indeks baris yang memenuhi semua filter.
+        
+        Filter kolom dievaluasi per PWX_SCAN_ROWS baris tanpa loop Python
+        per baris: tiap kolom di-translate menjadi byte 0/1 lewat tabel 256
+        byte, hasilnya di-AND sebagai integer, lalu posisi byte 1 dicari
+        dengan bytes.find. Regex hanya dijalankan pada baris yang lolos
+        filter kolom.
+        
+        Args:
+            min_score: Skor minimal (opsional)
+            max_score: Skor maksimal (opsional)
+            strengths: Iterable PasswordStrength yang diterima (opsional)
+            required_mask: Bit kriteria (CRITERIA) yang harus terpenuhi semua
+            pattern: Regex yang dicari (re.search) di password (opsional)
+        """
+        lo = 0 if min_score is None else min_score
+        hi = 255 if max_score is None else max_score
+        conditions = []
+        if lo > 0 or hi < 255:
+            conditions.append((self.scores, bytes(lo <= value <= hi for value in range(256))))
+        if strengths is not None:
+            codes = {STRENGTH_LEVELS.index(level) for level in strengths}
+            conditions.append((self.codes, bytes(value in codes for value in range(256))))
+        if required_mask:
+            conditions.append((self.masks, bytes(value & required_mask == required_mask
+                                                 for value in range(256))))
+        regex = re.compile(pattern) if pattern is not None else None
+        
+        for start in range(0, self.rows, PWX_SCAN_ROWS):
+            end = min(start + PWX_SCAN_ROWS, self.rows)
+            if conditions:
+                hits = None
+                for column, table in conditions:
+                    chunk = int.from_bytes(column[start:end].tobytes().translate(table), "little")
+                    hits = chunk if hits is None else hits & chunk
+                hits = hits.to_bytes(end - start, "little")
+                candidates = _byte_positions(hits, start)
+            else:
+                candidates = range(start, end)
+            
+            if regex is None:
+                yield from candidates
+            else:
+                search = regex.search
+                password = self.password
+                for i in candidates:
+                    if search(password(i)):
+                        yield i
+
+
+def _byte_positions(hits: bytes, base: int):
+    """Yield base + posisi setiap byte 1 di `hits`"""
+    find = hits.find
+    pos = find(1)
+    while pos != -1:
+        yield base + pos
+        pos = find(1, pos + 1)
+
+
+def _format_pwx_preview(filepath: str, max_rows: int) -> str:
+    """Ringkasan dan beberapa baris pertama file .pwx dalam bentuk teks"""
+    with PwxReader(filepath) as reader:
+        lines = [f"Export binary .pwx: {len(reader):,} password", ""]
+        for i in range(min(max_rows, len(reader))):
+            password, result, rules = reader[i]
+            lines.append(f"{i + 1:>8}. {password}  ({result.strength.value}, skor {result.score})")
+        if len(reader) > max_rows:
+            lines.append(f"... dan {len(reader) - max_rows:,} password lainnya")
+    return "\n".join(lines)
 
 
-def read_export_file(filepath: str) -> str:
+def read_export_file(filepath: str, max_rows: int = PWX_PREVIEW_ROWS) -> str:
     """
     Baca isi file export
     
     Args:
         filepath: Path ke file yang akan dibaca
+        max_rows: Jumlah baris yang ditampilkan untuk file binary .pwx
     
     Returns:
-        Isi file sebagai string
+        Isi file sebagai string (file .pwx: ringkasan dan baris pertama).
+        Untuk export teks berukuran besar gunakan get_text_reader().
     
     Raises:
         FileNotFoundError: Jika file tidak ditemukan
     """
     try:
+        with open(filepath, 'rb') as f:
+            if f.read(len(PWX_MAGIC)) == PWX_MAGIC:
+                return _format_pwx_preview(filepath, max_rows)
         with open(filepath, 'r', encoding='utf-8') as f:
             return f.read()
     except FileNotFoundError:
         raise FileNotFoundError(f"File tidak ditemukan: {filepath}")
 
 
+class TextExportReader:
+    """
+    Baca file export teks (txt/csv/jsonl) per halaman baris tanpa memuat
+    seluruh file.
+    
+    File di-memory-map dan offset awal setiap LINE_INDEX_STRIDE baris
+    disimpan sebagai index (8 byte per blok, bukan per baris). Index file
+    besar di-cache di `.<nama file>.idx` di sebelahnya dan di-mmap saat
+    dibuka lagi, jadi cukup dibangun sekali per file. Mengambil baris ke-i
+    hanya melompat ke blok-nya lalu maju paling banyak LINE_INDEX_STRIDE
+    baris, sehingga biayanya sebanding dengan ukuran halaman, bukan file.
+    """
+    
+    def __init__(self, filepath: str):
+        """
+        Args:
+            filepath: Path file export teks
+        
+        Raises:
+            FileNotFoundError: Jika file tidak ditemukan
+            ValueError: Jika file adalah export binary .pwx
+        """
+        try:
+            f = open(filepath, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File tidak ditemukan: {filepath}")
+        
+        with f:
+            stat = os.fstat(f.fileno())
+            if f.read(len(PWX_MAGIC)) == PWX_MAGIC:
+                raise ValueError(f"File binary .pwx, gunakan PwxReader: {filepath}")
+            self._data = (mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                          if stat.st_size else b"")
+        
+        self.path = filepath
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        directory, name = os.path.split(filepath)
+        self.index_path = os.path.join(directory, f".{name}.idx")
+        self._index_map = None
+        self._blocks, self._lines = self._load_index()
+    
+    def __len__(self) -> int:
+        return self._lines
+    
+    def close(self):
+        self._blocks = array("Q")
+        if self._index_map is not None:
+            self._index_map.close()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def _load_index(self) -> tuple:
+        """Baca index dari cache di disk, atau bangun ulang jika basi"""
+        if self.size >= LINE_INDEX_MIN_SIZE:
+            try:
+                with open(self.index_path, "rb") as f:
+                    index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, size, mtime, lines, stride = LINE_INDEX_HEADER.unpack_from(index_map)
+                if (magic == LINE_INDEX_MAGIC and size == self.size
+                        and mtime == self.mtime_ns and stride == LINE_INDEX_STRIDE):
+                    self._index_map = index_map
+                    # Zero-copy: view langsung ke page mmap index
+                    return memoryview(index_map)[LINE_INDEX_HEADER.size:].cast("Q"), lines
+                index_map.close()
+            except (OSError, ValueError, struct.error):
+                pass
+        
+        blocks, lines = self._build_index()
+        if self.size >= LINE_INDEX_MIN_SIZE:
+            self._write_index(blocks, lines)
+        return blocks, lines
+    
+    def _build_index(self) -> tuple:
+        """
+        Scan file sekali: satu regex match (di C) per LINE_INDEX_STRIDE
+        baris, bukan satu find() per baris
+        """
+        data = self._data
+        blocks = array("Q", [0])
+        pos = 0
+        match = _LINE_BLOCK.match(data, pos)
+        while match:
+            pos = match.end()
+            blocks.append(pos)
+            match = _LINE_BLOCK.match(data, pos)
+        
+        # Baris sisa setelah blok lengkap terakhir; baris terakhir tanpa
+        # newline tetap dihitung
+        lines = (len(blocks) - 1) * LINE_INDEX_STRIDE + data[pos:].count(b"\n")
+        if self.size and data[self.size - 1:self.size] != b"\n":
+            lines += 1
+        return blocks, lines
+    
+    def _write_index(self, blocks: array, lines: int):
+        """Simpan index ke disk secara atomic (best effort, read-only dir diabaikan)"""
+        header = LINE_INDEX_HEADER.pack(LINE_INDEX_MAGIC, self.size, self.mtime_ns,
+                                        lines, LINE_INDEX_STRIDE)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                blocks.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def lines(self, start: int, count: int) -> list:
+        """
+        Ambil baris [start, start + count) tanpa newline
+        
+        Args:
+            start: Nomor baris pertama (mulai 0)
+            count: Jumlah baris maksimal
+        
+        Returns:
+            List baris (lebih pendek dari count di akhir file)
+        
+        Raises:
+            ValueError: Jika start atau count negatif
+        """
+        if start < 0 or count < 0:
+            raise ValueError("Nomor baris dan jumlah baris tidak boleh negatif")
+        count = min(count, self._lines - start)
+        if count <= 0:
+            return []
+        
+        data = self._data
+        find = data.find
+        block, skip = divmod(start, LINE_INDEX_STRIDE)
+        pos = self._blocks[block]
+        for _ in range(skip):
+            pos = find(b"\n", pos) + 1
+        
+        first = pos
+        for _ in range(count):
+            end = find(b"\n", pos)
+            pos = self.size if end == -1 else end + 1
+        text = data[first:pos].decode("utf-8", "replace")
+        return text.replace("\r\n", "\n").split("\n")[:count]
+    
+    def pages(self, per_page: int = DEFAULT_PAGE_LINES) -> int:
+        """Jumlah halaman (minimal 1, file kosong tetap satu halaman)"""
+        return max(1, -(-self._lines // per_page))
+    
+    def page(self, page: int, per_page: int = DEFAULT_PAGE_LINES) -> str:
+        """
+        Isi satu halaman sebagai string
+        
+        Args:
+            page: Nomor halaman (mulai 1)
+            per_page: Jumlah baris per halaman
+        
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if page < 1 or per_page < 1:
+            raise ValueError("Halaman dan jumlah baris per halaman minimal 1")
+        return "\n".join(self.lines((page - 1) * per_page, per_page))
+
+
+def get_text_reader(filepath: str) -> TextExportReader:
+    """
+    TextExportReader untuk satu file (di-cache per path; dibuka ulang jika
+    ukuran/mtime file berubah)
+    
+    Raises:
+        FileNotFoundError: Jika file tidak ditemukan
+        ValueError: Jika file adalah export binary .pwx
+    """
+    path = os.path.abspath(filepath)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File tidak ditemukan: {filepath}")
+    
+    with _TEXT_READER_LOCK:
+        reader = _TEXT_READER_CACHE.get(path)
+        if reader is not None and (reader.size, reader.mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+            _TEXT_READER_CACHE.move_to_end(path)
+            return reader
+    
+    reader = TextExportReader(path)
+    with _TEXT_READER_LOCK:
+        _TEXT_READER_CACHE[path] = reader
+        # Reader lama tidak di-close: mungkin masih dipakai thread lain,
+        # mmap-nya dilepas saat tidak ada lagi yang memegang
+        while len(_TEXT_READER_CACHE) > TEXT_READER_CACHE_SIZE:
+            _TEXT_READER_CACHE.popitem(last=False)
+    return reader
+
+
+def iter_export_chunks(filepath: str, chunk_size: int = DEFAULT_EXPORT_BUFFER):
+    """
+    Isi file export sebagai generator potongan bytes (untuk download/stream
+    tanpa memuat seluruh file)
+    
+    Args:
+        filepath: Path file export
+        chunk_size: Ukuran maksimal tiap potongan (byte)
+    
+    Raises:
+        FileNotFoundError: Jika file tidak ditemukan
+        ValueError: Jika chunk_size kurang dari 1
+    """
+    if chunk_size < 1:
+        raise ValueError("Ukuran potongan minimal 1 byte")
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File tidak ditemukan: {filepath}")
+    return _iter_chunks(f, chunk_size)
+
+
+def _iter_chunks(f, chunk_size: int):
+    with f:
+        chunk = f.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = f.read(chunk_size)
+
+
+def _inspect_export(filepath: str, fmt: str) -> tuple:
+    """
+    (jumlah password, skor terendah) file export yang belum tercatat di
+    manifest (misal dibuat sebelum ada manifest); (None, None) jika file
+    tidak bisa dibaca
+    """
+    scores = []
+    try:
+        if fmt == "pwx":
+            with PwxReader(filepath) as reader:
+                column = reader.scores.tobytes()
+            # Cari nilai terkecil yang ada di kolom (pencarian byte di C)
+            lowest = next((value for value in range(256) if bytes((value,)) in column), None)
+            return len(column), lowest
+        with open(filepath, encoding="utf-8", newline="") as f:
+            if fmt == "txt":
+                scores = [int(line[7:].split("/")[0]) for line in f if line.startswith("Score: ")]
+            elif fmt == "csv":
+                rows = csv.reader(f)
+                next(rows, None)
+                scores = [int(row[2]) for row in rows]
+            else:
+                scores = [json.loads(line)["score"] for line in f if line.strip()]
+    except (OSError, ValueError, KeyError, IndexError):
+        return None, None
+    return len(scores), min(scores, default=None)
+
+
+def get_export_manifest(output_dir: str = None):
+    """
+    ExportManifest folder export (lihat export_manifest)
+    
+    Raises:
+        sqlite3.Error: Jika database manifest tidak bisa dibuat/dibuka
+    """
+    extensions = {extension: fmt for fmt, extension in EXPORT_FORMATS.items()}
+    return get_manifest(output_dir or _default_output_dir(), extensions, _inspect_export)
+
+
+def record_export(filepath: str, rows: int, score: int):
+    """Catat file export yang baru ditulis ke manifest folder-nya"""
+    try:
+        get_export_manifest(os.path.dirname(filepath)).record(filepath, rows, score)
+    except (sqlite3.Error, OSError):
+        # Manifest hanya index: file tetap tersimpan, dan refresh
+        # berikutnya (mtime folder berubah) akan mencatatnya
+        pass
+
+
+def query_exports(output_dir: str = None, **filters) -> tuple:
+    """
+    Daftar export dengan filter, urutan dan halaman (lihat ExportManifest.query)
+    
+    Returns:
+        Tuple (list dictionary export, jumlah total yang cocok)
+    """
+    return get_export_manifest(output_dir).query(**filters)
+
+
 def list_exports(output_dir: str = None) -> list:
     """
     List semua file export yang sudah dibuat
     
     Returns:
-        List nama file dalam direktori output
+        List nama file dalam direktori output, terbaru lebih dulu
     """
     if output_dir is None:
-        output_dir = os.path.join(os.path.dirname(__file__), "..", "output")
+        output_dir = _default_output_dir()
     
     if not os.path.exists(output_dir):
         return []
     
-    return [f for f in os.listdir(output_dir) if f.endswith('.txt')]
+    try:
+        return get_export_manifest(output_dir).names()
+    except sqlite3.Error:
+        # Folder read-only / database rusak: scan langsung
+        extensions = tuple(EXPORT_FORMATS.values())
+        return [f for f in os.listdir(output_dir) if f.endswith(extensions)]
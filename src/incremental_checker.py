@@ -0,0 +1,306 @@
+"""
+Incremental Checker Module
+Strength check as-you-type: state diperbarui per ketikan, bukan dihitung ulang
+"""
+
+from pattern_analyzer import (KEYBOARD_GRAPH, LEET_TABLES, MAX_ANALYSIS_LENGTH, REPEAT_SUFFIX,
+                              YEAR_PATTERN, _digit_date_match, _separator_date_match,
+                              _sequence_match, _spatial_match, _year_match)
+from strength_checker import (StrengthResult, _CLASS_TABLE, _capped_result,
+                              _length_bits)
+
+# Bit kelas karakter yang dihitung (huruf besar, huruf kecil, angka, simbol)
+CLASS_BITS = (1 << 1, 1 << 2, 1 << 3, 1 << 4)
+
+
+class IncrementalChecker:
+    """
+    Strength checker dengan state berjalan untuk live strength meter.
+    
+    Setiap karakter menyimpan satu record di stack: bit kelasnya, node
+    automaton kamus (huruf kecil, tiap tabel leet dan kata terbalik), kata
+    yang berakhir di posisi itu, serta state run terakhir matcher keyboard,
+    urutan, pengulangan dan tanggal. append() dan backspace() hanya push/pop
+    satu record dan memperbarui counter, jadi biayanya O(1) amortized per
+    ketikan (ditambah jumlah pola yang ditemukan).
+    
+    result() identik dengan check_password_strength pada teks yang sama:
+    semua pola diambil dari stack, hanya dynamic programming tebakan yang
+    dijalankan (baris yang pola-nya tidak berubah dipakai ulang). Hasil
+    di-cache sampai teks berubah.
+    """
+    
+    def __init__(self, pattern_analyzer=None, breach_db=None, entropy_bits: float = None):
+        """
+        Args:
+            pattern_analyzer: PatternAnalyzer (opsional), sama dengan check_password_strength
+            breach_db: BreachDatabase (opsional)
+            entropy_bits: Entropy generator (opsional)
+        """
+        self.pattern_analyzer = pattern_analyzer
+        self.breach_db = breach_db
+        self.entropy_bits = entropy_bits
+        # Automaton per varian: huruf kecil, tiap tabel leet, lalu kata terbalik
+        self._automata = ()
+        if pattern_analyzer is not None:
+            self._automata = (pattern_analyzer.automaton,) * (1 + len(LEET_TABLES))
+            if pattern_analyzer.reversed_automaton is not None:
+                self._automata += (pattern_analyzer.reversed_automaton,)
+        
+        self._chars = []
+        # Record per karakter: (bit kelas, node automaton per varian,
+        # kata yang berakhir di posisi ini per varian, mengandung 'Σ',
+        # state matcher lain, lihat _runs)
+        self._records = []
+        self._class_counts = dict.fromkeys(CLASS_BITS, 0)
+        self._irregular = 0
+        # Baris dynamic programming tebakan yang bisa dipakai ulang
+        self._guess_rows = []
+        self._result = None
+    
+    @property
+    def text(self) -> str:
+        """Teks saat ini"""
+        return "".join(self._chars)
+    
+    def __len__(self) -> int:
+        return len(self._chars)
+    
+    def append(self, char: str):
+        """
+        Tambah satu karakter di akhir.
+        
+        Raises:
+            ValueError: Jika char bukan tepat satu karakter
+        """
+        if len(char) != 1:
+            raise ValueError("append hanya menerima satu karakter")
+        
+        pos = len(self._chars)
+        code = ord(char)
+        bit = _CLASS_TABLE[code] if code < 128 else 0
+        
+        nodes = found = runs = None
+        irregular = False
+        if self._automata and pos < MAX_ANALYSIS_LENGTH:
+            # Sama dengan _lowercase; huruf kecil 'Σ' bergantung karakter
+            # setelahnya, jadi teks yang mengandungnya di-scan ulang penuh
+            lower = char.lower()
+            if len(lower) != 1:
+                lower = char
+            irregular = char == "Σ"
+            variants = (lower,) + tuple(lower.translate(table) for table in LEET_TABLES) + (lower,)
+            nodes, found = self._step(pos, variants)
+            runs = self._runs(pos, char)
+        
+        self._chars.append(char)
+        self._records.append((bit, nodes, found, irregular, runs))
+        self._count(bit, irregular, 1)
+        self._result = None
+    
+    def backspace(self):
+        """Hapus karakter terakhir (tidak melakukan apa-apa jika kosong)"""
+        if not self._chars:
+            return
+        self._chars.pop()
+        bit, _, _, irregular, _ = self._records.pop()
+        self._count(bit, irregular, -1)
+        self._result = None
+    
+    def extend(self, text: str):
+        """Tambah beberapa karakter di akhir"""
+        for char in text:
+            self.append(char)
+    
+    def set_text(self, text: str):
+        """
+        Samakan state dengan `text`: backspace sampai prefix yang sama,
+        lalu append sisanya (cocok untuk widget yang mengirim teks utuh)
+        """
+        chars = self._chars
+        common = 0
+        limit = min(len(chars), len(text))
+        while common < limit and chars[common] == text[common]:
+            common += 1
+        while len(chars) > common:
+            self.backspace()
+        self.extend(text[common:])
+    
+    def clear(self):
+        """Kosongkan teks"""
+        self.set_text("")
+    
+    def _step(self, pos: int, variants: tuple) -> tuple:
+        """Satu transisi automaton per varian, beserta kata yang berakhir di pos"""
+        previous = self._records[-1][1] if pos else (0,) * len(self._automata)
+        
+        nodes = []
+        found = []
+        for automaton, node, char in zip(self._automata, previous, variants):
+            node = automaton.step(node, char)
+            nodes.append(node)
+            word_len = automaton.word_len
+            found.append(tuple((pos - word_len[wid] + 1, pos, wid)
+                               for wid in automaton.words_at(node)))
+        return tuple(nodes), tuple(found)
+    
+    def _runs(self, pos: int, char: str) -> tuple:
+        """
+        State matcher keyboard, urutan, pengulangan dan tanggal setelah
+        `char` ditambahkan di pos (sama dengan matcher di pattern_analyzer).
+        
+        Keyboard dan urutan hanya memeriksa apakah run terakhir bisa
+        diperpanjang; run yang selesai disimpan sebagai Match di record ini.
+        Tanggal dan tahun hanya dicari di jendela yang berakhir di pos.
+        Pengulangan hanya dicari ulang jika ada pengulangan baru yang
+        berakhir di pos, mulai dari pola pertama yang bisa terpengaruh.
+        
+        Returns:
+            Tuple (run keyboard, Match keyboard yang selesai, run urutan,
+            Match urutan yang selesai, Match pengulangan seluruh teks,
+            Match tanggal yang berakhir di pos, Match tahun, akhir tahun terakhir)
+        """
+        chars = self._chars
+        entry = KEYBOARD_GRAPH.get(char)
+        shifted = 1 if entry is not None and entry[1] else 0
+        if not pos:
+            return (0, None, 0, shifted), None, (0, None), None, (), (), None, -1
+        previous = chars[pos - 1]
+        spatial, _, sequence, _, repeats, _, _, year_end = self._records[-1][4]
+        
+        # Keyboard: (awal run, arah terakhir, jumlah belokan, jumlah shift)
+        start, last_direction, turns, run_shifted = spatial
+        current = KEYBOARD_GRAPH.get(previous)
+        direction = None
+        if current is not None and entry is not None:
+            direction = current[2].get(entry[0])
+        spatial_closed = None
+        if direction is not None:
+            if direction != last_direction:
+                turns += 1
+            spatial = (start, direction, turns, run_shifted + shifted)
+        else:
+            if pos - 1 - start >= 2:
+                spatial_closed = _spatial_match("".join(chars[start:pos]), start,
+                                                turns, run_shifted)
+            spatial = (pos, None, 0, shifted)
+        
+        # Urutan: (awal run, selisih kode), run baru dimulai di karakter sebelumnya
+        start, delta = sequence
+        step = ord(char) - ord(previous)
+        sequence_closed = None
+        if delta is None or (step == delta and delta != 0 and abs(delta) <= 5):
+            sequence = (start, step)
+        else:
+            if pos - 1 - start >= 2:
+                sequence_closed = _sequence_match("".join(chars[start:pos]), start, delta)
+            sequence = (pos - 1, step)
+        
+        # Pengulangan baru harus berakhir di pos, jadi char sudah muncul di
+        # paruh terakhir teks. Pola yang dimulai sebelum pengulangan baru
+        # paling kiri tidak berubah.
+        if char in chars[pos - (pos + 1) // 2:pos]:
+            head = "".join(chars) + char
+            suffix = REPEAT_SUFFIX.search(head)
+            if suffix is not None:
+                keep = 0
+                while keep < len(repeats) and repeats[keep].i < suffix.start():
+                    keep += 1
+                resume = repeats[keep - 1].j + 1 if keep else 0
+                repeats = repeats[:keep] + tuple(
+                    self.pattern_analyzer._repeat_matches(head, resume))
+        
+        # Tanggal (maksimal 10 karakter) dan tahun yang berakhir di pos
+        first = max(pos - 9, 0)
+        window = "".join(chars[first:pos]) + char
+        dates = []
+        for i in range(first, pos - 2):
+            token = window[i - first:]
+            m = _separator_date_match(token, i) if pos - i >= 5 else None
+            if m is None and pos - i <= 7 and token.isdigit():
+                m = _digit_date_match(token, i)
+            if m is not None:
+                dates.append(m)
+        year = None
+        if pos >= 3 and pos - 3 > year_end and YEAR_PATTERN.fullmatch(window[-4:]):
+            year = _year_match(window[-4:], pos - 3)
+            year_end = pos
+        
+        return (spatial, spatial_closed, sequence, sequence_closed, repeats,
+                tuple(dates), year, year_end)
+    
+    def _count(self, bit: int, irregular: bool, delta: int):
+        """Perbarui counter berjalan untuk satu record"""
+        if bit:
+            self._class_counts[bit] += delta
+        if irregular:
+            self._irregular += delta
+    
+    def _mask(self) -> int:
+        """Mask kriteria dari counter kelas dan panjang (sama dengan _classify)"""
+        counts = self._class_counts
+        mask = sum(bit for bit in CLASS_BITS if counts[bit])
+        return mask | _length_bits(len(self._chars))
+    
+    def _scans(self) -> tuple:
+        """Scan kamus dari stack, format argumen `scans` PatternAnalyzer"""
+        found = [record[2] for record in self._records[:MAX_ANALYSIS_LENGTH]]
+        forward = [match for per_pos in found for match in per_pos[0]]
+        leet = tuple([match for per_pos in found for match in per_pos[t + 1]]
+                     for t in range(len(LEET_TABLES)))
+        if len(self._automata) == 1 + len(LEET_TABLES):
+            return forward, leet
+        # Urutan sama dengan scan password yang dibalik
+        backward = sorted((match for per_pos in found for match in per_pos[-1]),
+                          key=lambda match: (-match[0], -match[1]))
+        return forward, leet, backward
+    
+    def _matches(self, head: str) -> list:
+        """Semua pola `head` dari stack, format PatternAnalyzer.find_matches"""
+        runs = [record[4] for record in self._records[:MAX_ANALYSIS_LENGTH]]
+        matches = self.pattern_analyzer.dictionary_matches(head, self._scans())
+        if not runs:
+            return matches
+        
+        spatial, _, sequence, _, repeats, _, _, _ = runs[-1]
+        last = len(head) - 1
+        spatial_matches = [run[1] for run in runs if run[1] is not None]
+        start, _, turns, shifted = spatial
+        if last - start >= 2:
+            spatial_matches.append(_spatial_match(head[start:], start, turns, shifted))
+        sequence_matches = [run[3] for run in runs if run[3] is not None]
+        start, delta = sequence
+        if last - start >= 2:
+            sequence_matches.append(_sequence_match(head[start:], start, delta))
+        
+        found = (spatial_matches + sequence_matches + list(repeats)
+                 + [m for run in runs for m in run[5]]
+                 + [run[6] for run in runs if run[6] is not None])
+        # Salinan: dynamic programming menaikkan guesses_log10 in-place
+        return matches + [m.copy() for m in found]
+    
+    def result(self) -> StrengthResult:
+        """
+        Hasil strength check teks saat ini (identik dengan
+        check_password_strength dengan opsi yang sama)
+        """
+        if self._result is not None:
+            return self._result
+        
+        password = self.text
+        mask = self._mask()
+        if (self.pattern_analyzer is None and self.breach_db is None
+                and self.entropy_bits is None):
+            result = StrengthResult(mask, len(password))
+        else:
+            analysis = None
+            if self.pattern_analyzer is not None:
+                matches = None
+                if not self._irregular:
+                    matches = self._matches(password[:MAX_ANALYSIS_LENGTH])
+                analysis = self.pattern_analyzer.analyze(password, rows=self._guess_rows,
+                                                         matches=matches)
+            result = _capped_result(password, mask, self.entropy_bits, self.breach_db, analysis)
+        
+        self._result = result
+        return result
@@ -0,0 +1,37 @@
+"""
+Latency Tracker Module
+Persentil latency (p50/p99/max) dari sampel terakhir, dipakai service HTTP dan export writer
+"""
+
+from collections import deque
+
+# Jumlah sampel latency terakhir yang dipakai untuk p50/p99
+LATENCY_WINDOW = 10_000
+
+
+class LatencyTracker:
+    """Sampel latency terakhir (ring buffer) untuk menghitung persentil"""
+    
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples = deque(maxlen=window)
+        self.count = 0
+    
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+    
+    def percentile(self, p: float) -> float:
+        """Persentil p (0-100) dalam detik, 0 jika belum ada sampel"""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+    
+    def stats(self) -> dict:
+        """Jumlah sampel serta p50, p99 dan max (milidetik)"""
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": max(self._samples, default=0.0) * 1000,
+        }
@@ -0,0 +1,184 @@
+"""
+Mask Generator Module
+Generate password berdasarkan mask/template posisi (contoh: ?u?l?l?d?d?s)
+"""
+
+import math
+import string
+from functools import lru_cache
+
+from entropy_pool import get_default_pool
+
+# Charset bawaan per placeholder
+BUILTIN_CHARSETS = {
+    "l": string.ascii_lowercase,
+    "u": string.ascii_uppercase,
+    "d": string.digits,
+    "s": string.punctuation,
+    "a": string.ascii_uppercase + string.ascii_lowercase + string.digits + string.punctuation,
+    "h": "0123456789abcdef",
+    "H": "0123456789ABCDEF",
+}
+
+# Placeholder charset custom: ?1 .. ?4
+CUSTOM_PLACEHOLDERS = "1234"
+
+MASK_HELP = (
+    "?l=a-z, ?u=A-Z, ?d=0-9, ?s=simbol, ?a=semua, ?h=hex, ?H=HEX, "
+    "?1-?4=charset custom, ??=tanda tanya"
+)
+
+
+class MaskPlan:
+    """
+    Hasil compile mask: daftar charset per posisi yang siap dipakai berulang.
+    
+    Setiap posisi di-generate per kolom secara bulk (satu draw untuk semua
+    password), lalu kolom digabung menjadi password.
+    """
+    
+    def __init__(self, mask: str, positions: tuple):
+        self.mask = mask
+        self.positions = positions
+        self.length = len(positions)
+    
+    @property
+    def keyspace(self) -> int:
+        """Jumlah kombinasi password yang mungkin (exact)"""
+        return math.prod(len(charset) for charset in self.positions)
+    
+    @property
+    def entropy_bits(self) -> float:
+        """Entropy dalam bit (log2 keyspace)"""
+        return sum(math.log2(len(charset)) for charset in self.positions)
+    
+    def generate(self, count: int = 1) -> list:
+        """
+        Generate `count` password sesuai mask.
+        
+        Returns:
+            List password
+        
+        Raises:
+            ValueError: Jika count negatif
+        """
+        if count < 0:
+            raise ValueError("Jumlah password tidak boleh negatif")
+        if count == 0:
+            return []
+        
+        columns = [_random_column(charset, count) for charset in self.positions]
+        return list(map("".join, zip(*columns)))
+    
+    def iter_blocks(self, count: int, block_size: int = 10_000):
+        """
+        Generate password per blok supaya memory tetap konstan.
+        
+        Yields:
+            List password dengan ukuran maksimal block_size
+        """
+        for start in range(0, count, block_size):
+            yield self.generate(min(block_size, count - start))
+
+
+def _random_column(charset: str, count: int):
+    """Satu kolom (posisi) untuk `count` password"""
+    if len(charset) == 1:
+        return charset * count
+    pool = get_default_pool()
+    if charset.isascii():
+        return pool.random_chars(charset, count)
+    return pool.choices(charset, count)
+
+
+def _expand_charset(definition: str, custom: dict = None) -> str:
+    """
+    Expand definisi charset yang boleh berisi placeholder (misal "?l?d_").
+    
+    Karakter duplikat dibuang (urutan dipertahankan) supaya distribusi
+    uniform dan keyspace exact.
+    """
+    chars = []
+    i = 0
+    while i < len(definition):
+        c = definition[i]
+        if c == "?" and i + 1 < len(definition):
+            key = definition[i + 1]
+            if key == "?":
+                chars.append("?")
+            elif key in BUILTIN_CHARSETS:
+                chars.append(BUILTIN_CHARSETS[key])
+            elif custom is not None and key in CUSTOM_PLACEHOLDERS:
+                if key not in custom:
+                    raise ValueError(f"Charset custom ?{key} belum didefinisikan")
+                chars.append(custom[key])
+            else:
+                raise ValueError(f"Placeholder tidak dikenal: ?{key}")
+            i += 2
+        else:
+            chars.append(c)
+            i += 1
+    
+    return "".join(dict.fromkeys("".join(chars)))
+
+
+@lru_cache(maxsize=128)
+def _compile(mask: str, custom_items: tuple) -> MaskPlan:
+    """Compile mask (di-cache per kombinasi mask + charset custom)"""
+    custom = {}
+    for key, definition in custom_items:
+        if key not in CUSTOM_PLACEHOLDERS:
+            raise ValueError(f"Charset custom harus salah satu dari ?1-?4, bukan ?{key}")
+        charset = _expand_charset(definition)
+        if not charset:
+            raise ValueError(f"Charset custom ?{key} kosong")
+        custom[key] = charset
+    
+    positions = []
+    i = 0
+    while i < len(mask):
+        if mask[i] == "?":
+            if i + 1 >= len(mask):
+                raise ValueError("Mask tidak boleh diakhiri '?' tunggal (gunakan ??)")
+            positions.append(_expand_charset(mask[i:i + 2], custom))
+            i += 2
+        else:
+            positions.append(mask[i])
+            i += 1
+    
+    if not positions:
+        raise ValueError("Mask tidak boleh kosong")
+    
+    for charset in positions:
+        if len(charset) > 256:
+            raise ValueError("Charset per posisi maksimal 256 karakter")
+    
+    return MaskPlan(mask, tuple(positions))
+
+
+def compile_mask(mask: str, custom_charsets: dict = None) -> MaskPlan:
+    """
+    Compile mask menjadi MaskPlan yang bisa dipakai ulang.
+    
+    Args:
+        mask: Template, contoh "?u?l?l?l?d?d?s" atau "INV-?d?d?d?d"
+        custom_charsets: Dict "1".."4" -> definisi charset (boleh berisi ?l, ?d, dst)
+    
+    Returns:
+        MaskPlan
+    
+    Raises:
+        ValueError: Jika mask atau charset tidak valid
+    """
+    custom_items = tuple(sorted((custom_charsets or {}).items()))
+    return _compile(mask, custom_items)
+
+
+def generate_from_mask(mask: str, count: int = 1, custom_charsets: dict = None) -> list:
+    """
+    Shortcut: compile mask lalu generate `count` password.
+    
+    Returns:
+        List password
+    """
+    return compile_mask(mask, custom_charsets).generate(count)
@@ -0,0 +1,134 @@
+"""
+Parallel Password Generator Module
+Bulk generate password memakai banyak core (process pool)
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from entropy_pool import get_default_pool
+from password_generator import GenerationPolicy, _resolve_policy
+
+# Jumlah password yang dikerjakan satu worker per task
+DEFAULT_CHUNK_SIZE = 50_000
+
+
+def _init_worker():
+    """
+    Initializer tiap worker process.
+    
+    EntropyPool yang dipakai generator sudah membuang buffer warisan parent
+    (setelah fork) secara otomatis; buffer-nya dikosongkan di sini supaya
+    refill pertama terjadi di worker, bukan di task pertama.
+    """
+    get_default_pool().reset()
+
+
+def _generate_chunk(task: tuple) -> str:
+    """Worker: generate satu chunk dan kembalikan sebagai teks satu-per-baris"""
+    count, length, policy = task
+    passwords = policy.sample_many(count, length)
+    # Satu string besar jauh lebih murah di-pickle daripada list of str
+    return "\n".join(passwords) + "\n" if passwords else ""
+
+
+def _split_tasks(count: int, length: int, policy: GenerationPolicy, chunk_size: int):
+    """Bagi request menjadi task berukuran chunk_size"""
+    for start in range(0, count, chunk_size):
+        yield (min(chunk_size, count - start), length, policy)
+
+
+def iter_chunks_parallel(count: int, length: int, use_uppercase: bool = True,
+                         use_lowercase: bool = True, use_numbers: bool = True,
+                         use_symbols: bool = True, workers: int = None,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE,
+                         policy: GenerationPolicy = None):
+    """
+    Generate password paralel dan yield hasilnya per chunk sesuai urutan task.
+    
+    Args:
+        count: Total password
+        length: Panjang tiap password (minimal 4)
+        use_uppercase: Include huruf besar A-Z
+        use_lowercase: Include huruf kecil a-z
+        use_numbers: Include angka 0-9
+        use_symbols: Include simbol spesial
+        workers: Jumlah worker process (default: jumlah core)
+        chunk_size: Jumlah password per task
+        policy: GenerationPolicy (opsional, menggantikan flag use_*)
+    
+    Yields:
+        String berisi password satu per baris (diakhiri newline)
+    
+    Raises:
+        ValueError: Jika parameter tidak valid
+    """
+    
+    if count < 0:
+        raise ValueError("Jumlah password tidak boleh negatif")
+    if chunk_size < 1:
+        raise ValueError("Ukuran chunk minimal 1")
+    if workers is not None and workers < 1:
+        raise ValueError("Jumlah worker minimal 1")
+    
+    # Validasi di parent supaya error tidak muncul dari dalam worker
+    policy = _resolve_policy(policy, use_uppercase, use_lowercase,
+                             use_numbers, use_symbols)
+    policy.validate_length(length)
+    
+    tasks = _split_tasks(count, length, policy, chunk_size)
+    
+    # Batasi task yang sedang berjalan supaya memory tidak tumbuh
+    # ketika consumer (misal pipe) lebih lambat dari worker
+    max_pending = (workers or os.cpu_count() or 1) * 2
+    pending = deque()
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        for task in tasks:
+            pending.append(pool.submit(_generate_chunk, task))
+            if len(pending) >= max_pending:
+                # Ambil dari depan antrian -> urutan hasil stabil
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def generate_passwords_parallel(count: int, length: int, use_uppercase: bool = True,
+                                use_lowercase: bool = True, use_numbers: bool = True,
+                                use_symbols: bool = True, workers: int = None,
+                                chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                policy: GenerationPolicy = None) -> list:
+    """
+    Versi paralel dari generate_passwords().
+    
+    Returns:
+        List berisi `count` password dengan urutan yang stabil (urutan chunk)
+    """
+    passwords = []
+    for chunk in iter_chunks_parallel(count, length, use_uppercase, use_lowercase,
+                                      use_numbers, use_symbols, workers, chunk_size,
+                                      policy):
+        passwords.extend(chunk.splitlines())
+    return passwords
+
+
+def write_passwords_parallel(stream, count: int, length: int, use_uppercase: bool = True,
+                             use_lowercase: bool = True, use_numbers: bool = True,
+                             use_symbols: bool = True, workers: int = None,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE,
+                             policy: GenerationPolicy = None) -> int:
+    """
+    Tulis password hasil generate paralel langsung ke stream.
+    
+    Parent hanya menyalin chunk teks ke stream, sehingga throughput
+    bisa naik hampir linear sesuai jumlah worker.
+    
+    Returns:
+        Jumlah password yang ditulis
+    """
+    for chunk in iter_chunks_parallel(count, length, use_uppercase, use_lowercase,
+                                      use_numbers, use_symbols, workers, chunk_size,
+                                      policy):
+        stream.write(chunk)
+    return count
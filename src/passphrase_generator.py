@@ -0,0 +1,239 @@
+"""
+Passphrase Generator Module
+Generate passphrase ala Diceware dari wordlist lokal yang di-memory-map
+"""
+
+import math
+import mmap
+import os
+import string
+import struct
+from array import array
+
+from entropy_pool import get_default_pool
+
+# Lokasi default wordlist (satu kata per baris, format Diceware "11111<TAB>kata" juga didukung)
+BUNDLED_WORDLIST_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "wordlist.txt")
+DEFAULT_WORDLIST_PATH = os.environ.get("PASSWORD_WORDLIST", BUNDLED_WORDLIST_PATH)
+
+# Dipakai get_wordlist() jika data/wordlist.txt belum ada (dan PASSWORD_WORDLIST
+# tidak di-set): kamus bahasa Inggris bawaan, jauh lebih kecil dari list
+# Diceware sehingga entropy per kata juga lebih kecil
+FALLBACK_WORDLIST_PATH = os.path.join(os.path.dirname(__file__), "..", "data",
+                                      "dictionaries", "english.txt")
+
+# Header file index: magic, typecode, ukuran & mtime wordlist sumber, jumlah kata
+# (di-pad ke 40 byte supaya array offset setelahnya ter-align)
+INDEX_MAGIC = b"PWIDX002"
+INDEX_HEADER = struct.Struct("<8s4sQQQ4x")
+
+CAPITALIZE_MODES = ("none", "all", "random")
+
+# Cache WordlistIndex per path supaya mmap hanya dibuka sekali per process
+_INDEX_CACHE = {}
+
+
+class WordlistIndex:
+    """
+    Index offset kata di atas wordlist yang di-memory-map.
+    
+    Offset (awal, akhir) tiap kata disimpan sebagai array integer compact di
+    file `<wordlist>.idx`. Index dibangun sekali lalu di-mmap juga, sehingga
+    startup tidak perlu parsing seluruh file dan beberapa worker process
+    berbagi page memory yang sama.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path ke file wordlist
+        
+        Raises:
+            FileNotFoundError: Jika wordlist tidak ditemukan
+            ValueError: Jika wordlist kosong
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Wordlist tidak ditemukan: {path}")
+        
+        self.path = path
+        self.index_path = path + ".idx"
+        
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size == 0:
+                raise ValueError(f"Wordlist kosong: {path}")
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        self._offsets = self._load_index(stat)
+        if len(self._offsets) == 0:
+            raise ValueError(f"Wordlist tidak berisi kata: {path}")
+    
+    def __len__(self) -> int:
+        return len(self._offsets) // 2
+    
+    def __getitem__(self, i: int) -> str:
+        start = self._offsets[2 * i]
+        end = self._offsets[2 * i + 1]
+        return self._data[start:end].decode("utf-8")
+    
+    def _load_index(self, stat):
+        """Baca index dari cache di disk, atau bangun ulang jika basi"""
+        try:
+            with open(self.index_path, "rb") as f:
+                index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, typecode, size, mtime, count = INDEX_HEADER.unpack_from(index_map)
+            if (magic == INDEX_MAGIC and size == stat.st_size
+                    and mtime == stat.st_mtime_ns):
+                self._index_map = index_map
+                # Zero-copy: view langsung ke page mmap index
+                view = memoryview(index_map)[INDEX_HEADER.size:]
+                return view.cast(typecode.rstrip(b"\0").decode("ascii"))
+            index_map.close()
+        except (OSError, ValueError, struct.error):
+            pass
+        
+        offsets = self._build_offsets()
+        self._write_index(offsets, stat)
+        return offsets
+    
+    def _build_offsets(self) -> array:
+        """
+        Scan wordlist sekali dan kumpulkan offset (awal, akhir) tiap kata.
+        Baris komentar (#) dan kata duplikat dilewati supaya entropy yang
+        dihitung dari jumlah kata tidak berlebihan.
+        """
+        data = self._data
+        typecode = "I" if len(data) < (1 << 32) else "Q"
+        offsets = array(typecode)
+        seen = set()
+        pos = 0
+        size = len(data)
+        
+        while pos < size:
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = size
+            start = pos
+            # Format Diceware: ambil bagian setelah TAB terakhir
+            tab = data.rfind(b"\t", start, end)
+            if tab != -1:
+                start = tab + 1
+            stop = end
+            while stop > start and data[stop - 1] in b" \r":
+                stop -= 1
+            while start < stop and data[start] == 0x20:
+                start += 1
+            word = data[start:stop]
+            if word and not word.startswith(b"#") and word not in seen:
+                seen.add(word)
+                offsets.append(start)
+                offsets.append(stop)
+            pos = end + 1
+        
+        return offsets
+    
+    def _write_index(self, offsets: array, stat):
+        """Simpan index ke disk secara atomic (best effort, read-only dir diabaikan)"""
+        header = INDEX_HEADER.pack(INDEX_MAGIC, offsets.typecode.encode("ascii"),
+                                   stat.st_size, stat.st_mtime_ns, len(offsets) // 2)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                offsets.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def get_wordlist(path: str = None) -> WordlistIndex:
+    """
+    Dapatkan WordlistIndex (di-cache per path)
+    
+    Args:
+        path: Path wordlist (default: DEFAULT_WORDLIST_PATH, atau
+            FALLBACK_WORDLIST_PATH jika data/wordlist.txt belum ada)
+    
+    Returns:
+        WordlistIndex yang siap dipakai
+    """
+    if path is None:
+        path = DEFAULT_WORDLIST_PATH
+        if path == BUNDLED_WORDLIST_PATH and not os.path.exists(path):
+            path = FALLBACK_WORDLIST_PATH
+    path = os.path.abspath(path)
+    index = _INDEX_CACHE.get(path)
+    if index is None:
+        index = WordlistIndex(path)
+        _INDEX_CACHE[path] = index
+    return index
+
+
+def generate_passphrase(word_count: int = 6, separator: str = "-",
+                        capitalize: str = "none", inject_digit: bool = False,
+                        wordlist: WordlistIndex = None) -> str:
+    """
+    Generate passphrase dari kata-kata acak di wordlist.
+    
+    Args:
+        word_count: Jumlah kata (minimal 3)
+        separator: Pemisah antar kata
+        capitalize: "none", "all" (semua kata kapital) atau "random" (tiap kata 50%)
+        inject_digit: Sisipkan satu angka acak di akhir salah satu kata
+        wordlist: WordlistIndex (default: get_wordlist())
+    
+    Returns:
+        String passphrase
+    
+    Raises:
+        ValueError: Jika parameter tidak valid
+    """
+    _validate_options(word_count, capitalize)
+    wordlist = wordlist or get_wordlist()
+    
+    pool = get_default_pool()
+    
+    words = [wordlist[pool.randbelow(len(wordlist))] for _ in range(word_count)]
+    
+    if capitalize == "all":
+        words = [w.capitalize() for w in words]
+    elif capitalize == "random":
+        words = [w.capitalize() if pool.randbelow(2) else w for w in words]
+    
+    if inject_digit:
+        target = pool.randbelow(word_count)
+        words[target] += pool.choice(string.digits)
+    
+    return separator.join(words)
+
+
+def get_passphrase_entropy(word_count: int = 6, capitalize: str = "none",
+                           inject_digit: bool = False,
+                           wordlist: WordlistIndex = None) -> float:
+    """
+    Hitung entropy (bit) passphrase berdasarkan cara generate-nya.
+    
+    Entropy dihitung dari ukuran wordlist, bukan dari karakter yang terlihat,
+    karena penyerang yang tahu wordlist cukup menebak kata per kata.
+    
+    Returns:
+        Entropy dalam bit
+    """
+    _validate_options(word_count, capitalize)
+    wordlist = wordlist or get_wordlist()
+    
+    bits = word_count * math.log2(len(wordlist))
+    if capitalize == "random":
+        bits += word_count
+    if inject_digit:
+        bits += math.log2(10) + math.log2(word_count)
+    return bits
+
+
+def _validate_options(word_count: int, capitalize: str):
+    """Validasi opsi passphrase"""
+    if word_count < 3:
+        raise ValueError("Jumlah kata minimal 3")
+    if capitalize not in CAPITALIZE_MODES:
+        raise ValueError(f"Mode kapital harus salah satu dari: {', '.join(CAPITALIZE_MODES)}")
@@ -3,75 +3,523 @@ Password Generator Module
 Menghasilkan password random berdasarkan rules yang ditentukan
 """
 
-import random
+import math
 import string
+from functools import lru_cache
 
+from entropy_pool import EntropyPool, get_default_pool
+from uniqueness_guard import unique_blocks
 
-def generate_password(length: int, use_uppercase: bool = True, 
-                     use_lowercase: bool = True, use_numbers: bool = True, 
-                     use_symbols: bool = True) -> str:
+# Jumlah password per blok pada mode streaming
+DEFAULT_BLOCK_SIZE = 10_000
+
+# Batas panjang password (sama dengan slider Streamlit dan validasi CLI)
+MIN_PASSWORD_LENGTH = 4
+MAX_PASSWORD_LENGTH = 128
+
+# Karakter yang mudah tertukar saat dibaca/diketik ulang
+AMBIGUOUS_CHARS = "Il1|O0o`'\""
+
+# Kelas karakter: (nama, karakter, label untuk rules summary)
+CHARACTER_CLASSES = (
+    ("uppercase", string.ascii_uppercase, "Huruf Besar (A-Z)"),
+    ("lowercase", string.ascii_lowercase, "Huruf Kecil (a-z)"),
+    ("numbers", string.digits, "Angka (0-9)"),
+    ("symbols", string.punctuation, "Simbol (!@#$%^&*)"),
+)
+
+
+class GenerationPolicy:
+    """
+    Policy generate password yang sudah di-compile sekali dan bisa dipakai ulang.
+    
+    Alphabet, karakter per kelas dan jumlah minimal per kelas dihitung saat
+    constructor, sehingga tiap generate tidak perlu membangun ulang string.
+    Sampler menjamin setiap kelas aktif muncul minimal `min_counts[kelas]`
+    kali dalam satu pass (tanpa loop generate ulang).
+    """
+    
+    def __init__(self, use_uppercase: bool = True, use_lowercase: bool = True,
+                 use_numbers: bool = True, use_symbols: bool = True,
+                 min_counts: dict = None, exclude_chars: str = "",
+                 exclude_ambiguous: bool = False,
+                 min_length: int = MIN_PASSWORD_LENGTH,
+                 max_length: int = MAX_PASSWORD_LENGTH):
+        """
+        Args:
+            use_uppercase: Include huruf besar A-Z
+            use_lowercase: Include huruf kecil a-z
+            use_numbers: Include angka 0-9
+            use_symbols: Include simbol spesial
+            min_counts: Dict nama kelas -> jumlah minimal (default 1 per kelas aktif)
+            exclude_chars: Karakter yang tidak boleh dipakai
+            exclude_ambiguous: Buang karakter ambigu (AMBIGUOUS_CHARS)
+            min_length: Panjang minimal password
+            max_length: Panjang maksimal password (maksimal 256)
+        
+        Raises:
+            ValueError: Jika tidak ada rule yang dipilih atau konfigurasi tidak valid
+        """
+        enabled = {
+            "uppercase": use_uppercase,
+            "lowercase": use_lowercase,
+            "numbers": use_numbers,
+            "symbols": use_symbols,
+        }
+        
+        if not any(enabled.values()):
+            raise ValueError("Minimal harus memilih 1 rule (huruf/angka/simbol)")
+        
+        if max_length > 256:
+            raise ValueError("Panjang maksimal policy tidak boleh lebih dari 256")
+        
+        excluded = set(exclude_chars)
+        if exclude_ambiguous:
+            excluded.update(AMBIGUOUS_CHARS)
+        
+        if min_counts is None:
+            min_counts = {name: 1 for name, active in enabled.items() if active}
+        
+        for name, count in min_counts.items():
+            if name not in enabled:
+                raise ValueError(f"Kelas karakter tidak dikenal: {name}")
+            if count < 0:
+                raise ValueError("Jumlah minimal per kelas tidak boleh negatif")
+            if count > 0 and not enabled[name]:
+                raise ValueError(f"Kelas '{name}' tidak aktif tapi punya jumlah minimal")
+        
+        classes = []
+        labels = []
+        for name, chars, label in CHARACTER_CLASSES:
+            if not enabled[name]:
+                continue
+            chars = "".join(c for c in chars if c not in excluded)
+            if not chars:
+                if min_counts.get(name, 0) > 0:
+                    raise ValueError(f"Semua karakter kelas '{name}' dikecualikan")
+                continue
+            classes.append((name, chars))
+            labels.append(label)
+        
+        self.use_uppercase = use_uppercase
+        self.use_lowercase = use_lowercase
+        self.use_numbers = use_numbers
+        self.use_symbols = use_symbols
+        self.min_counts = {name: min_counts.get(name, 0) for name, _ in classes}
+        self.exclude_chars = "".join(sorted(excluded))
+        self.exclude_ambiguous = exclude_ambiguous
+        self.min_length = min_length
+        self.max_length = max_length
+        self.classes = tuple(classes)
+        self.alphabet = "".join(chars for _, chars in classes)
+        self._labels = tuple(labels)
+        
+        # Slot karakter wajib, misal ("ABC..", "abc..", "012..", "!@#..")
+        self._required = tuple(
+            chars for name, chars in classes for _ in range(self.min_counts[name])
+        )
+        
+        if len(self._required) > max_length:
+            raise ValueError("Total minimal karakter per kelas melebihi panjang maksimal")
+    
+    def validate_length(self, length: int):
+        """
+        Validasi panjang password terhadap policy.
+        
+        Raises:
+            ValueError: Jika panjang di luar batas policy
+        """
+        if length < self.min_length:
+            raise ValueError(f"Panjang password minimal {self.min_length} karakter")
+        if length > self.max_length:
+            raise ValueError(f"Panjang password maksimal {self.max_length} karakter")
+        if length < len(self._required):
+            raise ValueError(
+                f"Panjang password minimal {len(self._required)} karakter "
+                f"untuk memenuhi jumlah minimal per kelas"
+            )
+    
+    def sample(self, length: int, pool: EntropyPool = None) -> str:
+        """
+        Generate satu password sesuai policy.
+        
+        Algoritmanya sama dengan sample_many(), tapi semua draw kecil
+        (posisi dan karakter wajib) diambil dalam satu panggilan pool.
+        """
+        self.validate_length(length)
+        pool = pool or get_default_pool()
+        
+        chars = list(pool.random_chars(self.alphabet, length))
+        if not self._required:
+            return "".join(chars)
+        
+        k = len(self._required)
+        bounds = [length - j for j in range(k)] + [len(c) for c in self._required]
+        draws = pool.randbelow_each(bounds)
+        
+        swapped = {}
+        for j, charset in enumerate(self._required):
+            t = j + draws[j]
+            chars[swapped.get(t, t)] = charset[draws[k + j]]
+            swapped[t] = swapped.get(j, j)
+        
+        return "".join(chars)
+    
+    def sample_many(self, count: int, length: int, pool: EntropyPool = None) -> list:
+        """
+        Generate `count` password sesuai policy dalam satu pass.
+        
+        Semua posisi diisi dulu dari alphabet penuh, lalu karakter wajib tiap
+        kelas ditaruh di posisi acak yang berbeda (partial Fisher-Yates).
+        Hasilnya sama dengan mengacak gabungan karakter wajib + pengisi,
+        tanpa perlu generate ulang password yang tidak lolos.
+        
+        Args:
+            count: Jumlah password
+            length: Panjang tiap password
+            pool: EntropyPool sumber byte acak (default: pool shared)
+        
+        Raises:
+            ValueError: Jika count negatif atau panjang tidak valid
+        """
+        if count < 0:
+            raise ValueError("Jumlah password tidak boleh negatif")
+        self.validate_length(length)
+        
+        pool = pool or get_default_pool()
+        total = count * length
+        fill = pool.random_chars(self.alphabet, total)
+        
+        if not self._required:
+            # Tanpa karakter wajib: cukup potong stream
+            return [fill[i:i + length] for i in range(0, total, length)]
+        
+        required = [pool.random_chars(chars, count).encode("ascii")
+                    for chars in self._required]
+        offsets = [pool.randbelow_bytes(length - j, count)
+                   for j in range(len(self._required))]
+        
+        buf = bytearray(fill.encode("ascii"))
+        for start, offs, chars in zip(range(0, total, length), zip(*offsets), zip(*required)):
+            # Partial Fisher-Yates di atas array indeks 0..length-1 (implisit)
+            swapped = {}
+            for j, (offset, char) in enumerate(zip(offs, chars)):
+                t = j + offset
+                buf[start + swapped.get(t, t)] = char
+                swapped[t] = swapped.get(j, j)
+        
+        text = buf.decode("ascii")
+        return [text[i:i + length] for i in range(0, total, length)]
+    
+    def entropy_bits(self, length: int) -> float:
+        """
+        Entropy (bit) password sepanjang `length` dari policy ini.
+        
+        Dihitung dari jumlah password yang memenuhi policy (alphabet setelah
+        exclude dan jumlah minimal per kelas), bukan dari jenis karakter
+        yang kebetulan muncul di satu password.
+        
+        Raises:
+            ValueError: Jika panjang di luar batas policy
+        """
+        self.validate_length(length)
+        sizes = tuple(len(chars) for _, chars in self.classes)
+        minimums = tuple(self.min_counts[name] for name, _ in self.classes)
+        return _policy_entropy(sizes, minimums, length)
+    
+    def summary(self) -> str:
+        """
+        Ringkasan rules policy
+        
+        Returns:
+            String yang merangkum rules yang aktif
+        """
+        rules = list(self._labels)
+        
+        counts = set(self.min_counts.values())
+        if counts != {1}:
+            if len(counts) == 1:
+                rules.append(f"Minimal {counts.pop()} per kelas")
+            else:
+                detail = ", ".join(f"{name}={n}" for name, n in self.min_counts.items())
+                rules.append(f"Minimal per kelas ({detail})")
+        
+        if self.exclude_ambiguous:
+            rules.append("Tanpa karakter ambigu")
+        
+        extra = "".join(c for c in self.exclude_chars
+                        if not (self.exclude_ambiguous and c in AMBIGUOUS_CHARS))
+        if extra:
+            rules.append(f"Tanpa karakter: {extra}")
+        
+        return ", ".join(rules)
+
+
+@lru_cache(maxsize=1024)
+def _policy_entropy(sizes: tuple, minimums: tuple, length: int) -> float:
+    """
+    log2 jumlah string sepanjang `length` dengan minimal `minimums[i]`
+    karakter dari kelas berukuran `sizes[i]` (di-memoize per kombinasi).
+    
+    DP per kelas: ways[n] = jumlah cara mengisi n posisi dengan kelas yang
+    sudah diproses; kelas berikutnya menempati k >= minimal posisi dari
+    n + k posisi, yaitu C(n + k, k) * size^k cara.
+    """
+    if not any(minimums):
+        return length * math.log2(sum(sizes))
+    
+    ways = [1] + [0] * length
+    for size, minimum in zip(sizes, minimums):
+        next_ways = [0] * (length + 1)
+        for n, count in enumerate(ways):
+            if not count:
+                continue
+            for k in range(minimum, length - n + 1):
+                next_ways[n + k] += count * math.comb(n + k, k) * size ** k
+        ways = next_ways
+    return math.log2(ways[length])
+
+
+@lru_cache(maxsize=64)
+def get_policy(use_uppercase: bool = True, use_lowercase: bool = True,
+               use_numbers: bool = True, use_symbols: bool = True,
+               min_per_class: int = 1, exclude_chars: str = "",
+               exclude_ambiguous: bool = False) -> GenerationPolicy:
+    """
+    Dapatkan GenerationPolicy yang sudah di-compile (di-cache per kombinasi rules).
+    
+    Args:
+        min_per_class: Jumlah minimal karakter untuk setiap kelas aktif
+        exclude_chars: Karakter yang tidak boleh dipakai
+        exclude_ambiguous: Buang karakter ambigu
+    
+    Returns:
+        GenerationPolicy yang bisa dipakai ulang
+    """
+    flags = {
+        "uppercase": use_uppercase,
+        "lowercase": use_lowercase,
+        "numbers": use_numbers,
+        "symbols": use_symbols,
+    }
+    min_counts = {name: min_per_class for name, active in flags.items() if active}
+    return GenerationPolicy(use_uppercase, use_lowercase, use_numbers, use_symbols,
+                            min_counts=min_counts, exclude_chars=exclude_chars,
+                            exclude_ambiguous=exclude_ambiguous)
+
+
+def generate_password(length: int, use_uppercase: bool = True,
+                     use_lowercase: bool = True, use_numbers: bool = True,
+                     use_symbols: bool = True,
+                     policy: GenerationPolicy = None) -> str:
     """
     Generate password random dengan kriteria tertentu.
     
+    Setiap tipe karakter yang dipilih dijamin muncul minimal sekali.
+    
     Args:
         length: Panjang password yang ingin dibuat (minimal 4)
         use_uppercase: Include huruf besar A-Z
         use_lowercase: Include huruf kecil a-z
         use_numbers: Include angka 0-9
         use_symbols: Include simbol spesial
+        policy: GenerationPolicy (opsional, menggantikan flag use_*)
     
     Returns:
         String password yang ter-generate
     
     Raises:
-        ValueError: Jika panjang < 4 atau tidak ada rule yang dipilih
+        ValueError: Jika panjang di luar batas atau tidak ada rule yang dipilih
     """
     
-    # Validasi panjang password
-    if length < 4:
-        raise ValueError("Panjang password minimal 4 karakter")
+    policy = _resolve_policy(policy, use_uppercase, use_lowercase,
+                             use_numbers, use_symbols)
+    
+    # Generate password
+    password = policy.sample(length)
+    
+    return password
+
+
+def generate_passwords(count: int, length: int, use_uppercase: bool = True,
+                       use_lowercase: bool = True, use_numbers: bool = True,
+                       use_symbols: bool = True,
+                       policy: GenerationPolicy = None) -> list:
+    """
+    Generate banyak password sekaligus (bulk) dalam satu panggilan.
     
-    # Bangun karakter yang tersedia
-    available_chars = ""
+    Byte acak diambil dari EntropyPool (os.urandom per blok besar), lalu
+    dipetakan ke alphabet dengan rejection sampling supaya distribusinya
+    tetap uniform (tidak ada bias modulo).
     
-    if use_uppercase:
-        available_chars += string.ascii_uppercase
-    if use_lowercase:
-        available_chars += string.ascii_lowercase
-    if use_numbers:
-        available_chars += string.digits
-    if use_symbols:
-        available_chars += string.punctuation
+    Args:
+        count: Jumlah password yang ingin dibuat
+        length: Panjang tiap password (minimal 4)
+        use_uppercase: Include huruf besar A-Z
+        use_lowercase: Include huruf kecil a-z
+        use_numbers: Include angka 0-9
+        use_symbols: Include simbol spesial
+        policy: GenerationPolicy (opsional, menggantikan flag use_*)
     
-    # Validasi minimal ada 1 rule yang dipilih
-    if not available_chars:
-        raise ValueError("Minimal harus memilih 1 rule (huruf/angka/simbol)")
+    Returns:
+        List berisi `count` password
     
-    # Generate password
-    password = ''.join(random.choice(available_chars) for _ in range(length))
+    Raises:
+        ValueError: Jika count negatif, panjang tidak valid, atau tidak ada rule yang dipilih
+    """
     
-    return password
+    policy = _resolve_policy(policy, use_uppercase, use_lowercase,
+                             use_numbers, use_symbols)
+    return policy.sample_many(count, length)
 
 
-def get_rules_summary(use_uppercase: bool = True, 
-                     use_lowercase: bool = True, 
-                     use_numbers: bool = True, 
-                     use_symbols: bool = True) -> str:
+def iter_password_blocks(length: int, count: int = None, use_uppercase: bool = True,
+                         use_lowercase: bool = True, use_numbers: bool = True,
+                         use_symbols: bool = True,
+                         block_size: int = DEFAULT_BLOCK_SIZE,
+                         policy: GenerationPolicy = None, guard=None):
+    """
+    Generator yang menghasilkan password per blok (list) secara lazy.
+    
+    Memory yang dipakai hanya sebesar satu blok, berapapun total password
+    yang diminta.
+    
+    Args:
+        length: Panjang tiap password (minimal 4)
+        count: Total password (None = tanpa batas)
+        use_uppercase: Include huruf besar A-Z
+        use_lowercase: Include huruf kecil a-z
+        use_numbers: Include angka 0-9
+        use_symbols: Include simbol spesial
+        block_size: Jumlah password per blok
+        policy: GenerationPolicy (opsional, menggantikan flag use_*)
+        guard: UniquenessGuard (opsional) supaya password tidak pernah ter-issue dua kali
+    
+    Yields:
+        List password dengan ukuran maksimal block_size
+    
+    Raises:
+        ValueError: Jika block_size < 1 atau rules tidak valid
+    """
+    
+    if block_size < 1:
+        raise ValueError("Ukuran blok minimal 1")
+    
+    policy = _resolve_policy(policy, use_uppercase, use_lowercase,
+                             use_numbers, use_symbols)
+    
+    # Validasi panjang tetap jalan walaupun count = 0
+    policy.validate_length(length)
+    
+    blocks = _sample_blocks(policy, length, count, block_size)
+    if guard is not None:
+        blocks = unique_blocks(blocks, guard, lambda n: policy.sample_many(n, length))
+    
+    yield from blocks
+
+
+def _sample_blocks(policy: GenerationPolicy, length: int, count: int, block_size: int):
+    """Generator blok mentah dari policy (count None = tanpa batas)"""
+    remaining = count
+    while remaining is None or remaining > 0:
+        n = block_size if remaining is None else min(block_size, remaining)
+        yield policy.sample_many(n, length)
+        if remaining is not None:
+            remaining -= n
+
+
+def iter_passwords(length: int, count: int = None, use_uppercase: bool = True,
+                   use_lowercase: bool = True, use_numbers: bool = True,
+                   use_symbols: bool = True, block_size: int = DEFAULT_BLOCK_SIZE,
+                   policy: GenerationPolicy = None, guard=None):
+    """
+    Generator password satu per satu (lazy) dengan memory konstan.
+    
+    Secara internal password dibuat per blok lewat iter_password_blocks().
+    
+    Yields:
+        String password
+    """
+    for block in iter_password_blocks(length, count, use_uppercase, use_lowercase,
+                                      use_numbers, use_symbols, block_size, policy,
+                                      guard):
+        yield from block
+
+
+def write_passwords(stream, length: int, count: int, use_uppercase: bool = True,
+                    use_lowercase: bool = True, use_numbers: bool = True,
+                    use_symbols: bool = True,
+                    block_size: int = DEFAULT_BLOCK_SIZE,
+                    policy: GenerationPolicy = None, guard=None) -> int:
+    """
+    Tulis password (satu per baris) ke stream seperti file atau sys.stdout.
+    
+    Args:
+        stream: Object dengan method write() (file, sys.stdout, pipe)
+        length: Panjang tiap password
+        count: Total password (None = tanpa batas sampai pipe ditutup)
+    
+    Returns:
+        Jumlah password yang ditulis
+    """
+    written = 0
+    for block in iter_password_blocks(length, count, use_uppercase, use_lowercase,
+                                      use_numbers, use_symbols, block_size, policy,
+                                      guard):
+        # Satu write per blok, bukan per password
+        stream.write("\n".join(block))
+        stream.write("\n")
+        written += len(block)
+    return written
+
+
+def _resolve_policy(policy: GenerationPolicy, use_uppercase: bool, use_lowercase: bool,
+                    use_numbers: bool, use_symbols: bool) -> GenerationPolicy:
+    """Pakai policy yang diberikan, atau ambil policy cached dari flag use_*"""
+    if policy is not None:
+        return policy
+    return get_policy(use_uppercase, use_lowercase, use_numbers, use_symbols)
+
+
+def get_rules_summary(use_uppercase: bool = True,
+                     use_lowercase: bool = True,
+                     use_numbers: bool = True,
+                     use_symbols: bool = True,
+                     policy: GenerationPolicy = None) -> str:
     """
     Dapatkan ringkasan rules yang digunakan
     
+    Args:
+        policy: GenerationPolicy (opsional, menggantikan flag use_*)
+    
     Returns:
         String yang merangkum rules yang aktif
     """
-    rules = []
+    if policy is None:
+        if not any([use_uppercase, use_lowercase, use_numbers, use_symbols]):
+            return ""
+        policy = get_policy(use_uppercase, use_lowercase, use_numbers, use_symbols)
+    
+    return policy.summary()
+
+
+def get_policy_entropy(length: int, use_uppercase: bool = True,
+                       use_lowercase: bool = True,
+                       use_numbers: bool = True,
+                       use_symbols: bool = True,
+                       policy: GenerationPolicy = None) -> float:
+    """
+    Hitung entropy (bit) password dari policy generate yang dipakai
+    
+    Args:
+        length: Panjang password
+        policy: GenerationPolicy (opsional, menggantikan flag use_*)
     
-    if use_uppercase:
-        rules.append("Huruf Besar (A-Z)")
-    if use_lowercase:
-        rules.append("Huruf Kecil (a-z)")
-    if use_numbers:
-        rules.append("Angka (0-9)")
-    if use_symbols:
-        rules.append("Simbol (!@#$%^&*)")
+    Returns:
+        Entropy dalam bit
     
-    return ", ".join(rules)
+    Raises:
+        ValueError: Jika tidak ada rule yang dipilih atau panjang tidak valid
+    """
+    policy = _resolve_policy(policy, use_uppercase, use_lowercase, use_numbers, use_symbols)
+    return policy.entropy_bits(length)
@@ -0,0 +1,944 @@
+"""
+Pattern Analyzer Module
+Deteksi pola yang mudah ditebak (kata kamus, leet, keyboard, urutan, tanggal)
+dan perkiraan jumlah tebakan ala zxcvbn
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import re
+import struct
+from array import array
+from datetime import date
+
+# Folder kamus default: satu file .txt per kamus, satu kata per baris (urutan = peringkat)
+DEFAULT_DICTIONARY_DIR = os.environ.get(
+    "PASSWORD_DICTIONARY_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "data", "dictionaries")
+)
+
+# File automaton hasil build, disimpan di folder kamus
+AUTOMATON_FILENAME = "dictionaries.ac"
+REVERSED_AUTOMATON_FILENAME = "dictionaries.reversed.ac"
+
+# Header automaton: magic, versi, jumlah node, ukuran alphabet, jumlah kata,
+# fingerprint kamus sumber, panjang alphabet & nama kamus (di-pad ke kelipatan 4)
+AUTOMATON_MAGIC = b"PWACDFA1"
+AUTOMATON_HEADER = struct.Struct("<8sIIIIQII4x")
+FORMAT_VERSION = 1
+
+NO_WORD = 0xFFFFFFFF
+
+# Password lebih panjang dari ini: sisa karakter dihitung sebagai bruteforce
+MAX_ANALYSIS_LENGTH = 64
+
+# Konstanta perkiraan tebakan (mengikuti zxcvbn)
+BRUTEFORCE_CARDINALITY = 10
+MIN_GUESSES_BEFORE_GROWING_SEQUENCE = 10_000
+MIN_SUBMATCH_GUESSES_SINGLE_CHAR = 10
+MIN_SUBMATCH_GUESSES_MULTI_CHAR = 50
+MIN_YEAR_SPACE = 20
+REFERENCE_YEAR = date.today().year
+
+# Substitusi leet: dua varian untuk karakter yang ambigu (1 -> i/l, | -> i/l, 7 -> t/l)
+LEET_COMMON = {"4": "a", "@": "a", "8": "b", "(": "c", "{": "c", "[": "c", "<": "c",
+               "3": "e", "6": "g", "9": "g", "!": "i", "0": "o", "$": "s", "5": "s",
+               "+": "t", "%": "x", "2": "z"}
+LEET_TABLES = (
+    str.maketrans({**LEET_COMMON, "1": "i", "|": "i", "7": "t"}),
+    str.maketrans({**LEET_COMMON, "1": "l", "|": "l", "7": "l"}),
+)
+LEET_AMBIGUOUS = frozenset("1|7")
+
+# Layout keyboard QWERTY (tiap key: karakter normal + shift), baris miring
+KEYBOARD_ROWS = (
+    (0, ("`~", "1!", "2@", "3#", "4$", "5%", "6^", "7&", "8*", "9(", "0)", "-_", "=+")),
+    (1, ("qQ", "wW", "eE", "rR", "tT", "yY", "uU", "iI", "oO", "pP", "[{", "]}", "\\|")),
+    (1, ("aA", "sS", "dD", "fF", "gG", "hH", "jJ", "kK", "lL", ";:", "'\"")),
+    (1, ("zZ", "xX", "cC", "vV", "bB", "nN", "mM", ",<", ".>", "/?")),
+)
+
+# Saran per jenis pola
+PATTERN_FEEDBACK = {
+    "dictionary": "Hindari kata umum atau password populer ('{token}')",
+    "l33t": "Substitusi seperti '@' untuk 'a' mudah ditebak ('{token}')",
+    "reversed": "Kata yang dibalik tetap mudah ditebak ('{token}')",
+    "spatial": "Hindari urutan tombol keyboard ('{token}')",
+    "repeat": "Hindari pengulangan karakter atau kata ('{token}')",
+    "sequence": "Hindari urutan seperti abc atau 123 ('{token}')",
+    "date": "Hindari tanggal yang berkaitan dengan Anda ('{token}')",
+    "year": "Hindari tahun ('{token}')",
+}
+
+
+class Match:
+    """Satu pola yang ditemukan di password[i:j + 1]"""
+    
+    __slots__ = ("pattern", "i", "j", "token", "guesses_log10", "info")
+    
+    def __init__(self, pattern: str, i: int, j: int, token: str,
+                 guesses: float, info: dict = None):
+        self.pattern = pattern
+        self.i = i
+        self.j = j
+        self.token = token
+        self.guesses_log10 = math.log10(max(guesses, 1))
+        self.info = info or {}
+    
+    @property
+    def guesses(self) -> float:
+        return 10 ** self.guesses_log10
+    
+    def copy(self) -> "Match":
+        """Salinan (dynamic programming menaikkan guesses_log10 sub-match in-place)"""
+        m = Match.__new__(Match)
+        m.pattern, m.i, m.j, m.token = self.pattern, self.i, self.j, self.token
+        m.guesses_log10, m.info = self.guesses_log10, self.info
+        return m
+    
+    def __repr__(self) -> str:
+        return f"Match({self.pattern}, {self.token!r}, 10^{self.guesses_log10:.1f})"
+
+
+class PatternAnalysis:
+    """
+    Hasil analisis: perkiraan jumlah tebakan (log10) dan urutan pola
+    dengan total tebakan paling kecil yang menutupi seluruh password.
+    """
+    
+    __slots__ = ("password_length", "guesses_log10", "sequence")
+    
+    def __init__(self, password_length: int, guesses_log10: float, sequence: list):
+        self.password_length = password_length
+        self.guesses_log10 = guesses_log10
+        self.sequence = sequence
+    
+    @property
+    def patterns(self) -> list:
+        """Pola yang ditemukan (tanpa segmen bruteforce)"""
+        return [m for m in self.sequence if m.pattern != "bruteforce"]
+    
+    def feedback(self) -> list:
+        """Saran perbaikan, satu per jenis pola"""
+        messages = []
+        seen = set()
+        for m in self.patterns:
+            if m.pattern in seen:
+                continue
+            seen.add(m.pattern)
+            messages.append(PATTERN_FEEDBACK[m.pattern].format(token=m.token))
+        return messages
+    
+    def __repr__(self) -> str:
+        return f"PatternAnalysis(10^{self.guesses_log10:.1f}, {self.patterns!r})"
+
+
+class DictionaryAutomaton:
+    """
+    Automaton Aho-Corasick atas semua kamus, dalam bentuk DFA penuh.
+    
+    Transisi setiap (node, karakter) sudah di-resolve termasuk failure
+    link, jadi scanning cukup satu lookup array per karakter: linear
+    terhadap panjang password, tidak bergantung ukuran kamus. Semua tabel
+    berupa array uint32 yang di-serialize ke satu file dan di-mmap saat
+    load (tanpa parsing).
+    """
+    
+    def __init__(self, directory: str, reverse: bool = False):
+        """
+        Args:
+            directory: Folder berisi file kamus *.txt
+            reverse: Bangun automaton atas kata yang dibalik (file cache
+                terpisah). Id kata sama dengan automaton maju.
+        
+        Raises:
+            FileNotFoundError: Jika folder kamus tidak ditemukan
+            ValueError: Jika tidak ada kata di kamus
+        """
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Folder kamus tidak ditemukan: {directory}")
+        
+        self.directory = directory
+        self.reverse = reverse
+        self.path = os.path.join(directory, REVERSED_AUTOMATON_FILENAME if reverse
+                                 else AUTOMATON_FILENAME)
+        self._sources = sorted(
+            name for name in os.listdir(directory) if name.endswith(".txt")
+        )
+        self.fingerprint = fingerprint = self._fingerprint()
+        
+        if not self._load(fingerprint):
+            self._build()
+            self._write(fingerprint)
+            self._load(fingerprint)
+    
+    @classmethod
+    def from_words(cls, words) -> "DictionaryAutomaton":
+        """
+        Automaton in-memory dari list kata (tanpa folder dan file cache),
+        misal untuk substring terlarang di policy. Kata di-lowercase;
+        peringkat mengikuti urutan list.
+        
+        Raises:
+            ValueError: Jika tidak ada kata ASCII
+        """
+        entries = [(word.lower(), rank, 0) for rank, word in enumerate(words, 1)
+                   if word and word.isascii()]
+        if not entries:
+            raise ValueError("Automaton membutuhkan minimal 1 kata ASCII")
+        
+        automaton = cls.__new__(cls)
+        automaton.directory = automaton.path = automaton.fingerprint = None
+        automaton.reverse = False
+        automaton._sources = []
+        automaton._build(entries)
+        automaton._use_built()
+        return automaton
+    
+    def _fingerprint(self) -> int:
+        """Fingerprint nama, ukuran dan mtime semua file kamus"""
+        digest = hashlib.blake2b(digest_size=8)
+        for name in self._sources:
+            stat = os.stat(os.path.join(self.directory, name))
+            digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+        return int.from_bytes(digest.digest(), "little")
+    
+    def _read_words(self) -> list:
+        """(kata, peringkat, indeks kamus) dari semua kamus, hanya ASCII"""
+        words = []
+        for dict_index, name in enumerate(self._sources):
+            rank = 0
+            with open(os.path.join(self.directory, name), "r", encoding="utf-8") as f:
+                for line in f:
+                    word = line.strip().lower()
+                    if not word or word.startswith("#") or not word.isascii():
+                        continue
+                    rank += 1
+                    words.append((word[::-1] if self.reverse else word, rank, dict_index))
+        return words
+    
+    def _build(self, words: list = None):
+        """Bangun trie, failure link dan DFA penuh (BFS) dari kamus atau `words`"""
+        if words is None:
+            words = self._read_words()
+        if not words:
+            raise ValueError(f"Kamus kosong: {self.directory}")
+        
+        # Indeks 0 dipakai untuk karakter di luar alphabet (kembali ke root)
+        alphabet = "".join(sorted(set("".join(w for w, _, _ in words))))
+        char_index = {c: i + 1 for i, c in enumerate(alphabet)}
+        size = len(alphabet) + 1
+        
+        goto = [{}]
+        out_word = array("I", [NO_WORD])
+        word_len, word_rank, word_dict = array("I"), array("I"), array("I")
+        
+        for word, rank, dict_index in words:
+            node = 0
+            for c in word:
+                idx = char_index[c]
+                child = goto[node].get(idx)
+                if child is None:
+                    child = len(goto)
+                    goto[node][idx] = child
+                    goto.append({})
+                    out_word.append(NO_WORD)
+                node = child
+            # Kata yang sama di beberapa kamus: simpan peringkat terbaik
+            current = out_word[node]
+            if current == NO_WORD or rank < word_rank[current]:
+                out_word[node] = len(word_len)
+                word_len.append(len(word))
+                word_rank.append(rank)
+                word_dict.append(dict_index)
+        
+        nodes = len(goto)
+        delta = array("I", bytes(4 * nodes * size))
+        fail = array("I", bytes(4 * nodes))
+        out_link = array("I", bytes(4 * nodes))
+        
+        queue = []
+        for idx, child in goto[0].items():
+            delta[idx] = child
+            queue.append(child)
+        
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            base = node * size
+            fail_base = fail[node] * size
+            children = goto[node]
+            for idx in range(size):
+                child = children.get(idx)
+                if child is None:
+                    delta[base + idx] = delta[fail_base + idx]
+                    continue
+                delta[base + idx] = child
+                target = delta[fail_base + idx]
+                fail[child] = target
+                out_link[child] = target if out_word[target] != NO_WORD else out_link[target]
+                queue.append(child)
+        
+        self._built = (alphabet, size, delta, out_word, out_link,
+                       word_len, word_rank, word_dict)
+    
+    def _write(self, fingerprint: int):
+        """Simpan automaton ke disk secara atomic (best effort, read-only dir diabaikan)"""
+        alphabet, size, delta, out_word, out_link, word_len, word_rank, word_dict = self._built
+        alphabet_bytes = _pad4(alphabet.encode("ascii"))
+        names_bytes = _pad4("\n".join(name[:-4] for name in self._sources).encode("utf-8"))
+        header = AUTOMATON_HEADER.pack(AUTOMATON_MAGIC, FORMAT_VERSION, len(out_word), size,
+                                       len(word_len), fingerprint,
+                                       len(alphabet_bytes), len(names_bytes))
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(alphabet_bytes)
+                f.write(names_bytes)
+                for table in (delta, out_word, out_link, word_len, word_rank, word_dict):
+                    table.tofile(f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _load(self, fingerprint: int) -> bool:
+        """Load automaton dari disk (zero-copy via mmap). False jika basi/tidak ada."""
+        try:
+            with open(self.path, "rb") as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return self._use_built()
+        
+        try:
+            (magic, version, nodes, size, word_count, stored_fingerprint,
+             alphabet_size, names_size) = AUTOMATON_HEADER.unpack_from(data)
+        except struct.error:
+            data.close()
+            return self._use_built()
+        
+        expected = (AUTOMATON_HEADER.size + alphabet_size + names_size
+                    + 4 * (nodes * size + 2 * nodes + 3 * word_count))
+        if (magic != AUTOMATON_MAGIC or version != FORMAT_VERSION
+                or stored_fingerprint != fingerprint or len(data) != expected):
+            data.close()
+            return self._use_built()
+        
+        offset = AUTOMATON_HEADER.size
+        alphabet = data[offset:offset + alphabet_size].rstrip(b"\0").decode("ascii")
+        offset += alphabet_size
+        self.dictionaries = data[offset:offset + names_size].rstrip(b"\0").decode("utf-8").split("\n")
+        offset += names_size
+        
+        view = memoryview(data)
+        tables = []
+        for count in (nodes * size, nodes, nodes, word_count, word_count, word_count):
+            tables.append(view[offset:offset + 4 * count].cast("I"))
+            offset += 4 * count
+        
+        self._map = data
+        self._set_tables(alphabet, size, *tables)
+        return True
+    
+    def _use_built(self) -> bool:
+        """Pakai tabel hasil build di memory jika file tidak bisa dipakai"""
+        built = getattr(self, "_built", None)
+        if built is None:
+            return False
+        self.dictionaries = [name[:-4] for name in self._sources]
+        self._set_tables(*built)
+        return True
+    
+    def _set_tables(self, alphabet, size, delta, out_word, out_link,
+                    word_len, word_rank, word_dict):
+        self.alphabet = alphabet
+        self.size = size
+        self.delta = delta
+        self.out_word = out_word
+        self.out_link = out_link
+        self.word_len = word_len
+        self.word_rank = word_rank
+        self.word_dict = word_dict
+        self.node_count = len(out_word)
+        # Tabel karakter ASCII -> indeks alphabet (0 = di luar alphabet)
+        table = bytearray(128)
+        for i, c in enumerate(alphabet):
+            table[ord(c)] = i + 1
+        self.char_table = bytes(table)
+    
+    def char_index(self, c: str) -> int:
+        """Indeks alphabet untuk satu karakter (0 jika tidak dikenal)"""
+        code = ord(c)
+        return self.char_table[code] if code < 128 else 0
+    
+    def step(self, node: int, c: str) -> int:
+        """Transisi satu karakter"""
+        return self.delta[node * self.size + self.char_index(c)]
+    
+    def words_at(self, node: int):
+        """Yield id kata yang berakhir di node ini (termasuk lewat output link)"""
+        out_word, out_link = self.out_word, self.out_link
+        if out_word[node] == NO_WORD:
+            node = out_link[node]
+        while node:
+            yield out_word[node]
+            node = out_link[node]
+    
+    def scan(self, text: str):
+        """
+        Yield (i, j, word_id) untuk setiap kata kamus di text[i:j + 1].
+        
+        Satu lookup DFA per karakter; output hanya dikunjungi jika ada kata.
+        """
+        delta, size, table = self.delta, self.size, self.char_table
+        out_word, out_link, word_len = self.out_word, self.out_link, self.word_len
+        node = 0
+        for j, c in enumerate(text):
+            code = ord(c)
+            node = delta[node * size + (table[code] if code < 128 else 0)]
+            match = node if out_word[node] != NO_WORD else out_link[node]
+            while match:
+                wid = out_word[match]
+                yield j - word_len[wid] + 1, j, wid
+                match = out_link[match]
+
+
+def _pad4(data: bytes) -> bytes:
+    """Pad bytes ke kelipatan 4 supaya array uint32 setelahnya ter-align"""
+    return data + b"\0" * (-len(data) % 4)
+
+
+def _build_keyboard_graph() -> dict:
+    """Karakter -> (posisi key, shifted?, dict arah -> key tetangga)"""
+    positions = {}
+    for y, (offset, keys) in enumerate(KEYBOARD_ROWS):
+        for x, key in enumerate(keys):
+            positions[(x + offset, y)] = key
+    
+    directions = ((-1, 0), (0, -1), (1, -1), (1, 0), (0, 1), (-1, 1))
+    graph = {}
+    for (x, y), key in positions.items():
+        neighbors = {}
+        for d, (dx, dy) in enumerate(directions):
+            neighbor = positions.get((x + dx, y + dy))
+            if neighbor is not None:
+                neighbors[neighbor] = d
+        for shifted, c in enumerate(key):
+            graph[c] = (key, bool(shifted), neighbors)
+    return graph
+
+
+KEYBOARD_GRAPH = _build_keyboard_graph()
+KEYBOARD_STARTING_POSITIONS = sum(1 for _, keys in KEYBOARD_ROWS for _ in keys)
+KEYBOARD_AVERAGE_DEGREE = (
+    sum(len(n) for _, shifted, n in KEYBOARD_GRAPH.values() if not shifted)
+    / KEYBOARD_STARTING_POSITIONS
+)
+
+DATE_WITH_SEPARATOR = re.compile(r"^(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})$")
+YEAR_PATTERN = re.compile(r"19\d\d|20\d\d")
+REPEAT_GREEDY = re.compile(r"(.+)\1+")
+REPEAT_LAZY = re.compile(r"(.+?)\1+")
+# Pengulangan yang berakhir di akhir teks (posisi awal paling kiri)
+REPEAT_SUFFIX = re.compile(r"(.+)\1+\Z")
+
+
+class PatternAnalyzer:
+    """
+    Analyzer pola password di atas DictionaryAutomaton.
+    
+    Semua matcher dijalankan kiri ke kanan, lalu dynamic programming
+    memilih urutan pola (ditambah segmen bruteforce) dengan jumlah
+    tebakan paling kecil, seperti zxcvbn.
+    """
+    
+    def __init__(self, automaton: DictionaryAutomaton):
+        self.automaton = automaton
+        self._reversed_automaton = None
+    
+    @property
+    def reversed_automaton(self):
+        """
+        Automaton atas kata kamus yang dibalik (di-load saat pertama dipakai),
+        untuk menemukan kata terbalik sambil membaca password kiri ke kanan.
+        None jika automaton maju tidak berasal dari folder kamus.
+        """
+        if self._reversed_automaton is None and self.automaton.directory is not None:
+            self._reversed_automaton = DictionaryAutomaton(self.automaton.directory,
+                                                           reverse=True)
+        return self._reversed_automaton
+    
+    def analyze(self, password: str, scans: tuple = None, rows: list = None,
+                matches: list = None) -> PatternAnalysis:
+        """
+        Analisis password.
+        
+        Args:
+            password: Password yang dianalisis
+            scans: Hasil scan automaton yang sudah dihitung untuk
+                MAX_ANALYSIS_LENGTH karakter pertama (lihat dictionary_matches)
+            rows: Cache baris dynamic programming dari analisis sebelumnya
+                (lihat _minimum_guesses)
+            matches: Semua pola MAX_ANALYSIS_LENGTH karakter pertama yang
+                sudah dicari (format find_matches), misal oleh IncrementalChecker.
+                Default: cari ulang.
+        
+        Returns:
+            PatternAnalysis dengan perkiraan log10 jumlah tebakan
+        """
+        head = password[:MAX_ANALYSIS_LENGTH]
+        if matches is None:
+            matches = self.find_matches(head, scans)
+        guesses_log10, sequence = _minimum_guesses(head, matches, rows)
+        
+        # Sisa password yang sangat panjang dihitung sebagai bruteforce
+        extra = len(password) - len(head)
+        if extra > 0:
+            guesses_log10 += extra * math.log10(BRUTEFORCE_CARDINALITY)
+        return PatternAnalysis(len(password), guesses_log10, sequence)
+    
+    def guesses_log10(self, password: str) -> float:
+        """Shortcut: log10 perkiraan jumlah tebakan"""
+        return self.analyze(password).guesses_log10
+    
+    def find_matches(self, password: str, scans: tuple = None) -> list:
+        """Semua pola yang ditemukan (boleh overlap)"""
+        matches = self.dictionary_matches(password, scans)
+        matches += _spatial_matches(password)
+        matches += _sequence_matches(password)
+        matches += self._repeat_matches(password)
+        matches += _date_matches(password)
+        return matches
+    
+    def dictionary_matches(self, password: str, scans: tuple = None) -> list:
+        """
+        Kata kamus: apa adanya, dengan substitusi leet, dan dibalik
+        
+        Args:
+            password: Password yang dianalisis
+            scans: Tuple (scan huruf kecil, tuple scan per LEET_TABLES) berisi
+                list (i, j, word_id) yang sudah dihitung, misal oleh
+                IncrementalChecker, opsional ditambah list (i, j, word_id)
+                kata terbalik dari reversed_automaton (urut i menurun).
+                Default: scan ulang password.
+        """
+        automaton = self.automaton
+        lower = _lowercase(password)
+        n = len(password)
+        matches = []
+        
+        forward = automaton.scan(lower) if scans is None else scans[0]
+        for i, j, wid in forward:
+            matches.append(self._dictionary_match("dictionary", password, i, j, wid))
+        
+        if scans is not None and len(scans) > 2:
+            backward = scans[2]
+        else:
+            backward = ((n - 1 - j, n - 1 - i, wid) for i, j, wid in automaton.scan(lower[::-1]))
+        for i, j, wid in backward:
+            if lower[i:j + 1] == lower[i:j + 1][::-1]:
+                continue  # palindrom sudah ditemukan apa adanya
+            matches.append(self._dictionary_match("reversed", password, i, j, wid))
+        
+        tables = LEET_TABLES if LEET_AMBIGUOUS.intersection(lower) else LEET_TABLES[:1]
+        seen = set()
+        for t, table in enumerate(tables):
+            unleet = lower.translate(table)
+            if unleet == lower:
+                continue
+            found = automaton.scan(unleet) if scans is None else scans[1][t]
+            for i, j, wid in found:
+                subs = {lower[k]: unleet[k] for k in range(i, j + 1) if lower[k] != unleet[k]}
+                if not subs or (i, j, wid) in seen:
+                    continue
+                seen.add((i, j, wid))
+                matches.append(self._dictionary_match("l33t", password, i, j, wid, subs))
+        
+        return matches
+    
+    def _dictionary_match(self, pattern, password, i, j, wid, subs=None) -> Match:
+        """Match kamus beserta perkiraan tebakannya"""
+        automaton = self.automaton
+        token = password[i:j + 1]
+        rank = automaton.word_rank[wid]
+        guesses = rank * _uppercase_variations(token)
+        if pattern == "reversed":
+            guesses *= 2
+        if subs:
+            guesses *= _l33t_variations(token.lower(), subs)
+        info = {
+            "dictionary": automaton.dictionaries[automaton.word_dict[wid]],
+            "rank": rank,
+        }
+        if subs:
+            info["sub"] = subs
+        return Match(pattern, i, j, token, guesses, info)
+    
+    def _repeat_matches(self, password: str, pos: int = 0) -> list:
+        """Pengulangan: 'aaa', 'abcabc' (dicari mulai dari posisi `pos`)"""
+        matches = []
+        while pos < len(password):
+            greedy = REPEAT_GREEDY.search(password, pos)
+            if greedy is None:
+                break
+            lazy = REPEAT_LAZY.search(password, pos)
+            if len(greedy.group(0)) > len(lazy.group(0)):
+                # 'aabaab': pakai greedy, lalu cari unit terkecil dari hasilnya
+                match = greedy
+                base = REPEAT_LAZY.fullmatch(match.group(0)).group(1)
+            else:
+                match = lazy
+                base = lazy.group(1)
+            i, j = match.start(), match.end() - 1
+            count = len(match.group(0)) // len(base)
+            base_guesses = 10 ** self.guesses_log10(base)
+            matches.append(Match("repeat", i, j, match.group(0), base_guesses * count,
+                                 {"base": base, "count": count}))
+            pos = j + 1
+        return matches
+
+
+def _lowercase(text: str) -> str:
+    """
+    Huruf kecil dengan panjang tetap, supaya indeks hasil scan tetap
+    sesuai password ('İ'.lower() menjadi 2 karakter, jadi dibiarkan)
+    """
+    lower = text.lower()
+    if len(lower) == len(text):
+        return lower
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+def _uppercase_variations(token: str) -> float:
+    """Jumlah variasi huruf besar/kecil yang perlu dicoba penyerang"""
+    if token.islower() or not any(c.isalpha() for c in token):
+        return 1
+    if token.isupper() or (token[0].isupper() and token[1:].islower()) \
+            or (token[-1].isupper() and token[:-1].islower()):
+        return 2
+    upper = sum(1 for c in token if c.isupper())
+    lower = sum(1 for c in token if c.islower())
+    return sum(math.comb(upper + lower, k) for k in range(1, min(upper, lower) + 1))
+
+
+def _l33t_variations(token: str, subs: dict) -> float:
+    """Jumlah variasi substitusi leet yang perlu dicoba penyerang"""
+    variations = 1
+    for subbed, letter in subs.items():
+        s = token.count(subbed)
+        u = token.count(letter)
+        if s == 0 or u == 0:
+            variations *= 2
+        else:
+            variations *= sum(math.comb(s + u, k) for k in range(1, min(s, u) + 1))
+    return variations
+
+
+def _spatial_matches(password: str) -> list:
+    """Urutan tombol keyboard yang bersebelahan (minimal 3 karakter)"""
+    matches = []
+    graph = KEYBOARD_GRAPH
+    n = len(password)
+    i = 0
+    while i < n - 2:
+        j = i
+        turns = 0
+        last_direction = None
+        shifted = 1 if password[i] in graph and graph[password[i]][1] else 0
+        while j + 1 < n:
+            current = graph.get(password[j])
+            following = graph.get(password[j + 1])
+            if current is None or following is None:
+                break
+            direction = current[2].get(following[0])
+            if direction is None:
+                break
+            if direction != last_direction:
+                turns += 1
+                last_direction = direction
+            if following[1]:
+                shifted += 1
+            j += 1
+        if j - i >= 2:
+            matches.append(_spatial_match(password[i:j + 1], i, turns, shifted))
+            i = j
+        else:
+            i += 1
+    return matches
+
+
+def _spatial_match(token: str, i: int, turns: int, shifted: int) -> Match:
+    """Match pola keyboard `token` yang dimulai di posisi i"""
+    return Match("spatial", i, i + len(token) - 1, token, _spatial_guesses(len(token), turns, shifted),
+                 {"turns": turns, "shifted": shifted})
+
+
+def _spatial_guesses(length: int, turns: int, shifted: int) -> float:
+    """Perkiraan tebakan pola keyboard (rumus zxcvbn)"""
+    s = KEYBOARD_STARTING_POSITIONS
+    d = KEYBOARD_AVERAGE_DEGREE
+    guesses = 0
+    for i in range(2, length + 1):
+        for k in range(1, min(turns, i - 1) + 1):
+            guesses += math.comb(i - 1, k - 1) * s * d ** k
+    if shifted:
+        unshifted = length - shifted
+        if unshifted == 0:
+            guesses *= 2
+        else:
+            guesses *= sum(math.comb(shifted + unshifted, k)
+                           for k in range(1, min(shifted, unshifted) + 1))
+    return guesses
+
+
+def _sequence_matches(password: str) -> list:
+    """Urutan dengan selisih kode tetap: 'abcd', '2468', 'zyx' (minimal 3 karakter)"""
+    matches = []
+    n = len(password)
+    i = 0
+    while i < n - 2:
+        delta = ord(password[i + 1]) - ord(password[i])
+        j = i + 1
+        if delta != 0 and abs(delta) <= 5:
+            while j + 1 < n and ord(password[j + 1]) - ord(password[j]) == delta:
+                j += 1
+        if j - i >= 2:
+            matches.append(_sequence_match(password[i:j + 1], i, delta))
+            i = j
+        else:
+            i += 1
+    return matches
+
+
+def _sequence_match(token: str, i: int, delta: int) -> Match:
+    """Match urutan `token` (dimulai di posisi i) dengan selisih kode `delta`"""
+    first = token[0]
+    if first in "aAzZ019":
+        base = 4
+    elif first.isdigit():
+        base = 10
+    else:
+        base = 26
+    if delta < 0:
+        base *= 2
+    return Match("sequence", i, i + len(token) - 1, token, base * len(token), {"delta": delta})
+
+
+def _year_guesses(year: int) -> float:
+    return max(abs(year - REFERENCE_YEAR), MIN_YEAR_SPACE)
+
+
+def _normalize_year(year: int) -> int:
+    """Tahun 2 digit -> 4 digit"""
+    if year > 99:
+        return year
+    return 1900 + year if year > 50 else 2000 + year
+
+
+def _valid_date(a: int, b: int, c: int):
+    """Coba tafsirkan (a, b, c) sebagai tanggal; kembalikan tahun atau None"""
+    for year, rest in ((c, (a, b)), (a, (b, c))):
+        if year > 31 or year < 100 and year > 12:
+            for day, month in (rest, rest[::-1]):
+                if 1 <= day <= 31 and 1 <= month <= 12:
+                    year = _normalize_year(year)
+                    if 1000 <= year <= 2050:
+                        return year
+    return None
+
+
+def _date_matches(password: str) -> list:
+    """Tanggal (dengan atau tanpa pemisah) dan tahun"""
+    matches = []
+    n = len(password)
+    
+    for i in range(n):
+        # Tanggal dengan pemisah: 17-08-1945, 1/2/99
+        for j in range(i + 5, min(i + 10, n)):
+            m = _separator_date_match(password[i:j + 1], i)
+            if m is not None:
+                matches.append(m)
+        
+        # Tanggal tanpa pemisah: 170845, 17081945
+        for j in range(i + 3, min(i + 8, n)):
+            token = password[i:j + 1]
+            if not token.isdigit():
+                break
+            m = _digit_date_match(token, i)
+            if m is not None:
+                matches.append(m)
+    
+    for m in YEAR_PATTERN.finditer(password):
+        matches.append(_year_match(m.group(0), m.start()))
+    return matches
+
+
+def _separator_date_match(token: str, i: int):
+    """Match tanggal dengan pemisah untuk `token` di posisi i, atau None"""
+    m = DATE_WITH_SEPARATOR.match(token)
+    if m is None:
+        return None
+    year = _valid_date(int(m.group(1)), int(m.group(3)), int(m.group(4)))
+    if year is None:
+        return None
+    return Match("date", i, i + len(token) - 1, token, 365 * _year_guesses(year) * 4,
+                 {"year": year, "separator": m.group(2)})
+
+
+def _digit_date_match(token: str, i: int):
+    """Match tanggal tanpa pemisah untuk `token` (hanya angka) di posisi i, atau None"""
+    best = None
+    for k in range(1, len(token) - 1):
+        for l in range(k + 1, len(token)):
+            year = _valid_date(int(token[:k]), int(token[k:l]), int(token[l:]))
+            if year is not None and (best is None or
+                                     abs(year - REFERENCE_YEAR) < abs(best - REFERENCE_YEAR)):
+                best = year
+    if best is None:
+        return None
+    return Match("date", i, i + len(token) - 1, token, 365 * _year_guesses(best),
+                 {"year": best, "separator": ""})
+
+
+def _year_match(token: str, i: int) -> Match:
+    """Match tahun 4 digit `token` di posisi i"""
+    year = int(token)
+    return Match("year", i, i + 3, token, _year_guesses(year), {"year": year})
+
+
+def _log10_add(a: float, b: float) -> float:
+    """log10(10^a + 10^b) tanpa overflow"""
+    if a < b:
+        a, b = b, a
+    return a + math.log10(1 + 10 ** (b - a))
+
+
+def _row_signature(row_matches: list) -> list:
+    """Isi pola yang berakhir di satu posisi, untuk membandingkan baris DP"""
+    return [(m.pattern, m.i, m.token, m.guesses_log10, m.info) for m in row_matches]
+
+
+def _minimum_guesses(password: str, matches: list, rows: list = None) -> tuple:
+    """
+    Dynamic programming kiri ke kanan: urutan pola non-overlap dengan
+    total tebakan minimum, celah diisi segmen bruteforce.
+    
+    Baris best[k] untuk k < n - 1 hanya bergantung pada pola yang berakhir
+    di posisi <= k (batas minimum sub-match dan segmen bruteforce penuh
+    hanya berbeda di baris terakhir), jadi bisa dipakai ulang antar
+    pemanggilan selama pola di posisi tersebut tidak berubah.
+    
+    Args:
+        password: Password
+        matches: Semua pola yang ditemukan
+        rows: List (signature pola, baris best) dari pemanggilan sebelumnya
+            (opsional, diperbarui in-place), dipakai IncrementalChecker
+    
+    Returns:
+        Tuple (log10 tebakan, list Match)
+    """
+    n = len(password)
+    if n == 0:
+        if rows is not None:
+            rows.clear()
+        return 0.0, []
+    
+    by_end = [[] for _ in range(n)]
+    for m in matches:
+        # Sub-match tidak boleh lebih murah dari batas minimum
+        if m.j - m.i + 1 < n:
+            floor = (MIN_SUBMATCH_GUESSES_SINGLE_CHAR if m.i == m.j
+                     else MIN_SUBMATCH_GUESSES_MULTI_CHAR)
+            m.guesses_log10 = max(m.guesses_log10, math.log10(floor))
+        by_end[m.j].append(m)
+    
+    log_bf = math.log10(BRUTEFORCE_CARDINALITY)
+    log_growth = math.log10(MIN_GUESSES_BEFORE_GROWING_SEQUENCE)
+    
+    # best[k][l] = (log10 total, log10 product, match) untuk l pola yang
+    # menutupi password[:k + 1]
+    best = [{} for _ in range(n)]
+    
+    # Pakai ulang baris awal yang pola-nya sama; baris terakhir selalu dihitung
+    start = 0
+    if rows is not None:
+        limit = min(len(rows), n - 1)
+        while start < limit and rows[start][0] == _row_signature(by_end[start]):
+            best[start] = rows[start][1]
+            start += 1
+        del rows[start:]
+    
+    def update(k, m, l, log_product):
+        total = _log10_add(math.lgamma(l + 1) / math.log(10) + log_product,
+                           (l - 1) * log_growth)
+        for other_l, entry in best[k].items():
+            if other_l <= l and entry[0] <= total:
+                return
+        best[k][l] = (total, log_product, m)
+    
+    for k in range(start, n):
+        for m in by_end[k]:
+            if m.i == 0:
+                update(k, m, 1, m.guesses_log10)
+            else:
+                for l, entry in list(best[m.i - 1].items()):
+                    update(k, m, l + 1, entry[1] + m.guesses_log10)
+        
+        # Segmen bruteforce i..k (tidak disambung ke segmen bruteforce lain)
+        for i in range(k + 1):
+            length = k - i + 1
+            floor = (MIN_SUBMATCH_GUESSES_SINGLE_CHAR if length == 1
+                     else MIN_SUBMATCH_GUESSES_MULTI_CHAR) + 1
+            log_guesses = max(length * log_bf, math.log10(floor)) if length < n else n * log_bf
+            bf = ("bruteforce", i, k)
+            if i == 0:
+                update(k, bf, 1, log_guesses)
+            else:
+                for l, entry in list(best[i - 1].items()):
+                    if isinstance(entry[2], tuple):
+                        continue
+                    update(k, bf, l + 1, entry[1] + log_guesses)
+        
+        if rows is not None and k < n - 1:
+            rows.append((_row_signature(by_end[k]), best[k]))
+    
+    # Backtrack dari urutan terbaik di posisi terakhir
+    l, (total, _, _) = min(best[n - 1].items(), key=lambda item: item[1][0])
+    sequence = []
+    k = n - 1
+    while k >= 0:
+        _, _, m = best[k][l]
+        if isinstance(m, tuple):
+            _, i, j = m
+            token = password[i:j + 1]
+            m = Match("bruteforce", i, j, token, BRUTEFORCE_CARDINALITY ** len(token))
+        sequence.append(m)
+        k = m.i - 1
+        l -= 1
+    sequence.reverse()
+    return total, sequence
+
+
+_ANALYZER_CACHE = {}
+
+
+def get_analyzer(directory: str = None) -> PatternAnalyzer:
+    """
+    Dapatkan PatternAnalyzer (automaton di-load sekali per folder kamus)
+    
+    Args:
+        directory: Folder kamus (default: DEFAULT_DICTIONARY_DIR)
+    
+    Returns:
+        PatternAnalyzer yang siap dipakai
+    """
+    directory = os.path.abspath(directory or DEFAULT_DICTIONARY_DIR)
+    analyzer = _ANALYZER_CACHE.get(directory)
+    if analyzer is None:
+        analyzer = PatternAnalyzer(DictionaryAutomaton(directory))
+        _ANALYZER_CACHE[directory] = analyzer
+    return analyzer
@@ -0,0 +1,493 @@
+"""
+Policy Engine Module
+Policy password deklaratif (JSON/TOML) yang di-compile menjadi satu fungsi evaluasi
+"""
+
+import hashlib
+import json
+import math
+import os
+import sys
+from array import array
+from functools import lru_cache
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+from crack_estimator import charset_entropy
+from pattern_analyzer import DictionaryAutomaton
+from strength_checker import CRITERIA, _CHARSET_BY_MASK, _SCORE_BY_MASK, _classify
+
+# Bit kelas karakter di mask strength_checker, per nama kelas generator
+CLASS_BITS = {
+    "uppercase": 1 << 1,
+    "lowercase": 1 << 2,
+    "numbers": 1 << 3,
+    "symbols": 1 << 4,
+}
+CLASS_MASK = sum(CLASS_BITS.values())
+
+# Rule policy: (key, bit pelanggaran, pesan). Pesan `required` diambil dari
+# saran CRITERIA per kelas yang kurang.
+POLICY_RULES = (
+    ("min_length", 1 << 0, "Password minimal {min_length} karakter"),
+    ("max_length", 1 << 1, "Password maksimal {max_length} karakter"),
+    ("required", 1 << 2, None),
+    ("min_classes", 1 << 3, "Gunakan minimal {min_classes} jenis karakter "
+                            "(huruf besar, huruf kecil, angka, simbol)"),
+    ("max_repeat", 1 << 4, "Karakter yang sama maksimal {max_repeat} kali berturut-turut"),
+    ("banned_substrings", 1 << 5, "Password mengandung kata yang dilarang policy"),
+    ("min_score", 1 << 6, "Skor kekuatan minimal {min_score}"),
+    ("min_entropy", 1 << 7, "Entropy minimal {min_entropy:g} bit"),
+)
+RULE_BITS = {key: bit for key, bit, _ in POLICY_RULES}
+
+# Nilai default tiap field spec (None = rule tidak aktif)
+POLICY_DEFAULTS = {
+    "name": "policy",
+    "min_length": None,
+    "max_length": None,
+    "required": [],
+    "min_classes": None,
+    "max_repeat": None,
+    "banned_substrings": [],
+    "min_score": None,
+    "min_entropy": None,
+}
+
+# Jumlah policy hasil compile yang disimpan (key: hash isi spec)
+POLICY_CACHE_SIZE = 256
+
+# Jumlah kelas karakter untuk setiap mask
+_CLASS_COUNT_BY_MASK = bytes(bin(mask & CLASS_MASK).count("1") for mask in range(64))
+
+_REQUIRED_MESSAGES = {bit: message for _, bit, _, message in CRITERIA if bit & CLASS_MASK}
+
+
+class PolicyResult:
+    """
+    Hasil evaluasi satu password terhadap satu policy.
+    
+    Hanya menyimpan mask pelanggaran dan mask kelas karakter (tanpa
+    plaintext); pesan dibangun saat diakses.
+    """
+    
+    __slots__ = ("policy", "violations", "mask")
+    
+    def __init__(self, policy, violations: int, mask: int):
+        self.policy = policy
+        self.violations = violations
+        self.mask = mask
+    
+    @property
+    def passed(self) -> bool:
+        return not self.violations
+    
+    @property
+    def failed_rules(self) -> list:
+        """Key rule yang dilanggar, urut sesuai POLICY_RULES"""
+        return [key for key, bit, _ in POLICY_RULES if self.violations & bit]
+    
+    @property
+    def messages(self) -> list:
+        """Pesan per rule yang dilanggar"""
+        spec = self.policy.spec
+        messages = []
+        for key, bit, message in POLICY_RULES:
+            if not self.violations & bit:
+                continue
+            if key == "required":
+                missing = self.policy.required_bits & ~self.mask
+                messages += [text for class_bit, text in _REQUIRED_MESSAGES.items()
+                             if missing & class_bit]
+            else:
+                messages.append(message.format(**spec))
+        return messages
+    
+    def __repr__(self) -> str:
+        return f"PolicyResult({self.policy.name}, passed={self.passed}, {self.failed_rules})"
+
+
+class PolicyBatch:
+    """Hasil evaluate_many: mask pelanggaran per password dalam kolom array"""
+    
+    def __init__(self, policy, violations: array, masks: array):
+        self.policy = policy
+        self.violations = violations
+        self.masks = masks
+    
+    def __len__(self) -> int:
+        return len(self.violations)
+    
+    def __getitem__(self, i: int) -> PolicyResult:
+        return PolicyResult(self.policy, self.violations[i], self.masks[i])
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    @property
+    def passed_count(self) -> int:
+        """Jumlah password yang lolos policy"""
+        return self.violations.count(0)
+    
+    def rule_counts(self) -> dict:
+        """Jumlah password yang melanggar tiap rule"""
+        counts = dict.fromkeys(RULE_BITS, 0)
+        for violations in set(self.violations):
+            if violations:
+                matching = self.violations.count(violations)
+                for key, bit in RULE_BITS.items():
+                    if violations & bit:
+                        counts[key] += matching
+        return counts
+
+
+class CompiledPolicy:
+    """
+    Policy yang sudah di-compile.
+    
+    Semua rule aktif dievaluasi oleh satu fungsi dari fitur password yang
+    dihitung sekali (panjang, mask kelas, run karakter terpanjang,
+    substring terlarang). Rule yang tidak aktif memakai nilai netral,
+    jadi tidak ada percabangan per rule di luar perbandingan integer.
+    """
+    
+    def __init__(self, spec: dict, digest: str):
+        """
+        Args:
+            spec: Spec yang sudah dinormalisasi (lihat normalize_policy)
+            digest: Hash isi spec (key cache)
+        """
+        self.spec = spec
+        self.digest = digest
+        self.name = spec["name"]
+        self.banned = tuple(spec["banned_substrings"])
+        self.required_bits = sum(CLASS_BITS[name] for name in spec["required"])
+        self.needs_runs = spec["max_repeat"] is not None
+        self.check = _violation_function(spec, self.required_bits)
+        self._scanner = None
+    
+    @property
+    def scanner(self):
+        """Feature scanner untuk policy ini saja (dibangun saat pertama dipakai)"""
+        if self._scanner is None:
+            self._scanner = _FeatureScanner((self,))
+        return self._scanner
+    
+    def evaluate(self, password: str) -> PolicyResult:
+        """Evaluasi satu password"""
+        length, mask, longest, banned = self.scanner.scan(password)
+        return PolicyResult(self, self.check(length, mask, longest, banned & 1), mask)
+    
+    def evaluate_many(self, passwords) -> PolicyBatch:
+        """
+        Evaluasi banyak password sekaligus
+        
+        Args:
+            passwords: Iterable berisi password
+        
+        Returns:
+            PolicyBatch sesuai urutan input
+        """
+        violations, masks = array("B"), array("B")
+        scan, check = self.scanner.scan, self.check
+        for password in passwords:
+            length, mask, longest, banned = scan(password)
+            violations.append(check(length, mask, longest, banned & 1))
+            masks.append(mask)
+        return PolicyBatch(self, violations, masks)
+    
+    def find_banned(self, password: str) -> list:
+        """Substring terlarang yang ada di password (untuk penjelasan ke user)"""
+        lower = password.lower()
+        return [word for word in self.banned if word in lower]
+    
+    def __repr__(self) -> str:
+        return f"CompiledPolicy({self.name}, {self.digest[:12]})"
+
+
+class PolicySet:
+    """
+    Beberapa policy yang dievaluasi bersamaan.
+    
+    Fitur password dihitung satu kali untuk semua policy: substring
+    terlarang semua policy digabung ke satu automaton Aho-Corasick yang
+    menandai bit policy per node, lalu tiap policy hanya menjalankan fungsi
+    perbandingan hasil compile-nya.
+    """
+    
+    def __init__(self, policies):
+        """
+        Args:
+            policies: Iterable CompiledPolicy (atau spec yang akan di-compile)
+        
+        Raises:
+            ValueError: Jika tidak ada policy
+        """
+        self.policies = tuple(policy if isinstance(policy, CompiledPolicy) else compile_policy(policy)
+                              for policy in policies)
+        if not self.policies:
+            raise ValueError("PolicySet membutuhkan minimal 1 policy")
+        self.scanner = _FeatureScanner(self.policies)
+        self._checks = tuple((1 << index, policy.check) for index, policy in enumerate(self.policies))
+    
+    def __len__(self) -> int:
+        return len(self.policies)
+    
+    def evaluate(self, password: str) -> list:
+        """Hasil semua policy untuk satu password (urutan sama dengan policies)"""
+        length, mask, longest, banned = self.scanner.scan(password)
+        return [PolicyResult(policy, check(length, mask, longest, banned & bit), mask)
+                for policy, (bit, check) in zip(self.policies, self._checks)]
+    
+    def passing(self, password: str) -> list:
+        """Nama policy yang lolos"""
+        length, mask, longest, banned = self.scanner.scan(password)
+        return [policy.name for policy, (bit, check) in zip(self.policies, self._checks)
+                if not check(length, mask, longest, banned & bit)]
+
+
+class _FeatureScanner:
+    """
+    Hitung fitur password untuk sekumpulan policy dalam satu pass:
+    (panjang, mask kriteria, run karakter sama terpanjang, bit policy yang
+    substring terlarangnya ditemukan).
+    
+    Mask kelas dihitung dengan tabel translate strength_checker. Run dan
+    substring terlarang dihitung dalam satu loop karakter yang sama; loop
+    dilewati jika tidak ada policy yang membutuhkannya.
+    """
+    
+    def __init__(self, policies: tuple):
+        word_bits = {}
+        for index, policy in enumerate(policies):
+            for word in policy.banned:
+                word_bits[word] = word_bits.get(word, 0) | (1 << index)
+        
+        ascii_words = [word for word in word_bits if word.isascii()]
+        # Kata non-ASCII tidak masuk automaton, dicek langsung di teks lowercase
+        self.extra = tuple((word, bits) for word, bits in word_bits.items() if not word.isascii())
+        self.needs_loop = bool(ascii_words) or any(policy.needs_runs for policy in policies)
+        
+        if ascii_words:
+            automaton = DictionaryAutomaton.from_words(ascii_words)
+            self.delta = automaton.delta
+            self.size = automaton.size
+            # Huruf besar ASCII dipetakan ke indeks huruf kecilnya (case-insensitive)
+            self.fold = bytes(automaton.char_table[ord(chr(code).lower())] for code in range(128))
+            self.node_bits = [0] * automaton.node_count
+            for node in range(automaton.node_count):
+                for wid in automaton.words_at(node):
+                    self.node_bits[node] |= word_bits[ascii_words[wid]]
+        else:
+            self.delta, self.size, self.fold, self.node_bits = (0,), 1, bytes(128), (0,)
+    
+    def scan(self, password: str) -> tuple:
+        mask = _classify(password)
+        longest = banned = 0
+        if self.needs_loop:
+            delta, size, fold, node_bits = self.delta, self.size, self.fold, self.node_bits
+            node = run = 0
+            previous = None
+            for c in password:
+                if c == previous:
+                    run += 1
+                else:
+                    previous = c
+                    run = 1
+                if run > longest:
+                    longest = run
+                code = ord(c)
+                node = delta[node * size + (fold[code] if code < 128 else 0)]
+                banned |= node_bits[node]
+        if self.extra:
+            lower = password.lower()
+            for word, bits in self.extra:
+                if word in lower:
+                    banned |= bits
+        return len(password), mask, longest, banned
+
+
+def _violation_function(spec: dict, required_bits: int):
+    """
+    Compile rule spec menjadi satu fungsi (panjang, mask, run, banned) ->
+    mask pelanggaran. Rule yang tidak aktif diberi nilai netral supaya
+    perbandingannya selalu lolos.
+    """
+    min_length = spec["min_length"] or 0
+    max_length = spec["max_length"] if spec["max_length"] is not None else sys.maxsize
+    min_classes = spec["min_classes"] or 0
+    max_repeat = spec["max_repeat"] if spec["max_repeat"] is not None else sys.maxsize
+    min_score = spec["min_score"] or 0
+    min_entropy = spec["min_entropy"] or 0
+    class_count, score_by_mask, charset_by_mask = _CLASS_COUNT_BY_MASK, _SCORE_BY_MASK, _CHARSET_BY_MASK
+    bits = RULE_BITS
+    (MIN_LENGTH, MAX_LENGTH, REQUIRED, MIN_CLASSES, MAX_REPEAT,
+     BANNED, MIN_SCORE, MIN_ENTROPY) = (bits[key] for key, _, _ in POLICY_RULES)
+    
+    def check(length: int, mask: int, longest: int, banned: int) -> int:
+        violations = 0
+        if length < min_length:
+            violations |= MIN_LENGTH
+        if length > max_length:
+            violations |= MAX_LENGTH
+        if required_bits & ~mask:
+            violations |= REQUIRED
+        if class_count[mask] < min_classes:
+            violations |= MIN_CLASSES
+        if longest > max_repeat:
+            violations |= MAX_REPEAT
+        if banned:
+            violations |= BANNED
+        if score_by_mask[mask] < min_score:
+            violations |= MIN_SCORE
+        if min_entropy and charset_entropy(charset_by_mask[mask], length) < min_entropy:
+            violations |= MIN_ENTROPY
+        return violations
+    
+    return check
+
+
+def _int_field(spec: dict, key: str, low: int, high: int = None):
+    """
+    Validasi field integer opsional
+    
+    Raises:
+        ValueError: Jika bukan integer atau di luar batas
+    """
+    value = spec[key]
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"'{key}' harus berupa bilangan bulat")
+    if value < low or (high is not None and value > high):
+        bound = f"antara {low} dan {high}" if high is not None else f"minimal {low}"
+        raise ValueError(f"'{key}' harus {bound}")
+    return value
+
+
+def normalize_policy(spec: dict) -> dict:
+    """
+    Validasi spec policy dan lengkapi dengan nilai default.
+    
+    Substring terlarang di-lowercase, duplikatnya dibuang dan diurutkan,
+    kelas wajib diurutkan, sehingga spec yang isinya sama selalu
+    menghasilkan hash yang sama.
+    
+    Args:
+        spec: Dictionary policy (key sesuai POLICY_DEFAULTS)
+    
+    Returns:
+        Dictionary policy lengkap
+    
+    Raises:
+        ValueError: Jika ada key yang tidak dikenal atau nilai tidak valid
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("Policy harus berupa object/table")
+    unknown = set(spec) - set(POLICY_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Field policy tidak dikenal: {', '.join(sorted(unknown))}")
+    
+    data = {**POLICY_DEFAULTS, **spec}
+    if not isinstance(data["name"], str) or not data["name"]:
+        raise ValueError("'name' harus berupa teks yang tidak kosong")
+    
+    for key, low, high in (("min_length", 0, None), ("max_length", 1, None),
+                           ("min_classes", 0, len(CLASS_BITS)), ("max_repeat", 1, None),
+                           ("min_score", 0, 100)):
+        data[key] = _int_field(data, key, low, high)
+    if (data["min_length"] is not None and data["max_length"] is not None
+            and data["min_length"] > data["max_length"]):
+        raise ValueError("'min_length' tidak boleh lebih besar dari 'max_length'")
+    
+    entropy = data["min_entropy"]
+    if entropy is not None:
+        if isinstance(entropy, bool) or not isinstance(entropy, (int, float)) \
+                or not math.isfinite(entropy) or entropy < 0:
+            raise ValueError("'min_entropy' harus berupa angka tidak negatif")
+        data["min_entropy"] = float(entropy)
+    
+    required = data["required"]
+    if not isinstance(required, list) or any(name not in CLASS_BITS for name in required):
+        raise ValueError(f"'required' harus berupa list dari: {', '.join(CLASS_BITS)}")
+    data["required"] = sorted(set(required), key=list(CLASS_BITS).index)
+    
+    banned = data["banned_substrings"]
+    if not isinstance(banned, list) or not all(isinstance(word, str) and word for word in banned):
+        raise ValueError("'banned_substrings' harus berupa list teks yang tidak kosong")
+    data["banned_substrings"] = sorted({word.lower() for word in banned})
+    return data
+
+
+def parse_policy(text, fmt: str = "json") -> dict:
+    """
+    Parse teks policy JSON atau TOML menjadi dictionary
+    
+    Args:
+        text: Isi policy (str atau bytes)
+        fmt: "json" atau "toml"
+    
+    Raises:
+        ValueError: Jika format tidak dikenal, teks tidak valid, atau TOML
+            dipakai tanpa tomllib (Python < 3.11)
+    """
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    if fmt == "json":
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Policy JSON tidak valid: {e}")
+    if fmt == "toml":
+        if tomllib is None:
+            raise ValueError("Policy TOML membutuhkan Python 3.11+ (tomllib)")
+        try:
+            return tomllib.loads(text)
+        except tomllib.TOMLDecodeError as e:
+            raise ValueError(f"Policy TOML tidak valid: {e}")
+    raise ValueError(f"Format policy tidak dikenal: {fmt}")
+
+
+def compile_policy(spec) -> CompiledPolicy:
+    """
+    Compile policy (di-cache per hash isi spec yang sudah dinormalisasi)
+    
+    Args:
+        spec: Dictionary policy atau teks JSON
+    
+    Returns:
+        CompiledPolicy
+    
+    Raises:
+        ValueError: Jika spec tidak valid
+    """
+    if isinstance(spec, (str, bytes)):
+        spec = parse_policy(spec)
+    canonical = json.dumps(normalize_policy(spec), sort_keys=True,
+                           separators=(",", ":"), ensure_ascii=False)
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+    return _compile_cached(digest, canonical)
+
+
+@lru_cache(maxsize=POLICY_CACHE_SIZE)
+def _compile_cached(digest: str, canonical: str) -> CompiledPolicy:
+    return CompiledPolicy(json.loads(canonical), digest)
+
+
+def load_policy(path: str) -> CompiledPolicy:
+    """
+    Load dan compile policy dari file .json atau .toml
+    
+    Raises:
+        FileNotFoundError: Jika file tidak ditemukan
+        ValueError: Jika ekstensi tidak dikenal atau isi tidak valid
+    """
+    fmt = os.path.splitext(path)[1].lower().lstrip(".")
+    if fmt not in ("json", "toml"):
+        raise ValueError(f"Ekstensi file policy harus .json atau .toml: {path}")
+    with open(path, "rb") as f:
+        return compile_policy(parse_policy(f.read(), fmt))
@@ -0,0 +1,318 @@
+"""
+Pronounceable Generator Module
+Generate password yang mudah diucapkan dari model Markov huruf (n-gram)
+"""
+
+import math
+import os
+import string
+import struct
+
+from entropy_pool import get_default_pool
+
+# Corpus default (satu kata per baris, huruf a-z)
+DEFAULT_CORPUS_PATH = os.environ.get(
+    "PASSWORD_PRONOUNCEABLE_CORPUS",
+    os.path.join(os.path.dirname(__file__), "..", "data", "pronounceable_corpus.txt")
+)
+
+# Order model: huruf berikutnya ditentukan oleh 2 huruf sebelumnya
+ORDER = 2
+
+LETTERS = string.ascii_lowercase
+
+# Simbol awal kata (state sebelum huruf pertama)
+START = len(LETTERS)
+SYMBOLS = len(LETTERS) + 1
+STATE_COUNT = SYMBOLS ** ORDER
+
+# Tiap state punya tabel lookup 256 slot: satu byte acak -> satu huruf,
+# jadi sampling per karakter cukup satu indexing (tanpa rejection, tanpa scan)
+SLOTS = 256
+
+# Header file cache model: magic, order, ukuran & mtime corpus sumber
+MODEL_MAGIC = b"PWMKV001"
+MODEL_HEADER = struct.Struct("<8sI4xQQ")
+
+MIN_PRONOUNCEABLE_LENGTH = 6
+MAX_PRONOUNCEABLE_LENGTH = 64
+MAX_DIGITS = 8
+
+# Cache MarkovModel per path corpus
+_MODEL_CACHE = {}
+
+
+class MarkovModel:
+    """
+    Model transisi huruf order-2 yang sudah di-precompute.
+    
+    Untuk setiap state (2 huruf terakhir) distribusi huruf berikutnya
+    dikuantisasi ke 256 slot dari tabel kumulatif frekuensinya. Semua tabel
+    disimpan sebagai satu bytes flat (STATE_COUNT x 256) yang di-cache ke
+    file `<corpus>.markov`, sehingga load berikutnya tidak perlu membaca
+    ulang corpus.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Path ke file corpus
+        
+        Raises:
+            FileNotFoundError: Jika corpus tidak ditemukan
+            ValueError: Jika corpus tidak berisi kata
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Corpus tidak ditemukan: {path}")
+        
+        self.path = path
+        self.cache_path = path + ".markov"
+        self.table = self._load_table(os.stat(path))
+        self._rows = None
+        self._entropy = None
+    
+    def _load_table(self, stat) -> bytes:
+        """Baca tabel dari cache di disk, atau bangun ulang jika basi"""
+        try:
+            with open(self.cache_path, "rb") as f:
+                data = f.read()
+            magic, order, size, mtime = MODEL_HEADER.unpack_from(data)
+            table = data[MODEL_HEADER.size:]
+            if (magic == MODEL_MAGIC and order == ORDER and size == stat.st_size
+                    and mtime == stat.st_mtime_ns
+                    and len(table) == STATE_COUNT * SLOTS):
+                return table
+        except (OSError, struct.error):
+            pass
+        
+        table = self._build_table()
+        self._write_table(table, stat)
+        return table
+    
+    def _build_table(self) -> bytes:
+        """Hitung frekuensi transisi dari corpus lalu kuantisasi ke tabel slot"""
+        counts = [[0] * len(LETTERS) for _ in range(STATE_COUNT)]
+        backoff = [[0] * len(LETTERS) for _ in range(SYMBOLS)]
+        words = 0
+        
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                word = line.strip().lower()
+                if not word or word.startswith("#"):
+                    continue
+                if not all(c in LETTERS for c in word):
+                    continue
+                words += 1
+                prev2, prev1 = START, START
+                for c in word:
+                    letter = ord(c) - 97
+                    counts[prev2 * SYMBOLS + prev1][letter] += 1
+                    backoff[prev1][letter] += 1
+                    prev2, prev1 = prev1, letter
+        
+        if not words:
+            raise ValueError(f"Corpus tidak berisi kata: {self.path}")
+        
+        unigram = [sum(column) for column in zip(*backoff)]
+        
+        table = bytearray()
+        for state in range(STATE_COUNT):
+            row = counts[state]
+            if not any(row):
+                # State tanpa data (misal akhir kata): mundur ke order-1, lalu unigram
+                row = backoff[state % SYMBOLS]
+                if not any(row):
+                    row = unigram
+            table += _quantize(row)
+        return bytes(table)
+    
+    def _write_table(self, table: bytes, stat):
+        """Simpan tabel ke disk secara atomic (best effort, read-only dir diabaikan)"""
+        header = MODEL_HEADER.pack(MODEL_MAGIC, ORDER, stat.st_size, stat.st_mtime_ns)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(table)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def sample(self, length: int, pool=None) -> str:
+        """
+        Sample `length` huruf dari model.
+        
+        Satu byte acak per huruf dipakai langsung sebagai indeks slot di
+        tabel state saat ini.
+        """
+        pool = pool or get_default_pool()
+        table = self.table
+        raw = pool.take_bytes(length)
+        
+        chars = bytearray(length)
+        state = START * SYMBOLS + START
+        for i in range(length):
+            letter = table[state * SLOTS + raw[i]]
+            chars[i] = letter + 97
+            state = (state % SYMBOLS) * SYMBOLS + letter
+        return chars.decode("ascii")
+    
+    def surprisal(self, word: str) -> float:
+        """Jumlah bit informasi (-log2 peluang) kata di bawah model ini"""
+        table = self.table
+        bits = 0.0
+        state = START * SYMBOLS + START
+        for c in word.lower():
+            letter = ord(c) - 97
+            if not 0 <= letter < len(LETTERS):
+                raise ValueError(f"Karakter di luar a-z: {c!r}")
+            row = table[state * SLOTS:(state + 1) * SLOTS]
+            slots = row.count(letter)
+            if slots == 0:
+                return math.inf
+            bits += math.log2(SLOTS / slots)
+            state = (state % SYMBOLS) * SYMBOLS + letter
+        return bits
+    
+    def _row_weights(self) -> list:
+        """(entropy, [(huruf, jumlah_slot), ...]) per state, dihitung sekali"""
+        if self._rows is None:
+            rows = []
+            for state in range(STATE_COUNT):
+                row = self.table[state * SLOTS:(state + 1) * SLOTS]
+                weights = [(letter, row.count(letter)) for letter in set(row)]
+                rows.append((
+                    -sum(w / SLOTS * math.log2(w / SLOTS) for _, w in weights),
+                    weights,
+                ))
+            self._rows = rows
+        return self._rows
+    
+    def entropy_bits(self, length: int) -> float:
+        """
+        Entropy Shannon (bit) dari distribusi password sepanjang `length`.
+        
+        Dihitung exact dengan propagasi peluang state per posisi, bukan
+        perkiraan dari jenis karakter yang terlihat, jadi hasilnya jauh
+        lebih kecil daripada log2(26) per huruf. Satu propagasi memberi
+        entropy semua panjang sekaligus, jadi hasilnya disimpan per instance.
+        """
+        if self._entropy is None or length >= len(self._entropy):
+            self._entropy = self._entropy_by_length(max(length, MAX_PRONOUNCEABLE_LENGTH))
+        return self._entropy[length]
+    
+    def _entropy_by_length(self, max_length: int) -> list:
+        """Entropy kumulatif (bit) untuk panjang 0 sampai max_length"""
+        rows = self._row_weights()
+        bits = 0.0
+        totals = [bits]
+        dist = {START * SYMBOLS + START: 1.0}
+        for _ in range(max_length):
+            next_dist = {}
+            for state, p in dist.items():
+                row_entropy, weights = rows[state]
+                bits += p * row_entropy
+                base = (state % SYMBOLS) * SYMBOLS
+                for letter, w in weights:
+                    key = base + letter
+                    next_dist[key] = next_dist.get(key, 0.0) + p * w / SLOTS
+            dist = next_dist
+            totals.append(bits)
+        return totals
+
+
+def _quantize(row: list) -> bytes:
+    """
+    Kuantisasi frekuensi huruf ke tabel 256 slot.
+    
+    Setiap huruf yang pernah muncul mendapat minimal satu slot, sisanya
+    dibagi proporsional (largest remainder) sampai totalnya tepat 256.
+    """
+    total = sum(row)
+    ideal = [count * SLOTS / total for count in row]
+    slots = [max(1, int(x)) if count else 0 for x, count in zip(ideal, row)]
+    
+    diff = SLOTS - sum(slots)
+    if diff > 0:
+        order = sorted((i for i in range(len(row)) if row[i]),
+                       key=lambda i: ideal[i] - int(ideal[i]), reverse=True)
+        for i in range(diff):
+            slots[order[i % len(order)]] += 1
+    while diff < 0:
+        largest = max(range(len(row)), key=slots.__getitem__)
+        slots[largest] -= 1
+        diff += 1
+    
+    return b"".join(bytes([letter]) * n for letter, n in enumerate(slots))
+
+
+def get_model(path: str = None) -> MarkovModel:
+    """
+    Dapatkan MarkovModel (di-load lazy dan di-cache per path)
+    
+    Args:
+        path: Path corpus (default: DEFAULT_CORPUS_PATH)
+    
+    Returns:
+        MarkovModel yang siap dipakai
+    """
+    path = os.path.abspath(path or DEFAULT_CORPUS_PATH)
+    model = _MODEL_CACHE.get(path)
+    if model is None:
+        model = MarkovModel(path)
+        _MODEL_CACHE[path] = model
+    return model
+
+
+def generate_pronounceable(length: int = 12, capitalize: bool = True, digits: int = 2,
+                           model: MarkovModel = None) -> str:
+    """
+    Generate password yang mudah diucapkan.
+    
+    Args:
+        length: Jumlah huruf (di luar angka)
+        capitalize: Huruf pertama kapital
+        digits: Jumlah angka acak di akhir password
+        model: MarkovModel (default: get_model())
+    
+    Returns:
+        String password, contoh "Bantarila42"
+    
+    Raises:
+        ValueError: Jika parameter tidak valid
+    """
+    _validate_options(length, digits)
+    model = model or get_model()
+    pool = get_default_pool()
+    
+    word = model.sample(length, pool)
+    if capitalize:
+        word = word.capitalize()
+    if digits:
+        word += pool.random_chars(string.digits, digits)
+    return word
+
+
+def get_pronounceable_entropy(length: int = 12, digits: int = 2,
+                              model: MarkovModel = None) -> float:
+    """
+    Hitung entropy (bit) password pronounceable berdasarkan model-nya.
+    
+    Huruf kapital di awal tidak menambah entropy karena selalu sama.
+    
+    Returns:
+        Entropy dalam bit
+    """
+    _validate_options(length, digits)
+    model = model or get_model()
+    return model.entropy_bits(length) + digits * math.log2(10)
+
+
+def _validate_options(length: int, digits: int):
+    """Validasi opsi pronounceable"""
+    if not MIN_PRONOUNCEABLE_LENGTH <= length <= MAX_PRONOUNCEABLE_LENGTH:
+        raise ValueError(f"Jumlah huruf harus di antara {MIN_PRONOUNCEABLE_LENGTH} "
+                         f"dan {MAX_PRONOUNCEABLE_LENGTH}")
+    if not 0 <= digits <= MAX_DIGITS:
+        raise ValueError(f"Jumlah angka harus di antara 0 dan {MAX_DIGITS}")
@@ -0,0 +1,225 @@
+"""
+Strength Cache Module
+Cache LRU/TTL hasil check_password_strength tanpa menyimpan plaintext password
+"""
+
+import hashlib
+import itertools
+import os
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from pattern_analyzer import Match, PatternAnalysis
+from strength_checker import StrengthResult, check_password_strength
+
+DEFAULT_MAX_ENTRIES = 4096
+DEFAULT_TTL = 600.0  # detik, None = tanpa kedaluwarsa
+
+# Ukuran salt acak per cache dan digest key
+SALT_SIZE = 16
+DIGEST_SIZE = 16
+
+# Info pola yang boleh disimpan: tidak berisi potongan password
+SAFE_INFO_KEYS = ("dictionary", "turns", "shifted", "delta", "count")
+
+_DEFAULT_CACHE = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+# Nomor unik untuk objek tanpa identitas file (tidak dipakai ulang seperti id())
+_SERIALS = weakref.WeakKeyDictionary()
+_SERIAL_COUNTER = itertools.count(1)
+_SERIAL_LOCK = threading.Lock()
+
+
+def _source_identity(source):
+    """
+    Identitas stabil database kebocoran / analyzer untuk key cache
+    
+    Database diidentifikasi dari path, jumlah record dan mtime file;
+    analyzer dari folder kamus dan fingerprint-nya. Objek tanpa file
+    (misal automaton dari list kata) mendapat nomor unik yang tidak
+    dipakai ulang walaupun objeknya sudah dibebaskan.
+    """
+    if source is None:
+        return None
+    path = getattr(source, "path", None)
+    if path is not None:
+        return "breach", os.path.abspath(path), source.count, source.mtime_ns
+    automaton = getattr(source, "automaton", None)
+    if automaton is not None and automaton.directory is not None:
+        return "patterns", os.path.abspath(automaton.directory), automaton.fingerprint
+    with _SERIAL_LOCK:
+        serial = _SERIALS.get(source)
+        if serial is None:
+            serial = _SERIALS[source] = next(_SERIAL_COUNTER)
+    return "object", serial
+
+
+def _pack(result: StrengthResult) -> tuple:
+    """
+    Bentuk StrengthResult yang disimpan di cache, tanpa plaintext.
+    
+    Dari analisis pola hanya nama pola, posisi, tebakan dan info yang
+    tidak berisi potongan password yang disimpan; token tidak disimpan.
+    """
+    analysis = result.analysis
+    if analysis is not None:
+        analysis = (analysis.password_length, analysis.guesses_log10, tuple(
+            (m.pattern, m.i, m.j, m.guesses_log10,
+             tuple((key, m.info[key]) for key in SAFE_INFO_KEYS if key in m.info))
+            for m in analysis.sequence))
+    return (result.mask, result.length, result.score, result.code,
+            result.generator_entropy, result.breached, analysis)
+
+
+def _unpack(password: str, packed: tuple) -> StrengthResult:
+    """StrengthResult dari entry cache; token pola diambil ulang dari password"""
+    mask, length, score, code, generator_entropy, breached, analysis = packed
+    if analysis is not None:
+        password_length, guesses_log10, sequence = analysis
+        matches = []
+        for pattern, i, j, match_guesses, info in sequence:
+            m = Match.__new__(Match)
+            m.pattern, m.i, m.j, m.token = pattern, i, j, password[i:j + 1]
+            m.guesses_log10, m.info = match_guesses, dict(info)
+            matches.append(m)
+        analysis = PatternAnalysis(password_length, guesses_log10, matches)
+    result = StrengthResult(mask, length, score, generator_entropy, breached, analysis)
+    result.code = code
+    return result
+
+
+class StrengthCache:
+    """
+    Cache LRU dengan TTL di depan check_password_strength.
+    
+    Key berupa BLAKE2b ber-key (salt acak per instance) dari password, jadi
+    plaintext tidak pernah disimpan sebagai key dan digest tidak bisa
+    dicocokkan dengan tabel hash di luar proses ini. Opsi cek (entropy,
+    database kebocoran, analyzer) ikut menjadi bagian key. Value juga
+    bebas plaintext: token hasil analisis pola tidak disimpan dan diambil
+    ulang dari password saat hit, jadi setiap hit menghasilkan
+    StrengthResult baru.
+    
+    Semua akses ke struktur internal dijaga satu lock, sehingga satu
+    instance aman dipakai bersama oleh banyak thread/session Streamlit.
+    Pengecekan saat miss dijalankan di luar lock.
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL,
+                 clock=time.monotonic):
+        """
+        Args:
+            max_entries: Jumlah maksimal hasil yang disimpan
+            ttl: Umur maksimal hasil dalam detik (None = tanpa kedaluwarsa)
+            clock: Fungsi waktu (default: time.monotonic)
+        
+        Raises:
+            ValueError: Jika max_entries atau ttl tidak valid
+        """
+        if max_entries < 1:
+            raise ValueError("Jumlah maksimal entry cache minimal 1")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL cache harus lebih dari 0 detik")
+        
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._salt = os.urandom(SALT_SIZE)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def _key(self, password: str, entropy_bits, breach_db, pattern_analyzer) -> tuple:
+        """Key cache: digest password ber-salt + identitas opsi cek"""
+        digest = hashlib.blake2b(password.encode("utf-8", "surrogatepass"),
+                                 key=self._salt, digest_size=DIGEST_SIZE).digest()
+        return (digest, entropy_bits, _source_identity(breach_db),
+                _source_identity(pattern_analyzer))
+    
+    def check(self, password: str, entropy_bits: float = None, breach_db=None,
+              pattern_analyzer=None):
+        """
+        Sama dengan check_password_strength, tapi hasil diambil dari cache
+        jika password (dengan opsi yang sama) sudah pernah dicek.
+        
+        Returns:
+            StrengthResult
+        """
+        key = self._key(password, entropy_bits, breach_db, pattern_analyzer)
+        
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                packed, expires = entry
+                if expires is None or self._clock() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return _unpack(password, packed)
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+        
+        result = check_password_strength(password, entropy_bits=entropy_bits,
+                                         breach_db=breach_db,
+                                         pattern_analyzer=pattern_analyzer)
+        packed = _pack(result)
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        
+        with self._lock:
+            self._entries[key] = (packed, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return result
+    
+    def clear(self):
+        """Hapus semua hasil (counter statistik tidak di-reset)"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def stats(self) -> dict:
+        """
+        Statistik cache
+        
+        Returns:
+            Dictionary berisi entries, max_entries, hits, misses, evictions,
+            expirations dan hit_rate (0-1)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def get_default_cache() -> StrengthCache:
+    """
+    StrengthCache shared untuk seluruh proses (dibuat saat pertama dipakai)
+    
+    Modul Python hanya di-import sekali per proses, jadi semua session
+    Streamlit memakai instance yang sama.
+    """
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        with _DEFAULT_CACHE_LOCK:
+            if _DEFAULT_CACHE is None:
+                _DEFAULT_CACHE = StrengthCache()
+    return _DEFAULT_CACHE
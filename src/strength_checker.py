@@ -3,9 +3,15 @@ Password Strength Checker Module
 Mengecek kekuatan password menggunakan regex dan kategori
 """
 
+import math
 import re
+from array import array
+from collections.abc import Mapping
 from enum import Enum
 
+from crack_estimator import (ATTACK_MODELS, charset_entropy, crack_seconds, crack_times,
+                             entropy_to_guesses_log10)
+
 
 class PasswordStrength(Enum):
     """Enum untuk kategori kekuatan password"""
@@ -15,94 +21,448 @@ class PasswordStrength(Enum):
     VERY_STRONG = "Sangat Kuat"
 
 
-def check_password_strength(password: str) -> dict:
+# Regex patterns per kelas karakter
+PATTERN_UPPERCASE = r'[A-Z]'
+PATTERN_LOWERCASE = r'[a-z]'
+PATTERN_NUMBERS = r'[0-9]'
+PATTERN_SYMBOLS = r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>?/\\|`~]'
+
+# Kriteria dalam urutan key `details`: (key, bit di mask, skor, saran jika tidak terpenuhi)
+CRITERIA = (
+    ("panjang", 1 << 0, 20, "Password terlalu pendek (minimal 8 karakter, saat ini: {length})"),
+    ("huruf_besar", 1 << 1, 15, "Tambahkan huruf besar (A-Z)"),
+    ("huruf_kecil", 1 << 2, 15, "Tambahkan huruf kecil (a-z)"),
+    ("angka", 1 << 3, 20, "Tambahkan angka (0-9)"),
+    ("simbol", 1 << 4, 15, "Tambahkan karakter spesial (!@#$%^&*)"),
+    ("panjang_extra", 1 << 5, 15, None),
+)
+
+# Urutan kode strength (0..3) untuk StrengthResult dan hasil kolumnar
+STRENGTH_LEVELS = (
+    PasswordStrength.WEAK,
+    PasswordStrength.MEDIUM,
+    PasswordStrength.STRONG,
+    PasswordStrength.VERY_STRONG,
+)
+
+# Batas atas skor berdasarkan entropy generator: (entropy minimal, skor maksimal)
+# Password dengan entropy di bawah batas tidak bisa naik ke level berikutnya
+ENTROPY_SCORE_CAPS = (
+    (28, 39),   # < 28 bit: maksimal Lemah
+    (36, 59),   # < 36 bit: maksimal Sedang
+    (60, 79),   # < 60 bit: maksimal Kuat
+)
+
+
+# Batas atas skor berdasarkan perkiraan jumlah tebakan dari pattern analyzer:
+# (log10 tebakan minimal, skor maksimal)
+GUESS_SCORE_CAPS = (
+    (6, 39),    # < 10^6 tebakan: maksimal Lemah
+    (8, 59),    # < 10^8 tebakan: maksimal Sedang
+    (10, 79),   # < 10^10 tebakan: maksimal Kuat
+)
+GUESS_FEEDBACK = "Password mudah ditebak (sekitar 10^{guesses:.0f} tebakan)"
+
+# Skor maksimal password yang ditemukan di database kebocoran (selalu Lemah)
+BREACHED_SCORE_CAP = 39
+BREACHED_FEEDBACK = "Password ini ditemukan di data kebocoran, jangan dipakai"
+
+# Saran tambahan jika skor dipotong oleh ENTROPY_SCORE_CAPS
+ENTROPY_FEEDBACK = "Entropy hanya {bits:.1f} bit, tambah panjang password (minimal {threshold} bit)"
+
+# Ukuran charset yang dipakai jika password tidak punya karakter ASCII
+# yang dikenali (misal hanya huruf non-Latin)
+UNKNOWN_CHARSET_SIZE = 10
+
+# Sumber entropy: dari policy/model generator atau dari kelas karakter yang terlihat
+ENTROPY_SOURCE_GENERATOR = "generator"
+ENTROPY_SOURCE_CHARSET = "karakter"
+
+# Key yang tersedia lewat view dict StrengthResult
+RESULT_KEYS = ("strength", "score", "feedback", "details",
+               "entropy_bits", "entropy_source", "crack_times")
+
+
+def _strength_code(score: int) -> int:
+    """Kode strength (indeks STRENGTH_LEVELS) dari skor"""
+    if score >= 80:
+        return 3
+    if score >= 60:
+        return 2
+    if score >= 40:
+        return 1
+    return 0
+
+
+def _build_class_table() -> bytes:
+    """
+    Tabel translate byte -> bit kelas karakter, diturunkan langsung dari
+    regex PATTERN_* supaya hasilnya identik dengan re.search per pattern.
+    
+    Semua pattern hanya cocok dengan karakter ASCII, jadi byte UTF-8 >= 0x80
+    dipetakan ke 0 (tidak masuk kelas mana pun).
+    """
+    classes = (
+        (PATTERN_UPPERCASE, 1 << 1),
+        (PATTERN_LOWERCASE, 1 << 2),
+        (PATTERN_NUMBERS, 1 << 3),
+        (PATTERN_SYMBOLS, 1 << 4),
+    )
+    table = bytearray(256)
+    for b in range(128):
+        for pattern, bit in classes:
+            if re.fullmatch(pattern, chr(b)):
+                table[b] |= bit
+    return bytes(table)
+
+
+_CLASS_TABLE = _build_class_table()
+
+# Skor dan kode strength untuk setiap kemungkinan mask 6 bit
+_SCORE_BY_MASK = bytes(
+    sum(score for _, bit, score, _ in CRITERIA if mask & bit) for mask in range(64)
+)
+_CODE_BY_MASK = bytes(_strength_code(score) for score in _SCORE_BY_MASK)
+
+# Ukuran charset yang terlihat untuk setiap mask (jumlah karakter per bit kelas)
+_CHARSET_BY_MASK = tuple(
+    sum(_CLASS_TABLE.count(bit) for bit in (1 << 1, 1 << 2, 1 << 3, 1 << 4) if mask & bit)
+    or UNKNOWN_CHARSET_SIZE
+    for mask in range(64)
+)
+
+
+def _classify(password: str) -> int:
+    """
+    Mask kriteria password dalam satu pass.
+    
+    Password di-encode lalu bytes.translate memetakan setiap byte ke bit
+    kelasnya; gabungan bit (set lalu dijumlah, karena tiap bit unik)
+    ditambah bit panjang menjadi mask 6 bit.
+    """
+    mask = sum(set(password.encode("utf-8", "surrogatepass").translate(_CLASS_TABLE)))
+    return mask | _length_bits(len(password))
+
+
+def _length_bits(length: int) -> int:
+    """Bit kriteria panjang (panjang & panjang_extra)"""
+    if length >= 12:
+        return (1 << 0) | (1 << 5)
+    if length >= 8:
+        return 1 << 0
+    return 0
+
+
+def _score_cap(value: float, caps: tuple):
+    """(threshold, skor maksimal) pertama dari `caps` yang berlaku, atau None"""
+    for threshold, cap in caps:
+        if value < threshold:
+            return threshold, cap
+    return None
+
+
+class StrengthResult(Mapping):
+    """
+    Hasil check_password_strength yang compact.
+    
+    Hanya menyimpan mask kriteria 6 bit, panjang, skor dan kode strength
+    (indeks ke STRENGTH_LEVELS) di __slots__. Enum, `details`, `feedback`,
+    entropy dan waktu crack dibangun saat diakses dari tabel yang dipakai
+    bersama (perhitungan log di-memoize per ukuran charset dan panjang).
+    
+    Bisa dipakai seperti dict (result['score'], result['details'], dst)
+    sehingga kode lama tetap berjalan tanpa perubahan.
+    """
+    
+    __slots__ = ("mask", "length", "score", "code", "generator_entropy", "breached", "analysis")
+    
+    def __init__(self, mask: int, length: int, score: int = None,
+                 generator_entropy: float = None, breached: bool = None, analysis=None):
+        """
+        Args:
+            mask: Mask kriteria (bit sesuai CRITERIA)
+            length: Panjang password
+            score: Skor final (default: skor dari mask, tanpa pembatasan)
+            generator_entropy: Entropy dari policy/model generator (opsional)
+            breached: Hasil cek database kebocoran (None jika tidak dicek)
+            analysis: PatternAnalysis (None jika pola tidak dicek)
+        """
+        self.mask = mask
+        self.length = length
+        if score is None:
+            self.score = _SCORE_BY_MASK[mask]
+            self.code = _CODE_BY_MASK[mask]
+        else:
+            self.score = score
+            self.code = _strength_code(score)
+        self.generator_entropy = generator_entropy
+        self.breached = breached
+        self.analysis = analysis
+    
+    @property
+    def strength(self) -> PasswordStrength:
+        """Kategori strength"""
+        return STRENGTH_LEVELS[self.code]
+    
+    @property
+    def details(self) -> dict:
+        """Dictionary kriteria yang terpenuhi"""
+        mask = self.mask
+        return {key: bool(mask & bit) for key, bit, _, _ in CRITERIA}
+    
+    @property
+    def feedback(self) -> list:
+        """List saran untuk improve password"""
+        mask = self.mask
+        messages = [BREACHED_FEEDBACK] if self.breached else []
+        messages += [message.format(length=self.length) for _, bit, _, message in CRITERIA
+                     if message is not None and not mask & bit]
+        if self.generator_entropy is not None:
+            limit = _score_cap(self.generator_entropy, ENTROPY_SCORE_CAPS)
+            if limit is not None and _SCORE_BY_MASK[mask] > limit[1]:
+                messages.append(ENTROPY_FEEDBACK.format(bits=self.generator_entropy,
+                                                        threshold=limit[0]))
+        if self.analysis is not None:
+            limit = _score_cap(self.analysis.guesses_log10, GUESS_SCORE_CAPS)
+            if limit is not None and _SCORE_BY_MASK[mask] > limit[1]:
+                messages.append(GUESS_FEEDBACK.format(guesses=self.analysis.guesses_log10))
+            messages += self.analysis.feedback()
+        return messages
+    
+    @property
+    def entropy_bits(self) -> float:
+        """
+        Entropy (bit) password: dari generator jika diketahui, selain itu
+        dari ukuran charset kelas karakter yang terlihat dan panjangnya
+        """
+        if self.generator_entropy is not None:
+            return self.generator_entropy
+        return charset_entropy(_CHARSET_BY_MASK[self.mask], self.length)
+    
+    @property
+    def entropy_source(self) -> str:
+        """Sumber entropy_bits ("generator" atau "karakter")"""
+        if self.generator_entropy is not None:
+            return ENTROPY_SOURCE_GENERATOR
+        return ENTROPY_SOURCE_CHARSET
+    
+    @property
+    def crack_times(self) -> dict:
+        """
+        Perkiraan waktu crack (detik) per model penyerang di ATTACK_MODELS.
+        
+        Jumlah tebakan diambil dari entropy, atau dari pattern analyzer jika
+        hasilnya lebih kecil (password berpola lebih cepat ditebak).
+        """
+        guesses = entropy_to_guesses_log10(self.entropy_bits)
+        if self.analysis is not None:
+            guesses = min(guesses, self.analysis.guesses_log10)
+        return crack_times(guesses)
+    
+    @property
+    def guesses_log10(self) -> float:
+        """log10 perkiraan jumlah tebakan (hanya jika pola dicek)"""
+        return self.analysis.guesses_log10
+    
+    @property
+    def patterns(self) -> list:
+        """Pola yang ditemukan (hanya jika pola dicek)"""
+        return self.analysis.patterns
+    
+    def _optional_keys(self) -> tuple:
+        """Key tambahan yang hanya ada jika cek terkait dijalankan"""
+        keys = ()
+        if self.breached is not None:
+            keys += ("breached",)
+        if self.analysis is not None:
+            keys += ("guesses_log10", "patterns")
+        return keys
+    
+    def __getitem__(self, key: str):
+        if key in RESULT_KEYS or key in self._optional_keys():
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __iter__(self):
+        yield from RESULT_KEYS
+        yield from self._optional_keys()
+    
+    def __len__(self) -> int:
+        return len(RESULT_KEYS) + len(self._optional_keys())
+    
+    def __repr__(self) -> str:
+        return f"StrengthResult(strength={self.strength.name}, score={self.score})"
+
+
+def check_password_strength(password: str, entropy_bits: float = None,
+                            breach_db=None, pattern_analyzer=None) -> StrengthResult:
     """
     Cek kekuatan password menggunakan regex dan scoring.
     
     Args:
         password: Password yang akan dicek
+        entropy_bits: Entropy sebenarnya dari generator (opsional). Jika
+            diisi, skor dibatasi sesuai ENTROPY_SCORE_CAPS supaya password
+            dari model yang mudah ditebak (misal pronounceable) tidak
+            terlihat lebih kuat dari kenyataannya.
+        breach_db: BreachDatabase (opsional). Password yang ditemukan di
+            data kebocoran selalu dianggap Lemah.
+        pattern_analyzer: PatternAnalyzer (opsional). Skor dibatasi sesuai
+            perkiraan jumlah tebakan (GUESS_SCORE_CAPS), jadi password
+            seperti "Password123!" tidak lagi dianggap kuat.
     
     Returns:
-        Dictionary berisi:
+        StrengthResult (bisa diakses seperti dictionary) berisi:
         - strength: Enum PasswordStrength
         - score: Skor 0-100
         - feedback: List saran untuk improve password
         - details: Dictionary detail kriteria yang terpenuhi
+        - entropy_bits: Entropy dari parameter entropy_bits, atau dari
+          charset yang terlihat jika tidak diisi
+        - entropy_source: "generator" atau "karakter"
+        - crack_times: Dictionary model penyerang -> perkiraan detik
+        - breached: Hanya ada jika parameter breach_db diisi
+        - guesses_log10, patterns: Hanya ada jika parameter pattern_analyzer diisi
     """
+    mask = _classify(password)
+    if entropy_bits is None and breach_db is None and pattern_analyzer is None:
+        return StrengthResult(mask, len(password))
     
-    score = 0
-    feedback = []
-    details = {
-        "panjang": False,
-        "huruf_besar": False,
-        "huruf_kecil": False,
-        "angka": False,
-        "simbol": False,
-        "panjang_extra": False,
-    }
+    analysis = pattern_analyzer.analyze(password) if pattern_analyzer is not None else None
+    return _capped_result(password, mask, entropy_bits, breach_db, analysis)
+
+
+def _capped_result(password: str, mask: int, entropy_bits: float, breach_db,
+                   analysis) -> StrengthResult:
+    """
+    StrengthResult dengan skor dibatasi entropy, hasil analisis pola dan
+    database kebocoran (dipakai juga oleh IncrementalChecker)
+    """
+    score = _SCORE_BY_MASK[mask]
     
-    # Regex patterns
-    pattern_uppercase = r'[A-Z]'
-    pattern_lowercase = r'[a-z]'
-    pattern_numbers = r'[0-9]'
-    pattern_symbols = r'[!@#$%^&*()_+\-=\[\]{};:\'",.<>?/\\|`~]'
-    
-    # Cek panjang dasar (minimal 8)
-    if len(password) >= 8:
-        score += 20
-        details["panjang"] = True
-    else:
-        feedback.append(f"Password terlalu pendek (minimal 8 karakter, saat ini: {len(password)})")
-    
-    # Cek panjang extra (12+)
-    if len(password) >= 12:
-        score += 15
-        details["panjang_extra"] = True
-    
-    # Cek huruf besar
-    if re.search(pattern_uppercase, password):
-        score += 15
-        details["huruf_besar"] = True
-    else:
-        feedback.append("Tambahkan huruf besar (A-Z)")
-    
-    # Cek huruf kecil
-    if re.search(pattern_lowercase, password):
-        score += 15
-        details["huruf_kecil"] = True
-    else:
-        feedback.append("Tambahkan huruf kecil (a-z)")
-    
-    # Cek angka
-    if re.search(pattern_numbers, password):
-        score += 20
-        details["angka"] = True
-    else:
-        feedback.append("Tambahkan angka (0-9)")
-    
-    # Cek simbol
-    if re.search(pattern_symbols, password):
-        score += 15
-        details["simbol"] = True
-    else:
-        feedback.append("Tambahkan karakter spesial (!@#$%^&*)")
-    
-    # Tentukan kategori berdasarkan score
-    if score >= 80:
-        strength = PasswordStrength.VERY_STRONG
-    elif score >= 60:
-        strength = PasswordStrength.STRONG
-    elif score >= 40:
-        strength = PasswordStrength.MEDIUM
-    else:
-        strength = PasswordStrength.WEAK
-    
-    return {
-        "strength": strength,
-        "score": min(score, 100),  # Cap score di 100
-        "feedback": feedback,
-        "details": details
-    }
+    # Batasi skor berdasarkan entropy generator
+    if entropy_bits is not None:
+        limit = _score_cap(entropy_bits, ENTROPY_SCORE_CAPS)
+        if limit is not None:
+            score = min(score, limit[1])
+    
+    # Batasi skor berdasarkan pola yang mudah ditebak
+    if analysis is not None:
+        limit = _score_cap(analysis.guesses_log10, GUESS_SCORE_CAPS)
+        if limit is not None:
+            score = min(score, limit[1])
+    
+    # Password yang sudah bocor tidak pernah aman
+    breached = None
+    if breach_db is not None:
+        breached = password in breach_db
+        if breached:
+            score = min(score, BREACHED_SCORE_CAP)
+    
+    return StrengthResult(mask, len(password), score, entropy_bits, breached, analysis)
+
+
+class StrengthBatch:
+    """
+    Hasil check_password_strength_many dalam bentuk kolom array compact.
+    
+    Setiap password hanya menyimpan skor, kode strength, mask kriteria
+    (1 byte masing-masing) dan panjangnya. StrengthResult baru dibuat saat
+    diminta lewat indexing.
+    """
+    
+    def __init__(self):
+        self.scores = array("B")
+        self.codes = array("B")
+        self.masks = array("B")
+        self.lengths = array("I")
+    
+    def __len__(self) -> int:
+        return len(self.scores)
+    
+    def __getitem__(self, i: int) -> StrengthResult:
+        """Hasil password ke-i, identik dengan check_password_strength"""
+        return StrengthResult(self.masks[i], self.lengths[i])
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def strength(self, i: int) -> PasswordStrength:
+        """Kategori strength password ke-i"""
+        return STRENGTH_LEVELS[self.codes[i]]
+    
+    def feedback(self, i: int) -> list:
+        """Saran perbaikan password ke-i (dibangun saat diminta)"""
+        return self[i].feedback
+    
+    def entropy_bits(self, i: int) -> float:
+        """Entropy (bit) password ke-i dari charset yang terlihat"""
+        return charset_entropy(_CHARSET_BY_MASK[self.masks[i]], self.lengths[i])
+    
+    def crack_seconds(self, i: int) -> tuple:
+        """Perkiraan waktu crack password ke-i, urutan sesuai ATTACK_MODELS"""
+        return crack_seconds(entropy_to_guesses_log10(self.entropy_bits(i)))
+    
+    def min_crack_seconds(self, model: str) -> float:
+        """
+        Waktu crack tercepat di seluruh batch untuk satu model penyerang.
+        
+        Perhitungan per (charset, panjang) di-memoize, jadi audit jutaan
+        password hanya menghitung log sekali per kombinasi unik.
+        
+        Raises:
+            ValueError: Jika model tidak dikenal
+        """
+        index = _attack_model_index(model)
+        if not len(self):
+            return math.inf
+        pairs = set(zip(self.masks, self.lengths))
+        return min(crack_seconds(entropy_to_guesses_log10(
+                       charset_entropy(_CHARSET_BY_MASK[mask], length)))[index]
+                   for mask, length in pairs)
+    
+    def level_counts(self) -> dict:
+        """Jumlah password per kategori strength"""
+        codes = self.codes.tobytes()
+        return {level: codes.count(code) for code, level in enumerate(STRENGTH_LEVELS)}
+
+
+def _attack_model_index(model: str) -> int:
+    """Indeks model penyerang di ATTACK_MODELS"""
+    for index, (key, _, _) in enumerate(ATTACK_MODELS):
+        if key == model:
+            return index
+    raise ValueError(f"Model penyerang tidak dikenal: {model}")
+
+
+def check_password_strength_many(passwords) -> StrengthBatch:
+    """
+    Cek kekuatan banyak password sekaligus (misal audit dump kredensial).
+    
+    Klasifikasi sama dengan check_password_strength (satu pass per
+    password), tetapi hasilnya langsung ditulis ke kolom array tanpa
+    membuat object per password.
+    
+    Args:
+        passwords: Iterable berisi password (str)
+    
+    Returns:
+        StrengthBatch dengan hasil per password sesuai urutan input
+    """
+    batch = StrengthBatch()
+    scores, codes, masks, lengths = batch.scores, batch.codes, batch.masks, batch.lengths
+    score_by_mask, code_by_mask = _SCORE_BY_MASK, _CODE_BY_MASK
+    classify = _classify
+    
+    for password in passwords:
+        mask = classify(password)
+        scores.append(score_by_mask[mask])
+        codes.append(code_by_mask[mask])
+        masks.append(mask)
+        lengths.append(len(password))
+    
+    return batch
 
 
 def get_strength_color(strength: PasswordStrength) -> str:
@@ -0,0 +1,604 @@
+"""
+Strength Service Module
+Service HTTP JSON lokal (asyncio) untuk generate dan strength check dengan micro-batching
+"""
+
+import asyncio
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from http import HTTPStatus
+
+from breach_checker import get_breach_db
+from latency_tracker import LatencyTracker
+from parallel_generator import _init_worker
+from password_generator import get_policy
+from pattern_analyzer import get_analyzer
+from strength_checker import check_password_strength
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Micro-batching: jumlah maksimal password per batch dan lama maksimal
+# (detik) item pertama menunggu item lain sebelum batch dikirim ke worker.
+# Request yang lebih besar dipecah menjadi beberapa item
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.002
+
+# Backpressure: jumlah maksimal password yang antre atau sedang dikerjakan;
+# di atas itu request langsung ditolak dengan 503
+DEFAULT_MAX_PENDING = 4096
+
+# Batas per request
+MAX_BODY_BYTES = 1024 * 1024
+MAX_HEADER_LINES = 100
+MAX_ITEMS_PER_REQUEST = 1000
+
+
+class ServiceOverloaded(RuntimeError):
+    """Antrean service penuh (dijawab 503 supaya client mencoba lagi nanti)"""
+
+
+class MicroBatcher:
+    """
+    Gabungkan item dari banyak request yang datang bersamaan menjadi satu
+    batch untuk worker pool.
+    
+    Setiap item punya bobot (jumlah unit kerja, misal jumlah password),
+    dan batas batch maupun antrean dihitung dari bobot, bukan jumlah
+    request. Batch dikirim begitu bobotnya mencapai max_batch atau item
+    pertamanya sudah menunggu max_wait detik. Jumlah batch yang berjalan
+    dibatasi `slots` (biasanya jumlah worker): saat semua worker sibuk,
+    item terus terkumpul sehingga batch berikutnya otomatis lebih besar.
+    Jika bobot yang antre dan berjalan akan melebihi max_pending,
+    submit_many() langsung melempar ServiceOverloaded.
+    """
+    
+    def __init__(self, handler, executor, slots: int, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_wait: float = DEFAULT_MAX_WAIT, max_pending: int = DEFAULT_MAX_PENDING):
+        """
+        Args:
+            handler: Fungsi picklable list item -> list hasil (urutan sama)
+            executor: Executor tempat handler dijalankan
+            slots: Jumlah maksimal batch yang berjalan bersamaan
+            max_batch: Bobot maksimal per batch (juga bobot maksimal satu item)
+            max_wait: Lama maksimal (detik) menunggu batch terisi
+            max_pending: Bobot maksimal yang antre dan berjalan
+        
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if slots < 1:
+            raise ValueError("Jumlah slot batch minimal 1")
+        if max_batch < 1:
+            raise ValueError("Ukuran batch minimal 1")
+        if max_wait < 0:
+            raise ValueError("Waktu tunggu batch tidak boleh negatif")
+        if max_pending < 1:
+            raise ValueError("Jumlah antrean maksimal minimal 1")
+        
+        self.handler = handler
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self._slots = asyncio.Semaphore(slots)
+        self._queue = asyncio.Queue()
+        self._arrived = asyncio.Event()
+        # Item yang tidak muat di batch sebelumnya, jadi awal batch berikutnya
+        self._carry = None
+        self._collector = None
+        self._running = set()
+        
+        self.pending = 0
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.rejected = 0
+    
+    def start(self):
+        """Jalankan task pengumpul batch di event loop yang sedang berjalan"""
+        if self._collector is None:
+            self._collector = asyncio.get_running_loop().create_task(self._collect())
+    
+    async def close(self):
+        """
+        Hentikan pengumpul, tolak item yang masih antre dan tunggu batch
+        yang sedang berjalan
+        """
+        if self._collector is not None:
+            self._collector.cancel()
+            try:
+                await self._collector
+            except asyncio.CancelledError:
+                pass
+            self._collector = None
+        stopped = ServiceOverloaded("Service sedang dihentikan")
+        if self._carry is not None:
+            self._fail([self._carry[2]], stopped)
+            self._carry = None
+        while not self._queue.empty():
+            _, _, future = self._queue.get_nowait()
+            self._fail([future], stopped)
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+    
+    async def submit(self, item, weight: int = 1):
+        """
+        Kirim satu item dan tunggu hasilnya (lihat submit_many)
+        """
+        return (await self.submit_many([(item, weight)]))[0]
+    
+    async def submit_many(self, items: list) -> list:
+        """
+        Kirim beberapa item sekaligus dan tunggu semua hasilnya. Semua item
+        diterima atau semuanya ditolak, jadi request yang dipecah tidak
+        setengah dikerjakan.
+        
+        Args:
+            items: List (item, bobot)
+        
+        Returns:
+            List hasil dengan urutan sama
+        
+        Raises:
+            ValueError: Jika bobot satu item di luar 1..max_batch atau total
+                bobot melebihi max_pending
+            ServiceOverloaded: Jika antrean penuh
+        """
+        if any(not 1 <= weight <= self.max_batch for _, weight in items):
+            raise ValueError(f"Bobot item harus antara 1 dan {self.max_batch}")
+        total = sum(weight for _, weight in items)
+        if total > self.max_pending:
+            raise ValueError(f"Request terlalu besar: maksimal {self.max_pending} per request")
+        if self.pending + total > self.max_pending:
+            self.rejected += 1
+            raise ServiceOverloaded("Antrean service penuh, coba lagi nanti")
+        
+        self.pending += total
+        loop = asyncio.get_running_loop()
+        futures = []
+        for item, weight in items:
+            future = loop.create_future()
+            self._queue.put_nowait((item, weight, future))
+            futures.append(future)
+        self._arrived.set()
+        return await asyncio.gather(*futures)
+    
+    async def _collect(self):
+        """Loop pengumpul: tunggu slot worker, lalu isi batch sampai penuh atau timeout"""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        while True:
+            await self._slots.acquire()
+            first, self._carry = self._carry, None
+            batch = [first if first is not None else await queue.get()]
+            weight = batch[0][1]
+            deadline = loop.time() + self.max_wait
+            try:
+                while True:
+                    while self._carry is None and not queue.empty():
+                        entry = queue.get_nowait()
+                        if weight + entry[1] > self.max_batch:
+                            self._carry = entry
+                            break
+                        batch.append(entry)
+                        weight += entry[1]
+                    remaining = deadline - loop.time()
+                    if weight >= self.max_batch or self._carry is not None or remaining <= 0:
+                        break
+                    # Event, bukan wait_for(queue.get()), supaya item tidak
+                    # hilang jika timeout bersamaan dengan item baru
+                    self._arrived.clear()
+                    try:
+                        await asyncio.wait_for(self._arrived.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            except asyncio.CancelledError:
+                self._fail([future for _, _, future in batch],
+                           ServiceOverloaded("Service sedang dihentikan"))
+                self.pending -= weight
+                raise
+            
+            task = loop.create_task(self._dispatch(batch, weight))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+    
+    async def _dispatch(self, batch: list, weight: int):
+        """Jalankan satu batch di executor lalu bagikan hasil ke tiap future"""
+        self.batches += 1
+        self.items += weight
+        self.largest_batch = max(self.largest_batch, weight)
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.handler, [item for item, _, _ in batch])
+        except Exception as e:
+            self._fail([future for _, _, future in batch], e)
+        else:
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self.pending -= weight
+            self._slots.release()
+    
+    def _fail(self, futures: list, error: Exception):
+        """Lempar error ke future yang masih menunggu"""
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+    
+    def stats(self) -> dict:
+        """Statistik batch (jumlah, rata-rata dan bobot terbesar, antrean, penolakan)"""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch": self.items / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "pending": self.pending,
+            "rejected": self.rejected,
+        }
+
+
+def result_to_dict(result) -> dict:
+    """
+    Ubah StrengthResult menjadi dictionary yang bisa di-encode JSON
+    
+    Waktu crack tak terhingga menjadi null.
+    """
+    data = {
+        "strength": result.strength.name,
+        "label": result.strength.value,
+        "score": result.score,
+        "feedback": result.feedback,
+        "details": result.details,
+        "entropy_bits": result.entropy_bits,
+        "entropy_source": result.entropy_source,
+        "crack_times": {key: seconds if math.isfinite(seconds) else None
+                        for key, seconds in result.crack_times.items()},
+    }
+    if result.breached is not None:
+        data["breached"] = result.breached
+    if result.analysis is not None:
+        data["guesses_log10"] = result.guesses_log10
+        data["patterns"] = [{"pattern": m.pattern, "token": m.token, "i": m.i, "j": m.j,
+                             "guesses_log10": m.guesses_log10} for m in result.patterns]
+    return data
+
+
+def _check_batch(breach_db_path: str, dictionaries: str, items: list) -> list:
+    """Worker: strength check satu batch; item berupa (tuple password, entropy_bits)"""
+    breach_db = get_breach_db(breach_db_path) if breach_db_path else None
+    analyzer = get_analyzer(dictionaries) if dictionaries else None
+    return [[result_to_dict(check_password_strength(password, entropy_bits=entropy_bits,
+                                                    breach_db=breach_db,
+                                                    pattern_analyzer=analyzer))
+             for password in passwords]
+            for passwords, entropy_bits in items]
+
+
+def _generate_batch(items: list) -> list:
+    """Worker: generate satu batch; item berupa (policy, panjang, jumlah)"""
+    return [policy.sample_many(count, length) for policy, length, count in items]
+
+
+def _parse_rules(body: dict):
+    """GenerationPolicy dari field rules body request /generate"""
+    return get_policy(
+        use_uppercase=_field(body, "uppercase", bool, True),
+        use_lowercase=_field(body, "lowercase", bool, True),
+        use_numbers=_field(body, "numbers", bool, True),
+        use_symbols=_field(body, "symbols", bool, True),
+        min_per_class=_field(body, "min_per_class", int, 1),
+        exclude_chars=_field(body, "exclude", str, ""),
+        exclude_ambiguous=_field(body, "exclude_ambiguous", bool, False),
+    )
+
+
+def _field(body: dict, name: str, kind: type, default):
+    """
+    Ambil field body dengan validasi tipe
+    
+    Raises:
+        ValueError: Jika tipe field salah
+    """
+    value = body.get(name, default)
+    # bool adalah subclass int, jangan terima True sebagai angka
+    if not isinstance(value, kind) or (kind is not bool and isinstance(value, bool)):
+        raise ValueError(f"Field '{name}' harus bertipe {kind.__name__}")
+    return value
+
+
+def _count_field(body: dict, name: str, default: int) -> int:
+    """Field jumlah item per request (1 sampai MAX_ITEMS_PER_REQUEST)"""
+    count = _field(body, name, int, default)
+    if not 1 <= count <= MAX_ITEMS_PER_REQUEST:
+        raise ValueError(f"Field '{name}' harus antara 1 dan {MAX_ITEMS_PER_REQUEST}")
+    return count
+
+
+class StrengthService:
+    """
+    Service HTTP/1.1 JSON untuk generate dan strength check.
+    
+    Endpoint:
+        POST /check     {"password": ...} atau {"passwords": [...]}, opsional "entropy_bits"
+        POST /generate  {"length": 16, "count": 1, "symbols": false, ...}
+        GET  /stats     latency p50/p99 per endpoint, statistik batch dan antrean
+        GET  /health
+    
+    Request yang datang bersamaan digabung per endpoint oleh MicroBatcher
+    dan dikerjakan di process pool, sehingga event loop hanya mengurus
+    I/O. Keep-alive didukung supaya client tidak membuka koneksi baru
+    per request.
+    """
+    
+    def __init__(self, workers: int = None, max_batch: int = DEFAULT_MAX_BATCH,
+                 max_wait: float = DEFAULT_MAX_WAIT, max_pending: int = DEFAULT_MAX_PENDING,
+                 breach_db_path: str = None, dictionaries: str = None, executor=None):
+        """
+        Args:
+            workers: Jumlah worker process (default: jumlah core)
+            max_batch: Jumlah maksimal item per batch
+            max_wait: Lama maksimal (detik) menunggu batch terisi
+            max_pending: Jumlah maksimal item yang antre per endpoint (di atasnya 503)
+            breach_db_path: Database kebocoran (opsional)
+            dictionaries: Folder kamus untuk deteksi pola (opsional)
+            executor: Executor sendiri (opsional, menggantikan process pool)
+        
+        Raises:
+            ValueError: Jika parameter tidak valid
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("Jumlah worker minimal 1")
+        
+        # Validasi di parent supaya error tidak muncul dari dalam worker
+        if breach_db_path:
+            get_breach_db(breach_db_path)
+        if dictionaries:
+            get_analyzer(dictionaries)
+        
+        self.workers = workers or os.cpu_count() or 1
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self.breach_db_path = breach_db_path
+        self.dictionaries = dictionaries
+        self._executor = executor
+        self._own_executor = executor is None
+        self._batchers = {}
+        self._server = None
+        self.latency = {path: LatencyTracker() for path in ("/check", "/generate")}
+        self.errors = 0
+        self.started = None
+    
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """
+        Buka socket dan mulai menerima koneksi
+        
+        Returns:
+            asyncio.Server (port sebenarnya ada di server.sockets jika port=0)
+        """
+        self.open()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+    
+    def open(self):
+        """Siapkan worker pool dan batcher tanpa membuka socket (sekali per instance)"""
+        if self._batchers:
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                 initializer=_init_worker)
+            # Fork worker sekarang, sebelum socket dibuka: worker yang di-fork
+            # belakangan ikut memegang socket client yang sedang terbuka,
+            # sehingga koneksi tidak benar-benar tertutup setelah response
+            self._executor.submit(os.getpid).result()
+        options = {"max_batch": self.max_batch, "max_wait": self.max_wait,
+                   "max_pending": self.max_pending}
+        check = partial(_check_batch, self.breach_db_path, self.dictionaries)
+        self._batchers = {
+            "/check": MicroBatcher(check, self._executor, self.workers, **options),
+            "/generate": MicroBatcher(_generate_batch, self._executor, self.workers, **options),
+        }
+        for batcher in self._batchers.values():
+            batcher.start()
+        self.started = time.monotonic()
+    
+    async def close(self):
+        """Tutup socket, selesaikan batch yang berjalan dan matikan worker pool"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Batcher tetap disimpan supaya statistiknya masih bisa dibaca
+        for batcher in self._batchers.values():
+            await batcher.close()
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    async def handle_request(self, method: str, path: str, body: bytes) -> tuple:
+        """
+        Proses satu request (tanpa lapisan HTTP)
+        
+        Returns:
+            Tuple (status HTTP, payload dictionary)
+        """
+        if path in ("/health", "/stats"):
+            if method != "GET":
+                return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Gunakan GET"}
+            return HTTPStatus.OK, self.stats() if path == "/stats" else {"status": "ok"}
+        if path not in self.latency:
+            return HTTPStatus.NOT_FOUND, {"error": f"Endpoint tidak ditemukan: {path}"}
+        if method != "POST":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Gunakan POST"}
+        
+        started = time.perf_counter()
+        try:
+            try:
+                request = json.loads(body or b"{}")
+            except (UnicodeDecodeError, json.JSONDecodeError):
+                raise ValueError("Body harus berupa JSON yang valid")
+            if not isinstance(request, dict):
+                raise ValueError("Body harus berupa object JSON")
+            
+            if path == "/check":
+                payload = await self._check(request)
+            else:
+                payload = await self._generate(request)
+        except ServiceOverloaded as e:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(e)}
+        except ValueError as e:
+            self.errors += 1
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except Exception as e:
+            # Misal worker process mati; koneksi lain tetap dilayani
+            self.errors += 1
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"Terjadi error: {e}"}
+        
+        self.latency[path].record(time.perf_counter() - started)
+        return HTTPStatus.OK, payload
+    
+    async def _check(self, request: dict) -> dict:
+        """Endpoint /check"""
+        single = "password" in request
+        passwords = [request["password"]] if single else request.get("passwords")
+        if not isinstance(passwords, list) or not passwords:
+            raise ValueError("Isi field 'password' atau 'passwords' (list tidak kosong)")
+        if len(passwords) > MAX_ITEMS_PER_REQUEST:
+            raise ValueError(f"Maksimal {MAX_ITEMS_PER_REQUEST} password per request")
+        if not all(isinstance(password, str) for password in passwords):
+            raise ValueError("Password harus berupa string")
+        try:
+            for password in passwords:
+                password.encode("utf-8")
+        except UnicodeEncodeError:
+            raise ValueError("Password mengandung karakter yang tidak valid")
+        
+        entropy_bits = request.get("entropy_bits")
+        if entropy_bits is not None and (isinstance(entropy_bits, bool)
+                                         or not isinstance(entropy_bits, (int, float))):
+            raise ValueError("Field 'entropy_bits' harus berupa angka")
+        # json.loads menerima NaN dan 1e400 (inf), keduanya bukan entropy yang valid
+        if entropy_bits is not None and not (math.isfinite(entropy_bits) and entropy_bits >= 0):
+            raise ValueError("Field 'entropy_bits' harus angka berhingga dan tidak negatif")
+        
+        batcher = self._batchers["/check"]
+        size = batcher.max_batch
+        chunks = await batcher.submit_many(
+            [((tuple(passwords[i:i + size]), entropy_bits), len(passwords[i:i + size]))
+             for i in range(0, len(passwords), size)])
+        results = [result for chunk in chunks for result in chunk]
+        return {"result": results[0]} if single else {"results": results}
+    
+    async def _generate(self, request: dict) -> dict:
+        """Endpoint /generate"""
+        policy = _parse_rules(request)
+        length = _field(request, "length", int, 16)
+        count = _count_field(request, "count", 1)
+        policy.validate_length(length)
+        
+        batcher = self._batchers["/generate"]
+        size = batcher.max_batch
+        chunks = await batcher.submit_many(
+            [((policy, length, min(size, count - i)), min(size, count - i))
+             for i in range(0, count, size)])
+        passwords = [password for chunk in chunks for password in chunk]
+        return {"passwords": passwords, "entropy_bits": policy.entropy_bits(length)}
+    
+    def stats(self) -> dict:
+        """Statistik service: uptime, latency dan batch per endpoint, jumlah error"""
+        return {
+            "uptime": time.monotonic() - self.started if self.started else 0.0,
+            "workers": self.workers,
+            "errors": self.errors,
+            "endpoints": {path: {"latency": tracker.stats(),
+                                 "batching": self._batchers[path].stats()
+                                 if self._batchers else None}
+                          for path, tracker in self.latency.items()},
+        }
+    
+    async def _handle_connection(self, reader, writer):
+        """Layani satu koneksi HTTP/1.1 (bisa beberapa request dengan keep-alive)"""
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                if isinstance(request, HTTPStatus):
+                    status, payload, keep_alive = request, {"error": request.phrase}, False
+                else:
+                    method, path, body, keep_alive = request
+                    status, payload = await self.handle_request(method, path, body)
+                
+                writer.write(_encode_response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def _read_request(reader):
+    """
+    Baca satu request HTTP
+    
+    Returns:
+        (method, path, body, keep_alive), HTTPStatus jika request tidak
+        valid, atau None jika koneksi ditutup client
+    """
+    line = await reader.readline()
+    if not line:
+        return None
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        return HTTPStatus.BAD_REQUEST
+    method, target, version = parts
+    
+    headers = {}
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        return HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE
+    
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        return HTTPStatus.BAD_REQUEST
+    if length < 0:
+        return HTTPStatus.BAD_REQUEST
+    if length > MAX_BODY_BYTES:
+        return HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    body = await reader.readexactly(length) if length else b""
+    
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    return method.upper(), target.split("?", 1)[0], body, keep_alive
+
+
+def _encode_response(status: HTTPStatus, payload: dict, keep_alive: bool) -> bytes:
+    """Response HTTP lengkap dengan body JSON"""
+    body = json.dumps(payload, ensure_ascii=False, allow_nan=False).encode("utf-8")
+    headers = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if status == HTTPStatus.SERVICE_UNAVAILABLE:
+        headers.append("Retry-After: 1")
+    return ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body
@@ -0,0 +1,320 @@
+"""
+Uniqueness Guard Module
+Mencegah password yang sama ter-issue dua kali lintas run (Bloom filter persisten)
+"""
+
+import hashlib
+import math
+import mmap
+import os
+import secrets
+import struct
+import threading
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: hanya lock antar thread, bukan antar proses
+    fcntl = None
+
+# Header: magic, versi, jumlah bit, jumlah hash, fp rate, kapasitas, jumlah item
+HEADER_MAGIC = b"PWBLOOM1"
+HEADER_FORMAT = struct.Struct("<8sIQIdQQ")
+FORMAT_VERSION = 1
+
+# Bit array dimulai setelah header berukuran satu page
+HEADER_SIZE = 4096
+
+KEY_SIZE = 32
+
+DEFAULT_CAPACITY = 10_000_000
+DEFAULT_FP_RATE = 1e-6
+
+# Berhenti top-up jika berkali-kali tidak ada password baru (keyspace hampir habis)
+MAX_EMPTY_ROUNDS = 100
+
+
+def bloom_parameters(capacity: int, fp_rate: float) -> tuple:
+    """
+    Hitung ukuran Bloom filter optimal.
+    
+    Args:
+        capacity: Perkiraan jumlah password yang akan disimpan
+        fp_rate: False positive rate yang diinginkan (0 < fp_rate < 1)
+    
+    Returns:
+        Tuple (jumlah_bit, jumlah_hash)
+    """
+    if capacity < 1:
+        raise ValueError("Kapasitas minimal 1")
+    if not 0 < fp_rate < 1:
+        raise ValueError("False positive rate harus di antara 0 dan 1")
+    
+    bits = math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))
+    bits = max(8, (bits + 7) // 8 * 8)
+    hashes = max(1, round(bits / capacity * math.log(2)))
+    return bits, hashes
+
+
+class UniquenessGuard:
+    """
+    Bloom filter persisten di atas file yang di-memory-map.
+    
+    Yang disimpan hanya bit dari keyed hash (BLAKE2b dengan key rahasia di
+    file `<path>.key`), tidak ada plaintext password. Cek membership O(k)
+    dengan k konstan, dan memory dibatasi oleh ukuran file (page cache OS).
+    
+    Penambahan (test-and-set) dilakukan di bawah lock eksklusif pada file
+    filter (flock), jadi beberapa proses yang memakai file yang sama tidak
+    bisa meng-issue password yang sama. Jumlah item di header diperbarui
+    setiap penambahan.
+    """
+    
+    def __init__(self, path: str, capacity: int = DEFAULT_CAPACITY,
+                 fp_rate: float = DEFAULT_FP_RATE):
+        """
+        Buka Bloom filter yang sudah ada, atau buat baru.
+        
+        Args:
+            path: Path file Bloom filter
+            capacity: Kapasitas (hanya dipakai saat membuat file baru)
+            fp_rate: False positive rate (hanya dipakai saat membuat file baru)
+        
+        Raises:
+            ValueError: Jika file bukan Bloom filter yang valid, atau file
+                key-nya hilang
+        """
+        self.path = path
+        self.key_path = path + ".key"
+        self._lock = threading.Lock()
+        
+        if not os.path.exists(path):
+            self._create(capacity, fp_rate)
+        
+        self._key = self._load_key()
+        self._file = open(path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        
+        magic, version, bits, hashes, rate, cap, count = HEADER_FORMAT.unpack_from(self._map)
+        if magic != HEADER_MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Bukan file Bloom filter yang valid: {path}")
+        if len(self._map) < HEADER_SIZE + bits // 8:
+            self.close()
+            raise ValueError(f"File Bloom filter terpotong: {path}")
+        
+        self.bits = bits
+        self.hashes = hashes
+        self.fp_rate = rate
+        self.capacity = cap
+        self.count = count
+    
+    def _create(self, capacity: int, fp_rate: float):
+        """
+        Buat file Bloom filter baru (sparse) beserta key-nya. Key dibuat
+        lebih dulu, jadi filter yang terlihat selalu punya key.
+        """
+        bits, hashes = bloom_parameters(capacity, fp_rate)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        
+        self._create_key()
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(HEADER_FORMAT.pack(HEADER_MAGIC, FORMAT_VERSION, bits, hashes,
+                                           fp_rate, capacity, 0))
+                f.truncate(HEADER_SIZE + bits // 8)
+            # link (bukan replace): jika proses lain sudah membuat filter
+            # lebih dulu, filter itu yang dipakai dan tidak ditimpa
+            os.link(tmp_path, self.path)
+        except FileExistsError:
+            pass
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _create_key(self):
+        """Buat key hash baru dengan permission 0600 (key yang sudah ada dipakai)"""
+        tmp_path = f"{self.key_path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(secrets.token_bytes(KEY_SIZE))
+            os.link(tmp_path, self.key_path)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_path)
+    
+    def _load_key(self) -> bytes:
+        """Baca key hash milik filter"""
+        try:
+            with open(self.key_path, "rb") as f:
+                key = f.read()
+        except FileNotFoundError:
+            # Key baru akan membuat semua password yang sudah ter-issue
+            # tidak terlihat lagi, jadi jangan dibuat diam-diam
+            raise ValueError(f"File key tidak ditemukan: {self.key_path} (tanpa key ini "
+                             f"password yang sudah ter-issue tidak bisa dicek)")
+        
+        if len(key) != KEY_SIZE:
+            raise ValueError(f"File key tidak valid: {self.key_path}")
+        return key
+    
+    def _positions(self, password: str):
+        """Posisi bit untuk password (double hashing dari satu digest BLAKE2b)"""
+        digest = hashlib.blake2b(password.encode("utf-8"), key=self._key,
+                                 digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+    
+    def _test_and_set(self, password: str, update: bool) -> bool:
+        """Cek apakah password sudah ada; jika update=True sekalian tandai"""
+        data = self._map
+        present = True
+        for pos in self._positions(password):
+            offset = HEADER_SIZE + (pos >> 3)
+            mask = 1 << (pos & 7)
+            byte = data[offset]
+            if not byte & mask:
+                present = False
+                if not update:
+                    break
+                data[offset] = byte | mask
+        if update and not present:
+            self.count += 1
+        return present
+    
+    def _insert(self, passwords) -> list:
+        """
+        Test-and-set banyak password di bawah lock thread dan lock file
+        (antar proses), lalu simpan jumlah item ke header
+        
+        Returns:
+            List bool, True untuk password yang baru
+        """
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            try:
+                # Proses lain bisa sudah menambah item sejak header terakhir dibaca
+                self.count = HEADER_FORMAT.unpack_from(self._map)[6]
+                fresh = [not self._test_and_set(p, update=True) for p in passwords]
+                self._write_header()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        return fresh
+    
+    def _write_header(self):
+        HEADER_FORMAT.pack_into(self._map, 0, HEADER_MAGIC, FORMAT_VERSION,
+                                self.bits, self.hashes, self.fp_rate,
+                                self.capacity, self.count)
+    
+    def __contains__(self, password: str) -> bool:
+        with self._lock:
+            return self._test_and_set(password, update=False)
+    
+    def add(self, password: str) -> bool:
+        """
+        Tandai password sebagai sudah ter-issue.
+        
+        Returns:
+            True jika password baru, False jika (kemungkinan) sudah pernah ada
+        """
+        return self._insert((password,))[0]
+    
+    def contains_many(self, passwords) -> list:
+        """Cek banyak password sekaligus, kembalikan list bool"""
+        with self._lock:
+            return [self._test_and_set(p, update=False) for p in passwords]
+    
+    def add_many(self, passwords) -> list:
+        """
+        Tandai banyak password sekaligus.
+        
+        Returns:
+            List bool, True untuk password yang baru
+        """
+        return self._insert(passwords)
+    
+    def add_new(self, passwords) -> list:
+        """
+        Tandai banyak password dan kembalikan hanya yang baru.
+        
+        Duplikat di dalam batch yang sama juga ikut dibuang.
+        """
+        passwords = list(passwords)
+        return [p for p, fresh in zip(passwords, self._insert(passwords)) if fresh]
+    
+    def filter_new(self, passwords, block_size: int = 10_000):
+        """
+        Bungkus iterable password apa saja (mask, passphrase, dll) dan
+        yield hanya password yang belum pernah ter-issue.
+        """
+        block = []
+        for password in passwords:
+            block.append(password)
+            if len(block) >= block_size:
+                yield from self.add_new(block)
+                block = []
+        if block:
+            yield from self.add_new(block)
+    
+    @property
+    def estimated_fp_rate(self) -> float:
+        """Perkiraan false positive rate saat ini berdasarkan jumlah item"""
+        return (1 - math.exp(-self.hashes * self.count / self.bits)) ** self.hashes
+    
+    def flush(self):
+        """Flush page (bit dan header) ke disk"""
+        with self._lock:
+            self._map.flush()
+    
+    def close(self):
+        """Flush dan tutup file"""
+        if getattr(self, "_map", None) is None:
+            return
+        if hasattr(self, "bits"):
+            self.flush()
+        self._map.close()
+        self._file.close()
+        self._map = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def unique_blocks(blocks, guard: UniquenessGuard, refill):
+    """
+    Saring blok password lewat guard dan top-up sampai ukurannya kembali penuh.
+    
+    Args:
+        blocks: Iterable berisi list password
+        guard: UniquenessGuard
+        refill: Function(n) -> list berisi n password baru untuk top-up
+    
+    Yields:
+        List password unik dengan ukuran sama seperti blok asal
+    
+    Raises:
+        ValueError: Jika keyspace hampir habis (tidak ada password baru lagi)
+    """
+    for block in blocks:
+        target = len(block)
+        fresh = guard.add_new(block)
+        empty_rounds = 0
+        while len(fresh) < target:
+            extra = guard.add_new(refill(target - len(fresh)))
+            if not extra:
+                empty_rounds += 1
+                if empty_rounds >= MAX_EMPTY_ROUNDS:
+                    raise ValueError("Keyspace hampir habis, tidak ada password unik lagi")
+            fresh.extend(extra)
+        yield fresh
@@ -29,7 +29,7 @@ try:
     # Get rules summary
     rules = get_rules_summary(True, True, True, True)
     print(f"✓ Rules summary: {rules}")
-    
+
 except Exception as e:
     print(f"✗ Error: {str(e)}")
 
@@ -55,7 +55,7 @@ try:
     print(f"  - Password: MySecurePass123!Secure")
     print(f"  - Strength: {result_strong['strength'].value}")
     print(f"  - Score: {result_strong['score']}/100")
-    
+
 except Exception as e:
     print(f"✗ Error: {str(e)}")
 
@@ -81,7 +81,7 @@ try:
     
     is_valid, result, msg = validate_yes_no("invalid")
     print(f"✓ Yes/No validation 'invalid': valid={is_valid}, msg='{msg}'")
-    
+
 except Exception as e:
     print(f"✗ Error: {str(e)}")
 
@@ -105,7 +105,7 @@ try:
     # List exports
     exports = list_exports()
     print(f"✓ List exports: {len(exports)} file(s) found")
-    
+
 except Exception as e:
     print(f"✗ Error: {str(e)}")
 
@@ -131,10 +131,1089 @@ try:
     print(f"✓ Exported: {filepath}")
     
     print("\n✓ All integration tests passed!")
-    
+
 except Exception as e:
     print(f"✗ Integration test failed: {str(e)}")
 
+# Test 6: Bulk Generation
+print("\n[TEST 6] Bulk Password Generation")
+print("-" * 60)
+
+try:
+    from password_generator import generate_passwords
+    
+    batch = generate_passwords(1000, 12, True, True, True, False)
+    assert len(batch) == 1000
+    assert all(len(p) == 12 for p in batch)
+    assert all(p.isalnum() for p in batch)
+    print(f"✓ Bulk generated: {len(batch)} password, contoh: {batch[0]}")
+    
+    digits_only = generate_passwords(200, 8, False, False, True, False)
+    assert all(p.isdigit() for p in digits_only)
+    print("✓ Rules dihormati pada bulk generation")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 7: Streaming Generation
+print("\n[TEST 7] Streaming Password Iterator")
+print("-" * 60)
+
+try:
+    import io
+    import itertools
+    from password_generator import iter_passwords, iter_password_blocks, write_passwords
+    
+    lazy = list(itertools.islice(iter_passwords(10), 25))
+    assert len(lazy) == 25 and all(len(p) == 10 for p in lazy)
+    print("✓ iter_passwords tanpa batas bisa di-slice secara lazy")
+    
+    sizes = [len(b) for b in iter_password_blocks(8, count=250, block_size=100)]
+    assert sizes == [100, 100, 50]
+    print(f"✓ Ukuran blok: {sizes}")
+    
+    sink = io.StringIO()
+    written = write_passwords(sink, 12, 1234, block_size=500)
+    assert written == 1234 and sink.getvalue().count("\n") == 1234
+    print(f"✓ write_passwords ke stream: {written} baris")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 8: Parallel Generation
+print("\n[TEST 8] Parallel Password Generation")
+print("-" * 60)
+
+try:
+    from parallel_generator import generate_passwords_parallel
+    
+    parallel = generate_passwords_parallel(5000, 10, workers=2, chunk_size=1000)
+    assert len(parallel) == 5000 and all(len(p) == 10 for p in parallel)
+    assert len(set(parallel)) == 5000
+    print(f"✓ Parallel generated: {len(parallel)} password unik dengan 2 worker")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 9: Generation Policy
+print("\n[TEST 9] GenerationPolicy")
+print("-" * 60)
+
+try:
+    from password_generator import GenerationPolicy, get_policy, AMBIGUOUS_CHARS
+    from strength_checker import check_password_strength
+    
+    policy = get_policy(True, True, True, True)
+    short = [generate_password(4, policy=policy) for _ in range(500)]
+    assert all(check_password_strength(p)['details']['angka'] for p in short)
+    assert all(check_password_strength(p)['details']['simbol'] for p in short)
+    print("✓ Password 4 karakter selalu berisi semua tipe karakter")
+    
+    strict = GenerationPolicy(min_counts={"uppercase": 3, "numbers": 2},
+                              exclude_ambiguous=True)
+    for p in strict.sample_many(500, 8):
+        assert sum(c.isupper() for c in p) >= 3 and sum(c.isdigit() for c in p) >= 2
+        assert not set(p) & set(AMBIGUOUS_CHARS)
+    print(f"✓ Minimal per kelas & exclude ambigu OK: {strict.summary()}")
+    
+    try:
+        strict.validate_length(129)
+        print("✗ Panjang > max_length seharusnya ditolak")
+    except ValueError as e:
+        print(f"✓ Validasi max length: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 10: Passphrase Generator
+print("\n[TEST 10] Passphrase Generator")
+print("-" * 60)
+
+try:
+    import tempfile
+    from passphrase_generator import (WordlistIndex, generate_passphrase,
+                                      get_passphrase_entropy, get_wordlist)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        wordlist_path = os.path.join(tmp, "words.txt")
+        with open(wordlist_path, "w", encoding="utf-8") as f:
+            f.write("# komentar\n11111\tapel\n11112\tbuku\r\n\nkopi\nmeja \nrumah\nkopi\n")
+        
+        index = WordlistIndex(wordlist_path)
+        assert [index[i] for i in range(len(index))] == ["apel", "buku", "kopi", "meja", "rumah"]
+        assert os.path.exists(wordlist_path + ".idx")
+        
+        cached = WordlistIndex(wordlist_path)
+        assert len(cached) == 5 and cached[4] == "rumah"
+        print(f"✓ Wordlist index dibangun & di-load dari cache: {len(cached)} kata")
+        
+        phrase = generate_passphrase(4, separator=".", capitalize="all",
+                                     inject_digit=True, wordlist=cached)
+        assert phrase.count(".") == 3 and any(c.isdigit() for c in phrase)
+        bits = get_passphrase_entropy(4, capitalize="all", inject_digit=True, wordlist=cached)
+        result = check_password_strength(phrase)
+        print(f"✓ Passphrase: {phrase} ({bits:.1f} bit, {result['strength'].value})")
+        del index, cached
+    
+    # Path default harus jalan tanpa wordlist tambahan (fallback ke kamus bawaan)
+    default_list = get_wordlist()
+    phrase = generate_passphrase(6)
+    assert len(default_list) > 100 and len(phrase.split("-")) == 6
+    print(f"✓ Wordlist default: {len(default_list)} kata, contoh {phrase}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 11: Mask Generator
+print("\n[TEST 11] Mask / Template Generator")
+print("-" * 60)
+
+try:
+    from mask_generator import compile_mask
+    
+    plan = compile_mask("?u?l?l?d?d?s")
+    assert plan.keyspace == 26 * 26 * 26 * 10 * 10 * 32
+    for p in plan.generate(500):
+        assert p[0].isupper() and p[1:3].islower() and p[3:5].isdigit() and not p[5].isalnum()
+    print(f"✓ Mask ?u?l?l?d?d?s keyspace {plan.keyspace:,}, contoh: {plan.generate(1)[0]}")
+    
+    custom = compile_mask("ID-?1?1??", {"1": "?dX"})
+    assert custom.keyspace == 11 * 11
+    assert all(p.startswith("ID-") and p.endswith("?") for p in custom.generate(100))
+    print(f"✓ Charset custom & literal: {custom.generate(1)[0]}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 12: Uniqueness Guard
+print("\n[TEST 12] Uniqueness Guard (Bloom Filter)")
+print("-" * 60)
+
+try:
+    import tempfile
+    from password_generator import iter_password_blocks
+    from uniqueness_guard import UniquenessGuard
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        bloom_path = os.path.join(tmp, "issued.bloom")
+        
+        with UniquenessGuard(bloom_path, capacity=10_000, fp_rate=1e-4) as guard:
+            assert guard.add("Rahasia123!") is True
+            assert guard.add("Rahasia123!") is False
+            assert "Rahasia123!" in guard and "LainLagi456?" not in guard
+            assert guard.add_new(["a1", "b2", "a1"]) == ["a1", "b2"]
+            first_run = [p for b in iter_password_blocks(6, 500, guard=guard) for p in b]
+        
+        with open(bloom_path, "rb") as f:
+            assert b"Rahasia123!" not in f.read()
+        
+        with UniquenessGuard(bloom_path) as guard:
+            assert guard.count == 503
+            assert all(p in guard for p in first_run)
+            print(f"✓ Bloom filter persisten: {guard.count} item, fp ~{guard.estimated_fp_rate:.2e}")
+        
+        # Dua guard (file descriptor terpisah, seperti dua proses) di file yang
+        # sama: test-and-set di bawah flock, tidak ada password ter-issue dua kali
+        import threading
+        shared = [f"pwd{i}" for i in range(2000)]
+        issued = []
+        def issue():
+            with UniquenessGuard(bloom_path) as other:
+                issued.extend(p for block in range(0, len(shared), 100)
+                              for p in other.add_new(shared[block:block + 100]))
+        workers = [threading.Thread(target=issue) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        assert sorted(issued) == sorted(shared)
+        with UniquenessGuard(bloom_path) as guard:
+            assert guard.count == 503 + len(shared)
+        print(f"✓ Dua guard bersamaan: {len(issued)} password, tanpa duplikat, header ter-update")
+        
+        os.remove(bloom_path + ".key")
+        try:
+            UniquenessGuard(bloom_path)
+            print("✗ Filter tanpa key seharusnya ditolak")
+        except ValueError as e:
+            print(f"✓ Validasi: {str(e).split(' (')[0]}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 13: Entropy Pool
+print("\n[TEST 13] Entropy Pool")
+print("-" * 60)
+
+try:
+    from collections import Counter
+    from entropy_pool import EntropyPool
+    
+    pool = EntropyPool(block_size=4096)
+    view = pool.take(32)
+    assert isinstance(view, memoryview) and len(view) == 32
+    
+    values = pool.randbelow_bytes(6, 60_000)
+    counts = Counter(values)
+    assert set(counts) == set(range(6)) and min(counts.values()) > 9000
+    assert all(0 <= pool.randbelow(1000) < 1000 for _ in range(200))
+    assert all(0 <= v < n for v, n in zip(pool.randbelow_each([3, 7, 200]), [3, 7, 200]))
+    
+    stats = pool.stats()
+    assert stats["refills"] > 0 and stats["bytes_served"] > 60_000
+    print(f"✓ Pool stats: {stats['refills']} refill, {stats['bytes_served']:,} byte, "
+          f"rejection rate {stats['rejection_rate']:.2%}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 14: Pronounceable Generator
+print("\n[TEST 14] Pronounceable Generator")
+print("-" * 60)
+
+try:
+    import math
+    import tempfile
+    from strength_checker import check_password_strength, PasswordStrength
+    from pronounceable_generator import (generate_pronounceable, get_pronounceable_entropy,
+                                        MarkovModel)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_path = os.path.join(tmp, "corpus.txt")
+        with open(corpus_path, "w", encoding="utf-8") as f:
+            f.write("# komentar\nbanana\nkelapa\nmatahari\npelangi\n")
+        
+        model = MarkovModel(corpus_path)
+        assert os.path.exists(corpus_path + ".markov")
+        assert MarkovModel(corpus_path).table == model.table
+        
+        password = generate_pronounceable(length=10, digits=2, model=model)
+        assert len(password) == 12 and password[0].isupper() and password[-2:].isdigit()
+        assert model.surprisal(password[:10]) < float("inf")
+        
+        entropy = get_pronounceable_entropy(length=10, digits=2, model=model)
+        assert entropy < 10 * math.log2(26)
+        print(f"✓ Pronounceable: {password} ({entropy:.1f} bit)")
+    
+    result = check_password_strength("Bananakelapa42", entropy_bits=20.0)
+    assert result["strength"] == PasswordStrength.WEAK and result["entropy_bits"] == 20.0
+    assert check_password_strength("Bananakelapa42")["entropy_source"] == "karakter"
+    print(f"✓ Skor dibatasi entropy: {result['score']}/100 ({result['strength'].value})")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 15: Batch Strength Check
+print("\n[TEST 15] Batch Strength Check")
+print("-" * 60)
+
+try:
+    from password_generator import generate_passwords
+    import re
+    from strength_checker import (check_password_strength, check_password_strength_many,
+                                  PasswordStrength, PATTERN_UPPERCASE, PATTERN_LOWERCASE,
+                                  PATTERN_NUMBERS, PATTERN_SYMBOLS)
+    
+    def regex_details(password):
+        """Referensi: kriteria dihitung langsung dengan re.search per pattern"""
+        return {
+            "panjang": len(password) >= 8,
+            "huruf_besar": bool(re.search(PATTERN_UPPERCASE, password)),
+            "huruf_kecil": bool(re.search(PATTERN_LOWERCASE, password)),
+            "angka": bool(re.search(PATTERN_NUMBERS, password)),
+            "simbol": bool(re.search(PATTERN_SYMBOLS, password)),
+            "panjang_extra": len(password) >= 12,
+        }
+    
+    samples = ["", "abc", "password", "Password1", "P@ssw0rd!2024", "ÄÖÜ äöü 12",
+               "tab\tdan\nbaris", "[]{}\\|`~", "émoji🔐Aa1!", "12345678901"]
+    samples += generate_passwords(500, 10)
+    
+    batch = check_password_strength_many(iter(samples))
+    assert len(batch) == len(samples)
+    for i, password in enumerate(samples):
+        assert batch[i] == check_password_strength(password), password
+        assert batch[i]["details"] == regex_details(password), password
+    
+    counts = batch.level_counts()
+    assert sum(counts.values()) == len(samples)
+    print(f"✓ {len(batch)} hasil batch identik dengan check_password_strength")
+    print(f"✓ Sangat Kuat: {counts[PasswordStrength.VERY_STRONG]}, "
+          f"Lemah: {counts[PasswordStrength.WEAK]}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 16: Compact StrengthResult
+print("\n[TEST 16] Compact StrengthResult")
+print("-" * 60)
+
+try:
+    from strength_checker import check_password_strength, StrengthResult, PasswordStrength
+    
+    result = check_password_strength("abc")
+    assert isinstance(result, StrengthResult) and not hasattr(result, "__dict__")
+    assert {key: result[key] for key in ("strength", "score", "feedback", "details")} == {
+        "strength": PasswordStrength.WEAK,
+        "score": 15,
+        "feedback": [
+            "Password terlalu pendek (minimal 8 karakter, saat ini: 3)",
+            "Tambahkan huruf besar (A-Z)",
+            "Tambahkan angka (0-9)",
+            "Tambahkan karakter spesial (!@#$%^&*)",
+        ],
+        "details": {"panjang": False, "huruf_besar": False, "huruf_kecil": True,
+                    "angka": False, "simbol": False, "panjang_extra": False},
+    }
+    assert "breached" not in result and result.get("breached") is None
+    
+    capped = check_password_strength("Bananakelapa42!", entropy_bits=30.0)
+    assert capped["score"] == 59 and capped["strength"] == PasswordStrength.MEDIUM
+    assert capped["feedback"][-1].startswith("Entropy hanya 30.0 bit")
+    print(f"✓ StrengthResult: {result!r}, {sys.getsizeof(result)} byte per hasil")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 17: Breach Checker
+print("\n[TEST 17] Breach Checker")
+print("-" * 60)
+
+try:
+    import tempfile
+    from breach_checker import BreachDatabase, build_breach_db, password_digest
+    from strength_checker import check_password_strength, PasswordStrength
+    
+    breached = ["password", "123456", "P@ssw0rd!2024", "qwerty", "Sup3r#Secret99"]
+    dump = sorted(f"{password_digest(p).hex().upper()}:{i + 1}" for i, p in enumerate(breached))
+    dump.insert(2, dump[2])  # duplikat dilewati
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "breached.sha1db")
+        assert build_breach_db(dump, db_path) == len(breached)
+        
+        with BreachDatabase(db_path) as db:
+            assert all(p in db for p in breached)
+            assert db.contains_many(["bukan-bocor-xyz", "qwerty"]) == [False, True]
+            
+            result = check_password_strength("P@ssw0rd!2024", breach_db=db)
+            assert result["breached"] and result["strength"] == PasswordStrength.WEAK
+            assert not check_password_strength("Kq8#vT2!mZ9w", breach_db=db)["breached"]
+            print(f"✓ Breach DB: {len(db)} hash, 'P@ssw0rd!2024' -> {result['strength'].value}")
+        
+        try:
+            build_breach_db(list(reversed(dump)), db_path)
+            print("✗ Dump tidak terurut seharusnya ditolak")
+        except ValueError as e:
+            print(f"✓ Dump tidak terurut ditolak: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 18: Pattern Analyzer
+print("\n[TEST 18] Pattern Analyzer")
+print("-" * 60)
+
+try:
+    import tempfile
+    from pattern_analyzer import DictionaryAutomaton, PatternAnalyzer, get_analyzer
+    from strength_checker import check_password_strength, PasswordStrength
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, "umum.txt"), "w", encoding="utf-8") as f:
+            f.write("# kamus test\npassword\nrahasia\nmonyet\n")
+        
+        automaton = DictionaryAutomaton(tmp)
+        assert os.path.exists(automaton.path)
+        reloaded = DictionaryAutomaton(tmp)
+        assert reloaded.dictionaries == ["umum"] and reloaded.node_count == automaton.node_count
+        
+        analyzer = PatternAnalyzer(reloaded)
+        found = {(m.pattern, m.token) for m in analyzer.find_matches("R4h4s1a-qwerty-4321")}
+        assert ("l33t", "R4h4s1a") in found and ("spatial", "qwerty") in found
+        assert ("sequence", "4321") in found
+        assert ("reversed", "drowssap") in {(m.pattern, m.token)
+                                            for m in analyzer.find_matches("drowssap")}
+        
+        dates = {m.token for m in analyzer.find_matches("lahir17-08-1945") if m.pattern == "date"}
+        assert "17-08-1945" in dates
+        assert analyzer.guesses_log10("aaaaaaaa") < analyzer.guesses_log10("Kq8#vT2!")
+        print(f"✓ Pola terdeteksi: {sorted(found)}")
+    
+    result = check_password_strength("Password123!", pattern_analyzer=get_analyzer())
+    assert result["strength"] == PasswordStrength.WEAK and result["patterns"]
+    strong = check_password_strength("Kq8#vT2!mZ9w", pattern_analyzer=get_analyzer())
+    assert strong["strength"] == PasswordStrength.VERY_STRONG
+    print(f"✓ 'Password123!' -> {result['strength'].value} (~10^{result['guesses_log10']:.1f} tebakan)")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 19: Entropy & Crack Time
+print("\n[TEST 19] Entropy & Crack Time")
+print("-" * 60)
+
+try:
+    import math
+    from itertools import product
+    from crack_estimator import (charset_entropy, crack_seconds, crack_times,
+                                 format_duration, ATTACK_MODELS)
+    from password_generator import GenerationPolicy, get_policy_entropy
+    from strength_checker import check_password_strength, check_password_strength_many
+    
+    # Keyspace policy exact: hitung manual untuk alphabet kecil
+    policy = GenerationPolicy(use_lowercase=False, use_symbols=False,
+                              exclude_chars="CDEFGHIJKLMNOPQRSTUVWXYZ23456789")
+    brute = sum(1 for p in product(policy.alphabet, repeat=4)
+                if any(c in "AB" for c in p) and any(c in "01" for c in p))
+    assert math.isclose(2 ** policy.entropy_bits(4), brute)
+    assert get_policy_entropy(16) < charset_entropy(94, 16)
+    
+    result = check_password_strength("abcdefgh")
+    assert result["entropy_source"] == "karakter"
+    assert math.isclose(result["entropy_bits"], 8 * math.log2(26))
+    assert list(result["crack_times"]) == [key for key, _, _ in ATTACK_MODELS]
+    
+    generated = check_password_strength("abcdefgh", entropy_bits=get_policy_entropy(8))
+    assert generated["entropy_source"] == "generator"
+    assert generated["crack_times"]["offline_fast"] > result["crack_times"]["offline_fast"]
+    
+    # Batch: matematika log hanya dihitung sekali per (charset, panjang)
+    charset_entropy.cache_clear()
+    crack_seconds.cache_clear()
+    batch = check_password_strength_many(["abcdefgh", "zyxwvuts"] * 500)
+    fastest = batch.min_crack_seconds("offline_fast")
+    assert fastest == result["crack_times"]["offline_fast"]
+    assert charset_entropy.cache_info().misses == 1 and crack_seconds.cache_info().misses == 1
+    assert batch.crack_seconds(3) == crack_seconds(math.log10(2) * (batch.entropy_bits(3) - 1))
+    
+    assert format_duration(0.5) == "kurang dari 1 detik"
+    assert format_duration(7200) == "2 jam"
+    assert format_duration(math.inf) == "berabad-abad"
+    assert crack_times(400)["offline_fast"] == math.inf
+    print(f"✓ 'abcdefgh': {result['entropy_bits']:.1f} bit, offline cepat "
+          f"{format_duration(fastest)}, policy 16 karakter {get_policy_entropy(16):.1f} bit")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 20: Strength Cache
+print("\n[TEST 20] Strength Cache")
+print("-" * 60)
+
+try:
+    import threading
+    from strength_cache import StrengthCache
+    from strength_checker import check_password_strength
+    
+    now = [0.0]
+    cache = StrengthCache(max_entries=2, ttl=10, clock=lambda: now[0])
+    first = cache.check("Rahasia123!")
+    assert dict(cache.check("Rahasia123!")) == dict(first)
+    assert dict(first) == dict(check_password_strength("Rahasia123!"))
+    assert cache.check("Rahasia123!", entropy_bits=20.0)["score"] != first["score"]
+    
+    # Plaintext tidak ada di key maupun struktur internal cache
+    assert all("Rahasia123!" not in repr(key) for key in cache._entries)
+    
+    # Token hasil analisis pola juga tidak disimpan, tapi tetap ada saat hit
+    import pickle
+    from pattern_analyzer import get_analyzer
+    analyzer = get_analyzer()
+    secret = "Hunter2024!secret"
+    pattern_cache = StrengthCache()
+    miss = pattern_cache.check(secret, pattern_analyzer=analyzer)
+    hit = pattern_cache.check(secret, pattern_analyzer=analyzer)
+    tokens = [m.token for m in miss.analysis.sequence]
+    assert [m.token for m in hit.analysis.sequence] == tokens
+    assert (hit.score, hit.code, hit.feedback, hit.crack_times) == \
+        (miss.score, miss.code, miss.feedback, miss.crack_times)
+    stored = pickle.dumps(list(pattern_cache._entries.items()))
+    leaked = [t for t in tokens + [secret] if len(t) >= 3 and t.encode() in stored]
+    assert not leaked, leaked
+    
+    # Key memakai identitas stabil (folder kamus), bukan id() objek
+    pattern_cache.check(secret, pattern_analyzer=type(analyzer)(analyzer.automaton))
+    assert pattern_cache.stats()["hits"] == 2
+    
+    cache.check("abc")  # entry ke-3 -> yang paling lama tidak dipakai dibuang
+    now[0] = 11.0
+    cache.check("abc")  # sudah kedaluwarsa
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 4
+    assert stats["evictions"] == 1 and stats["expirations"] == 1 and stats["entries"] == 2
+    
+    shared = StrengthCache(max_entries=100)
+    words = [f"kata{i}" for i in range(100)]
+    threads = [threading.Thread(target=lambda: [shared.check(w) for w in words * 3])
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    stats = shared.stats()
+    assert stats["hits"] + stats["misses"] == 1200 and stats["entries"] == 100
+    print(f"✓ StrengthCache: {stats['hits']} hit, {stats['misses']} miss, "
+          f"{stats['evictions']} eviction (4 thread)")
+    
+    try:
+        StrengthCache(max_entries=0)
+        print("✗ max_entries=0 seharusnya ditolak")
+    except ValueError as e:
+        print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 21: Incremental Checker
+print("\n[TEST 21] Incremental Checker")
+print("-" * 60)
+
+try:
+    from incremental_checker import IncrementalChecker
+    from pattern_analyzer import get_analyzer
+    from strength_checker import check_password_strength
+    
+    def same_result(live, full):
+        live, full = dict(live), dict(full)
+        for result in (live, full):
+            if "patterns" in result:
+                result["patterns"] = [(m.pattern, m.i, m.j, m.guesses_log10)
+                                      for m in result["patterns"]]
+        return live == full
+    
+    def match_keys(matches):
+        return sorted((m.j, m.pattern, m.i, m.token, m.guesses_log10) for m in matches)
+    
+    analyzer = get_analyzer()
+    checker = IncrementalChecker(analyzer)
+    typed = ("drowssap9876abcab\bcabc\b\bP@ssw0rdx\b\b\bword17-08-1945qwerty\bİΣ"
+             + "z" * 70 + "\b" * 100)
+    for char in typed:
+        if char == "\b":
+            checker.backspace()
+        else:
+            checker.append(char)
+        full = check_password_strength(checker.text, pattern_analyzer=analyzer)
+        assert same_result(checker.result(), full), checker.text
+        if not checker._irregular:
+            # Semua pola (termasuk kata terbalik, keyboard, urutan,
+            # pengulangan dan tanggal) diambil dari stack
+            head = checker.text[:64]
+            assert match_keys(checker._matches(head)) == \
+                match_keys(analyzer.find_matches(head)), checker.text
+    
+    checker.set_text("Monyet2024!")
+    assert checker.result() is checker.result()
+    assert same_result(checker.result(),
+                       check_password_strength("Monyet2024!", pattern_analyzer=analyzer))
+    
+    plain = IncrementalChecker()
+    plain.extend("abc")
+    assert dict(plain.result()) == dict(check_password_strength("abc"))
+    plain.clear()
+    assert len(plain) == 0 and plain.result()["score"] == 0
+    print(f"✓ {len(typed)} ketikan identik dengan check penuh, "
+          f"'{checker.text}': {checker.result()['strength'].value}")
+    
+    try:
+        plain.append("ab")
+        print("✗ append 2 karakter seharusnya ditolak")
+    except ValueError as e:
+        print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+# Test 22: Dump Auditor
+print("\n[TEST 22] Dump Auditor")
+print("-" * 60)
+
+try:
+    import tempfile
+    from dump_auditor import audit_dump
+    from strength_checker import check_password_strength, PasswordStrength
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        dump_path = os.path.join(tmp, "dump.txt")
+        passwords = ["password", "Rahasia123!", "abc", "", "Xy9#kLm2$pQ7&wZ4"] * 40
+        with open(dump_path, "w", encoding="utf-8", newline="") as f:
+            for i, password in enumerate(passwords):
+                f.write(f"user{i}@contoh.id:{password}" + ("\r\n" if i % 3 else "\n"))
+            f.write("baris tanpa separator")
+        
+        # Chunk kecil: banyak batas chunk, hasil harus sama dengan check per baris
+        report = audit_dump(dump_path, workers=1, chunk_bytes=64, separator=":", top=3)
+        expected = [check_password_strength(p) for p in passwords if p]
+        assert report.lines == len(passwords) + 1 and report.audited == len(expected)
+        assert report.level_counts()[PasswordStrength.WEAK] == sum(
+            r["strength"] == PasswordStrength.WEAK for r in expected)
+        assert report.criteria_failures()["simbol"] == sum(
+            not r["details"]["simbol"] for r in expected)
+        assert [(score, line) for score, line, _, _ in report.worst] == [(15, 3), (15, 8), (15, 13)]
+        assert report.worst[0][2] == "user2@contoh.id"
+        
+        parallel = audit_dump(dump_path, workers=2, chunk_bytes=100, separator=":", top=3)
+        assert parallel.score_counts == report.score_counts and parallel.worst == report.worst
+        assert "password terlemah" in report.format()
+        print(f"✓ Audit {report.lines} baris: {report.level_counts()[PasswordStrength.WEAK]} lemah, "
+              f"{report.lines_per_second:,.0f} baris/detik")
+    
+    try:
+        audit_dump(__file__, chunk_bytes=0)
+        print("✗ chunk_bytes=0 seharusnya ditolak")
+    except ValueError as e:
+        print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 23] Strength Service")
+print("-" * 60)
+
+try:
+    import asyncio
+    import json
+    from concurrent.futures import ThreadPoolExecutor
+    from strength_service import StrengthService
+    from strength_checker import check_password_strength
+    
+    async def http_request(port, method, path, payload=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        body = json.dumps(payload).encode() if payload is not None else b""
+        writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, data = response.partition(b"\r\n\r\n")
+        return int(head.split()[1]), json.loads(data)
+    
+    async def run_service_tests():
+        # Request bersamaan harus digabung menjadi batch, hasil sama dengan check langsung
+        service = StrengthService(workers=1, max_batch=16, max_wait=0.01)
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            passwords = [f"Rahasia{i}!" for i in range(40)]
+            responses = await asyncio.gather(*(http_request(port, "POST", "/check", {"password": p})
+                                               for p in passwords))
+            assert all(status == 200 for status, _ in responses)
+            assert [r["result"]["score"] for _, r in responses] == \
+                [check_password_strength(p)["score"] for p in passwords]
+            
+            status, data = await http_request(port, "POST", "/generate",
+                                              {"length": 20, "count": 3, "symbols": False})
+            assert status == 200 and len(data["passwords"]) == 3
+            assert all(len(p) == 20 and p.isalnum() for p in data["passwords"])
+            
+            status, data = await http_request(port, "POST", "/generate", {"length": 2})
+            assert status == 400
+            
+            # NaN/Infinity bukan JSON valid: entropy_bits harus berhingga dan >= 0
+            for entropy_bits in (float("nan"), float("inf"), -1):
+                status, data = await http_request(port, "POST", "/check",
+                                                  {"password": "Abcdefgh12!x",
+                                                   "entropy_bits": entropy_bits})
+                assert status == 400 and "entropy_bits" in data["error"]
+            
+            # Request besar dipecah: batch dihitung per password, bukan per request
+            bulk = [f"Massal{i}?" for i in range(50)]
+            status, data = await http_request(port, "POST", "/check", {"passwords": bulk})
+            assert status == 200 and [r["score"] for r in data["results"]] == \
+                [check_password_strength(p)["score"] for p in bulk]
+            status, data = await http_request(port, "POST", "/generate", {"length": 12, "count": 40})
+            assert status == 200 and len(data["passwords"]) == 40
+            
+            status, stats = await http_request(port, "GET", "/stats")
+            batching = stats["endpoints"]["/check"]["batching"]
+            assert batching["items"] == 90 and batching["batches"] < 90
+            assert batching["largest_batch"] <= 16
+            assert stats["endpoints"]["/generate"]["batching"]["largest_batch"] <= 16
+            print(f"✓ 40 request + 1 request 50 password digabung/dipecah menjadi "
+                  f"{batching['batches']} batch (maks {batching['largest_batch']} password), "
+                  f"p99 {stats['endpoints']['/check']['latency']['p99_ms']:.1f} ms")
+        finally:
+            await service.close()
+        
+        # Backpressure: di atas max_pending request langsung ditolak 503
+        service = StrengthService(workers=1, max_pending=4, max_wait=0.05,
+                                  executor=ThreadPoolExecutor(1))
+        service.open()
+        try:
+            results = await asyncio.gather(*(service.handle_request("POST", "/check",
+                                                                    b'{"password": "abc"}')
+                                             for _ in range(10)))
+            statuses = [status for status, _ in results]
+            assert statuses.count(200) == 4 and statuses.count(503) == 6
+            print(f"✓ Backpressure: {statuses.count(503)} dari 10 request ditolak 503")
+            
+            # Antrean dihitung per password: dua request 3 password melebihi 4
+            results = await asyncio.gather(*(service.handle_request(
+                "POST", "/check", b'{"passwords": ["a", "b", "c"]}') for _ in range(2)))
+            assert sorted(status for status, _ in results) == [200, 503]
+            status, _ = await service.handle_request("POST", "/check",
+                                                     b'{"passwords": ["a", "b", "c", "d", "e"]}')
+            assert status == 400
+            print("✓ Backpressure per password: request melebihi antrean ditolak")
+        finally:
+            await service.close()
+    
+    asyncio.run(run_service_tests())
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 24] Policy Engine")
+print("-" * 60)
+
+try:
+    from policy_engine import compile_policy, load_policy, PolicySet
+    
+    tenant_a = compile_policy({"name": "a", "min_length": 10, "required": ["uppercase", "numbers"],
+                               "banned_substrings": ["Admin", "password"], "max_repeat": 2})
+    tenant_b = compile_policy('{"name": "b", "min_length": 6, "min_classes": 2, "min_score": 50}')
+    
+    result = tenant_a.evaluate("superADMIN111x")
+    assert result.failed_rules == ["max_repeat", "banned_substrings"], result.failed_rules
+    assert tenant_a.find_banned("superADMIN111x") == ["admin"]
+    assert tenant_a.evaluate("Rahasia2024!").passed
+    print(f"✓ Evaluasi: {result.failed_rules}")
+    
+    # Spec yang isinya sama (urutan/kapitalisasi berbeda) memakai hasil compile yang sama
+    same = compile_policy({"max_repeat": 2, "banned_substrings": ["password", "admin", "ADMIN"],
+                           "required": ["numbers", "uppercase"], "min_length": 10, "name": "a"})
+    assert same is tenant_a
+    print(f"✓ Cache per hash isi: {tenant_a.digest[:12]}")
+    
+    # Satu pass untuk banyak policy harus sama dengan evaluasi per policy
+    policies = PolicySet([tenant_a, tenant_b])
+    for password in ["abc", "Password99", "Rahasia2024!", "aaaBBB123", "pass word"]:
+        combined = [r.violations for r in policies.evaluate(password)]
+        assert combined == [tenant_a.evaluate(password).violations,
+                            tenant_b.evaluate(password).violations], password
+    assert policies.passing("Rahasia2024!") == ["a", "b"]
+    
+    batch = tenant_a.evaluate_many(["abc", "Rahasia2024!", "password1234"])
+    assert batch.passed_count == 1 and batch.rule_counts()["banned_substrings"] == 1
+    print(f"✓ PolicySet & batch: {batch.passed_count}/{len(batch)} lolos")
+    
+    example = load_policy(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                       "data", "policies", "contoh.toml"))
+    assert not example.evaluate("qwerty123").passed
+    print(f"✓ Load TOML: {example.name}")
+    
+    try:
+        compile_policy({"min_lenght": 8})
+        print("✗ Field tidak dikenal seharusnya ditolak")
+    except ValueError as e:
+        print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 25] Corpus Analyzer (MinHash/LSH)")
+print("-" * 60)
+
+try:
+    from corpus_analyzer import CorpusAnalyzer
+    
+    corpus = ["Summer2024!", "Summer2025!", "Kucing123", "zQ8#pLm2vT", "Kucing1234",
+              "summer2024!", "Tr0ub4dor&3", "Summer2024!"]
+    analyzer = CorpusAnalyzer()
+    analyzer.add_many(corpus + [""])
+    assert len(analyzer) == len(corpus)
+    
+    clusters = analyzer.clusters()
+    assert clusters == [[0, 1, 5, 7], [2, 4]], clusters
+    print(f"✓ Cluster: {[[corpus[i] for i in c] for c in clusters]}")
+    
+    assert analyzer.reuse_groups() == [[0, 7]]
+    assert analyzer.similarity(0, 7) == 1.0 and analyzer.similarity(0, 3) < 0.5
+    print("✓ Password dipakai ulang terdeteksi")
+    
+    assert analyzer.memory_bytes == len(corpus) * (analyzer.hashes * 2 + 8)
+    print(f"✓ Signature compact: {analyzer.memory_bytes // len(analyzer)} byte/password")
+    
+    try:
+        CorpusAnalyzer(threshold=0)
+        print("✗ Threshold 0 seharusnya ditolak")
+    except ValueError as e:
+        print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 26] Bulk Export (CSV/JSONL/teks)")
+print("-" * 60)
+
+try:
+    import csv
+    import json
+    import tempfile
+    from file_export import export_many, export_to_file, CSV_COLUMNS
+    from strength_checker import check_password_strength_many
+    
+    passwords = generate_passwords(500, 12) + ["abc"]
+    batch = check_password_strength_many(passwords)
+    records = [(p, batch[i], "rules") for i, p in enumerate(passwords)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, count = export_many(iter(records), "csv", output_dir=tmp, flush_every=100)
+        with open(csv_path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert count == len(passwords) and len(rows) == count + 1
+        assert tuple(rows[0]) == CSV_COLUMNS and rows[-1][0] == "abc"
+        assert rows[-1][2] == str(check_password_strength("abc")["score"])
+        print(f"✓ CSV: {count} record, satu file")
+        
+        jsonl_path, _ = export_many(records, "jsonl", output_dir=tmp, fsync=True)
+        with open(jsonl_path, encoding="utf-8") as f:
+            last = [json.loads(line) for line in f][-1]
+        assert last["password"] == "abc" and last["feedback"] == check_password_strength("abc")["feedback"]
+        print(f"✓ JSONL: {last['strength']} / {last['score']}")
+        
+        txt_path, _ = export_many(records[:2], "txt", output_dir=tmp)
+        with open(txt_path, encoding="utf-8") as f:
+            assert f.read().count("PASSWORD GENERATOR RESULT") == 2
+        assert len({csv_path, jsonl_path, txt_path}) == 3
+        print("✓ Format teks sama dengan export_to_file")
+    
+    # Export di detik yang sama tidak boleh saling menimpa
+    paths = [export_to_file("abc", check_password_strength("abc"), "rules") for _ in range(5)]
+    assert len(set(paths)) == 5
+    for path in paths:
+        os.remove(path)
+    print("✓ Nama file export unik")
+    
+    try:
+        export_many(records, "xml")
+        print("✗ Format tidak dikenal seharusnya ditolak")
+    except ValueError as e:
+        print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 27] Export Binary Kolumnar (.pwx)")
+print("-" * 60)
+
+try:
+    import tempfile
+    from file_export import export_many, read_export_file, PwxReader
+    from strength_checker import PasswordStrength
+    
+    passwords = generate_passwords(300, 12) + ["abc", "pässwört123", "Rahasia2024"]
+    results = [check_password_strength(p) for p in passwords]
+    records = [(p, r, "rules") for p, r in zip(passwords, results)]
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path, count = export_many(records, "pwx", output_dir=tmp)
+        with PwxReader(path) as reader:
+            assert len(reader) == count == len(passwords)
+            password, result, rules = reader[-2]
+            assert password == "pässwört123" and rules == "rules"
+            assert result.score == results[-2].score and result.mask == results[-2].mask
+            assert len(reader.scores) == count and reader.scores[0] == results[0].score
+            print(f"✓ Akses baris O(1): {password} (skor {result.score})")
+            
+            weak = list(reader.scan(strengths=[PasswordStrength.WEAK]))
+            assert weak == [i for i, r in enumerate(results) if r.strength == PasswordStrength.WEAK]
+            matched = list(reader.scan(min_score=50, pattern="^Raha"))
+            assert matched == [len(passwords) - 1], matched
+            print(f"✓ Scan kolom + regex: {len(weak)} lemah, {len(matched)} cocok")
+        
+        preview = read_export_file(path, max_rows=2)
+        assert f"{count} password" in preview and "lainnya" in preview
+        print("✓ read_export_file membuka .pwx dan .txt")
+        
+        bad_path = os.path.join(tmp, "rusak.pwx")
+        with open(bad_path, "wb") as f:
+            f.write(b"bukan pwx")
+        try:
+            PwxReader(bad_path)
+            print("✗ File rusak seharusnya ditolak")
+        except ValueError as e:
+            print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 28] Export Writer Background")
+print("-" * 60)
+
+try:
+    import tempfile
+    import threading
+    import time
+    from export_writer import ExportWriter
+    
+    result = check_password_strength("Rahasia2024!")
+    with tempfile.TemporaryDirectory() as tmp:
+        with ExportWriter(tmp, max_batch=16) as writer:
+            futures = [writer.submit("Rahasia2024!", result, "rules") for _ in range(50)]
+            assert writer.flush(timeout=10)
+            paths = [future.result() for future in futures]
+            assert len(set(paths)) == 50 and all(os.path.exists(path) for path in paths)
+            with open(paths[0], encoding="utf-8") as f:
+                assert "Rahasia2024!" in f.read()
+            
+            bulk_path, count = writer.submit_many([("abc", result, "rules")] * 3, "csv").result()
+            assert count == 3
+            
+            bad = writer.submit_many([("abc", {"score": 1}, "rules")], "jsonl")
+            try:
+                bad.result()
+                print("✗ Record rusak seharusnya gagal")
+            except IOError:
+                pass
+            stats = writer.stats()
+        assert stats["written"] == 51 and stats["failed"] == 1 and stats["largest_batch"] <= 16
+        assert not [name for name in os.listdir(tmp) if name.endswith(".tmp")]
+        print(f"✓ {stats['written']} export, {stats['batches']} batch, "
+              f"p99 {stats['latency']['p99_ms']:.1f} ms, tanpa file sementara tersisa")
+        
+        # Mode drop: writer ditahan oleh export bulk yang menunggu event
+        release = threading.Event()
+        def slow_records():
+            release.wait(10)
+            yield ("abc", result, "rules")
+        
+        writer = ExportWriter(tmp, queue_size=2, backpressure="drop", fsync=False)
+        writer.submit_many(slow_records(), "csv")
+        while writer.stats()["queued"]:
+            time.sleep(0.001)
+        queued = [writer.submit("abc", result, "rules") for _ in range(5)]
+        release.set()
+        writer.close()
+        assert queued.count(None) == 3 and writer.stats()["dropped"] == 3
+        print(f"✓ Backpressure drop: {writer.stats()['dropped']} export dibuang")
+        
+        try:
+            writer.submit("abc", result, "rules")
+            print("✗ Writer yang sudah ditutup seharusnya menolak submit")
+        except RuntimeError as e:
+            print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 29] Export Manifest")
+print("-" * 60)
+
+try:
+    import tempfile
+    from datetime import datetime, timedelta
+    from export_manifest import ExportManifest
+    from export_writer import ExportWriter
+    from file_export import export_many, query_exports, get_export_manifest
+    from strength_checker import PasswordStrength
+    
+    weak = check_password_strength("abc")
+    strong = check_password_strength("Rahasia2024!Xy")
+    with tempfile.TemporaryDirectory() as tmp:
+        with ExportWriter(tmp, fsync=False) as writer:
+            for i in range(12):
+                writer.submit("abc" if i % 3 == 0 else "Rahasia2024!Xy",
+                              weak if i % 3 == 0 else strong, "rules", f"single_{i:02d}.txt")
+        export_many([("abc", weak, "r"), ("Rahasia2024!Xy", strong, "r")], "pwx", "bulk.pwx", tmp)
+        
+        page, total = query_exports(tmp, page=2, per_page=5, sort="nama")
+        assert total == 13 and [item["name"] for item in page] == [f"single_{i:02d}.txt" for i in range(4, 9)]
+        
+        lows, total = query_exports(tmp, strengths=[PasswordStrength.WEAK])
+        assert total == 5 and {item["name"] for item in lows} >= {"bulk.pwx", "single_00.txt"}
+        assert all(item["score"] == weak["score"] for item in lows)
+        _, total = query_exports(tmp, min_score=strong["score"], formats=["txt"])
+        assert total == 8
+        _, total = query_exports(tmp, since=datetime.now() + timedelta(days=1))
+        assert total == 0
+        print("✓ Query halaman/filter skor, kekuatan, tanggal dan format benar")
+        
+        # File di luar file_export (misal disalin manual) dan file yang
+        # dihapus terdeteksi lewat mtime folder; scan kedua dilewati
+        manifest = get_export_manifest(tmp)
+        with open(os.path.join(tmp, "single_00.txt"), encoding="utf-8") as src:
+            content = src.read()
+        with open(os.path.join(tmp, "manual.txt"), "w", encoding="utf-8") as dst:
+            dst.write(content)
+        os.remove(os.path.join(tmp, "single_01.txt"))
+        assert manifest.refresh() and not manifest.refresh()
+        (item,), _ = query_exports(tmp, sort="terbaru", per_page=1, formats=["txt"], max_score=weak["score"])
+        assert item["name"] == "manual.txt" and item["rows"] == 1 and item["score"] == weak["score"]
+        assert len(manifest.names()) == 13 and "single_01.txt" not in manifest.names()
+        print("✓ Refresh incremental: file baru diperiksa, file terhapus dibuang")
+        
+        # Manifest baru di folder yang sama membaca database yang sudah ada
+        reopened = ExportManifest(tmp, manifest.extensions)
+        assert not reopened.refresh() and reopened.query(per_page=100)[1] == 13
+        reopened.close()
+        
+        try:
+            query_exports(tmp, sort="acak")
+            print("✗ Urutan tidak dikenal seharusnya ditolak")
+        except ValueError as e:
+            print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
+print("\n[TEST 30] Text Export Reader (halaman + index baris)")
+print("-" * 60)
+
+try:
+    import tempfile
+    import file_export
+    from file_export import TextExportReader, export_many, get_text_reader, iter_export_chunks
+    
+    result = check_password_strength("Rahasia2024!")
+    with tempfile.TemporaryDirectory() as tmp:
+        path, count = export_many((("pwd%05d" % i, result, "rules") for i in range(3000)),
+                                  "csv", "pager.csv", tmp)
+        with open(path, encoding="utf-8") as f:
+            expected = f.read().splitlines()
+        
+        with TextExportReader(path) as reader:
+            assert len(reader) == count + 1
+            for start in (0, 1, 255, 256, 257, 1500, count - 2):
+                assert reader.lines(start, 7) == expected[start:start + 7]
+            assert reader.lines(count, 10) == expected[count:] and reader.lines(count + 5, 3) == []
+            assert reader.page(2, 100).split("\n") == expected[100:200]
+            assert reader.pages(100) == 31
+        print(f"✓ {len(expected):,} baris, halaman acak sama dengan baca penuh")
+        
+        # Index di-cache di sebelah file dan di-mmap saat dibuka lagi
+        old_min = file_export.LINE_INDEX_MIN_SIZE
+        file_export.LINE_INDEX_MIN_SIZE = 1
+        try:
+            TextExportReader(path).close()
+            index_path = os.path.join(tmp, ".pager.csv.idx")
+            assert os.path.exists(index_path)
+            with TextExportReader(path) as reader:
+                assert reader._index_map is not None and reader.lines(2999, 2) == expected[2999:3001]
+        finally:
+            file_export.LINE_INDEX_MIN_SIZE = old_min
+        print("✓ Index baris di-cache ke .pager.csv.idx dan dipakai ulang")
+        
+        with open(os.path.join(tmp, "tail.txt"), "w", encoding="utf-8") as f:
+            f.write("a\r\nb\r\nc")
+        reader = get_text_reader(os.path.join(tmp, "tail.txt"))
+        assert reader.lines(0, 5) == ["a", "b", "c"] and reader is get_text_reader(os.path.join(tmp, "tail.txt"))
+        
+        chunks = list(iter_export_chunks(path, 4096))
+        with open(path, "rb") as f:
+            assert b"".join(chunks) == f.read() and max(map(len, chunks)) == 4096
+        print(f"✓ Download per potongan: {len(chunks)} chunk x 4 KB")
+        
+        try:
+            TextExportReader(export_many([("abc", result, "r")], "pwx", "x.pwx", tmp)[0])
+            print("✗ File .pwx seharusnya ditolak")
+        except ValueError as e:
+            print(f"✓ Validasi: {e}")
+
+except Exception as e:
+    print(f"✗ Error: {str(e)}")
+
 print("\n" + "=" * 60)
 print("TESTING COMPLETE")
 print("=" * 60)